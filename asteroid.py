@@ -10,7 +10,8 @@ from settings import (
     ASTEROID_SPAWN_SAFE_RADIUS,
     WHITE, LINE_WIDTH,
 )
-from utils import wrap_position
+from bodies import Body, KIND_ASTEROID
+from transform_cache import SHAPES
 
 
 # Size configs: (radius, speed_min, speed_max, child_size)
@@ -21,88 +22,118 @@ _SIZE_CONFIG = {
 }
 
 
-def _make_polygon(radius: float, num_vertices: int = None) -> list:
-    """Generate a jagged circle polygon with ±30% radius variation."""
+def _make_polygon(radius: float, num_vertices: int = None, rng=random,
+                  max_vertices: int = None) -> list:
+    """Generate a jagged circle polygon with ±30% radius variation.
+
+    max_vertices thins the outline evenly after every vertex has been rolled,
+    so the rng is consumed the same way at any detail level.
+    """
     if num_vertices is None:
-        num_vertices = random.randint(8, 12)
+        num_vertices = rng.randint(8, 12)
     points = []
     for i in range(num_vertices):
         angle = (2 * math.pi * i) / num_vertices
-        r = radius * random.uniform(0.7, 1.3)
+        r = radius * rng.uniform(0.7, 1.3)
         points.append((math.cos(angle) * r, math.sin(angle) * r))
+    if max_vertices is not None and num_vertices > max_vertices:
+        points = [points[i * num_vertices // max_vertices] for i in range(max_vertices)]
     return points
 
 
-def _random_edge_pos(ship_pos: pygame.Vector2) -> pygame.Vector2:
+def _random_edge_pos(ship_pos: pygame.Vector2, rng=random) -> pygame.Vector2:
     """Spawn at a random screen edge, away from the ship."""
     for _ in range(20):
-        edge = random.choice(["top", "bottom", "left", "right"])
+        edge = rng.choice(["top", "bottom", "left", "right"])
         if edge == "top":
-            pos = pygame.Vector2(random.uniform(0, SCREEN_WIDTH), 0)
+            pos = pygame.Vector2(rng.uniform(0, SCREEN_WIDTH), 0)
         elif edge == "bottom":
-            pos = pygame.Vector2(random.uniform(0, SCREEN_WIDTH), SCREEN_HEIGHT)
+            pos = pygame.Vector2(rng.uniform(0, SCREEN_WIDTH), SCREEN_HEIGHT)
         elif edge == "left":
-            pos = pygame.Vector2(0, random.uniform(0, SCREEN_HEIGHT))
+            pos = pygame.Vector2(0, rng.uniform(0, SCREEN_HEIGHT))
         else:
-            pos = pygame.Vector2(SCREEN_WIDTH, random.uniform(0, SCREEN_HEIGHT))
+            pos = pygame.Vector2(SCREEN_WIDTH, rng.uniform(0, SCREEN_HEIGHT))
         if pos.distance_to(ship_pos) >= ASTEROID_SPAWN_SAFE_RADIUS:
             return pos
     # Fallback: corner
     return pygame.Vector2(0, 0)
 
 
-class Asteroid:
+class Asteroid(Body):
     """An asteroid with procedural polygon, constant velocity, and screen wrapping."""
 
+    KIND = KIND_ASTEROID
+
     def __init__(
         self,
         pos: pygame.Vector2,
         vel: pygame.Vector2,
         size: str,
+        rng=random,
+        store=None,
+        max_vertices: int = None,
     ) -> None:
-        self.pos = pygame.Vector2(pos)
-        self.vel = pygame.Vector2(vel)
         self.size = size
         self.radius = _SIZE_CONFIG[size][0]
-        self._polygon = _make_polygon(self.radius)
-        self._rotation = 0.0
-        self._rotation_speed = random.uniform(-60, 60)  # degrees/s
+        self._rng = rng
+        self._polygon = _make_polygon(self.radius, rng=rng, max_vertices=max_vertices)
+        self._shape = SHAPES.shape(self._polygon)
+        spin = rng.uniform(-60, 60)  # degrees/s
+        super().__init__(store, pos[0], pos[1], vel[0], vel[1], spin=spin)
+
+    @property
+    def _rotation(self) -> float:
+        return float(self._store.rot[self._slot])
+
+    @_rotation.setter
+    def _rotation(self, value: float) -> None:
+        self._store.rot[self._slot] = value
+
+    @property
+    def _rotation_speed(self) -> float:
+        return float(self._store.spin[self._slot])
+
+    @_rotation_speed.setter
+    def _rotation_speed(self, value: float) -> None:
+        self._store.spin[self._slot] = value
 
     @classmethod
-    def spawn_large(cls, ship_pos: pygame.Vector2) -> "Asteroid":
+    def spawn_large(cls, ship_pos: pygame.Vector2, rng=random, store=None,
+                    max_vertices: int = None) -> "Asteroid":
         """Spawn a large asteroid at a random screen edge."""
-        pos = _random_edge_pos(ship_pos)
-        speed = random.uniform(ASTEROID_LARGE_SPEED_MIN, ASTEROID_LARGE_SPEED_MAX)
-        angle = random.uniform(0, 2 * math.pi)
+        pos = _random_edge_pos(ship_pos, rng)
+        speed = rng.uniform(ASTEROID_LARGE_SPEED_MIN, ASTEROID_LARGE_SPEED_MAX)
+        angle = rng.uniform(0, 2 * math.pi)
         vel = pygame.Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
-        return cls(pos, vel, "large")
+        return cls(pos, vel, "large", rng, store, max_vertices)
+
+    def split(self, rng=None, max_vertices: int = None) -> list:
+        """Return child asteroids when this one is destroyed. Small → no children.
 
-    def split(self) -> list:
-        """Return child asteroids when this one is destroyed. Small → no children."""
+        Children roll from `rng` (default: the one this asteroid was made with)
+        and keep it for their own split. max_vertices caps their outline detail.
+        """
         child_size = _SIZE_CONFIG[self.size][3]
         if child_size is None:
             return []
         cfg = _SIZE_CONFIG[child_size]
+        if rng is None:
+            rng = self._rng
         children = []
         for _ in range(2):
-            speed = random.uniform(cfg[1], cfg[2])
-            angle = random.uniform(0, 2 * math.pi)
+            speed = rng.uniform(cfg[1], cfg[2])
+            angle = rng.uniform(0, 2 * math.pi)
             vel = pygame.Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
-            children.append(Asteroid(self.pos, vel, child_size))
+            children.append(Asteroid(self.pos, vel, child_size, rng, self._store, max_vertices))
         return children
 
     def update(self, dt: float) -> None:
-        self.pos += self.vel * dt
-        self.pos = wrap_position(self.pos, SCREEN_WIDTH, SCREEN_HEIGHT)
-        self._rotation += self._rotation_speed * dt
-
-    def draw(self, screen: pygame.Surface) -> None:
-        import math as _math
-        angle = _math.radians(self._rotation)
-        cos_a, sin_a = _math.cos(angle), _math.sin(angle)
-        world_pts = []
-        for x, y in self._polygon:
-            rx = x * cos_a - y * sin_a
-            ry = x * sin_a + y * cos_a
-            world_pts.append((self.pos.x + rx, self.pos.y + ry))
-        pygame.draw.polygon(screen, WHITE, world_pts, LINE_WIDTH)
+        """Move on its own; GameWorld moves all asteroids via BodyStore.integrate."""
+        self._store.integrate_slot(self._slot, dt)
+
+    def outlines(self) -> tuple:
+        return (self._shape,)
+
+    def draw(self, screen: pygame.Surface, width: int = LINE_WIDTH) -> pygame.Rect:
+        px, py = self.draw_pos
+        return pygame.draw.polygon(screen, WHITE, self._shape.place(self.draw_rot, px, py), width)
@@ -0,0 +1,324 @@
+"""
+Batch simulator — headless games fanned out over every core, for balancing.
+
+    python batch.py --games 2000 --policy aim
+    python batch.py --games 500 --set WAVE_ASTEROID_START=5 --set HYPERSPACE_DEATH_CHANCE=0.1
+    python batch.py --games 500 --sweep SAUCER_SPAWN_INTERVAL_BASE=15,20,25
+
+A job is a chunk of games that share one arm: an input policy, a set of
+settings overrides and a tick limit. Every game gets its own seed. A worker
+patches the overrides into settings and into every game module that
+imported the constant by name. It then plays each game with GameWorld.run
+and restores the constants. What comes back is one compact summary per
+game: score, wave reached, deaths by cause, ticks, and whether the game
+ended.
+
+The parent keeps a bounded number of jobs in flight. It folds each summary
+into a running Aggregate (sums, counters and a score histogram) as soon as
+the job completes, so its memory does not grow with the number of games.
+Games share nothing, so throughput scales with the worker count up to the
+number of physical cores.
+
+Overrides only reach constants read while a game runs: wave sizes, saucer
+timers, scoring, hyperspace odds and the like. Tables built at import time,
+such as the asteroid size configs, keep their values.
+"""
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import ast
+import json
+import math
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import settings
+from settings import SIM_HZ, BATCH_MAX_TICKS, BATCH_CHUNK, BATCH_SCORE_BUCKET
+from world import GameWorld, PlayerInput, NO_INPUT
+from fastmath import torus_delta
+
+_GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# ── Input policies ────────────────────────────────────────────
+class RandomPolicy:
+    """Mashes the controls: holds a turn/thrust choice for a random stretch, fires often."""
+
+    def __init__(self, seed: int) -> None:
+        self._rng = random.Random(seed)
+        self._hold = 0
+        self._turn = 0.0
+        self._thrust = False
+
+    def __call__(self, world) -> PlayerInput:
+        rng = self._rng
+        if self._hold <= 0:
+            self._hold = rng.randint(5, 40)
+            self._turn = rng.choice((-1.0, 0.0, 1.0))
+            self._thrust = rng.random() < 0.3
+        self._hold -= 1
+        return PlayerInput(self._thrust, self._turn, rng.random() < 0.15, rng.random() < 0.002)
+
+
+class AimPolicy:
+    """Turns toward the nearest target on the torus and fires when lined up."""
+
+    def __init__(self, seed: int) -> None:
+        self._rng = random.Random(seed)
+
+    def __call__(self, world) -> PlayerInput:
+        ship = world.ship
+        if not ship.alive:
+            return NO_INPUT
+        sx, sy = ship.x, ship.y
+        w, h = settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT
+        best, bdx, bdy = math.inf, 0.0, 0.0
+        for t in world.asteroids + world.saucers:
+            dx = torus_delta(sx, t.x, w)
+            dy = torus_delta(sy, t.y, h)
+            d = dx * dx + dy * dy
+            if d < best:
+                best, bdx, bdy = d, dx, dy
+        if best == math.inf:
+            return NO_INPUT
+        want = math.degrees(math.atan2(bdx, -bdy))     # 0 = nose up, as Ship.angle
+        off = (want - ship.angle + 180.0) % 360.0 - 180.0
+        turn = max(-1.0, min(1.0, off / 15.0))
+        fire = abs(off) < 8.0 and world.ticks % 6 == 0
+        return PlayerInput(False, turn, fire, False)
+
+
+def _idle_policy(seed: int):
+    return lambda world: NO_INPUT
+
+
+POLICIES = {
+    "idle": _idle_policy,
+    "random": RandomPolicy,
+    "aim": AimPolicy,
+}
+
+
+# ── Overrides ─────────────────────────────────────────────────
+def parse_override(text: str) -> tuple:
+    """'NAME=value' -> (NAME, value); value is a Python literal, checked against settings."""
+    name, sep, raw = text.partition("=")
+    name = name.strip()
+    if not sep or not hasattr(settings, name) or not name.isupper():
+        raise ValueError(f"unknown setting: {name!r}")
+    try:
+        value = ast.literal_eval(raw.strip())
+    except (ValueError, SyntaxError):
+        raise ValueError(f"bad value for {name}: {raw!r}")
+    current = getattr(settings, name)
+    if isinstance(current, float) and isinstance(value, int):
+        value = float(value)
+    if type(value) is not type(current):
+        raise ValueError(f"{name} is {type(current).__name__}, got {type(value).__name__}")
+    return name, value
+
+
+def apply_overrides(overrides: dict) -> dict:
+    """Set each constant in settings and in every game module holding it; returns what to restore."""
+    saved = {}
+    for name, value in overrides.items():
+        for mod in list(sys.modules.values()):
+            path = getattr(mod, "__file__", None)
+            if path and os.path.dirname(os.path.abspath(path)) == _GAME_DIR and hasattr(mod, name):
+                saved[(mod, name)] = getattr(mod, name)
+                setattr(mod, name, value)
+    return saved
+
+
+def restore_overrides(saved: dict) -> None:
+    for (mod, name), value in saved.items():
+        setattr(mod, name, value)
+
+
+# ── Worker side ───────────────────────────────────────────────
+def play(seed: int, policy: str = "random", max_ticks: int = BATCH_MAX_TICKS) -> dict:
+    """One headless game; returns its summary."""
+    world = GameWorld(seed=seed)
+    world.run(POLICIES[policy](seed), max_ticks)
+    return {
+        "seed": seed,
+        "score": world.score,
+        "wave": world.wave,
+        "deaths": dict(world.deaths),
+        "ticks": world.ticks,
+        "game_over": world.game_over,
+    }
+
+
+def run_job(job: tuple) -> list:
+    """Worker entry point: (arm index, policy, overrides, max ticks, seeds) -> summaries."""
+    arm, policy, overrides, max_ticks, seeds = job
+    saved = apply_overrides(overrides)
+    try:
+        return [dict(play(seed, policy, max_ticks), arm=arm) for seed in seeds]
+    finally:
+        restore_overrides(saved)
+
+
+# ── Parent side ───────────────────────────────────────────────
+class Aggregate:
+    """Running totals for one arm; add() folds in a summary and forgets it."""
+
+    def __init__(self, label: str, bucket: int = BATCH_SCORE_BUCKET) -> None:
+        self.label = label
+        self.bucket = bucket
+        self.games = 0
+        self.finished = 0         # games that reached game over within the tick limit
+        self.score_sum = 0
+        self.score_sq = 0
+        self.score_max = 0
+        self.ticks = 0
+        self.waves = {}           # wave reached -> games
+        self.deaths = {}          # cause -> ship losses
+        self._hist = {}           # score bucket -> games
+
+    def add(self, s: dict) -> None:
+        self.games += 1
+        self.finished += s["game_over"]
+        score = s["score"]
+        self.score_sum += score
+        self.score_sq += score * score
+        self.score_max = max(self.score_max, score)
+        self.ticks += s["ticks"]
+        self.waves[s["wave"]] = self.waves.get(s["wave"], 0) + 1
+        for cause, n in s["deaths"].items():
+            self.deaths[cause] = self.deaths.get(cause, 0) + n
+        b = score // self.bucket
+        self._hist[b] = self._hist.get(b, 0) + 1
+
+    def score_percentile(self, q: float) -> int:
+        """Upper edge of the histogram bucket holding the q-th percentile score."""
+        if not self.games:
+            return 0
+        rank, seen = q / 100.0 * self.games, 0
+        for b in sorted(self._hist):
+            seen += self._hist[b]
+            if seen >= rank:
+                return (b + 1) * self.bucket
+        return (max(self._hist) + 1) * self.bucket
+
+    def report(self) -> dict:
+        n = self.games or 1
+        mean = self.score_sum / n
+        return {
+            "games": self.games,
+            "finished": self.finished,
+            "score_mean": round(mean, 1),
+            "score_std": round(math.sqrt(max(0.0, self.score_sq / n - mean * mean)), 1),
+            "score_p50": self.score_percentile(50),
+            "score_p90": self.score_percentile(90),
+            "score_max": self.score_max,
+            "wave_mean": round(sum(w * c for w, c in self.waves.items()) / n, 2),
+            "waves": {str(w): self.waves[w] for w in sorted(self.waves)},
+            "deaths_per_game": {c: round(k / n, 3) for c, k in sorted(self.deaths.items())},
+            "minutes_mean": round(self.ticks / n / SIM_HZ / 60, 2),
+        }
+
+
+def make_jobs(arms: list, games: int, seed: int, chunk: int, policy: str, max_ticks: int):
+    """Yield jobs lazily: every arm plays the same seeds, in chunks of `chunk` games."""
+    for start in range(0, games, chunk):
+        seeds = list(range(seed + start, seed + min(games, start + chunk)))
+        for i, overrides in enumerate(arms):
+            yield (i, policy, overrides, max_ticks, seeds)
+
+
+def run(arms: list, games: int, policy: str = "random", seed: int = 0, workers: int = None,
+        chunk: int = BATCH_CHUNK, max_ticks: int = BATCH_MAX_TICKS, on_progress=None) -> list:
+    """Play `games` games per arm (a dict of overrides each); returns one Aggregate per arm."""
+    if policy not in POLICIES:
+        raise ValueError(f"unknown policy {policy!r}; choose from {', '.join(POLICIES)}")
+    aggs = [Aggregate(", ".join(f"{k}={v}" for k, v in a.items()) or "defaults") for a in arms]
+    jobs = make_jobs(arms, games, seed, chunk, policy, max_ticks)
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        pending = set()
+        for job in jobs:
+            pending.add(pool.submit(run_job, job))
+            if len(pending) < 2 * workers:
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            _fold(done, aggs, on_progress)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            _fold(done, aggs, on_progress)
+    return aggs
+
+
+def _fold(done, aggs: list, on_progress) -> None:
+    for future in done:
+        for summary in future.result():
+            aggs[summary["arm"]].add(summary)
+    if on_progress:
+        on_progress(sum(a.games for a in aggs))
+
+
+def format_report(aggs: list) -> str:
+    lines = []
+    for a in aggs:
+        r = a.report()
+        lines.append(f"{a.label}")
+        lines.append(f"  games {r['games']}  finished {r['finished']}  "
+                     f"minutes/game {r['minutes_mean']:.2f}")
+        lines.append(f"  score mean {r['score_mean']:.0f} ± {r['score_std']:.0f}  "
+                     f"p50 ≤{r['score_p50']}  p90 ≤{r['score_p90']}  max {r['score_max']}")
+        lines.append(f"  wave mean {r['wave_mean']:.2f}  reached "
+                     + " ".join(f"{w}:{c}" for w, c in r["waves"].items()))
+        lines.append("  deaths/game " + ("  ".join(f"{c} {k:.2f}" for c, k in r["deaths_per_game"].items())
+                                          or "none"))
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Headless Asteroids games over a process pool")
+    parser.add_argument("--games", type=int, default=200, help="games per arm")
+    parser.add_argument("--policy", default="random", choices=sorted(POLICIES))
+    parser.add_argument("--seed", type=int, default=0, help="first game seed; arms share seeds")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--chunk", type=int, default=BATCH_CHUNK, help="games per job")
+    parser.add_argument("--max-ticks", type=int, default=BATCH_MAX_TICKS)
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="settings override for every arm (repeatable)")
+    parser.add_argument("--sweep", metavar="NAME=V1,V2,...",
+                        help="one arm per value of this setting")
+    parser.add_argument("--out", help="write the per-arm reports as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        base = dict(parse_override(s) for s in args.set)
+        arms = [base]
+        if args.sweep:
+            name, _, values = args.sweep.partition("=")
+            arms = [dict(base, **dict([parse_override(f"{name}={v}")])) for v in values.split(",")]
+    except ValueError as e:
+        parser.error(str(e))
+
+    total = args.games * len(arms)
+    t0 = time.perf_counter()
+
+    def progress(n):
+        print(f"\r{n}/{total} games", end="", file=sys.stderr, flush=True)
+
+    aggs = run(arms, args.games, args.policy, args.seed, args.workers, args.chunk,
+               args.max_ticks, progress)
+    elapsed = time.perf_counter() - t0
+    print(file=sys.stderr)
+    print(format_report(aggs))
+    print(f"\n{total} games in {elapsed:.1f} s ({total / elapsed:.1f} games/s)")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({a.label: a.report() for a in aggs}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
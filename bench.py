@@ -0,0 +1,385 @@
+"""
+Scenario benchmarks — per-phase frame timings at fixed, repeatable loads.
+
+Each scenario builds a seeded GameWorld and tops it up before every frame,
+so the load stays constant while the world runs. Scenarios cover a quiet
+wave 1, a capped late wave, a full particle pool, saucers firing, a bullet
+storm and asteroids straddling the wrap edges. Frames run headless under
+the dummy SDL driver and time these phases:
+
+    ship        ship input, drag and speed cap
+    kinematics  the vectorised integrate of every body
+    bullets     ship wrap-up and bullet expiry
+    particles   ParticlePool.update
+    saucers     saucer AI, firing and spawning
+    collisions  broadphase sync and hit tests
+    draw_*      the render backend, per kind of body
+    step        the whole GameWorld.step
+    draw        clear plus the render backend
+    frame       step + draw
+
+For each phase the runner reports mean, p50, p99 and max in ms. A second,
+shorter pass runs under tracemalloc and reports memory allocated per
+frame: the peak KB above the frame's start and the net blocks kept.
+
+    python bench.py                          # all scenarios -> bench_results.json
+    python bench.py wave12 particles_500     # just these
+    python bench.py --baseline before.json   # compare; exit 1 on regressions
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pygame
+from settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, SIM_HZ, BLACK,
+    WAVE_ASTEROID_MAX, RENDERER, SPRITE_CACHE_MB,
+    BENCH_FRAMES, BENCH_WARMUP, BENCH_ALLOC_FRAMES, BENCH_SEED, BENCH_REGRESSION,
+)
+from world import GameWorld, NO_INPUT, UPDATE_PHASES
+from asteroid import Asteroid
+from render_backend import make_backend, DRAW_PHASES
+
+PHASES = UPDATE_PHASES + DRAW_PHASES + ("step", "draw", "frame")
+
+
+# ── Phase timer ───────────────────────────────────────────────
+class PhaseTimer:
+    """GameWorld.timer hook: charges the time since the last mark to a phase."""
+
+    def __init__(self) -> None:
+        self.clock = time.perf_counter_ns
+        self.ns = {}
+        self._last = 0
+
+    def start(self) -> int:
+        """Begin a frame; returns the start timestamp in ns."""
+        self.ns = {}
+        self._last = self.clock()
+        return self._last
+
+    def skip(self) -> None:
+        """Charge the time since the last mark to nothing."""
+        self._last = self.clock()
+
+    def __call__(self, phase: str) -> None:
+        now = self.clock()
+        self.ns[phase] = self.ns.get(phase, 0) + now - self._last
+        self._last = now
+
+
+# ── Scenarios ─────────────────────────────────────────────────
+class Scenario:
+    """A named load: build() makes the world, top_up() restores the load each frame."""
+
+    def __init__(self, name: str, description: str, setup=None, top_up=None) -> None:
+        self.name = name
+        self.description = description
+        self._setup = setup
+        self._top_up = top_up
+
+    def build(self, seed: int) -> tuple:
+        """Return (world, rng); rng drives the scenario's own placements."""
+        world = GameWorld(seed=seed)
+        world.ship.invincible = True           # the load must not die mid-run
+        world.ship.invincibility_timer = float("inf")
+        world._saucer_timer = float("inf")     # scenarios place saucers themselves
+        rng = random.Random(seed)
+        if self._setup:
+            self._setup(world, rng)
+        return world, rng
+
+    def top_up(self, world: GameWorld, rng: random.Random) -> None:
+        if self._top_up:
+            self._top_up(world, rng)
+        world.drain_events()
+
+
+def _add_asteroid(world: GameWorld, size: str, pos, vel) -> None:
+    world.asteroids.append(Asteroid(pos, vel, size, world.rng.spawn, world.bodies))
+
+
+def _keep_asteroids(world: GameWorld, n: int) -> None:
+    while len(world.asteroids) < n:
+        world.asteroids.append(
+            Asteroid.spawn_large(world.ship.pos, world.rng.spawn, world.bodies))
+
+
+def _setup_wave12(world, rng) -> None:
+    world.wave = 12
+    world._spawn_wave(world.wave)
+
+
+def _top_up_particles(world, rng) -> None:
+    missing = 500 - len(world.particles)
+    while missing > 0:
+        n = min(missing, 25)
+        world.particles.emit((rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)), n)
+        missing -= n
+
+
+def _top_up_saucers(world, rng) -> None:
+    while len(world.saucers) < 5:
+        world._spawn_saucer()
+
+
+def _top_up_bullets(world, rng) -> None:
+    _keep_asteroids(world, WAVE_ASTEROID_MAX)
+    pool = world.player_bullets
+    while len(pool) < 200:
+        pool.fire(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT),
+                  rng.uniform(0, 360))
+
+
+_EDGE_ASTEROIDS = 40
+
+
+def _edge_spot(rng) -> tuple:
+    """A point on a screen edge or corner, so bodies straddle the wrap."""
+    x = rng.choice((0.0, SCREEN_WIDTH, rng.uniform(0, SCREEN_WIDTH)))
+    y = rng.choice((0.0, SCREEN_HEIGHT)) if 0 < x < SCREEN_WIDTH else rng.uniform(0, SCREEN_HEIGHT)
+    return x, y
+
+
+def _setup_edges(world, rng) -> None:
+    world.ship.pos = (0.0, 0.0)    # the ship's own queries straddle a corner too
+    _top_up_edges(world, rng)
+
+
+def _top_up_edges(world, rng) -> None:
+    while len(world.asteroids) < _EDGE_ASTEROIDS:
+        x, y = _edge_spot(rng)
+        _add_asteroid(world, rng.choice(("large", "medium", "small")),
+                      (x + rng.uniform(-10, 10), y + rng.uniform(-10, 10)),
+                      (rng.uniform(-5, 5), rng.uniform(-5, 5)))
+    pool = world.player_bullets
+    while len(pool) < 60:
+        x, y = _edge_spot(rng)
+        pool.fire(x, y, rng.uniform(0, 360))
+
+
+SCENARIOS = {s.name: s for s in (
+    Scenario("wave1", "fresh game, wave 1 asteroids"),
+    Scenario("wave12", f"wave 12, {WAVE_ASTEROID_MAX} large asteroids (the cap)",
+             setup=_setup_wave12),
+    Scenario("particles_500", "500 live explosion particles",
+             top_up=_top_up_particles),
+    Scenario("saucers_5", "5 saucers on screen, firing",
+             top_up=_top_up_saucers),
+    Scenario("bullets_200", "200 player bullets among capped asteroids",
+             top_up=_top_up_bullets),
+    Scenario("edge_clusters", "asteroids and bullets straddling the wrap edges",
+             setup=_setup_edges, top_up=_top_up_edges),
+)}
+
+
+# ── Running ───────────────────────────────────────────────────
+def _stats(ns: list) -> dict:
+    ms = np.asarray(ns, dtype=np.float64) / 1e6
+    return {
+        "mean": round(float(ms.mean()), 4),
+        "p50": round(float(np.percentile(ms, 50)), 4),
+        "p99": round(float(np.percentile(ms, 99)), 4),
+        "max": round(float(ms.max()), 4),
+    }
+
+
+def _frame(world, screen, backend, dt, timer) -> tuple:
+    """Step and draw once; returns (step ns, draw ns)."""
+    clock = timer.clock
+    t0 = timer.start()
+    world.step(NO_INPUT, dt)
+    t1 = clock()
+    screen.fill(BLACK)
+    timer.skip()
+    backend.draw(screen, world, timer)
+    return t1 - t0, clock() - t1
+
+
+def run_scenario(scenario: Scenario, screen: pygame.Surface, frames: int = BENCH_FRAMES,
+                 warmup: int = BENCH_WARMUP, alloc_frames: int = BENCH_ALLOC_FRAMES,
+                 renderer: str = RENDERER, seed: int = BENCH_SEED) -> dict:
+    dt = 1.0 / SIM_HZ
+    world, rng = scenario.build(seed)
+    backend = make_backend(renderer, SPRITE_CACHE_MB)
+    timer = PhaseTimer()
+    world.timer = timer
+    samples = {phase: [] for phase in PHASES}
+
+    for _ in range(warmup):
+        scenario.top_up(world, rng)
+        _frame(world, screen, backend, dt, timer)
+
+    gc_before = sum(s["collections"] for s in gc.get_stats())
+    for _ in range(frames):
+        scenario.top_up(world, rng)
+        step_ns, draw_ns = _frame(world, screen, backend, dt, timer)
+        for phase in UPDATE_PHASES + DRAW_PHASES:
+            samples[phase].append(timer.ns.get(phase, 0))
+        samples["step"].append(step_ns)
+        samples["draw"].append(draw_ns)
+        samples["frame"].append(step_ns + draw_ns)
+    gc_runs = sum(s["collections"] for s in gc.get_stats()) - gc_before
+
+    # Allocation pass: tracemalloc slows every allocation, so it is kept out of the timings
+    peak_kb, net_blocks = [], []
+    world.timer = None
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_frames):
+            scenario.top_up(world, rng)
+            blocks = sys.getallocatedblocks()
+            start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            world.step(NO_INPUT, dt)
+            screen.fill(BLACK)
+            backend.draw(screen, world)
+            _, peak = tracemalloc.get_traced_memory()
+            peak_kb.append((peak - start) / 1024)
+            net_blocks.append(sys.getallocatedblocks() - blocks)
+    finally:
+        tracemalloc.stop()
+
+    result = {
+        "description": scenario.description,
+        "frames": frames,
+        "bodies": {
+            "asteroids": len(world.asteroids),
+            "bullets": len(world.player_bullets) + len(world.enemy_bullets),
+            "saucers": len(world.saucers),
+            "particles": len(world.particles),
+        },
+        "phases": {phase: _stats(samples[phase]) for phase in PHASES},
+        "alloc": {
+            "peak_kb_mean": round(sum(peak_kb) / len(peak_kb), 2) if peak_kb else 0.0,
+            "peak_kb_max": round(max(peak_kb), 2) if peak_kb else 0.0,
+            "net_blocks_mean": round(sum(net_blocks) / len(net_blocks), 2) if net_blocks else 0.0,
+            "gc_collections": gc_runs,
+        },
+    }
+    return result
+
+
+def run(names=None, frames: int = BENCH_FRAMES, warmup: int = BENCH_WARMUP,
+        alloc_frames: int = BENCH_ALLOC_FRAMES, renderer: str = RENDERER,
+        seed: int = BENCH_SEED) -> dict:
+    """Run the named scenarios (all by default); returns the JSON-ready results."""
+    names = list(names or SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"unknown scenario(s): {', '.join(unknown)}")
+    pygame.display.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "renderer": renderer,
+            "seed": seed,
+            "sim_hz": SIM_HZ,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "scenarios": {
+            name: run_scenario(SCENARIOS[name], screen, frames, warmup,
+                               alloc_frames, renderer, seed)
+            for name in names
+        },
+    }
+
+
+# ── Baselines ─────────────────────────────────────────────────
+def compare(results: dict, baseline: dict, threshold: float = BENCH_REGRESSION) -> list:
+    """Rows of (scenario, phase, base p50, new p50, change, regressed) for shared phases.
+
+    A phase regresses when its p50 and its mean are both more than
+    `threshold` slower than the baseline. Requiring both keeps one noisy
+    statistic from flagging a regression.
+    """
+    rows = []
+    base_scenarios = baseline.get("scenarios", {})
+    for name, res in results["scenarios"].items():
+        base = base_scenarios.get(name)
+        if base is None:
+            continue
+        for phase, new in res["phases"].items():
+            old = base["phases"].get(phase)
+            if old is None or old["p50"] <= 0 or old["mean"] <= 0:
+                continue
+            change = new["p50"] / old["p50"] - 1.0
+            regressed = change > threshold and new["mean"] / old["mean"] - 1.0 > threshold
+            rows.append((name, phase, old["p50"], new["p50"], change, regressed))
+    return rows
+
+
+def format_results(results: dict) -> str:
+    lines = []
+    for name, res in results["scenarios"].items():
+        lines.append(f"{name}  ({res['description']})")
+        for phase, s in res["phases"].items():
+            lines.append(f"  {phase:<15} mean {s['mean']:8.3f}  p50 {s['p50']:8.3f}  "
+                         f"p99 {s['p99']:8.3f}  max {s['max']:8.3f} ms")
+        a = res["alloc"]
+        lines.append(f"  alloc           {a['peak_kb_mean']:.1f} KB/frame peak (max {a['peak_kb_max']:.1f}), "
+                     f"{a['net_blocks_mean']:+.1f} blocks/frame net, {a['gc_collections']} gc runs")
+    return "\n".join(lines)
+
+
+def format_comparison(rows: list) -> str:
+    lines = [f"{'scenario':<15}{'phase':<16}{'base p50':>10}{'p50':>10}{'change':>9}"]
+    for name, phase, old, new, change, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        lines.append(f"{name:<15}{phase:<16}{old:>10.3f}{new:>10.3f}{change:>+9.1%}{flag}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Asteroids scenario benchmarks")
+    parser.add_argument("scenarios", nargs="*", metavar="SCENARIO",
+                        help=f"any of: {', '.join(SCENARIOS)} (default: all)")
+    parser.add_argument("--frames", type=int, default=BENCH_FRAMES)
+    parser.add_argument("--warmup", type=int, default=BENCH_WARMUP)
+    parser.add_argument("--alloc-frames", type=int, default=BENCH_ALLOC_FRAMES)
+    parser.add_argument("--renderer", default=RENDERER, choices=("vector", "sprite"))
+    parser.add_argument("--seed", type=int, default=BENCH_SEED)
+    parser.add_argument("--out", default="bench_results.json", help="results JSON path")
+    parser.add_argument("--baseline", help="results JSON from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=BENCH_REGRESSION,
+                        help="slowdown fraction counted as a regression")
+    args = parser.parse_args(argv)
+
+    try:
+        results = run(args.scenarios, args.frames, args.warmup, args.alloc_frames,
+                      args.renderer, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    print(format_results(results))
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nwrote {args.out}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            rows = compare(results, json.load(f), args.threshold)
+        print()
+        print(format_comparison(rows))
+        if any(r[5] for r in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+"""
+BodyStore — structure-of-arrays kinematics for every moving body.
+
+Positions, velocities, rotation, spin, lifetimes and per-body drag live in
+contiguous NumPy arrays indexed by slot. One vectorised integrate() pass
+moves, wraps, spins, drags and ages every body of every kind, so per-frame
+Python work scales with the number of entity kinds rather than entities.
+
+Game object classes subclass Body and become thin views: `pos`, `vel` and
+friends are properties that read and write their slot. The getters return
+fresh pygame.Vector2 copies, so assign back (`obj.vel = v`) rather than
+mutating `obj.vel.x` in place. Hot paths read `obj.x` / `obj.y`, which are
+plain floats and build no Vector2.
+
+For fixed-timestep rendering the store also keeps the previous tick's
+position and rotation. snapshot() saves them before a tick; interpolate()
+blends them with the current state into `draw_pos` / `draw_rot`, which is
+what the draw methods read.
+"""
+import math
+
+import numpy as np
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+
+# Body kinds
+KIND_SHIP     = 0
+KIND_ASTEROID = 1
+KIND_BULLET   = 2
+KIND_SAUCER   = 3
+KIND_PARTICLE = 4
+
+_INITIAL_CAPACITY = 256
+
+
+class BodyStore:
+    """Slot-allocated arrays shared by all bodies of one simulation."""
+
+    def __init__(self, capacity: int = _INITIAL_CAPACITY,
+                 width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT) -> None:
+        self.width = width
+        self.height = height
+        self.capacity = 0
+        self.pos    = np.zeros((0, 2))
+        self.prev_pos = np.zeros((0, 2))    # position at the start of the last tick
+        self.draw_pos = np.zeros((0, 2))    # interpolated position for rendering
+        self.vel    = np.zeros((0, 2))
+        self.rot    = np.zeros(0)           # degrees
+        self.prev_rot = np.zeros(0)
+        self.draw_rot = np.zeros(0)
+        self.spin   = np.zeros(0)           # degrees/s
+        self.life   = np.zeros(0)           # seconds left; inf = immortal
+        self.drag   = np.ones(0)            # velocity multiplier per 1/FPS seconds
+        self.wrap_x = np.zeros(0, dtype=bool)
+        self.kind   = np.zeros(0, dtype=np.int8)
+        self.active = np.zeros(0, dtype=bool)
+        self._free = []
+        self._top = 0    # one past the highest slot ever handed out
+        self._grow(capacity)
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.active[:self._top]))
+
+    def _grow(self, capacity: int) -> None:
+        old = self.capacity
+        extra = capacity - old
+
+        def extend(arr, fill):
+            tail = np.full((extra,) + arr.shape[1:], fill, dtype=arr.dtype)
+            return np.concatenate([arr, tail])
+
+        self.pos    = extend(self.pos, 0.0)
+        self.prev_pos = extend(self.prev_pos, 0.0)
+        self.draw_pos = extend(self.draw_pos, 0.0)
+        self.vel    = extend(self.vel, 0.0)
+        self.rot    = extend(self.rot, 0.0)
+        self.prev_rot = extend(self.prev_rot, 0.0)
+        self.draw_rot = extend(self.draw_rot, 0.0)
+        self.spin   = extend(self.spin, 0.0)
+        self.life   = extend(self.life, np.inf)
+        self.drag   = extend(self.drag, 1.0)
+        self.wrap_x = extend(self.wrap_x, True)
+        self.kind   = extend(self.kind, -1)
+        self.active = extend(self.active, False)
+        # Hand out low slots first to keep the live range dense
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    # ── Slots ─────────────────────────────────────────────────
+    def alloc(self, kind: int, x: float, y: float, vx: float = 0.0, vy: float = 0.0,
+              rot: float = 0.0, spin: float = 0.0, life: float = math.inf,
+              drag: float = 1.0, wrap_x: bool = True) -> int:
+        if not self._free:
+            self._grow(self.capacity * 2)
+        slot = self._free.pop()
+        self.pos[slot] = self.prev_pos[slot] = self.draw_pos[slot] = (x, y)
+        self.vel[slot] = (vx, vy)
+        self.rot[slot] = self.prev_rot[slot] = self.draw_rot[slot] = rot
+        self.spin[slot] = spin
+        self.life[slot] = life
+        self.drag[slot] = drag
+        self.wrap_x[slot] = wrap_x
+        self.kind[slot] = kind
+        self.active[slot] = True
+        if slot >= self._top:
+            self._top = slot + 1
+        return slot
+
+    def free(self, slot: int) -> None:
+        """Return a slot; its row is reset so integrate() leaves it untouched."""
+        if not self.active[slot]:
+            return
+        self.active[slot] = False
+        self.kind[slot] = -1
+        self.vel[slot] = 0.0
+        self.spin[slot] = 0.0
+        self.life[slot] = np.inf
+        self.drag[slot] = 1.0
+        self.wrap_x[slot] = True
+        self._free.append(slot)
+        if slot == self._top - 1:
+            while self._top and not self.active[self._top - 1]:
+                self._top -= 1
+
+    # ── Integration ───────────────────────────────────────────
+    def integrate(self, dt: float) -> None:
+        """Move, wrap, spin, drag and age every live body in one pass.
+
+        Free rows carry zero velocity, zero spin and infinite life, so they
+        are swept along without masking.
+        """
+        n = self._top
+        if n == 0:
+            return
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        pos += vel * dt
+        np.mod(pos[:, 0], self.width, out=pos[:, 0], where=self.wrap_x[:n])
+        np.mod(pos[:, 1], self.height, out=pos[:, 1])
+        vel *= self.drag[:n, None] ** (dt * FPS)
+        rot = self.rot[:n]
+        rot += self.spin[:n] * dt
+        life = self.life[:n]
+        life -= dt
+        # Until interpolate() says otherwise, draw where the bodies are
+        self.draw_pos[:n] = pos
+        self.draw_rot[:n] = rot
+
+    def integrate_slot(self, slot: int, dt: float) -> None:
+        """Single-body version of integrate() for objects updated on their own."""
+        pos = self.pos[slot]
+        vel = self.vel[slot]
+        pos += vel * dt
+        if self.wrap_x[slot]:
+            pos[0] %= self.width
+        pos[1] %= self.height
+        vel *= self.drag[slot] ** (dt * FPS)
+        self.rot[slot] += self.spin[slot] * dt
+        self.life[slot] -= dt
+        self.draw_pos[slot] = pos
+        self.draw_rot[slot] = self.rot[slot]
+
+    # ── Interpolation ─────────────────────────────────────────
+    def snapshot(self) -> None:
+        """Remember the current state as the start of the next tick."""
+        n = self._top
+        self.prev_pos[:n] = self.pos[:n]
+        self.prev_rot[:n] = self.rot[:n]
+
+    def interpolate(self, alpha: float) -> None:
+        """Fill draw_pos/draw_rot at `alpha` of the way from prev to current.
+
+        Movement is blended along the shortest path on the torus, so a body
+        that wrapped this tick slides off one edge rather than streaking
+        across the screen.
+        """
+        n = self._top
+        if n == 0:
+            return
+        bounds = np.array([self.width, self.height], dtype=float)
+        prev = self.prev_pos[:n]
+        delta = self.pos[:n] - prev
+        delta -= np.round(delta / bounds) * bounds
+        np.multiply(delta, alpha, out=delta)
+        np.add(prev, delta, out=self.draw_pos[:n])
+        prev_rot = self.prev_rot[:n]
+        np.add(prev_rot, (self.rot[:n] - prev_rot) * alpha, out=self.draw_rot[:n])
+
+    def has_expired(self) -> bool:
+        """True if any live body's lifetime has run out."""
+        return bool((self.life[:self._top] <= 0).any())
+
+
+DEFAULT_STORE = BodyStore()
+
+
+class Body:
+    """Base for game objects whose kinematics live in a BodyStore slot."""
+
+    __slots__ = ("_store", "_slot")
+
+    KIND = -1
+
+    def __init__(self, store, x: float, y: float, vx: float = 0.0, vy: float = 0.0,
+                 **fields) -> None:
+        self._store = store if store is not None else DEFAULT_STORE
+        self._slot = self._store.alloc(self.KIND, x, y, vx, vy, **fields)
+
+    def release(self) -> None:
+        """Give the slot back to the store. The body must not be used afterwards."""
+        if self._slot >= 0:
+            self._store.free(self._slot)
+            self._slot = -1
+
+    def __del__(self) -> None:
+        try:
+            self.release()
+        except Exception:
+            pass
+
+    @property
+    def pos(self) -> pygame.Vector2:
+        p = self._store.pos[self._slot]
+        return pygame.Vector2(float(p[0]), float(p[1]))
+
+    @pos.setter
+    def pos(self, value) -> None:
+        # Direct placement is a teleport: nothing to interpolate from
+        store, slot = self._store, self._slot
+        store.pos[slot] = store.prev_pos[slot] = store.draw_pos[slot] = (value[0], value[1])
+
+    @property
+    def x(self) -> float:
+        """Current x as a plain float; no Vector2 is built."""
+        return self._store.pos.item(self._slot, 0)
+
+    @property
+    def y(self) -> float:
+        return self._store.pos.item(self._slot, 1)
+
+    @property
+    def vel(self) -> pygame.Vector2:
+        v = self._store.vel[self._slot]
+        return pygame.Vector2(float(v[0]), float(v[1]))
+
+    @vel.setter
+    def vel(self, value) -> None:
+        self._store.vel[self._slot] = (value[0], value[1])
+
+    @property
+    def draw_pos(self) -> tuple:
+        """Interpolated (x, y) as of the last BodyStore.interpolate()."""
+        p = self._store.draw_pos[self._slot]
+        return float(p[0]), float(p[1])
+
+    @property
+    def draw_rot(self) -> float:
+        return float(self._store.draw_rot[self._slot])
@@ -0,0 +1,139 @@
+"""
+Wrap-aware spatial hash broadphase.
+
+The playfield is a torus (see fastmath.wrap_inplace), so the grid tiles it
+exactly and cell coordinates wrap: an object straddling an edge is filed
+in every cell its bounding box touches on both sides of the seam.
+
+The grid is kept in sync incrementally — an object is only re-filed when
+the span of cells it covers changes — and queries return candidates only;
+the caller does the exact circle test.
+"""
+from settings import BROADPHASE_CELL_SIZE
+
+
+class SpatialHash:
+    """Uniform grid over a wrapped width × height field."""
+
+    def __init__(self, width: int, height: int, cell_size: float = BROADPHASE_CELL_SIZE) -> None:
+        self.width = width
+        self.height = height
+        # Whole number of cells so the grid tiles the torus without a seam
+        self.cols = max(1, int(width // cell_size))
+        self.rows = max(1, int(height // cell_size))
+        self._cell_w = width / self.cols
+        self._cell_h = height / self.rows
+        self._cells = {}    # (cx, cy) -> {obj: None}, insertion-ordered
+        self._spans = {}    # obj -> [span, stamp]
+        self._stamp = 0
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __contains__(self, obj) -> bool:
+        return obj in self._spans
+
+    # ── Cell math ─────────────────────────────────────────────
+    def _span(self, x: float, y: float, radius: float) -> tuple:
+        cw, ch = self._cell_w, self._cell_h
+        return (
+            int((x - radius) // cw), int((x + radius) // cw),
+            int((y - radius) // ch), int((y + radius) // ch),
+        )
+
+    def _cells_of(self, span: tuple) -> list:
+        x0, x1, y0, y1 = span
+        cols, rows = self.cols, self.rows
+        if x1 - x0 + 1 >= cols:
+            xs = range(cols)
+        else:
+            xs = [cx % cols for cx in range(x0, x1 + 1)]
+        if y1 - y0 + 1 >= rows:
+            ys = range(rows)
+        else:
+            ys = [cy % rows for cy in range(y0, y1 + 1)]
+        return [(cx, cy) for cx in xs for cy in ys]
+
+    # ── Maintenance ───────────────────────────────────────────
+    def insert(self, obj) -> None:
+        """File obj (needs .pos and .radius) under every cell it touches."""
+        pos = obj.pos
+        span = self._span(pos[0], pos[1], obj.radius)
+        self._spans[obj] = [span, self._stamp]
+        cells = self._cells
+        for key in self._cells_of(span):
+            bucket = cells.get(key)
+            if bucket is None:
+                bucket = cells[key] = {}
+            bucket[obj] = None
+
+    def remove(self, obj) -> None:
+        entry = self._spans.pop(obj, None)
+        if entry is None:
+            return
+        cells = self._cells
+        for key in self._cells_of(entry[0]):
+            bucket = cells.get(key)
+            if bucket is not None:
+                bucket.pop(obj, None)
+                if not bucket:
+                    del cells[key]
+
+    def sync(self, *groups) -> None:
+        """Bring the grid in line with the given object lists.
+
+        Objects whose cell span is unchanged cost one tuple compare; new
+        objects are inserted and objects no longer present are dropped.
+        """
+        self._stamp += 1
+        stamp = self._stamp
+        spans = self._spans
+        seen = 0
+        for group in groups:
+            for obj in group:
+                seen += 1
+                entry = spans.get(obj)
+                if entry is None:
+                    self.insert(obj)
+                    continue
+                pos = obj.pos
+                span = self._span(pos[0], pos[1], obj.radius)
+                if span != entry[0]:
+                    self.remove(obj)
+                    self.insert(obj)
+                else:
+                    entry[1] = stamp
+        if seen != len(spans):
+            for obj in [o for o, e in spans.items() if e[1] != stamp]:
+                self.remove(obj)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._spans.clear()
+
+    # ── Queries ───────────────────────────────────────────────
+    def query(self, pos, radius: float) -> list:
+        """Return objects sharing a cell with the circle at pos, no duplicates."""
+        return self.query_xy(pos[0], pos[1], radius)
+
+    def query_xy(self, x: float, y: float, radius: float) -> list:
+        """query() for a circle given as plain coordinates."""
+        cells = self._cells
+        keys = self._cells_of(self._span(x, y, radius))
+        if len(keys) == 1:
+            bucket = cells.get(keys[0])
+            return list(bucket) if bucket else []
+        found = {}
+        for key in keys:
+            bucket = cells.get(key)
+            if bucket:
+                found.update(bucket)
+        return list(found)
+
+    def candidate_pairs(self, objects, radius: float) -> list:
+        """Return (obj, target) pairs whose cells overlap, for each obj."""
+        pairs = []
+        for obj in objects:
+            for target in self.query(obj.pos, radius):
+                pairs.append((obj, target))
+        return pairs
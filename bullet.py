@@ -1,42 +1,131 @@
 import math
 import pygame
-from settings import (
-    SCREEN_WIDTH, SCREEN_HEIGHT,
-    BULLET_SPEED, BULLET_LIFETIME,
-    WHITE,
-)
-from utils import wrap_position
+from settings import BULLET_SPEED, BULLET_LIFETIME, WHITE
+from bodies import Body, KIND_BULLET
 
+# Unit heading vectors at 0.1° steps; angle 0 = up (−Y)
+_DIRECTION_STEPS = 3600
+_DIRECTIONS = [
+    (math.sin(2 * math.pi * i / _DIRECTION_STEPS), -math.cos(2 * math.pi * i / _DIRECTION_STEPS))
+    for i in range(_DIRECTION_STEPS)
+]
 
-class Bullet:
+
+def heading(angle: float) -> tuple:
+    """Unit (dx, dy) for a heading in degrees, from the precomputed table."""
+    return _DIRECTIONS[int(round(angle * (_DIRECTION_STEPS / 360.0))) % _DIRECTION_STEPS]
+
+
+class Bullet(Body):
     """A projectile fired by the player ship or a saucer."""
 
+    __slots__ = ("is_player_bullet", "_index")
+
+    KIND = KIND_BULLET
+
     def __init__(
         self,
         pos: pygame.Vector2,
         angle: float,
         ship_vel: pygame.Vector2,
         is_player_bullet: bool = True,
+        store=None,
     ) -> None:
-        self.pos = pygame.Vector2(pos)
         self.is_player_bullet = is_player_bullet
-        self.expired = False
-        self._lifetime = BULLET_LIFETIME
+        self._index = -1   # position in the owning BulletPool, if any
 
-        rad = math.radians(angle)
-        direction = pygame.Vector2(math.sin(rad), -math.cos(rad))
+        dx, dy = heading(angle)
+        vx, vy = dx * BULLET_SPEED, dy * BULLET_SPEED
         # Player bullets inherit ship velocity
         if is_player_bullet:
-            self.vel = direction * BULLET_SPEED + ship_vel
-        else:
-            self.vel = direction * BULLET_SPEED
+            vx += ship_vel[0]
+            vy += ship_vel[1]
+        super().__init__(store, pos[0], pos[1], vx, vy, life=BULLET_LIFETIME)
+
+    @property
+    def _lifetime(self) -> float:
+        return float(self._store.life[self._slot])
+
+    @_lifetime.setter
+    def _lifetime(self, value: float) -> None:
+        self._store.life[self._slot] = value
+
+    @property
+    def expired(self) -> bool:
+        return bool(self._store.life[self._slot] <= 0)
 
     def update(self, dt: float) -> None:
-        self.pos += self.vel * dt
-        self.pos = wrap_position(self.pos, SCREEN_WIDTH, SCREEN_HEIGHT)
-        self._lifetime -= dt
-        if self._lifetime <= 0:
-            self.expired = True
-
-    def draw(self, screen: pygame.Surface) -> None:
-        pygame.draw.circle(screen, WHITE, (int(self.pos.x), int(self.pos.y)), 2)
+        """Move on its own; GameWorld moves all bullets via BodyStore.integrate."""
+        self._store.integrate_slot(self._slot, dt)
+
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        p = self._store.draw_pos[self._slot]
+        return pygame.draw.circle(screen, WHITE, (int(p[0]), int(p[1])), 2)
+
+
+class BulletPool:
+    """Live bullets for one owner, recycling Bullet objects through a free list.
+
+    `active` is unordered: despawn() swaps the last bullet into the hole,
+    so removal is O(1). Despawned bullets give their body slot back to the
+    store and wait on the free list for the next fire().
+    """
+
+    def __init__(self, is_player_bullet: bool, store) -> None:
+        self.is_player_bullet = is_player_bullet
+        self.active = []
+        self._free = []
+        self._store = store
+
+    def __len__(self) -> int:
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def fire(self, x: float, y: float, angle: float,
+             base_vx: float = 0.0, base_vy: float = 0.0) -> Bullet:
+        """Spawn a bullet at (x, y) heading `angle` degrees.
+
+        The base velocity is inherited by player bullets; saucers pass zero.
+        """
+        if self._free:
+            dx, dy = heading(angle)
+            b = self._free.pop()
+            b._slot = self._store.alloc(
+                KIND_BULLET, x, y,
+                dx * BULLET_SPEED + base_vx, dy * BULLET_SPEED + base_vy,
+                life=BULLET_LIFETIME,
+            )
+        else:
+            b = Bullet((x, y), angle, (base_vx, base_vy), self.is_player_bullet, self._store)
+        b._index = len(self.active)
+        self.active.append(b)
+        return b
+
+    def despawn(self, b: Bullet) -> None:
+        """Swap-remove b from the live list and recycle it."""
+        active = self.active
+        last = active.pop()
+        if last is not b:
+            active[b._index] = last
+            last._index = b._index
+        b._index = -1
+        b.release()
+        self._free.append(b)
+
+    def despawn_expired(self) -> None:
+        """Recycle every bullet whose lifetime has run out."""
+        life = self._store.life
+        # Walk backwards so swapped-in bullets have already been checked
+        for i in range(len(self.active) - 1, -1, -1):
+            b = self.active[i]
+            if life[b._slot] <= 0:
+                self.despawn(b)
+
+    def clear(self) -> None:
+        for b in self.active:
+            b._index = -1
+            b.release()
+            self._free.append(b)
+        self.active = []
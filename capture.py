@@ -0,0 +1,129 @@
+"""
+ProfileCapture — cProfile over a window of real frames.
+
+A capture is requested from a hotkey, from SIGUSR1 or from code. It starts
+at the next frame boundary and stops after N frames or when the current
+wave ends. Then it writes two files side by side:
+
+    data/profiles/20250101-120000-600f.prof   pstats dump (snakeviz, pstats, ...)
+    data/profiles/20250101-120000-600f.txt    top-N by cumulative and own time
+
+The signal handler only sets a flag, so it is safe to trigger at any
+moment. Nothing is profiled until the next frame() call. The loop calls
+frame(world) once per iteration, and replay.py --profile does the same
+per tick, so headless replays of real sessions can be captured too.
+"""
+import cProfile
+import io
+import os
+import pstats
+import signal
+import time
+
+from settings import CAPTURE_FRAMES, CAPTURE_TOP_N
+from world import PlaySubState
+
+PROFILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "profiles")
+UNTIL_WAVE_END = -1
+
+
+class ProfileCapture:
+    def __init__(self, out_dir: str = PROFILES_DIR, frames: int = CAPTURE_FRAMES, top_n: int = CAPTURE_TOP_N) -> None:
+        self.out_dir = out_dir
+        self.frames = frames
+        self.top_n = top_n
+        self.last_paths = None    # (prof, txt) of the most recent capture
+        self._requested = 0       # frames to capture, UNTIL_WAVE_END, or 0 for none
+        self._profile = None
+        self._target = 0
+        self._count = 0
+        self._wave = None
+        self._started = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._profile is not None
+
+    def request(self, frames: int = None) -> None:
+        """Capture the next `frames` frames (UNTIL_WAVE_END for the rest of the wave)."""
+        self._requested = self.frames if frames is None else frames
+
+    def toggle(self, frames: int = None) -> None:
+        """Hotkey action: start a capture, or stop the running one early."""
+        if self.active:
+            self._requested = 0
+            self._target = self._count
+        else:
+            self.request(frames)
+
+    def install_signal(self, signum: int = None) -> bool:
+        """Request a capture on SIGUSR1 (or signum); False where there is no such signal."""
+        if signum is None:
+            signum = getattr(signal, "SIGUSR1", None)
+        if signum is None:
+            return False
+        try:
+            signal.signal(signum, lambda *_: self.request())
+        except ValueError:     # not the main thread
+            return False
+        return True
+
+    def frame(self, world=None):
+        """Call once per frame. Returns (prof, txt) paths when a capture finishes, else None."""
+        if self._profile is not None:
+            self._count += 1
+            if self._done(world):
+                return self._finish()
+        elif self._requested:
+            self._start(world)
+        return None
+
+    def stop(self):
+        """End the running capture now; returns its (prof, txt) paths, or None if idle."""
+        self._requested = 0
+        if self._profile is None:
+            return None
+        return self._finish()
+
+    def _start(self, world) -> None:
+        self._target = self._requested
+        self._requested = 0
+        self._count = 0
+        self._wave = world.wave if world is not None else None
+        self._started = time.perf_counter()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def _done(self, world) -> bool:
+        if self._target != UNTIL_WAVE_END:
+            return self._count >= self._target
+        if world is None or self._wave is None or world.game_over:
+            return True
+        return world.wave != self._wave or world.play_sub_state == PlaySubState.WAVE_TRANSITION
+
+    def _finish(self) -> tuple:
+        profile, self._profile = self._profile, None
+        profile.disable()
+        elapsed = time.perf_counter() - self._started
+
+        os.makedirs(self.out_dir, exist_ok=True)
+        stem = os.path.join(self.out_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{self._count}f")
+        base, n = stem, 1
+        while os.path.exists(base + ".prof"):
+            n += 1
+            base = f"{stem}-{n}"
+        profile.dump_stats(base + ".prof")
+        with open(base + ".txt", "w", encoding="utf-8") as f:
+            f.write(self.summary(profile, self._count, elapsed))
+        self.last_paths = (base + ".prof", base + ".txt")
+        return self.last_paths
+
+    def summary(self, profile, frames: int, elapsed: float) -> str:
+        """Text report: capture length, then the top N by cumulative and by own time."""
+        out = io.StringIO()
+        per_frame = elapsed * 1000 / frames if frames else 0.0
+        out.write(f"{frames} frames in {elapsed:.2f} s ({per_frame:.2f} ms/frame, profiler overhead included)\n")
+        for key, title in (("cumulative", "cumulative time"), ("tottime", "own time")):
+            out.write(f"\n== top {self.top_n} by {title} ==\n")
+            pstats.Stats(profile, stream=out).sort_stats(key).print_stats(self.top_n)
+        return out.getvalue()
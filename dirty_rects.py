@@ -0,0 +1,56 @@
+"""
+DirtyRectTracker — partial screen clears and display updates.
+
+Every draw path returns the rects it touched (pygame.draw and blit already
+report them). A frame clears only the rects drawn on the previous frame,
+redraws, and then pushes the previous and current rects to
+pygame.display.update(). Moving objects therefore erase their old position
+and paint their new one, and nothing else is touched.
+
+When the dirty area reaches DIRTY_FULL_FRACTION of the screen, a partial
+update stops paying off. That happens in a busy wave or with the
+full-screen settings overlay. The tracker then fills and flips the whole
+screen instead. A draw path that returns None also forces a full frame.
+"""
+import pygame
+from settings import BLACK, DIRTY_FULL_FRACTION
+
+
+class DirtyRectTracker:
+    def __init__(self, size, full_fraction: float = DIRTY_FULL_FRACTION) -> None:
+        self._screen_rect = pygame.Rect((0, 0), size)
+        self._limit = full_fraction * size[0] * size[1]
+        self._prev = [self._screen_rect]   # first frame paints everything
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def invalidate(self) -> None:
+        """Make the next frame a full clear and flip, e.g. after a mode change."""
+        self._prev = [self._screen_rect]
+
+    def _area(self, rects) -> int:
+        return sum(r.w * r.h for r in rects)
+
+    def clear(self, screen: pygame.Surface) -> None:
+        """Erase what the previous frame drew."""
+        if self._area(self._prev) >= self._limit:
+            screen.fill(BLACK)
+            return
+        for r in self._prev:
+            screen.fill(BLACK, r)
+
+    def present(self, rects) -> None:
+        """Push this frame's rects plus last frame's to the display."""
+        screen_rect = self._screen_rect
+        if rects is None:
+            rects = [screen_rect]
+        else:
+            rects = [r.clip(screen_rect) for r in rects if r]
+        dirty = self._prev + rects
+        self._prev = rects
+        if self._area(dirty) >= self._limit:
+            pygame.display.flip()
+            self.full_frames += 1
+        else:
+            pygame.display.update(dirty)
+            self.partial_frames += 1
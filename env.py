@@ -0,0 +1,410 @@
+"""
+Reinforcement-learning environments over the headless GameWorld.
+
+    env = AsteroidsEnv(obs_mode="entities")
+    obs, info = env.reset(seed=1)
+    obs, reward, terminated, truncated, info = env.step(action)
+
+The API follows the Gymnasium conventions without importing Gymnasium.
+
+Actions are integers in range(N_ACTIONS), one per combination of the
+keyboard controls: turn left / none / right (the arrow keys in
+PlayerShip.handle_keys), thrust, fire and hyperspace (SPACE and SHIFT in
+main's _handle_playing_events). ACTIONS[a] is the PlayerInput for action
+a, and a PlayerInput is accepted as an action too. Each step holds the
+action for frame_skip ticks. Like the keyboard, fire and hyperspace are
+presses: they act on the first tick only, while thrust and turn are held.
+The reward is the score gained during the step.
+
+Observation modes:
+
+  "entities"  float32 (ENV_MAX_ENTITIES, len(ENTITY_FIELDS)). Row 0 is the
+              ship. The other rows are the nearest asteroids, saucers and
+              bullets, closest first, with positions as torus offsets from
+              the ship. Unused rows are zero.
+  "frame"     uint8 (h, w) grayscale playfield, drawn by the vector
+              renderer and smooth-scaled down to ENV_FRAME_SIZE.
+
+SubprocVecEnv steps n environments in worker processes. Observations,
+actions, rewards, flags and episode stats all live in one
+multiprocessing.shared_memory block that both sides view as NumPy arrays.
+Each step sends only a short command down a pipe, so no observation is ever
+pickled, and step() hands the trainer views of the shared arrays.
+"""
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import math
+import multiprocessing as mp
+import random
+import traceback
+from multiprocessing import shared_memory
+
+import numpy as np
+import pygame
+
+from settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, SIM_HZ, MAX_SPEED, BLACK, LINE_WIDTH,
+    ASTEROID_LARGE_RADIUS, BULLET_RADIUS,
+    ENV_FRAME_SKIP, ENV_MAX_TICKS, ENV_MAX_ENTITIES, ENV_FRAME_SIZE,
+)
+from bodies import KIND_SHIP
+from world import GameWorld, PlayerInput
+from render_backend import VectorBackend
+
+OBS_MODES = ("entities", "frame")
+
+# Columns of an entity observation row
+ENTITY_FIELDS = ("present", "kind", "hostile", "x", "y", "vx", "vy", "radius", "nose_x", "nose_y")
+
+# Action a: turn = a % 3 (none, left, right), then one bit each for thrust, fire, hyperspace
+_TURNS = (0.0, -1.0, 1.0)
+ACTIONS = tuple(
+    PlayerInput(bool(a // 3 % 2), _TURNS[a % 3], bool(a // 6 % 2), bool(a // 12))
+    for a in range(24)
+)
+N_ACTIONS = len(ACTIONS)
+
+_DT = 1.0 / SIM_HZ
+_HALF_W = SCREEN_WIDTH * 0.5
+_HALF_H = SCREEN_HEIGHT * 0.5
+# A stroke LINE_WIDTH px wide covers about this fraction of a downsampled pixel;
+# frames are brightened by its inverse so outlines stay near full white
+_FRAME_GAIN = max(1, round(SCREEN_WIDTH / (ENV_FRAME_SIZE[0] * LINE_WIDTH)))
+
+
+def encode_action(thrust: bool = False, turn: float = 0.0, fire: bool = False,
+                  hyperspace: bool = False) -> int:
+    """Index into ACTIONS for a control combination; turn is rounded to its sign."""
+    t = 0 if not turn else (1 if turn < 0 else 2)
+    return t + 3 * bool(thrust) + 6 * bool(fire) + 12 * bool(hyperspace)
+
+
+def observation_spec(obs_mode: str) -> tuple:
+    """(shape, dtype) of one observation in the given mode."""
+    if obs_mode == "entities":
+        return (ENV_MAX_ENTITIES, len(ENTITY_FIELDS)), np.float32
+    if obs_mode == "frame":
+        return (ENV_FRAME_SIZE[1], ENV_FRAME_SIZE[0]), np.uint8
+    raise ValueError(f"unknown obs_mode {obs_mode!r}; expected one of {OBS_MODES}")
+
+
+# ── Single environment ────────────────────────────────────────
+class AsteroidsEnv:
+    """One game behind reset(seed) / step(action).
+
+    out, if given, is an array of observation_spec(obs_mode) that every
+    observation is written into and returned as; SubprocVecEnv passes rows
+    of its shared block. Otherwise the env owns a buffer, so copy an
+    observation to keep it past the next step.
+    """
+
+    def __init__(self, obs_mode: str = "entities", frame_skip: int = ENV_FRAME_SKIP,
+                 max_ticks: int = ENV_MAX_TICKS, out: np.ndarray = None) -> None:
+        shape, dtype = observation_spec(obs_mode)
+        if frame_skip < 1:
+            raise ValueError("frame_skip must be at least 1")
+        self.obs_mode = obs_mode
+        self.frame_skip = frame_skip
+        self.max_ticks = max_ticks
+        self.observation_shape = shape
+        self.observation_dtype = dtype
+        self.n_actions = N_ACTIONS
+        self._obs = out if out is not None else np.zeros(shape, dtype)
+        self._seeder = random.Random()
+        self._canvas = None
+        self.world = None
+
+    def reset(self, seed: int = None) -> tuple:
+        """Start a new game; returns (obs, info).
+
+        A seed fixes this game and the seeds of the games that follow it
+        through reset() with no seed.
+        """
+        if seed is not None:
+            self._seeder.seed(seed)
+            self.world = GameWorld(seed=seed)
+        else:
+            self.world = GameWorld(rng=self._seeder)
+        self._observe()
+        return self._obs, self._info()
+
+    def step(self, action) -> tuple:
+        """Play one action; returns (obs, reward, terminated, truncated, info)."""
+        world = self.world
+        if world is None:
+            raise RuntimeError("call reset() before step()")
+        inputs = action if isinstance(action, PlayerInput) else ACTIONS[action]
+        held = PlayerInput(inputs.thrust, inputs.turn)
+        start = world.score
+        world.step(inputs, _DT)
+        for _ in range(self.frame_skip - 1):
+            if world.game_over:
+                break
+            world.step(held, _DT)
+        world.drain_events()
+        self._observe()
+        truncated = not world.game_over and world.ticks >= self.max_ticks
+        return self._obs, float(world.score - start), world.game_over, truncated, self._info()
+
+    def _info(self) -> dict:
+        w = self.world
+        return {"score": w.score, "lives": w.lives, "wave": w.wave, "ticks": w.ticks}
+
+    def _observe(self) -> None:
+        if self.obs_mode == "entities":
+            self._observe_entities(self._obs)
+        else:
+            self._observe_frame(self._obs)
+
+    # ── Observations ──────────────────────────────────────────
+    def _observe_entities(self, out: np.ndarray) -> None:
+        world = self.world
+        out[:] = 0.0
+        ship = world.ship
+        sx, sy = ship.x, ship.y
+        row = out[0]
+        row[0] = ship.alive
+        row[1] = KIND_SHIP
+        row[3] = (sx - _HALF_W) / _HALF_W
+        row[4] = (sy - _HALF_H) / _HALF_H
+        vx, vy = ship.vel
+        row[5] = vx / MAX_SPEED
+        row[6] = vy / MAX_SPEED
+        row[7] = ship.RADIUS / ASTEROID_LARGE_RADIUS
+        heading = math.radians(ship.angle)
+        row[8] = math.sin(heading)      # angle 0 points the nose up (−Y)
+        row[9] = -math.cos(heading)
+
+        bodies = world.asteroids + world.saucers
+        targets = len(bodies)
+        bodies += world.player_bullets.active
+        friendly = len(bodies) - targets
+        bodies += world.enemy_bullets.active
+        n = len(bodies)
+        if n == 0:
+            return
+        store = world.bodies
+        slots = np.fromiter((b._slot for b in bodies), np.intp, n)
+        radius = np.full(n, BULLET_RADIUS, np.float64)
+        radius[:targets] = [b.radius for b in bodies[:targets]]
+        is_hostile = np.ones(n, np.float32)
+        is_hostile[targets:targets + friendly] = 0.0
+
+        d = store.pos[slots] - (sx, sy)
+        dx, dy = d[:, 0], d[:, 1]
+        dx += _HALF_W
+        dx %= SCREEN_WIDTH
+        dx -= _HALF_W
+        dy += _HALF_H
+        dy %= SCREEN_HEIGHT
+        dy -= _HALF_H
+        order = np.argsort(dx * dx + dy * dy, kind="stable")[:len(out) - 1]
+        vel = store.vel[slots[order]]
+        rows = out[1:1 + len(order)]
+        rows[:, 0] = 1.0
+        rows[:, 1] = store.kind[slots[order]]
+        rows[:, 2] = is_hostile[order]
+        rows[:, 3] = dx[order] / _HALF_W
+        rows[:, 4] = dy[order] / _HALF_H
+        rows[:, 5] = vel[:, 0] / MAX_SPEED
+        rows[:, 6] = vel[:, 1] / MAX_SPEED
+        rows[:, 7] = radius[order] / ASTEROID_LARGE_RADIUS
+
+    def _observe_frame(self, out: np.ndarray) -> None:
+        if self._canvas is None:
+            self._canvas = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), depth=32)
+            self._small = pygame.Surface(ENV_FRAME_SIZE, depth=32)
+            self._backend = VectorBackend()
+            self._gray = np.zeros(out.shape, np.uint16)
+        world = self.world
+        world.bodies.interpolate(1.0)
+        self._canvas.fill(BLACK)
+        self._backend.draw(self._canvas, world)
+        pygame.transform.smoothscale(self._canvas, ENV_FRAME_SIZE, self._small)
+        red = pygame.surfarray.pixels_red(self._small)   # outlines are white, so one channel is the gray
+        np.minimum(red.T * np.uint16(_FRAME_GAIN), 255, out=self._gray)
+        del red
+        out[:] = self._gray
+
+
+# ── Vectorized environment ────────────────────────────────────
+def _layout(n: int, obs_shape: tuple, obs_dtype) -> tuple:
+    """Fields of the shared block as (name, dtype, shape, offset), and its size."""
+    fields = [
+        ("obs", obs_dtype, (n,) + tuple(obs_shape)),
+        ("action", np.int64, (n,)),
+        ("reward", np.float32, (n,)),
+        ("terminated", np.bool_, (n,)),
+        ("truncated", np.bool_, (n,)),
+        ("score", np.int64, (n,)),
+        ("lives", np.int64, (n,)),
+        ("wave", np.int64, (n,)),
+        ("ticks", np.int64, (n,)),
+    ]
+    layout, offset = [], 0
+    for name, dtype, shape in fields:
+        offset = (offset + 63) & ~63    # each field starts on its own cache line
+        layout.append((name, np.dtype(dtype).str, shape, offset))
+        offset += int(np.prod(shape)) * np.dtype(dtype).itemsize
+    return layout, max(offset, 1)
+
+
+def _views(buf, layout) -> dict:
+    return {name: np.ndarray(shape, dtype, buf, offset) for name, dtype, shape, offset in layout}
+
+
+def _record(arrays: dict, i: int, info: dict) -> None:
+    for key in ("score", "lives", "wave", "ticks"):
+        arrays[key][i] = info[key]
+
+
+def _worker(conn, shm_name: str, layout, lo: int, hi: int, obs_mode: str,
+            frame_skip: int, max_ticks: int) -> None:
+    """Serve the envs lo..hi-1, reading actions from and writing results to the shared block."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    arrays = _views(shm.buf, layout)
+    envs = [AsteroidsEnv(obs_mode, frame_skip, max_ticks, out=arrays["obs"][i])
+            for i in range(lo, hi)]
+    try:
+        while True:
+            cmd, arg = conn.recv()
+            if cmd == "close":
+                break
+            try:
+                if cmd == "reset":
+                    for i, env in enumerate(envs, lo):
+                        _, info = env.reset(None if arg is None else arg[i])
+                        arrays["reward"][i] = 0.0
+                        arrays["terminated"][i] = arrays["truncated"][i] = False
+                        _record(arrays, i, info)
+                elif cmd == "step":
+                    actions = arrays["action"]
+                    for i, env in enumerate(envs, lo):
+                        _, reward, terminated, truncated, info = env.step(int(actions[i]))
+                        arrays["reward"][i] = reward
+                        arrays["terminated"][i] = terminated
+                        arrays["truncated"][i] = truncated
+                        _record(arrays, i, info)
+                        if terminated or truncated:
+                            env.reset()
+                else:
+                    raise ValueError(f"unknown command {cmd!r}")
+                conn.send(None)
+            except Exception:
+                conn.send(traceback.format_exc())
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        del envs, arrays
+        shm.close()
+        conn.close()
+
+
+class SubprocVecEnv:
+    """n AsteroidsEnvs stepped in worker processes, exchanging arrays through shared memory.
+
+    step(actions) returns (obs, reward, terminated, truncated, info). Each is
+    a view of the shared block, so it is overwritten by the next step; copy
+    what you keep. info maps score, lives, wave and ticks to arrays. An env
+    that finishes resets itself within the same step: its obs is the first
+    observation of the next game, while its reward, flags and info still
+    describe the game that just ended.
+    """
+
+    def __init__(self, n: int, obs_mode: str = "entities", workers: int = None,
+                 frame_skip: int = ENV_FRAME_SKIP, max_ticks: int = ENV_MAX_TICKS) -> None:
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        self.n = n
+        self.obs_mode = obs_mode
+        self.observation_shape, self.observation_dtype = observation_spec(obs_mode)
+        self.n_actions = N_ACTIONS
+        workers = max(1, min(n, workers or os.cpu_count() or 1))
+        layout, size = _layout(n, self.observation_shape, self.observation_dtype)
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._arrays = _views(self._shm.buf, layout)
+        self._conns, self._procs = [], []
+        self._waiting = False
+        bounds = np.linspace(0, n, workers + 1).astype(int)
+        ctx = mp.get_context()
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(
+                target=_worker, daemon=True,
+                args=(child, self._shm.name, layout, int(lo), int(hi), obs_mode, frame_skip, max_ticks),
+            )
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+
+    def reset(self, seed: int = None) -> tuple:
+        """Reset every env; env i gets seed + i. Returns (obs, info)."""
+        seeds = None if seed is None else [seed + i for i in range(self.n)]
+        self._call("reset", seeds)
+        return self._arrays["obs"], self._info()
+
+    def step_async(self, actions) -> None:
+        """Start a step; the trainer may work until step_wait()."""
+        self._arrays["action"][:] = actions
+        for conn in self._conns:
+            conn.send(("step", None))
+        self._waiting = True
+
+    def step_wait(self) -> tuple:
+        self._gather()
+        a = self._arrays
+        return a["obs"], a["reward"], a["terminated"], a["truncated"], self._info()
+
+    def step(self, actions) -> tuple:
+        self.step_async(actions)
+        return self.step_wait()
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        if self._waiting:
+            self._gather()
+        for conn in self._conns:
+            try:
+                conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self._procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        for conn in self._conns:
+            conn.close()
+        self._arrays = None
+        try:
+            self._shm.close()
+        except BufferError:
+            pass    # the trainer still holds views; the mapping goes when they do
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _info(self) -> dict:
+        a = self._arrays
+        return {key: a[key] for key in ("score", "lives", "wave", "ticks")}
+
+    def _call(self, cmd: str, arg) -> None:
+        for conn in self._conns:
+            conn.send((cmd, arg))
+        self._waiting = True
+        self._gather()
+
+    def _gather(self) -> None:
+        errors = [conn.recv() for conn in self._conns]
+        self._waiting = False
+        for error in errors:
+            if error is not None:
+                raise RuntimeError(f"env worker failed:\n{error}")
@@ -0,0 +1,132 @@
+"""
+In-place and batched math for the per-tick hot paths.
+
+The helpers in utils.py return fresh Vector2s and lists. That is fine for
+setup code, but it adds up when they run per body per tick. The functions
+here avoid that. They take plain floats, mutate what they are given, or
+write into a buffer the caller owns. Distances are compared squared, so no
+sqrt is taken. The *_array variants work the same way over (N, 2) position
+arrays such as BodyStore.pos, and they work in place unless given `out`.
+
+utils.py keeps its original signatures, mostly as thin wrappers over
+these. rotate_points stays a single comprehension: it returns a fresh list
+anyway, so rotate_into only pays off for a caller that keeps its buffer.
+"""
+import math
+
+import numpy as np
+
+
+# ── Scalars ───────────────────────────────────────────────────
+def wrap_inplace(v, width: float, height: float):
+    """Wrap a Vector2 (anything with settable .x/.y) onto the torus in place; returns v."""
+    v.x %= width
+    v.y %= height
+    return v
+
+
+def dist_sq(ax: float, ay: float, bx: float, by: float) -> float:
+    dx = ax - bx
+    dy = ay - by
+    return dx * dx + dy * dy
+
+
+def circles_overlap(ax: float, ay: float, ra: float, bx: float, by: float, rb: float) -> bool:
+    """True if two circles overlap; touching is not overlapping."""
+    dx = ax - bx
+    dy = ay - by
+    reach = ra + rb
+    return dx * dx + dy * dy < reach * reach
+
+
+def torus_delta(a: float, b: float, size: float) -> float:
+    """Shortest signed offset from a to b along one wrapped axis, in [-size/2, size/2)."""
+    return (b - a + size * 0.5) % size - size * 0.5
+
+
+def torus_dist_sq(ax: float, ay: float, bx: float, by: float, width: float, height: float) -> float:
+    """Squared distance between two points on the wrapped playfield."""
+    dx = abs(ax - bx) % width
+    if dx > width - dx:
+        dx = width - dx
+    dy = abs(ay - by) % height
+    if dy > height - dy:
+        dy = height - dy
+    return dx * dx + dy * dy
+
+
+def circles_overlap_wrapped(ax: float, ay: float, ra: float, bx: float, by: float, rb: float,
+                            width: float, height: float) -> bool:
+    """circles_overlap on the wrapped playfield."""
+    reach = ra + rb
+    return torus_dist_sq(ax, ay, bx, by, width, height) < reach * reach
+
+
+def rotate_into(points, angle_degrees: float, out: list) -> list:
+    """Rotate (x, y) points about the origin into out, a list of [x, y] lists.
+
+    out must hold at least len(points) rows; they are overwritten in order
+    and any extra rows are left alone. Returns out.
+    """
+    angle = math.radians(angle_degrees)
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    for row, (x, y) in zip(out, points):
+        row[0] = x * cos_a - y * sin_a
+        row[1] = x * sin_a + y * cos_a
+    return out
+
+
+# ── Batches (NumPy) ───────────────────────────────────────────
+def wrap_array(pos: np.ndarray, width: float, height: float, out: np.ndarray = None) -> np.ndarray:
+    """Wrap (N, 2) positions onto the torus, in place unless out is given."""
+    if out is None:
+        out = pos
+    np.mod(pos[..., 0], width, out=out[..., 0])
+    np.mod(pos[..., 1], height, out=out[..., 1])
+    return out
+
+
+def torus_delta_array(a: np.ndarray, b, width: float, height: float,
+                      out: np.ndarray = None) -> np.ndarray:
+    """Shortest offsets from positions a to b (one point or N), each axis in [-size/2, size/2).
+
+    Written into out, or into a new array; a is never modified.
+    """
+    d = np.subtract(b, a, out=out)
+    for axis, size in ((0, width), (1, height)):
+        col = d[..., axis]
+        col += size * 0.5
+        np.mod(col, size, out=col)
+        col -= size * 0.5
+    return d
+
+
+def torus_dist_sq_array(a: np.ndarray, b, width: float, height: float,
+                        scratch: np.ndarray = None) -> np.ndarray:
+    """Squared wrapped distances from each of a to b; scratch, if given, is a's shape."""
+    d = torus_delta_array(a, b, width, height, out=scratch)
+    np.multiply(d, d, out=d)
+    return d.sum(axis=-1)
+
+
+def circles_overlap_array(a: np.ndarray, ra, b, rb, width: float, height: float,
+                          scratch: np.ndarray = None) -> np.ndarray:
+    """Bool mask of circles at a (radii ra) overlapping circles at b (radii rb) on the torus."""
+    reach = np.add(ra, rb)
+    return torus_dist_sq_array(a, b, width, height, scratch) < reach * reach
+
+
+def rotate_array(points: np.ndarray, angle_degrees: float, out: np.ndarray = None) -> np.ndarray:
+    """Rotate (N, 2) points about the origin, into out (may be points) or a new array."""
+    angle = math.radians(angle_degrees)
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    x = points[:, 0].copy()     # survives out being points
+    if out is None:
+        out = np.empty_like(points, dtype=float)
+    np.multiply(points[:, 1], -sin_a, out=out[:, 0])
+    out[:, 0] += x * cos_a
+    np.multiply(points[:, 1], cos_a, out=out[:, 1])
+    out[:, 1] += x * sin_a
+    return out
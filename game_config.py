@@ -1,6 +1,7 @@
 import json
 import os
 import pygame
+from settings import FPS, SIM_HZ, RENDERER, SPRITE_CACHE_MB, DIRTY_RECTS, QUALITY_ADAPTIVE, IDLE_THROTTLE
 
 _CONFIG_PATH = os.path.join(os.path.dirname(__file__), "data", "user_settings.json")
 
@@ -17,6 +18,19 @@ DEFAULT_SETTINGS = {
         "fire": "space",
         "pause": "p",
     },
+    "video": {
+        "sim_hz": SIM_HZ,     # fixed simulation rate
+        "max_fps": FPS,       # render frame cap; may differ from sim_hz
+        "renderer": RENDERER, # "vector" or "sprite"
+        "sprite_cache_mb": SPRITE_CACHE_MB,
+        "dirty_rects": DIRTY_RECTS,   # partial display updates for fill-rate-bound machines
+        "adaptive_quality": QUALITY_ADAPTIVE,   # drop cosmetic detail when over the frame budget
+        "idle_throttle": IDLE_THROTTLE,         # menus and pause redraw only on input or blink
+    },
+    "debug": {
+        "record_inputs": False,       # write data/recordings/*.rec for replay.py
+        "telemetry": False,           # write per-frame data/telemetry/*.jsonl for telemetry.py
+    },
 }
 
 
@@ -34,6 +48,8 @@ class SettingsManager:
             merged = json.loads(json.dumps(DEFAULT_SETTINGS))
             merged["audio"].update(data.get("audio", {}))
             merged["controls"].update(data.get("controls", {}))
+            merged["video"].update(data.get("video", {}))
+            merged["debug"].update(data.get("debug", {}))
             return merged
         except Exception:
             return json.loads(json.dumps(DEFAULT_SETTINGS))
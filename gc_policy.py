@@ -0,0 +1,144 @@
+"""
+GcPolicy — keep cyclic garbage collection out of live waves.
+
+The collector runs whenever enough container objects have been allocated.
+The hot loop allocates lists, tuples and entity objects every frame, so
+collections, and the occasional full gen-2 pass, land at random moments
+mid-wave. This policy moves that work to moments where a pause is
+invisible:
+
+  * freeze() collects once and then moves every object alive after startup
+    and asset load into the permanent generation. Later collections no
+    longer traverse them.
+  * While play is hot (PLAYING and the world's sub-state is ACTIVE), the
+    automatic thresholds are raised to GC_ACTIVE_THRESHOLDS. A threshold
+    of 0 disables automatic collection outright.
+  * On entering a cheap window (wave transition, respawn delay, pause,
+    game over, menus), the normal thresholds come back and one explicit
+    full collection runs straight away.
+
+Every collection is timed through gc.callbacks into running count, total
+and max per category, so a long session costs no more memory than a short
+one. stats() reports the collections that still happened during hot play
+and the work moved into cheap windows, which is the pause time kept out of
+waves.
+"""
+import gc
+import time
+
+from settings import GC_ACTIVE_THRESHOLDS
+
+
+class PauseStats:
+    """Running count, total and max of one category of collection pauses."""
+
+    __slots__ = ("count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class GcPolicy:
+    def __init__(self, active_thresholds: tuple = GC_ACTIVE_THRESHOLDS) -> None:
+        self.active_thresholds = active_thresholds
+        self._normal = gc.get_threshold()
+        self._was_enabled = gc.isenabled()
+        self._hot = False
+        self._explicit = False
+        self._t0 = 0
+        self.hot_pauses = PauseStats()        # automatic collections during hot play
+        self.cold_pauses = PauseStats()       # automatic collections elsewhere
+        self.deferred_pauses = PauseStats()   # explicit collections in cheap windows
+        self.frozen = 0
+        gc.callbacks.append(self._on_gc)
+
+    @property
+    def hot(self) -> bool:
+        return self._hot
+
+    def close(self) -> None:
+        """Restore the collector's normal settings and stop timing."""
+        self.update(False, collect=False)
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._t0 = time.perf_counter_ns()
+            return
+        if self._explicit:
+            return
+        ms = (time.perf_counter_ns() - self._t0) / 1e6
+        (self.hot_pauses if self._hot else self.cold_pauses).add(ms)
+
+    def freeze(self) -> int:
+        """Collect, then exempt every live object from future collections.
+
+        Call after startup and asset loading. Anything frozen by an earlier
+        call is thawed first, so garbage from a finished game is still found.
+        """
+        gc.unfreeze()
+        self.collect()
+        gc.freeze()
+        self.frozen = gc.get_freeze_count()
+        return self.frozen
+
+    def collect(self) -> float:
+        """One full collection, timed as deferred work; returns its ms."""
+        self._explicit = True
+        t0 = time.perf_counter_ns()
+        try:
+            gc.collect()
+        finally:
+            self._explicit = False
+        ms = (time.perf_counter_ns() - t0) / 1e6
+        self.deferred_pauses.add(ms)
+        return ms
+
+    def update(self, hot: bool, collect: bool = True) -> None:
+        """Call once per frame with whether play is hot; switches policy on changes."""
+        if hot == self._hot:
+            return
+        self._hot = hot
+        if hot:
+            self._normal = gc.get_threshold()
+            self._was_enabled = gc.isenabled()
+            if self.active_thresholds[0] == 0:
+                gc.disable()
+            else:
+                gc.set_threshold(*self.active_thresholds)
+        else:
+            gc.set_threshold(*self._normal)
+            if self._was_enabled:
+                gc.enable()
+            if collect:
+                self.collect()
+
+    def stats(self) -> dict:
+        return {
+            "hot": self.hot_pauses.as_dict(),
+            "cold": self.cold_pauses.as_dict(),
+            "deferred": self.deferred_pauses.as_dict(),
+            "frozen": self.frozen,
+        }
+
+    def summary(self) -> str:
+        s = self.stats()
+        return (f"gc: {s['hot']['count']} in play (max {s['hot']['max_ms']:.2f} ms), "
+                f"{s['deferred']['count']} deferred ({s['deferred']['total_ms']:.1f} ms moved), "
+                f"{s['frozen']} frozen")
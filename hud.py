@@ -1,7 +1,8 @@
 import math
+import time
 import pygame
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, LINE_WIDTH, MAX_LIVES
-from utils import rotate_points
+from text_cache import get_font, render_text, digit_atlas
 
 
 # Mini ship silhouette for life indicators (scaled down)
@@ -13,41 +14,69 @@ _MINI_SHIP = [
 ]
 
 
-def _draw_mini_ship(screen: pygame.Surface, cx: float, cy: float) -> None:
+def _draw_mini_ship(screen: pygame.Surface, cx: float, cy: float) -> pygame.Rect:
     """Draw a small ship icon at (cx, cy)."""
     world_pts = [(cx + x, cy + y) for x, y in _MINI_SHIP]
-    pygame.draw.polygon(screen, WHITE, world_pts, 1)
+    return pygame.draw.polygon(screen, WHITE, world_pts, 1)
 
 
 class HUD:
-    """Renders the in-game HUD: score, high score, wave number, life indicators."""
+    """Renders the in-game HUD: score, high score, wave number, life indicators.
+
+    The HUD is composed into a transparent layer, which is rebuilt only when
+    a value changes, and then at most once per refresh_interval seconds.
+    Each frame blits just the layer's touched areas.
+    """
+
+    _LAYER_HEIGHT = 100   # px from the top; holds every HUD element
 
     def __init__(self, font: pygame.font.Font) -> None:
         self._font = font
-        self._small_font = pygame.font.SysFont(None, 32)
+        self._small_font = get_font(32)
+        self._digits = digit_atlas(font)
+        self.refresh_interval = 0.0   # raised by the quality governor on slow machines
+        self._layer = pygame.Surface((SCREEN_WIDTH, self._LAYER_HEIGHT), pygame.SRCALPHA)
+        self._rects = []
+        self._shown = None            # (score, lives, wave, high_score) on the layer
+        self._built_at = 0.0
 
-    def draw(
-        self,
-        screen: pygame.Surface,
-        score: int,
-        lives: int,
-        wave: int,
-        high_score: int,
-    ) -> None:
+    def _compose(self, score: int, lives: int, wave: int, high_score: int) -> None:
+        layer = self._layer
+        layer.fill((0, 0, 0, 0))
         # Score — top left
-        score_surf = self._font.render(str(score), True, WHITE)
-        screen.blit(score_surf, (20, 15))
+        rects = [self._digits.draw(layer, score, (20, 15))]
 
         # High score — top center
-        hs_surf = self._small_font.render(f"HI {high_score}", True, WHITE)
+        hs_surf = render_text(self._small_font, f"HI {high_score}")
         hs_rect = hs_surf.get_rect(midtop=(SCREEN_WIDTH // 2, 18))
-        screen.blit(hs_surf, hs_rect)
+        rects.append(layer.blit(hs_surf, hs_rect))
 
         # Wave number — top right
-        wave_surf = self._small_font.render(f"WAVE {wave}", True, WHITE)
+        wave_surf = render_text(self._small_font, f"WAVE {wave}")
         wave_rect = wave_surf.get_rect(topright=(SCREEN_WIDTH - 20, 18))
-        screen.blit(wave_surf, wave_rect)
+        rects.append(layer.blit(wave_surf, wave_rect))
 
         # Life indicators — row of mini ships below score
         for i in range(min(lives, MAX_LIVES)):
-            _draw_mini_ship(screen, 28 + i * 22, 60)
+            rects.append(_draw_mini_ship(layer, 28 + i * 22, 60))
+        self._rects = rects
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        score: int,
+        lives: int,
+        wave: int,
+        high_score: int,
+        now: float = None,
+    ) -> list:
+        """Draw the HUD; returns the touched rects."""
+        values = (score, lives, wave, high_score)
+        if values != self._shown:
+            if now is None:
+                now = time.perf_counter()
+            if self._shown is None or now - self._built_at >= self.refresh_interval:
+                self._compose(*values)
+                self._shown, self._built_at = values, now
+        layer = self._layer
+        return screen.blits([(layer, r, r) for r in self._rects])
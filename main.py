@@ -1,19 +1,27 @@
+import math
+import os
 import sys
-import random
+import time
 import pygame
 from enum import Enum, auto
 from settings import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WHITE, BLACK,
-    MAX_BULLETS, RESPAWN_DELAY, RESPAWN_SAFE_RADIUS,
-    WAVE_ASTEROID_START, WAVE_ASTEROID_MAX, WAVE_TRANSITION_DELAY,
-    EXTRA_LIFE_THRESHOLD, MAX_LIVES,
-    SCORE_LARGE_ASTEROID, SCORE_MEDIUM_ASTEROID, SCORE_SMALL_ASTEROID,
-    SCORE_LARGE_SAUCER, SCORE_SMALL_SAUCER,
-    SAUCER_SPAWN_INTERVAL_BASE, SAUCER_SPAWN_INTERVAL_MIN,
-    ROTATION_SPEED,
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, SIM_HZ, WHITE, BLACK,
+    RENDERER, SPRITE_CACHE_MB, DIRTY_RECTS, QUALITY_ADAPTIVE,
+    IDLE_THROTTLE, IDLE_MAX_WAIT,
 )
 from game_config import SettingsManager
 from settings_overlay import SettingsOverlay
+from world import GameWorld, PlayerInput, PlaySubState
+from timestep import FixedTimestep
+from render_backend import VectorBackend, make_backend
+from text_cache import get_font, render_text
+from dirty_rects import DirtyRectTracker
+from replay import InputRecorder
+from profiler import FrameProfiler, ProfilerOverlay
+from capture import ProfileCapture, UNTIL_WAVE_END
+from telemetry import TelemetrySink
+from gc_policy import GcPolicy
+from quality import QualityGovernor, apply_tier
 
 
 class GameState(Enum):
@@ -24,33 +32,7 @@ class GameState(Enum):
     GAME_OVER    = auto()
 
 
-class PlaySubState(Enum):
-    ACTIVE          = auto()
-    RESPAWNING      = auto()
-    WAVE_TRANSITION = auto()
-
-
 # ── Lazy imports (modules created in later stories) ───────────
-def _import_ship():
-    from ship import PlayerShip
-    return PlayerShip
-
-def _import_bullet():
-    from bullet import Bullet
-    return Bullet
-
-def _import_asteroid():
-    from asteroid import Asteroid
-    return Asteroid
-
-def _import_saucer():
-    from saucer import Saucer
-    return Saucer
-
-def _import_particle():
-    from particle import ExplosionParticle
-    return ExplosionParticle
-
 def _import_hud():
     from hud import HUD
     return HUD
@@ -71,26 +53,42 @@ def _import_sounds():
 # ── Module-level state ────────────────────────────────────────
 running        = True
 state          = GameState.TITLE_SCREEN
-play_sub_state = PlaySubState.ACTIVE
 _font          = None   # initialized after pygame.init()
 
-# Game objects (populated during PLAYING)
-ship           = None
-bullets        = []
-asteroids      = []
-saucers        = []
-particles      = []
-
-# Game stats
-score          = 0
-lives          = 3
-wave           = 1
+# Simulation (created when a new game starts)
+world          = None
 high_score     = 0
 
-# Timers
-_respawn_timer    = 0.0
-_wave_timer       = 0.0
-_saucer_timer     = 0.0
+# Fixed simulation ticks, decoupled from the render frame rate
+_timestep      = FixedTimestep()
+_max_fps       = FPS
+_renderer      = VectorBackend()
+_dirty         = None   # DirtyRectTracker when partial updates are enabled
+_recorder      = None   # InputRecorder for the current game when debug.record_inputs is on
+_RECORDINGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "recordings")
+
+# Frame profiler (F3); _timer is its mark() while the overlay or telemetry needs it, else None
+_profiler      = FrameProfiler()
+_profiler_overlay = None
+_profiler_shown = False
+_timer         = None
+_telemetry     = None   # TelemetrySink when debug.telemetry is on
+_TELEMETRY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "telemetry")
+# Collections deferred out of live waves into transitions, respawns, pause and menus
+_gc_policy     = GcPolicy()
+# Cosmetic detail traded for frame time when frames miss their budget
+_quality       = QualityGovernor()
+_adaptive      = QUALITY_ADAPTIVE
+# Idle screens (title, pause, settings, game over) block on input and redraw only on change
+_idle_throttle = IDLE_THROTTLE
+_redraw        = True
+_paused_scene  = None   # the frozen field under the pause text, drawn once per pause
+# cProfile capture: F4 for the next CAPTURE_FRAMES frames, Shift+F4 for the rest of the wave, SIGUSR1
+_capture       = ProfileCapture()
+
+# Player actions latched from KEYDOWN events until the next update
+_pending_fire       = False
+_pending_hyperspace = False
 
 # UI objects (lazy-imported)
 _hud           = None
@@ -110,8 +108,9 @@ _controller_status_msg = ""
 
 # ── State transition ──────────────────────────────────────────
 def transition_to(new_state: GameState) -> None:
-    global state
+    global state, _redraw
     state = new_state
+    _redraw = True
     _entry_hooks = {
         GameState.TITLE_SCREEN: _on_enter_title,
         GameState.PLAYING:      _on_enter_playing,
@@ -133,11 +132,9 @@ def _on_enter_title() -> None:
         _title_screen = None
 
 
-def _on_enter_playing() -> None:
-    global ship, bullets, asteroids, saucers, particles
-    global score, lives, wave, high_score
-    global _respawn_timer, _wave_timer, _saucer_timer
-    global play_sub_state, _hud, _sound_manager, _bindings
+def _new_game() -> None:
+    """Start a fresh simulation; entered from the title screen."""
+    global world, high_score, _pending_fire, _pending_hyperspace
 
     # Load high score
     try:
@@ -146,58 +143,165 @@ def _on_enter_playing() -> None:
     except Exception:
         high_score = 0
 
-    # Create HUD
-    try:
-        HUD = _import_hud()
-        _hud = HUD(_font)
-    except Exception:
-        _hud = None
+    _pending_fire = False
+    _pending_hyperspace = False
+    world = GameWorld()
+    world.timer = _timer
+    apply_tier(_quality.tier, world)   # the tier belongs to the window, so it carries over
+    _start_recording()
 
-    # Create sound manager
-    try:
-        SoundManager = _import_sounds()
-        _sound_manager = SoundManager()
-    except Exception:
-        _sound_manager = None
 
-    _apply_runtime_settings()
+def _start_recording() -> None:
+    """Record the new game's inputs if debug.record_inputs is enabled."""
+    global _recorder
+    _stop_recording()
+    if not _settings_mgr.settings["debug"].get("record_inputs", False):
+        return
+    os.makedirs(_RECORDINGS_DIR, exist_ok=True)
+    name = time.strftime("%Y%m%d-%H%M%S") + f"-{world.rng.seed}.rec"
+    _recorder = InputRecorder(world.rng.seed, _timestep.hz, os.path.join(_RECORDINGS_DIR, name))
+
+
+def _stop_recording() -> None:
+    global _recorder
+    if _recorder is not None:
+        try:
+            _recorder.close()
+        except OSError:
+            pass
+        _recorder = None
+
+
+def _on_enter_playing() -> None:
+    global _hud, _sound_manager
+
+    # Resuming from pause keeps the running world
+    fresh = world is None or world.game_over
+    if fresh:
+        _new_game()
+    _timestep.reset()
 
-    score = 0
-    lives = MAX_LIVES
-    wave  = 1
-    bullets = []
-    saucers = []
-    particles = []
-    _respawn_timer = 0.0
-    _saucer_timer  = SAUCER_SPAWN_INTERVAL_BASE
-    play_sub_state = PlaySubState.ACTIVE
+    # Create HUD
+    if _hud is None:
+        try:
+            HUD = _import_hud()
+            _hud = HUD(_font)
+        except Exception:
+            _hud = None
 
-    # Create ship
-    PlayerShip = _import_ship()
-    ship = PlayerShip(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
-    ship.invincible = True
-    ship.invincibility_timer = 3.0
+    # Create sound manager
+    if _sound_manager is None:
+        try:
+            SoundManager = _import_sounds()
+            _sound_manager = SoundManager()
+        except Exception:
+            _sound_manager = None
 
-    # Spawn first wave
-    _spawn_wave(wave)
+    _apply_runtime_settings()
+    if fresh:
+        # The new world, HUD and sounds live for the whole game
+        _gc_policy.freeze()
 
 
 def _apply_runtime_settings() -> None:
-    global _bindings
+    global _bindings, _max_fps, _dirty, _adaptive, _idle_throttle
     _bindings = _settings_mgr.key_bindings()
+    v = _settings_mgr.settings["video"]
+    _timestep.set_rate(v.get("sim_hz", SIM_HZ))
+    _max_fps = v.get("max_fps", FPS)
+    _quality.set_budget(1000.0 / _max_fps)
+    _adaptive = v.get("adaptive_quality", QUALITY_ADAPTIVE)
+    if not _adaptive:
+        _quality.reset()
+    _apply_quality()
+    _idle_throttle = v.get("idle_throttle", IDLE_THROTTLE)
+    if v.get("dirty_rects", DIRTY_RECTS):
+        if _dirty is None:
+            _dirty = DirtyRectTracker((SCREEN_WIDTH, SCREEN_HEIGHT))
+    else:
+        _dirty = None
     if _sound_manager:
         a = _settings_mgr.settings["audio"]
         _sound_manager.set_volumes(a.get("master", 0.8), a.get("music", 0.6), a.get("sfx", 0.9))
 
 
+def _apply_quality() -> None:
+    """Push the governor's tier into the renderer, world and HUD."""
+    global _renderer
+    v = _settings_mgr.settings["video"]
+    tier = _quality.tier
+    renderer = tier.renderer or v.get("renderer", RENDERER)
+    if renderer != _renderer.name:
+        _renderer = make_backend(renderer, v.get("sprite_cache_mb", SPRITE_CACHE_MB))
+    apply_tier(tier, world, _renderer, _hud)
+
+
 def _toggle_fullscreen() -> None:
     global _is_fullscreen
     _is_fullscreen = not _is_fullscreen
     _apply_display_mode()
 
 
+def _sync_timer() -> None:
+    """Time phases only while the overlay is shown or telemetry is recording."""
+    global _timer
+    wanted = _profiler_shown or _telemetry is not None
+    if wanted and _timer is None:
+        _profiler.reset()
+        _timer = _profiler.mark
+    elif not wanted:
+        _timer = None
+    if world is not None:
+        world.timer = _timer
+
+
+def _toggle_profiler() -> None:
+    global _profiler_shown, _profiler_overlay
+    _profiler_shown = not _profiler_shown
+    if _profiler_shown and _profiler_overlay is None:
+        _profiler_overlay = ProfilerOverlay(_profiler, status=(_quality.summary, _gc_policy.summary))
+    _sync_timer()
+
+
+def _start_telemetry() -> None:
+    """Stream per-frame records to data/telemetry/ if debug.telemetry is enabled."""
+    global _telemetry
+    if not _settings_mgr.settings["debug"].get("telemetry", False):
+        return
+    os.makedirs(_TELEMETRY_DIR, exist_ok=True)
+    video = _settings_mgr.settings["video"]
+    path = os.path.join(_TELEMETRY_DIR, time.strftime("%Y%m%d-%H%M%S") + ".jsonl")
+    _telemetry = TelemetrySink(path, {
+        "max_fps": _max_fps, "sim_hz": _timestep.hz,
+        "renderer": video.get("renderer"), "dirty_rects": video.get("dirty_rects"),
+        "adaptive_quality": _adaptive,
+    })
+    _sync_timer()
+
+
+def _stop_telemetry() -> None:
+    global _telemetry
+    if _telemetry is not None:
+        _telemetry.close()
+        _telemetry = None
+        _sync_timer()
+
+
+def _toggle_capture(mods: int) -> None:
+    if _capture.active:
+        _capture.toggle()
+        return
+    if mods & pygame.KMOD_SHIFT and world is not None and state == GameState.PLAYING:
+        _capture.toggle(UNTIL_WAVE_END)
+        _update_controller_status("Profiling until the wave ends")
+    else:
+        _capture.toggle()
+        _update_controller_status(f"Profiling {_capture.frames} frames")
+
+
 def _update_controller_status(msg: str, seconds: float = 2.5) -> None:
-    global _controller_status_msg, _controller_status_timer
+    global _controller_status_msg, _controller_status_timer, _redraw
+    _redraw = True
     _controller_status_msg = msg
     _controller_status_timer = max(_controller_status_timer, seconds)
 
@@ -214,26 +318,24 @@ def _get_gamepad():
         return None
 
 
-def _apply_gamepad_input(dt: float) -> None:
-    global bullets
-    if state != GameState.PLAYING or play_sub_state != PlaySubState.ACTIVE:
-        return
-    if not ship.alive:
-        return
+def _read_gamepad():
+    """Return (turn, thrust, fire) from the first gamepad, or None.
 
+    Debounce timers run on the world clock so they pause with the game.
+    """
     js = _get_gamepad()
     if js is None:
-        return
+        return None
+
+    now = world.clock.now()
 
     # Left stick X for turning, deadzone
     axis_x = js.get_axis(0)
     deadzone = 0.2
-    if abs(axis_x) >= deadzone:
-        ship.angle += axis_x * ROTATION_SPEED * dt
+    turn = axis_x if abs(axis_x) >= deadzone else 0.0
 
     # A (0) = thrust
-    thrust = js.get_button(0)
-    ship._thrust_on = bool(thrust)
+    thrust = bool(js.get_button(0))
 
     # Start/Menu button pauses
     pause_pressed = False
@@ -243,13 +345,12 @@ def _apply_gamepad_input(dt: float) -> None:
         pause_pressed = False
 
     if pause_pressed:
-        if not hasattr(_apply_gamepad_input, "_last_pause"):
-            _apply_gamepad_input._last_pause = 0.0
-        now = pygame.time.get_ticks() / 1000.0
-        if now - _apply_gamepad_input._last_pause > 0.25:
+        if not hasattr(_read_gamepad, "_last_pause"):
+            _read_gamepad._last_pause = -1.0
+        if now - _read_gamepad._last_pause > 0.25:
+            _read_gamepad._last_pause = now
             transition_to(GameState.PAUSED)
-            _apply_gamepad_input._last_pause = now
-            return
+            return None
 
     # RT axis (5) or B (1) as fire
     fire_pressed = False
@@ -260,18 +361,21 @@ def _apply_gamepad_input(dt: float) -> None:
         pass
     fire_pressed = fire_pressed or bool(js.get_button(1))
 
-    if fire_pressed and len(bullets) < MAX_BULLETS:
-        if not hasattr(_apply_gamepad_input, "_last_fire"):
-            _apply_gamepad_input._last_fire = 0.0
-        now = pygame.time.get_ticks() / 1000.0
-        if now - _apply_gamepad_input._last_fire > 0.16:
-            bullets.append(Bullet(ship.x, ship.y, ship.angle))
-            _apply_gamepad_input._last_fire = now
+    fire = False
+    if fire_pressed:
+        if not hasattr(_read_gamepad, "_last_fire"):
+            _read_gamepad._last_fire = -1.0
+        if now - _read_gamepad._last_fire > 0.16:
+            fire = True
+            _read_gamepad._last_fire = now
+
+    return turn, thrust, fire
 
 
 def _on_enter_paused() -> None:
-    global _paused_index
+    global _paused_index, _paused_scene
     _paused_index = 0
+    _paused_scene = None
 
 
 def _on_enter_settings() -> None:
@@ -281,6 +385,8 @@ def _on_enter_settings() -> None:
 
 def _on_enter_game_over() -> None:
     global _game_over_screen, high_score
+    _stop_recording()
+    score = world.score if world else 0
     # Save high score
     try:
         load_high_score, save_high_score = _import_highscore()
@@ -297,53 +403,60 @@ def _on_enter_game_over() -> None:
         _game_over_screen = None
 
 
-# ── Wave management ───────────────────────────────────────────
-def _spawn_wave(wave_num: int) -> None:
-    """Spawn large asteroids for the given wave number."""
-    global asteroids
-    Asteroid = _import_asteroid()
-    count = min(WAVE_ASTEROID_START + wave_num - 1, WAVE_ASTEROID_MAX)
-    asteroids = []
-    ship_pos = ship.pos if ship else pygame.Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
-    for _ in range(count):
-        asteroids.append(Asteroid.spawn_large(ship_pos))
-
-
-def _next_wave() -> None:
-    global wave, play_sub_state, _wave_timer, asteroids, saucers, particles
-    wave += 1
-    saucers = []
-    particles = []
-    _spawn_wave(wave)
-    play_sub_state = PlaySubState.ACTIVE
-    # Give ship brief invincibility at wave start
-    if ship and ship.alive:
-        ship.invincible = True
-        ship.invincibility_timer = 2.0
-
-
-# ── Scoring ───────────────────────────────────────────────────
-_next_extra_life_threshold = EXTRA_LIFE_THRESHOLD
-
-def _add_score(points: int) -> None:
-    global score, lives, _next_extra_life_threshold
-    score += points
-    if score >= _next_extra_life_threshold:
-        lives = min(lives + 1, MAX_LIVES)
-        _next_extra_life_threshold += EXTRA_LIFE_THRESHOLD
-        if _sound_manager:
-            _sound_manager.play("extra_life")
+# ── Idle screens ──────────────────────────────────────────────
+def _idle() -> bool:
+    """True on screens that change only on input, a blink edge or a status timeout."""
+    return (_idle_throttle and state != GameState.PLAYING
+            and not _profiler_shown and not _capture.active)
+
+
+def _idle_timeout_ms() -> int:
+    """How long the loop may block waiting for input before something visible changes."""
+    wait = IDLE_MAX_WAIT
+    menu = (_title_screen if state == GameState.TITLE_SCREEN
+            else _game_over_screen if state == GameState.GAME_OVER else None)
+    if menu is not None:
+        wait = min(wait, menu.until_change())
+    if _controller_status_timer > 0:
+        wait = min(wait, _controller_status_timer)
+    return max(1, math.ceil(wait * 1000))
+
+
+# Events that can change the picture; pointer and stick motion alone do not
+_REDRAW_EVENTS = frozenset((
+    pygame.QUIT, pygame.KEYDOWN, pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP, pygame.JOYHATMOTION,
+    pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED, pygame.VIDEORESIZE, pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED,
+))
+
+
+def _wait_for_input():
+    """Block until an event arrives or the idle timeout passes; returns the event or None."""
+    if pygame.event.peek():
+        return None
+    event = pygame.event.wait(_idle_timeout_ms())
+    return None if event.type == pygame.NOEVENT else event
 
 
 # ── Event handling ────────────────────────────────────────────
-def handle_events() -> None:
-    global running
-    for event in pygame.event.get():
+def handle_events(first=None) -> None:
+    """Handle `first` (an event already taken off the queue), then everything queued."""
+    global running, _redraw
+    events = pygame.event.get()
+    if first is not None:
+        events.insert(0, first)
+    if any(event.type in _REDRAW_EVENTS for event in events):
+        _redraw = True
+    for event in events:
         if event.type == pygame.QUIT:
             running = False
             return
         if event.type == pygame.KEYDOWN:
-            if state == GameState.TITLE_SCREEN:
+            if event.key == pygame.K_F3:
+                _toggle_profiler()
+            elif event.key == pygame.K_F4:
+                _toggle_capture(event.mod)
+            elif state == GameState.TITLE_SCREEN:
                 _handle_title_events(event)
             elif state == GameState.PLAYING:
                 _handle_playing_events(event)
@@ -358,8 +471,6 @@ def _handle_title_events(event) -> None:
     if event.key == pygame.K_ESCAPE:
         running = False
     elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
-        global _next_extra_life_threshold
-        _next_extra_life_threshold = EXTRA_LIFE_THRESHOLD
         transition_to(GameState.PLAYING)
     elif event.key == pygame.K_s:
         _settings_return_state = GameState.TITLE_SCREEN
@@ -369,13 +480,13 @@ def _handle_title_events(event) -> None:
 
 
 def _handle_playing_events(event) -> None:
-    global bullets, play_sub_state
+    global _pending_fire, _pending_hyperspace
     if event.key == pygame.K_ESCAPE or event.key == pygame.K_p:
         transition_to(GameState.PAUSED)
     elif event.key == pygame.K_SPACE:
-        _fire_bullet()
+        _pending_fire = True
     elif event.key == pygame.K_LSHIFT or event.key == pygame.K_RSHIFT:
-        _do_hyperspace()
+        _pending_hyperspace = True
 
 
 def _handle_paused_events(event) -> None:
@@ -388,41 +499,13 @@ def _handle_game_over_events(event) -> None:
         transition_to(GameState.TITLE_SCREEN)
 
 
-def _fire_bullet() -> None:
-    """Fire a bullet from the ship nose if under MAX_BULLETS limit."""
-    import math
-    if not ship or not ship.alive:
-        return
-    if play_sub_state != PlaySubState.ACTIVE:
-        return
-    if len(bullets) >= MAX_BULLETS:
-        return
-    try:
-        Bullet = _import_bullet()
-        rad = math.radians(ship.angle)
-        nose_offset = pygame.Vector2(math.sin(rad) * 20, -math.cos(rad) * 20)
-        bullet = Bullet(ship.pos + nose_offset, ship.angle, ship.vel)
-        bullets.append(bullet)
-        if _sound_manager:
-            _sound_manager.play("fire")
-    except Exception:
-        pass
-
-
-def _do_hyperspace() -> None:
-    if not ship or not ship.alive:
-        return
-    if play_sub_state != PlaySubState.ACTIVE:
-        return
-    survived = ship.hyperspace()
-    if not survived:
-        _on_ship_destroyed()
-    elif _sound_manager:
-        _sound_manager.play("hyperspace")
-
-
 # ── Update ────────────────────────────────────────────────────
 def update(dt: float) -> None:
+    global _controller_status_timer, _redraw
+    if _controller_status_timer > 0:
+        _controller_status_timer -= dt
+        if _controller_status_timer <= 0:
+            _redraw = True    # the hint disappears
     if state == GameState.TITLE_SCREEN:
         _update_title(dt)
     elif state == GameState.PLAYING:
@@ -434,221 +517,74 @@ def update(dt: float) -> None:
 
 
 def _update_title(dt: float) -> None:
-    if _title_screen:
-        _title_screen.update(dt)
+    global _redraw
+    if _title_screen and _title_screen.update(dt):
+        _redraw = True
+
+
+def _gather_input() -> PlayerInput:
+    """Merge keyboard, gamepad and latched key presses into one tick of input."""
+    global _pending_fire, _pending_hyperspace
+    keys = pygame.key.get_pressed()
+    turn = 0.0
+    if keys[_bindings["turn_left"]]:
+        turn -= 1.0
+    if keys[_bindings["turn_right"]]:
+        turn += 1.0
+    thrust = bool(keys[_bindings["thrust"]])
+    fire = _pending_fire
+
+    if world.play_sub_state == PlaySubState.ACTIVE and world.ship.alive:
+        pad = _read_gamepad()
+        if pad is not None:
+            pad_turn, pad_thrust, pad_fire = pad
+            turn = max(-1.0, min(1.0, turn + pad_turn))
+            thrust = thrust or pad_thrust
+            fire = fire or pad_fire
+
+    inputs = PlayerInput(thrust, turn, fire, _pending_hyperspace)
+    _pending_fire = False
+    _pending_hyperspace = False
+    return inputs
 
 
 def _update_playing(dt: float) -> None:
-    global play_sub_state, _respawn_timer, _wave_timer, _saucer_timer
-
-    if play_sub_state == PlaySubState.ACTIVE:
-        _update_active(dt)
-    elif play_sub_state == PlaySubState.RESPAWNING:
-        _respawn_timer -= dt
-        if _respawn_timer <= 0:
-            _do_respawn()
-    elif play_sub_state == PlaySubState.WAVE_TRANSITION:
-        _wave_timer -= dt
-        if _wave_timer <= 0:
-            _next_wave()
-
-
-def _update_active(dt: float) -> None:
-    global bullets, asteroids, saucers, particles, _saucer_timer, play_sub_state, _wave_timer
-
-    # Controller input
-    _apply_gamepad_input(dt)
-
-    # Ship
-    if ship and ship.alive:
-        keys = pygame.key.get_pressed()
-        ship.handle_keys(keys, dt, _bindings)
-        ship.update(dt)
-
-    # Bullets
-    for b in bullets[:]:
-        b.update(dt)
-        if b.expired:
-            bullets.remove(b)
-
-    # Asteroids
-    for a in asteroids:
-        a.update(dt)
-
-    # Saucers
-    for s in saucers[:]:
-        s.update(dt, ship)
-        if s.expired:
-            saucers.remove(s)
-        elif s.wants_to_fire():
-            _fire_saucer_bullet(s)
-
-    # Particles
-    for p in particles[:]:
-        p.update(dt)
-        if p.expired:
-            particles.remove(p)
-
-    # Saucer spawning
-    _saucer_timer -= dt
-    if _saucer_timer <= 0:
-        _spawn_saucer()
-        _saucer_timer = max(
-            SAUCER_SPAWN_INTERVAL_BASE - (wave - 1) * 1.0,
-            SAUCER_SPAWN_INTERVAL_MIN,
-        )
-
-    # Heartbeat audio
-    if _sound_manager:
-        _sound_manager.update_heartbeat(dt, len(asteroids))
-
-    # Collisions
-    _check_collisions()
-
-    # Wave clear check
-    if not asteroids and not saucers and play_sub_state == PlaySubState.ACTIVE:
-        _wave_timer = WAVE_TRANSITION_DELAY
-        play_sub_state = PlaySubState.WAVE_TRANSITION
-
-
-def _spawn_saucer() -> None:
-    try:
-        Saucer = _import_saucer()
-        large = score < 40000  # SMALL_SAUCER_SCORE_THRESHOLD
-        saucer = Saucer(large=large)
-        saucers.append(saucer)
-        if _sound_manager:
-            _sound_manager.play("saucer_large" if large else "saucer_small")
-    except Exception:
-        pass
-
-
-def _fire_saucer_bullet(saucer) -> None:
-    try:
-        Bullet = _import_bullet()
-        b = saucer.create_bullet(Bullet, ship)
-        if b:
-            bullets.append(b)
-    except Exception:
-        pass
-
-
-# ── Collision detection ───────────────────────────────────────
-def _check_collisions() -> None:
-    from utils import circles_collide
-
-    # Bullet vs asteroid
-    for b in bullets[:]:
-        if b.is_player_bullet:
-            for a in asteroids[:]:
-                if circles_collide(b.pos, 3, a.pos, a.radius):
-                    _on_bullet_hit_asteroid(b, a)
-                    if b in bullets:
-                        bullets.remove(b)
-                    break
-        else:
-            # Saucer bullet vs player
-            if ship and ship.alive and not ship.invincible:
-                if circles_collide(b.pos, 3, ship.pos, ship.RADIUS):
-                    if b in bullets:
-                        bullets.remove(b)
-                    _on_ship_destroyed()
-
-    # Bullet vs saucer
-    for b in bullets[:]:
-        if b.is_player_bullet:
-            for s in saucers[:]:
-                if circles_collide(b.pos, 3, s.pos, s.radius):
-                    _on_bullet_hit_saucer(b, s)
-                    if b in bullets:
-                        bullets.remove(b)
-                    break
-
-    # Ship vs asteroid
-    if ship and ship.alive and not ship.invincible:
-        for a in asteroids[:]:
-            if circles_collide(ship.pos, ship.RADIUS, a.pos, a.radius):
-                _on_ship_hit_asteroid(a)
+    steps = _timestep.advance(dt)
+    if steps:
+        inputs = _gather_input()
+        if _timer:
+            _timer("gamepad")
+        if state != GameState.PLAYING:
+            return  # gamepad paused the game
+
+        for _ in range(steps):
+            if _recorder is not None:
+                inputs = _recorder.record(inputs)
+            world.step(inputs, _timestep.dt)
+            if world.game_over:
                 break
+            # Presses fire once; held controls carry through catch-up ticks
+            inputs = PlayerInput(inputs.thrust, inputs.turn)
 
-    # Ship vs saucer
-    if ship and ship.alive and not ship.invincible:
-        for s in saucers[:]:
-            if circles_collide(ship.pos, ship.RADIUS, s.pos, s.radius):
-                saucers.remove(s)
-                _on_ship_destroyed()
-                break
-
-
-def _on_bullet_hit_asteroid(bullet, asteroid) -> None:
-    """Handle bullet hitting an asteroid: split, score, particles."""
-    asteroids.remove(asteroid)
-    # Score
-    if asteroid.size == "large":
-        _add_score(SCORE_LARGE_ASTEROID)
-    elif asteroid.size == "medium":
-        _add_score(SCORE_MEDIUM_ASTEROID)
-    elif asteroid.size == "small":
-        _add_score(SCORE_SMALL_ASTEROID)
-
-    # Split
-    children = asteroid.split()
-    asteroids.extend(children)
-
-    # Explosion
-    _spawn_explosion(asteroid.pos)
-    if _sound_manager:
-        _sound_manager.play("explosion_asteroid")
-
-
-def _on_bullet_hit_saucer(bullet, saucer) -> None:
-    saucers.remove(saucer)
-    if saucer.large:
-        _add_score(SCORE_LARGE_SAUCER)
-    else:
-        _add_score(SCORE_SMALL_SAUCER)
-    _spawn_explosion(saucer.pos)
-    if _sound_manager:
-        _sound_manager.play("explosion_saucer")
-
-
-def _on_ship_hit_asteroid(asteroid) -> None:
-    asteroids.remove(asteroid)
-    children = asteroid.split()
-    asteroids.extend(children)
-    _spawn_explosion(asteroid.pos)
-    _on_ship_destroyed()
+        # Route simulation events to audio
+        events = world.drain_events()
+        if _sound_manager:
+            for name in events:
+                _sound_manager.play(name)
 
+    if _sound_manager and world.play_sub_state == PlaySubState.ACTIVE and not world.game_over:
+        _sound_manager.update_heartbeat(dt, len(world.asteroids))
+    if _timer:
+        _timer("heartbeat")
 
-def _on_ship_destroyed() -> None:
-    global lives, play_sub_state, _respawn_timer
-    if ship:
-        ship.alive = False
-        _spawn_explosion(ship.pos)
-    if _sound_manager:
-        _sound_manager.play("explosion_ship")
-    lives -= 1
-    if lives <= 0:
+    if world.game_over:
         transition_to(GameState.GAME_OVER)
-    else:
-        play_sub_state = PlaySubState.RESPAWNING
-        _respawn_timer = RESPAWN_DELAY
-
-
-def _do_respawn() -> None:
-    global play_sub_state
-    if ship:
-        ship.respawn(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
-    play_sub_state = PlaySubState.ACTIVE
-
+        return
 
-def _spawn_explosion(pos: pygame.Vector2) -> None:
-    try:
-        ExplosionParticle = _import_particle()
-        for _ in range(12):
-            particles.append(ExplosionParticle(pos))
-    except Exception:
-        pass
+    # Draw between the last two ticks
+    world.bodies.interpolate(_timestep.alpha)
+    if _timer:
+        _timer("kinematics")
 
 
 def _update_paused(dt: float) -> None:
@@ -656,105 +592,127 @@ def _update_paused(dt: float) -> None:
 
 
 def _update_game_over(dt: float) -> None:
-    if _game_over_screen:
-        _game_over_screen.update(dt)
+    global _redraw
+    if _game_over_screen and _game_over_screen.update(dt):
+        _redraw = True
 
 
 # ── Draw ──────────────────────────────────────────────────────
-def draw(screen: pygame.Surface) -> None:
-    screen.fill(BLACK)
+def draw(screen: pygame.Surface) -> list:
+    """Draw the current state; returns the touched rects for dirty-rect mode."""
+    if _dirty is not None:
+        _dirty.clear(screen)
+    else:
+        screen.fill(BLACK)
     if state == GameState.TITLE_SCREEN:
-        _draw_title(screen)
+        return _draw_title(screen)
     elif state == GameState.PLAYING:
-        _draw_playing(screen)
+        return _draw_playing(screen)
     elif state == GameState.PAUSED:
-        _draw_paused(screen)
+        return _draw_paused(screen)
     elif state == GameState.GAME_OVER:
-        _draw_game_over(screen)
+        return _draw_game_over(screen)
+    return []
 
 
-def _draw_centered(screen: pygame.Surface, text: str, y_offset: int = 0) -> None:
-    surf = _font.render(text, True, WHITE)
+def _draw_centered(screen: pygame.Surface, text: str, y_offset: int = 0) -> pygame.Rect:
+    surf = render_text(_font, text)
     rect = surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + y_offset))
-    screen.blit(surf, rect)
+    return screen.blit(surf, rect)
 
 
-def _draw_title(screen: pygame.Surface) -> None:
+def _draw_title(screen: pygame.Surface) -> list:
     if _title_screen:
-        _title_screen.draw(screen)
-    else:
-        _draw_centered(screen, "ASTEROIDS")
-        small = pygame.font.SysFont(None, 32)
-        surf = small.render("Press ENTER or SPACE to play", True, WHITE)
-        rect = surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
-        screen.blit(surf, rect)
+        return _title_screen.draw(screen)
+    rects = [_draw_centered(screen, "ASTEROIDS")]
+    surf = render_text(get_font(32), "Press ENTER or SPACE to play")
+    rect = surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
+    rects.append(screen.blit(surf, rect))
+    return rects
 
 
-def _draw_playing(screen: pygame.Surface) -> None:
+def _draw_playing(screen: pygame.Surface) -> list:
     # Draw game objects
-    for p in particles:
-        p.draw(screen)
-    for a in asteroids:
-        a.draw(screen)
-    for b in bullets:
-        b.draw(screen)
-    for s in saucers:
-        s.draw(screen)
-    if ship and ship.alive:
-        ship.draw(screen)
+    rects = _renderer.draw(screen, world, _timer)
 
     # Draw HUD
     if _hud:
-        _hud.draw(screen, score, lives, wave, high_score)
+        rects.extend(_hud.draw(screen, world.score, world.lives, world.wave, high_score))
     else:
-        _draw_fallback_hud(screen)
+        rects.append(_draw_fallback_hud(screen))
 
     # Wave transition overlay
-    if play_sub_state == PlaySubState.WAVE_TRANSITION:
-        _draw_centered(screen, f"WAVE {wave + 1}", -30)
-    elif play_sub_state == PlaySubState.RESPAWNING:
-        _draw_centered(screen, "SHIP DESTROYED", -30)
+    if world.play_sub_state == PlaySubState.WAVE_TRANSITION:
+        rects.append(_draw_centered(screen, f"WAVE {world.wave + 1}", -30))
+    elif world.play_sub_state == PlaySubState.RESPAWNING:
+        rects.append(_draw_centered(screen, "SHIP DESTROYED", -30))
+    return rects
 
 
-def _draw_fallback_hud(screen: pygame.Surface) -> None:
+def _draw_fallback_hud(screen: pygame.Surface) -> pygame.Rect:
     """Minimal score/lives display used before hud.py exists."""
-    surf = _font.render(f"SCORE: {score}   LIVES: {lives}   WAVE: {wave}", True, WHITE)
-    screen.blit(surf, (10, 10))
-
-
-def _draw_paused(screen: pygame.Surface) -> None:
-    # Draw the game state underneath
-    for a in asteroids:
-        a.draw(screen)
-    for b in bullets:
-        b.draw(screen)
-    if ship and ship.alive:
-        ship.draw(screen)
+    surf = _font.render(
+        f"SCORE: {world.score}   LIVES: {world.lives}   WAVE: {world.wave}", True, WHITE
+    )
+    return screen.blit(surf, (10, 10))
+
+
+def _draw_paused(screen: pygame.Surface) -> list:
+    global _paused_scene
+    # The game state underneath is frozen: draw it once, then reuse the copy
+    if _paused_scene is None:
+        rects = _renderer.draw(screen, world, _timer)
+        _paused_scene = screen.copy()
+    else:
+        rects = [screen.blit(_paused_scene, (0, 0))]
     # Overlay
-    _draw_centered(screen, "PAUSED")
-    small = pygame.font.SysFont(None, 32)
-    surf = small.render("Press ESC or P to resume", True, WHITE)
+    rects.append(_draw_centered(screen, "PAUSED"))
+    surf = render_text(get_font(32), "Press ESC or P to resume")
     rect = surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-    screen.blit(surf, rect)
+    rects.append(screen.blit(surf, rect))
+    return rects
 
 
-def _draw_game_over(screen: pygame.Surface) -> None:
+def _draw_game_over(screen: pygame.Surface) -> list:
     if _game_over_screen:
-        _game_over_screen.draw(screen)
+        return _game_over_screen.draw(screen)
+    rects = [_draw_centered(screen, "GAME OVER", -40)]
+    small = get_font(36)
+    score = world.score if world else 0
+    surf = render_text(small, f"Score: {score}   High Score: {high_score}")
+    rect = surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10))
+    rects.append(screen.blit(surf, rect))
+    surf2 = render_text(small, "Press ENTER or SPACE")
+    rect2 = surf2.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 55))
+    rects.append(screen.blit(surf2, rect2))
+    return rects
+
+
+def _present(screen: pygame.Surface) -> None:
+    """Draw the frame, debug overlays included, and put it on the display."""
+    rects = draw(screen)
+    # Controller status hint
+    if _controller_status_timer > 0:
+        txt = render_text(get_font(28), _controller_status_msg, (180, 220, 255))
+        rects.append(screen.blit(txt, (SCREEN_WIDTH - txt.get_width() - 16, 12)))
+    if _timer:
+        _timer("hud")
+    if _profiler_shown:
+        # The overlay's own drawing is left out of the numbers it shows
+        rects.append(_profiler_overlay.draw(screen, world))
+        _profiler.skip()
+
+    if _dirty is not None:
+        _dirty.present(rects)
     else:
-        _draw_centered(screen, "GAME OVER", -40)
-        small = pygame.font.SysFont(None, 36)
-        surf = small.render(f"Score: {score}   High Score: {high_score}", True, WHITE)
-        rect = surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10))
-        screen.blit(surf, rect)
-        surf2 = small.render("Press ENTER or SPACE", True, WHITE)
-        rect2 = surf2.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 55))
-        screen.blit(surf2, rect2)
+        pygame.display.flip()
+    if _timer:
+        _timer("flip")
 
 
 # ── Main ──────────────────────────────────────────────────────
 def main() -> None:
-    global running, _font
+    global running, _font, _redraw
 
     pygame.init()
     pygame.mixer.init()
@@ -762,25 +720,54 @@ def main() -> None:
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Asteroids")
     clock  = pygame.time.Clock()
-    _font  = pygame.font.SysFont(None, 48)
+    _font  = get_font(48)
 
     running = True
+    _capture.install_signal()
+    _apply_runtime_settings()
+    _start_telemetry()
     transition_to(GameState.TITLE_SCREEN)
+    _gc_policy.freeze()
+    frame_state = state.name   # state of the frame the profiler closes next
 
     while running:
-        dt = clock.tick(FPS) / 1000.0
-
-        handle_events()
+        first = None
+        was_idle = _idle()
+        if was_idle:
+            # Nothing animates here: sleep until input or the next visible change
+            first = _wait_for_input()
+        # Capped either way, so a stream of input events cannot redraw faster than _max_fps
+        dt = clock.tick(_max_fps) / 1000.0
+        work_start = time.perf_counter()
+        if _timer:
+            _profiler.frame()
+            if _telemetry is not None:
+                _telemetry.frame(_profiler, frame_state, world, _quality)
+        saved = _capture.frame(world)
+        if saved:
+            _update_controller_status(f"Profile saved: {os.path.basename(saved[0])}")
+
+        handle_events(first)
+        if _timer:
+            _timer("events")
+        if was_idle and not _idle():
+            dt = 0.0    # the frame was spent blocked on input; do not simulate it
         update(dt)
-        draw(screen)
-        # Controller status hint
-        if _controller_status_timer > 0:
-            font = pygame.font.SysFont(None, 28)
-            txt = font.render(_controller_status_msg, True, (180, 220, 255))
-            screen.blit(txt, (SCREEN_WIDTH - txt.get_width() - 16, 12))
-
-        pygame.display.flip()
-
+        _gc_policy.update(state == GameState.PLAYING
+                          and world.play_sub_state == PlaySubState.ACTIVE)
+        if _redraw or not _idle():
+            _redraw = False
+            _present(screen)
+        # Work time only: clock.tick pads frames that fit out to the budget
+        if (_adaptive and state == GameState.PLAYING
+                and _quality.frame((time.perf_counter() - work_start) * 1000.0)):
+            _apply_quality()
+        frame_state = state.name
+
+    _stop_recording()
+    _stop_telemetry()
+    _capture.stop()
+    _gc_policy.close()
     pygame.quit()
     sys.exit()
 
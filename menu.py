@@ -1,5 +1,8 @@
 import pygame
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK
+from text_cache import get_font, render_text
+
+_BLINK_PERIOD = 0.6   # seconds the prompt stays on, then off
 
 
 class TitleScreen:
@@ -7,38 +10,48 @@ class TitleScreen:
 
     def __init__(self, font: pygame.font.Font) -> None:
         self._font = font
-        self._small = pygame.font.SysFont(None, 32)
+        self._small = get_font(32)
+        self._controls_font = get_font(26)
         self._pulse = 0.0
         self._blink_timer = 0.0
         self._show_prompt = True
 
-    def update(self, dt: float) -> None:
+    def update(self, dt: float) -> bool:
+        """Advance the blink; True when the prompt toggled and the screen needs a redraw."""
         self._pulse += dt * 2.0
         self._blink_timer += dt
-        if self._blink_timer >= 0.6:
+        if self._blink_timer >= _BLINK_PERIOD:
             self._blink_timer = 0.0
             self._show_prompt = not self._show_prompt
+            return True
+        return False
+
+    def until_change(self) -> float:
+        """Seconds until the next blink edge."""
+        return max(0.0, _BLINK_PERIOD - self._blink_timer)
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> list:
+        """Draw the title screen; returns the touched rects."""
         import math
+        rects = []
         cx = SCREEN_WIDTH // 2
         cy = SCREEN_HEIGHT // 2
 
         # Title
-        title_surf = self._font.render("ASTEROIDS", True, WHITE)
+        title_surf = render_text(self._font, "ASTEROIDS")
         title_rect = title_surf.get_rect(center=(cx, cy - 80))
-        screen.blit(title_surf, title_rect)
+        rects.append(screen.blit(title_surf, title_rect))
 
         # Subtitle
-        sub = self._small.render("A PYGAME CLONE", True, WHITE)
+        sub = render_text(self._small, "A PYGAME CLONE")
         sub_rect = sub.get_rect(center=(cx, cy - 40))
-        screen.blit(sub, sub_rect)
+        rects.append(screen.blit(sub, sub_rect))
 
         # Prompt (blinking)
         if self._show_prompt:
-            prompt = self._small.render("PRESS ENTER OR SPACE TO START", True, WHITE)
+            prompt = render_text(self._small, "PRESS ENTER OR SPACE TO START")
             prompt_rect = prompt.get_rect(center=(cx, cy + 20))
-            screen.blit(prompt, prompt_rect)
+            rects.append(screen.blit(prompt, prompt_rect))
 
         # Controls
         controls = [
@@ -48,11 +61,11 @@ class TitleScreen:
             "SHIFT     - Hyperspace",
             "P / ESC   - Pause",
         ]
-        ctrl_font = pygame.font.SysFont(None, 26)
         for i, line in enumerate(controls):
-            surf = ctrl_font.render(line, True, (180, 180, 180))
+            surf = render_text(self._controls_font, line, (180, 180, 180))
             rect = surf.get_rect(center=(cx, cy + 80 + i * 24))
-            screen.blit(surf, rect)
+            rects.append(screen.blit(surf, rect))
+        return rects
 
 
 class GameOverScreen:
@@ -60,47 +73,57 @@ class GameOverScreen:
 
     def __init__(self, font: pygame.font.Font, score: int, high_score: int) -> None:
         self._font = font
-        self._small = pygame.font.SysFont(None, 36)
+        self._small = get_font(36)
+        self._prompt_font = get_font(30)
         self._score = score
         self._high_score = high_score
         self._new_record = score >= high_score and score > 0
         self._blink_timer = 0.0
         self._show_prompt = True
 
-    def update(self, dt: float) -> None:
+    def update(self, dt: float) -> bool:
+        """Advance the blink; True when the prompt toggled and the screen needs a redraw."""
         self._blink_timer += dt
-        if self._blink_timer >= 0.6:
+        if self._blink_timer >= _BLINK_PERIOD:
             self._blink_timer = 0.0
             self._show_prompt = not self._show_prompt
+            return True
+        return False
+
+    def until_change(self) -> float:
+        """Seconds until the next blink edge."""
+        return max(0.0, _BLINK_PERIOD - self._blink_timer)
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> list:
+        """Draw the game over screen; returns the touched rects."""
+        rects = []
         cx = SCREEN_WIDTH // 2
         cy = SCREEN_HEIGHT // 2
 
         # Game Over
-        go_surf = self._font.render("GAME OVER", True, WHITE)
+        go_surf = render_text(self._font, "GAME OVER")
         go_rect = go_surf.get_rect(center=(cx, cy - 80))
-        screen.blit(go_surf, go_rect)
+        rects.append(screen.blit(go_surf, go_rect))
 
         # Score
-        score_surf = self._small.render(f"SCORE: {self._score}", True, WHITE)
+        score_surf = render_text(self._small, f"SCORE: {self._score}")
         score_rect = score_surf.get_rect(center=(cx, cy - 30))
-        screen.blit(score_surf, score_rect)
+        rects.append(screen.blit(score_surf, score_rect))
 
         # High score
-        hs_surf = self._small.render(f"HIGH SCORE: {self._high_score}", True, WHITE)
+        hs_surf = render_text(self._small, f"HIGH SCORE: {self._high_score}")
         hs_rect = hs_surf.get_rect(center=(cx, cy + 10))
-        screen.blit(hs_surf, hs_rect)
+        rects.append(screen.blit(hs_surf, hs_rect))
 
         # New record
         if self._new_record:
-            nr_surf = self._small.render("NEW HIGH SCORE!", True, WHITE)
+            nr_surf = render_text(self._small, "NEW HIGH SCORE!")
             nr_rect = nr_surf.get_rect(center=(cx, cy + 50))
-            screen.blit(nr_surf, nr_rect)
+            rects.append(screen.blit(nr_surf, nr_rect))
 
         # Prompt (blinking)
         if self._show_prompt:
-            tiny = pygame.font.SysFont(None, 30)
-            p = tiny.render("PRESS ENTER, SPACE, OR ESC", True, WHITE)
+            p = render_text(self._prompt_font, "PRESS ENTER, SPACE, OR ESC")
             p_rect = p.get_rect(center=(cx, cy + 95))
-            screen.blit(p, p_rect)
+            rects.append(screen.blit(p, p_rect))
+        return rects
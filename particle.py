@@ -1,37 +1,123 @@
 import math
-import random
+import numpy as np
 import pygame
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE
-from utils import wrap_position
+from settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS,
+    PARTICLE_CAPACITY, PARTICLES_PER_EXPLOSION, PARTICLE_DRAG,
+)
 
+# Per-particle roll ranges: (min, max)
+_SPEED    = (60, 220)    # px/s
+_LIFETIME = (0.4, 1.2)   # seconds
+_LENGTH   = (4, 12)      # px, line segment
 
-class ExplosionParticle:
-    """A single short-lived line segment that flies outward from an explosion."""
 
-    def __init__(self, pos: pygame.Vector2) -> None:
-        self.pos = pygame.Vector2(pos)
-        speed = random.uniform(60, 220)
-        angle = random.uniform(0, 2 * math.pi)
-        self.vel = pygame.Vector2(math.cos(angle) * speed, math.sin(angle) * speed)
-        self._lifetime = random.uniform(0.4, 1.2)
-        self._max_lifetime = self._lifetime
-        self.expired = False
-        # Each particle is a short line segment
-        length = random.uniform(4, 12)
-        self._end_offset = pygame.Vector2(math.cos(angle) * length, math.sin(angle) * length)
+class ParticlePool:
+    """Fixed-capacity explosion particles stored as flat arrays.
+
+    Live particles are packed densely at the front of the arrays. emit()
+    rolls a whole burst in one batch, update() moves, drags, fades and ages
+    every particle in one vectorised pass and drops the expired ones by
+    compaction. When a burst does not fit, the faintest particles (the ones
+    closest to the end of their life) are evicted first, so chain reactions
+    cost a bounded amount of work per frame.
+    """
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, seed=None,
+                 width: int = SCREEN_WIDTH, height: int = SCREEN_HEIGHT) -> None:
+        self.capacity = capacity
+        self.limit = capacity       # live particles allowed; at most capacity
+        self._bounds = np.array([width, height], dtype=float)
+        self._pos      = np.zeros((capacity, 2))
+        self._vel      = np.zeros((capacity, 2))
+        self._end      = np.zeros((capacity, 2))   # line segment offset
+        self._life     = np.zeros(capacity)
+        self._max_life = np.ones(capacity)
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.count = 0
+
+    def set_limit(self, limit: int) -> None:
+        """Allow at most `limit` live particles, evicting the faintest over it."""
+        self.limit = max(0, min(limit, self.capacity))
+        if self.count > self.limit:
+            self._evict(self.count - self.limit)
+
+    def emit(self, pos, n: int = PARTICLES_PER_EXPLOSION) -> None:
+        """Spawn a burst of n particles flying outward from pos."""
+        n = min(n, self.limit)
+        if n <= 0:
+            return
+        overflow = self.count + n - self.limit
+        if overflow > 0:
+            self._evict(overflow)
+
+        rng = self._rng
+        speed  = rng.uniform(*_SPEED, n)
+        angle  = rng.uniform(0, 2 * math.pi, n)
+        life   = rng.uniform(*_LIFETIME, n)
+        length = rng.uniform(*_LENGTH, n)
+        cos, sin = np.cos(angle), np.sin(angle)
+
+        i, j = self.count, self.count + n
+        self._pos[i:j] = (pos[0], pos[1])
+        self._vel[i:j, 0] = cos * speed
+        self._vel[i:j, 1] = sin * speed
+        self._end[i:j, 0] = cos * length
+        self._end[i:j, 1] = sin * length
+        self._life[i:j] = life
+        self._max_life[i:j] = life
+        self.count = j
+
+    def _evict(self, k: int) -> None:
+        """Drop the k faintest live particles."""
+        n = self.count
+        if k >= n:
+            self.count = 0
+            return
+        fade = self._life[:n] / self._max_life[:n]
+        keep = np.ones(n, dtype=bool)
+        keep[np.argpartition(fade, k - 1)[:k]] = False
+        self._compact(keep)
+
+    def _compact(self, keep: np.ndarray) -> None:
+        n = self.count
+        k = int(np.count_nonzero(keep))
+        for arr in (self._pos, self._vel, self._end, self._life, self._max_life):
+            arr[:k] = arr[:n][keep]
+        self.count = k
 
     def update(self, dt: float) -> None:
-        self.pos += self.vel * dt
-        self.pos = wrap_position(self.pos, SCREEN_WIDTH, SCREEN_HEIGHT)
-        self.vel *= 0.95  # slight drag
-        self._lifetime -= dt
-        if self._lifetime <= 0:
-            self.expired = True
-
-    def draw(self, screen: pygame.Surface) -> None:
-        # Fade out: alpha proportional to remaining lifetime
-        alpha = max(0, int(255 * (self._lifetime / self._max_lifetime)))
-        color = (alpha, alpha, alpha)
-        end = self.pos + self._end_offset
-        pygame.draw.line(screen, color, (int(self.pos.x), int(self.pos.y)),
-                         (int(end.x), int(end.y)), 1)
+        n = self.count
+        if n == 0:
+            return
+        pos = self._pos[:n]
+        vel = self._vel[:n]
+        pos += vel * dt
+        np.mod(pos, self._bounds, out=pos)
+        vel *= PARTICLE_DRAG ** (dt * FPS)
+        life = self._life[:n]
+        life -= dt
+        alive = life > 0
+        if not alive.all():
+            self._compact(alive)
+
+    def draw(self, screen: pygame.Surface) -> list:
+        """Stroke every live particle; returns the touched rects."""
+        n = self.count
+        if n == 0:
+            return []
+        # Fade out: brightness proportional to remaining lifetime
+        alpha = np.maximum(0, 255 * self._life[:n] / self._max_life[:n]).astype(int)
+        start = self._pos[:n]
+        end = start + self._end[:n]
+        line = pygame.draw.line
+        return [
+            line(screen, (a, a, a), p0, p1, 1)
+            for a, p0, p1 in zip(alpha.tolist(), start.astype(int).tolist(), end.astype(int).tolist())
+        ]
@@ -0,0 +1,236 @@
+"""
+FrameProfiler — per-phase frame timings in a ring buffer, plus an overlay.
+
+The driver calls frame() once per loop and mark(phase) after each phase. A
+mark charges the perf_counter_ns time since the previous mark to its phase.
+GameWorld.timer and the render backends' timer argument use the same
+callable, so the world's update phases and each kind of body drawn appear
+alongside the driver's own (events, gamepad, heartbeat, HUD, flip). Rows
+go into a fixed NumPy ring buffer; nothing is allocated per frame apart
+from one small list.
+
+While the overlay is hidden the driver passes no timer anywhere, so the
+only cost is one `if` per phase.
+
+The overlay (F3) scrolls a stacked frame-time graph one column per frame.
+Grey is the part of the frame outside every phase: the frame-cap sleep and
+unmarked work. It also shows live entity counts and the worst frame of the
+last PROFILER_WORST_WINDOW seconds with the phases that dominated it.
+"""
+import time
+
+import numpy as np
+import pygame
+from settings import (
+    SCREEN_HEIGHT, FPS, WHITE,
+    PROFILER_FRAMES, PROFILER_WORST_WINDOW, PROFILER_GRAPH_SIZE,
+    PROFILER_GRAPH_MS, PROFILER_TEXT_INTERVAL,
+)
+from world import UPDATE_PHASES
+from render_backend import DRAW_PHASES
+from text_cache import get_font
+
+PHASES = ("events", "gamepad") + UPDATE_PHASES + ("heartbeat",) + DRAW_PHASES + ("hud", "flip")
+
+
+class FrameProfiler:
+    def __init__(self, capacity: int = PROFILER_FRAMES, phases: tuple = PHASES) -> None:
+        self.phases = phases
+        self.capacity = capacity
+        self._index = {name: i for i, name in enumerate(phases)}
+        self.samples  = np.zeros((capacity, len(phases)), dtype=np.int64)  # ns per phase
+        self.frame_ns = np.zeros(capacity, dtype=np.int64)   # start to start, sleep included
+        self.end_ns   = np.zeros(capacity, dtype=np.int64)   # perf_counter_ns at frame end
+        self.head = 0     # next row to write
+        self.count = 0    # rows holding data, up to capacity
+        self.total = 0    # frames recorded since reset
+        self._cur = [0] * len(phases)
+        self._start = self._last = 0
+
+    def reset(self) -> None:
+        """Forget every frame and start timing a new one now."""
+        self.head = self.count = self.total = 0
+        self._cur = [0] * len(self.phases)
+        self._start = self._last = time.perf_counter_ns()
+
+    def frame(self) -> None:
+        """Close the running frame, if any, and start the next one."""
+        now = time.perf_counter_ns()
+        if self._start:
+            h = self.head
+            self.samples[h] = self._cur
+            self.frame_ns[h] = now - self._start
+            self.end_ns[h] = now
+            self.head = (h + 1) % self.capacity
+            if self.count < self.capacity:
+                self.count += 1
+            self.total += 1
+            self._cur = [0] * len(self.phases)
+        self._start = self._last = now
+
+    def mark(self, phase: str) -> None:
+        """Charge the time since the last mark to phase."""
+        now = time.perf_counter_ns()
+        self._cur[self._index[phase]] += now - self._last
+        self._last = now
+
+    def skip(self) -> None:
+        """Charge the time since the last mark to nothing, e.g. the overlay itself."""
+        self._last = time.perf_counter_ns()
+
+    # ── Queries ───────────────────────────────────────────────
+    def _rows(self, n: int) -> np.ndarray:
+        """Ring indices of the newest n frames, oldest first."""
+        n = min(n, self.count)
+        return (self.head - n + np.arange(n)) % self.capacity
+
+    def mean_ms(self, n: int = None) -> tuple:
+        """(frame ms, per-phase ms) averaged over the newest n frames (all by default)."""
+        rows = self._rows(self.count if n is None else n)
+        if not len(rows):
+            return 0.0, np.zeros(len(self.phases))
+        return (float(self.frame_ns[rows].mean()) / 1e6,
+                self.samples[rows].mean(axis=0) / 1e6)
+
+    def worst(self, seconds: float = PROFILER_WORST_WINDOW):
+        """(frame ms, per-phase ms) of the longest frame in the last `seconds`, or None."""
+        rows = self._rows(self.count)
+        if not len(rows):
+            return None
+        rows = rows[self.end_ns[rows] >= self.end_ns[rows[-1]] - int(seconds * 1e9)]
+        i = rows[np.argmax(self.frame_ns[rows])]
+        return float(self.frame_ns[i]) / 1e6, self.samples[i] / 1e6
+
+
+# ── Overlay ───────────────────────────────────────────────────
+_PHASE_COLORS = {
+    "events":         (120, 120, 255),
+    "gamepad":        ( 90, 160, 255),
+    "ship":           ( 80, 220, 255),
+    "kinematics":     ( 60, 255, 200),
+    "bullets":        ( 90, 255, 120),
+    "particles":      (170, 255,  80),
+    "saucers":        (230, 240,  70),
+    "collisions":     (255, 200,  60),
+    "heartbeat":      (255, 150,  60),
+    "draw_particles": (255, 110,  80),
+    "draw_asteroids": (255,  80, 120),
+    "draw_bullets":   (255,  80, 180),
+    "draw_saucers":   (230,  90, 255),
+    "draw_ship":      (180, 110, 255),
+    "hud":            (200, 200, 200),
+    "flip":           (150, 150, 170),
+}
+_IDLE_COLOR   = (45, 45, 45)
+_BUDGET_COLOR = (255, 255, 255)
+_PANEL_COLOR  = (12, 12, 20)
+_PAD = 8
+
+
+class ProfilerOverlay:
+    """Draws a FrameProfiler: scrolling stacked graph, legend, counts, worst frame."""
+
+    def __init__(self, profiler: FrameProfiler, bottomleft: tuple = (10, SCREEN_HEIGHT - 10),
+                 graph_size: tuple = PROFILER_GRAPH_SIZE, graph_ms: float = PROFILER_GRAPH_MS,
+                 text_interval: float = PROFILER_TEXT_INTERVAL, status=None) -> None:
+        """status, if given, is a callable returning one extra line of text
+        (e.g. GcPolicy.summary), or a tuple of such callables."""
+        self.profiler = profiler
+        self.status = status if isinstance(status, tuple) else (status,) if status else ()
+        self.bottomleft = bottomleft   # clear of the HUD along the top
+        self._graph = pygame.Surface(graph_size)
+        self._graph.fill(_PANEL_COLOR)
+        self._px_per_ns = graph_size[1] / (graph_ms * 1e6)
+        self._budget_y = graph_size[1] - int(1e9 / FPS * self._px_per_ns)
+        self._colors = [_PHASE_COLORS.get(p, WHITE) for p in profiler.phases]
+        self._font = get_font(18)
+        self._text_interval = text_interval
+        self._text = None
+        self._text_time = 0.0
+        self._drawn = 0   # profiler.total already plotted
+
+    def _plot(self, row: int) -> None:
+        """Scroll the graph left by one column and plot ring row `row` at the right edge."""
+        g = self._graph
+        w, h = g.get_size()
+        x = w - 1
+        g.scroll(-1, 0)
+        g.fill(_PANEL_COLOR, (x, 0, 1, h))
+        scale = self._px_per_ns
+        idle = min(h, int(self.profiler.frame_ns[row] * scale))
+        g.fill(_IDLE_COLOR, (x, h - idle, 1, idle))
+        y = float(h)
+        for ns, color in zip(self.profiler.samples[row].tolist(), self._colors):
+            if ns:
+                top = y - ns * scale
+                if int(top) < int(y):
+                    g.fill(color, (x, int(top), 1, int(y) - int(top)))
+                y = top
+                if y <= 0:
+                    break
+        g.set_at((x, self._budget_y), _BUDGET_COLOR)
+
+    def _render_text(self, world) -> pygame.Surface:
+        prof = self.profiler
+        frame_ms, phase_ms = prof.mean_ms(FPS)
+        lines = [(f"frame {frame_ms:5.2f} ms avg  ({1000 / frame_ms if frame_ms else 0:.0f} fps)", WHITE)]
+        worst = prof.worst()
+        if worst is not None:
+            w_ms, w_phases = worst
+            top = sorted(zip(w_phases.tolist(), prof.phases), reverse=True)[:3]
+            lines.append((f"worst {w_ms:5.2f} ms in {PROFILER_WORST_WINDOW:g} s: "
+                          + ", ".join(f"{name} {ms:.1f}" for ms, name in top if ms > 0), WHITE))
+        if world is not None:
+            lines.append((f"asteroids {len(world.asteroids)}  bullets {len(world.bullets)}  "
+                          f"saucers {len(world.saucers)}  particles {len(world.particles)}  "
+                          f"bodies {len(world.bodies)}", WHITE))
+        for status in self.status:
+            lines.append((status(), WHITE))
+
+        font = self._font
+        head = [font.render(text, True, color) for text, color in lines]
+        # Legend: two columns of phase name and mean ms
+        names = [font.render(name, True, color) for name, color in zip(prof.phases, self._colors)]
+        values = [font.render(f"{ms:.3f}", True, color)
+                  for ms, color in zip(phase_ms.tolist(), self._colors)]
+        line_h = font.get_linesize()
+        name_w = max(s.get_width() for s in names) + 8
+        col_w = name_w + max(s.get_width() for s in values) + 24
+        rows = (len(names) + 1) // 2
+        width = max([s.get_width() for s in head] + [2 * col_w, self._graph.get_width()])
+        surf = pygame.Surface((width, (len(head) + rows) * line_h))
+        surf.fill(_PANEL_COLOR)
+        for i, s in enumerate(head):
+            surf.blit(s, (0, i * line_h))
+        y0 = len(head) * line_h
+        for i, (name, value) in enumerate(zip(names, values)):
+            x, y = (i // rows) * col_w, y0 + (i % rows) * line_h
+            surf.blit(name, (x, y))
+            surf.blit(value, (x + name_w, y))
+        return surf
+
+    def draw(self, screen: pygame.Surface, world=None) -> pygame.Rect:
+        """Draw the overlay; returns the touched rect."""
+        prof = self.profiler
+        new = min(prof.total - self._drawn, prof.count, self._graph.get_width())
+        if prof.total < self._drawn:       # the profiler was reset
+            new = min(prof.total, self._graph.get_width())
+            self._graph.fill(_PANEL_COLOR)
+        for row in (prof.head - new + np.arange(new)) % prof.capacity:
+            self._plot(int(row))
+        self._drawn = prof.total
+
+        now = time.perf_counter()
+        if self._text is None or now - self._text_time >= self._text_interval:
+            self._text = self._render_text(world)
+            self._text_time = now
+
+        graph, text = self._graph, self._text
+        panel = pygame.Rect(0, 0, max(graph.get_width(), text.get_width()) + 2 * _PAD,
+                            graph.get_height() + text.get_height() + 3 * _PAD)
+        panel.bottomleft = self.bottomleft
+        x, y = panel.topleft
+        screen.fill(_PANEL_COLOR, panel)
+        screen.blit(graph, (x + _PAD, y + _PAD))
+        screen.blit(text, (x + _PAD, y + 2 * _PAD + graph.get_height()))
+        return panel
@@ -0,0 +1,153 @@
+"""
+QualityGovernor — trade cosmetic detail for frame time on slow machines.
+
+The driver reports each frame's work time: everything between the end of
+the frame-cap sleep and the end of the flip. The raw frame time cannot show
+headroom, because clock.tick pads every frame that fits out to the budget.
+
+Every QUALITY_WINDOW frames the governor takes the window's
+QUALITY_PERCENTILE work time and compares it with the budget:
+
+  * over QUALITY_DOWN_AT x budget: drop one tier straight away;
+  * under QUALITY_UP_AT x budget: the frames count toward a step back up,
+    which happens once QUALITY_UP_HOLD frames of such windows run in a row.
+
+This gives the hysteresis. Moves are one tier at a time, each decision
+judges a whole window, and there is a wide dead band between the two
+thresholds. If a restored tier is dropped again within the hold, the hold
+doubles (up to 8x). A machine sitting right at the edge then settles
+instead of oscillating.
+
+Tiers touch only cosmetic detail, so the simulation and replays are
+unaffected:
+  * particles per explosion and the particle cap;
+  * stroke width;
+  * asteroid outline vertices (new asteroids in the world passed in only);
+  * HUD refresh interval;
+  * at the bottom tier, the sprite renderer.
+"""
+from collections import deque
+
+import numpy as np
+from settings import (
+    FPS, LINE_WIDTH, PARTICLES_PER_EXPLOSION, PARTICLE_CAPACITY,
+    QUALITY_WINDOW, QUALITY_PERCENTILE, QUALITY_DOWN_AT, QUALITY_UP_AT, QUALITY_UP_HOLD,
+)
+
+_MAX_HOLD_FACTOR = 8
+
+
+class QualityTier:
+    __slots__ = ("name", "particles", "particle_limit", "line_width",
+                 "asteroid_vertices", "hud_interval", "renderer")
+
+    def __init__(self, name: str, particles: int, particle_limit: int, line_width: int,
+                 asteroid_vertices: int = None, hud_interval: float = 0.0, renderer: str = None) -> None:
+        self.name = name
+        self.particles = particles                  # per explosion
+        self.particle_limit = particle_limit        # live particles
+        self.line_width = line_width
+        self.asteroid_vertices = asteroid_vertices  # None keeps every rolled vertex
+        self.hud_interval = hud_interval            # seconds between HUD recompositions
+        self.renderer = renderer                    # None keeps the configured renderer
+
+
+# Best first; the governor moves one step at a time
+TIERS = (
+    QualityTier("high",    PARTICLES_PER_EXPLOSION, PARTICLE_CAPACITY,      LINE_WIDTH),
+    QualityTier("medium",  8,                       PARTICLE_CAPACITY // 2, LINE_WIDTH, 10, 0.1),
+    QualityTier("low",     5,                       PARTICLE_CAPACITY // 4, 1,          8,  0.25),
+    QualityTier("minimal", 3,                       PARTICLE_CAPACITY // 8, 1,          6,  0.5, "sprite"),
+)
+
+
+def apply_tier(tier: QualityTier, world=None, renderer=None, hud=None) -> None:
+    """Push a tier's levers into whichever of world, renderer and HUD exist."""
+    if world is not None:
+        world.asteroid_vertices = tier.asteroid_vertices
+        world.explosion_particles = tier.particles
+        world.particle_limit = tier.particle_limit
+        world.particles.set_limit(tier.particle_limit)
+    if renderer is not None:
+        renderer.line_width = tier.line_width
+    if hud is not None:
+        hud.refresh_interval = tier.hud_interval
+
+
+class QualityGovernor:
+    def __init__(self, budget_ms: float = 1000.0 / FPS, tiers: tuple = TIERS,
+                 window: int = QUALITY_WINDOW, percentile: float = QUALITY_PERCENTILE,
+                 down_at: float = QUALITY_DOWN_AT, up_at: float = QUALITY_UP_AT,
+                 up_hold: int = QUALITY_UP_HOLD) -> None:
+        self.budget_ms = budget_ms
+        self.tiers = tiers
+        self.percentile = percentile
+        self.down_at = down_at
+        self.up_at = up_at
+        self.up_hold = up_hold
+        self.decisions = deque(maxlen=16)   # (frame, from tier, to tier, window ms)
+        self._samples = np.zeros(window)
+        self.reset()
+
+    def reset(self) -> None:
+        """Back to the best tier with no history."""
+        self.index = 0
+        self.frames = 0
+        self.last_ms = 0.0        # the most recent window's percentile
+        self.hold = self.up_hold
+        self.decisions.clear()
+        self._n = 0
+        self._good = 0            # frames of consecutive windows under up_at
+        self._raised_at = None    # frame of the latest step up
+
+    @property
+    def tier(self) -> QualityTier:
+        return self.tiers[self.index]
+
+    def set_budget(self, budget_ms: float) -> None:
+        if budget_ms != self.budget_ms:
+            self.budget_ms = budget_ms
+            self._n = self._good = 0
+
+    def frame(self, work_ms: float) -> bool:
+        """Report one frame's work time; True when the tier changed."""
+        self.frames += 1
+        samples = self._samples
+        samples[self._n] = work_ms
+        self._n += 1
+        if self._n < len(samples):
+            return False
+        self._n = 0
+        ms = self.last_ms = float(np.percentile(samples, self.percentile))
+
+        if ms > self.budget_ms * self.down_at:
+            self._good = 0
+            if self.index == len(self.tiers) - 1:
+                return False
+            if self._raised_at is not None and self.frames - self._raised_at <= self.hold:
+                self.hold = min(self.hold * 2, self.up_hold * _MAX_HOLD_FACTOR)
+            return self._move(+1, ms)
+
+        if ms < self.budget_ms * self.up_at and self.index > 0:
+            self._good += len(samples)
+            if self._good >= self.hold:
+                self._good = 0
+                self._raised_at = self.frames
+                return self._move(-1, ms)
+        else:
+            self._good = 0
+        return False
+
+    def _move(self, step: int, ms: float) -> bool:
+        old = self.index
+        self.index += step
+        self.decisions.append((self.frames, self.tiers[old].name, self.tier.name, round(ms, 2)))
+        return True
+
+    def summary(self) -> str:
+        text = (f"quality {self.tier.name} ({self.index + 1}/{len(self.tiers)}), "
+                f"p{self.percentile:g} {self.last_ms:.1f} of {self.budget_ms:.1f} ms")
+        if self.decisions:
+            _, old, new, ms = self.decisions[-1]
+            text += f", last {old}->{new} at {ms:.1f} ms"
+        return text
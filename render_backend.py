@@ -0,0 +1,190 @@
+"""
+Render backends for the playfield.
+
+VectorBackend is the original immediate-mode path. Every outline is stroked
+with pygame.draw each frame.
+
+SpriteBackend rasterizes each outline once per quantized rotation into a
+small colorkeyed Surface. It then draws the field with one Surface.blits()
+call per kind of body. Sprites are keyed by (ShapeTable, rotation bucket)
+and kept in least-recently-used order under a byte budget.
+
+The backend is picked by the "renderer" entry in the video settings, so the
+two can be benchmarked against each other on the same machine.
+"""
+from collections import OrderedDict
+
+import pygame
+from settings import WHITE, BLACK, LINE_WIDTH, SPRITE_CACHE_MB
+
+_BULLET_RADIUS_PX = 2   # matches Bullet.draw
+
+# Phases reported to a draw() timer, in drawing order
+DRAW_PHASES = ("draw_particles", "draw_asteroids", "draw_bullets", "draw_saucers", "draw_ship")
+
+
+class VectorBackend:
+    name = "vector"
+
+    def __init__(self) -> None:
+        self.line_width = LINE_WIDTH
+
+    def draw(self, screen: pygame.Surface, world, timer=None) -> list:
+        """Draw the field; returns the touched rects.
+
+        timer(phase), if given, is called after each of DRAW_PHASES.
+        """
+        rects = world.particles.draw(screen)
+        if timer:
+            timer("draw_particles")
+        add = rects.append
+        width = self.line_width
+        for a in world.asteroids:
+            add(a.draw(screen, width))
+        if timer:
+            timer("draw_asteroids")
+        for b in world.bullets:
+            add(b.draw(screen))
+        if timer:
+            timer("draw_bullets")
+        for s in world.saucers:
+            add(s.draw(screen, width))
+        if timer:
+            timer("draw_saucers")
+        if world.ship.alive:
+            add(world.ship.draw(screen, width))
+        if timer:
+            timer("draw_ship")
+        return rects
+
+
+class SpriteBackend:
+    name = "sprite"
+
+    def __init__(self, cache_mb: float = SPRITE_CACHE_MB) -> None:
+        self.max_bytes = int(cache_mb * 1024 * 1024)
+        self._sprites = OrderedDict()   # (table, bucket) -> (surface, half, nbytes)
+        self._bytes = 0
+        self._line_width = LINE_WIDTH
+        self._bullet = None
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    @property
+    def bytes_used(self) -> int:
+        return self._bytes
+
+    @property
+    def line_width(self) -> int:
+        return self._line_width
+
+    @line_width.setter
+    def line_width(self, value: int) -> None:
+        # Sprites are rasterized at one width; a new width starts a new cache
+        if value != self._line_width:
+            self._line_width = value
+            self.clear()
+
+    def clear(self) -> None:
+        self._sprites.clear()
+        self._bytes = 0
+
+    @staticmethod
+    def _new_surface(size: int) -> pygame.Surface:
+        surf = pygame.Surface((size, size))
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        surf.fill(BLACK)
+        return surf
+
+    def _sprite(self, table, angle: float) -> tuple:
+        key = (table, table.bucket(angle))
+        sprites = self._sprites
+        entry = sprites.get(key)
+        if entry is not None:
+            sprites.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        width = self._line_width
+        half = int(table.radius + width + 1)
+        surf = self._new_surface(2 * half + 1)
+        pygame.draw.polygon(surf, WHITE, table.place(angle, half, half), width)
+        surf.set_colorkey(BLACK, pygame.RLEACCEL)
+        nbytes = surf.get_width() * surf.get_height() * surf.get_bytesize()
+        entry = sprites[key] = (surf, half, nbytes)
+        self._bytes += nbytes
+        while self._bytes > self.max_bytes and len(sprites) > 1:
+            _, (_, _, old_bytes) = sprites.popitem(last=False)
+            self._bytes -= old_bytes
+        return entry
+
+    def _bullet_sprite(self) -> pygame.Surface:
+        if self._bullet is None:
+            r = _BULLET_RADIUS_PX
+            surf = self._new_surface(2 * r + 1)
+            pygame.draw.circle(surf, WHITE, (r, r), r)
+            surf.set_colorkey(BLACK, pygame.RLEACCEL)
+            self._bullet = surf
+        return self._bullet
+
+    def _add_outlines(self, seq: list, bodies) -> None:
+        add = seq.append
+        sprite = self._sprite
+        for body in bodies:
+            x, y = body.draw_pos
+            rot = body.draw_rot
+            for table in body.outlines():
+                surf, half, _ = sprite(table, rot)
+                add((surf, (int(x) - half, int(y) - half)))
+
+    def draw(self, screen: pygame.Surface, world, timer=None) -> list:
+        """Draw the field; returns the touched rects.
+
+        One blits() call per kind, in VectorBackend's stacking order, so
+        timer(phase) can charge each kind separately.
+        """
+        rects = world.particles.draw(screen)
+        if timer:
+            timer("draw_particles")
+
+        seq = []
+        self._add_outlines(seq, world.asteroids)
+        rects.extend(screen.blits(seq))
+        if timer:
+            timer("draw_asteroids")
+
+        bullet = self._bullet_sprite()
+        r = _BULLET_RADIUS_PX
+        seq = []
+        for b in world.bullets:
+            x, y = b.draw_pos
+            seq.append((bullet, (int(x) - r, int(y) - r)))
+        rects.extend(screen.blits(seq))
+        if timer:
+            timer("draw_bullets")
+
+        seq = []
+        self._add_outlines(seq, world.saucers)
+        rects.extend(screen.blits(seq))
+        if timer:
+            timer("draw_saucers")
+
+        seq = []
+        if world.ship.alive:
+            self._add_outlines(seq, (world.ship,))
+        rects.extend(screen.blits(seq))
+        if timer:
+            timer("draw_ship")
+        return rects
+
+
+def make_backend(name: str, cache_mb: float = SPRITE_CACHE_MB):
+    """Build the backend called `name`; unknown names fall back to vector."""
+    if name == SpriteBackend.name:
+        return SpriteBackend(cache_mb)
+    return VectorBackend()
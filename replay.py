@@ -0,0 +1,235 @@
+"""
+Input recording and headless replay.
+
+A recording is the game seed plus the PlayerInput of every simulation tick.
+Given the same seed and the same inputs, GameWorld replays the session
+bit for bit. A replay needs no window, so it runs as fast as the CPU allows.
+
+File layout (all integers are LEB128 varints):
+
+    b"ASTR" | version | seed | hz numerator | hz denominator | record* | run | END
+
+The sim rate is stored as the exact ratio of the float the game ran at, so
+a replay steps with the same dt even at a non-integer rate. Version 1 files
+hold a single integer sim_hz and are still read.
+
+A record marks an input change. It holds the number of ticks the previous
+input was held, then a mask byte (thrust, fire, hyperspace, turn-changed).
+If turn changed, a zigzag varint follows with the delta of turn quantized
+to 1/127. A tick where nothing changes costs nothing. A tap of fire costs
+two small records. A typical session comes out to well under a byte per tick.
+
+    python replay.py session.rec          # replay, print result and slowest ticks
+    python replay.py session.rec --profile    # same, under cProfile; see capture.py
+"""
+import sys
+import time
+
+from world import GameWorld, PlayerInput
+from capture import ProfileCapture
+
+MAGIC = b"ASTR"
+VERSION = 2
+
+_THRUST = 0x01
+_FIRE   = 0x02
+_HYPER  = 0x04
+_TURN   = 0x08
+_END    = 0x80
+_TURN_SCALE = 127
+
+
+# ── Varints ───────────────────────────────────────────────────
+def write_varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def read_varint(data: bytes, i: int) -> tuple:
+    """Decode the varint at data[i]; returns (value, next index)."""
+    shift = n = 0
+    while True:
+        b = data[i]
+        i += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, i
+        shift += 7
+
+
+def _zigzag(n: int) -> int:
+    return (n << 1) if n >= 0 else ((-n << 1) - 1)
+
+
+def _unzigzag(n: int) -> int:
+    return (n >> 1) if not n & 1 else -((n + 1) >> 1)
+
+
+# ── Recording ─────────────────────────────────────────────────
+class InputRecorder:
+    """Encodes one game's inputs; write the bytes out with save() or close()."""
+
+    def __init__(self, seed: int, sim_hz: float, path: str = None) -> None:
+        self.path = path
+        self.seed = seed
+        self.sim_hz = sim_hz
+        self.ticks = 0
+        self._buf = bytearray(MAGIC)
+        self._buf.append(VERSION)
+        write_varint(self._buf, seed)
+        for part in float(sim_hz).as_integer_ratio():
+            write_varint(self._buf, part)
+        self._mask = 0
+        self._turn = 0
+        self._run = 0
+        self._closed = False
+
+    def record(self, inputs: PlayerInput) -> PlayerInput:
+        """Log one tick; returns the quantized input the world should be stepped with."""
+        q = round(max(-1.0, min(1.0, inputs.turn)) * _TURN_SCALE)
+        mask = ((_THRUST if inputs.thrust else 0)
+                | (_FIRE if inputs.fire else 0)
+                | (_HYPER if inputs.hyperspace else 0))
+        if self.ticks == 0 or mask != self._mask or q != self._turn:
+            buf = self._buf
+            write_varint(buf, self._run)
+            if q != self._turn:
+                buf.append(mask | _TURN)
+                write_varint(buf, _zigzag(q - self._turn))
+            else:
+                buf.append(mask)
+            self._mask, self._turn, self._run = mask, q, 0
+        self._run += 1
+        self.ticks += 1
+        return PlayerInput(bool(mask & _THRUST), q / _TURN_SCALE,
+                           bool(mask & _FIRE), bool(mask & _HYPER))
+
+    def getvalue(self) -> bytes:
+        """The complete encoded recording so far, terminator included."""
+        tail = bytearray()
+        write_varint(tail, self._run)
+        tail.append(_END)
+        return bytes(self._buf + tail)
+
+    def save(self, path: str = None) -> None:
+        with open(path or self.path, "wb") as f:
+            f.write(self.getvalue())
+
+    def close(self) -> None:
+        if not self._closed and self.path:
+            self.save()
+        self._closed = True
+
+
+# ── Playback ──────────────────────────────────────────────────
+class Recording:
+    def __init__(self, seed: int, sim_hz: float, runs: list) -> None:
+        self.seed = seed
+        self.sim_hz = sim_hz
+        self.runs = runs          # [(PlayerInput, ticks held)]
+
+    @property
+    def ticks(self) -> int:
+        return sum(n for _, n in self.runs)
+
+    def inputs(self):
+        """Yield one PlayerInput per recorded tick."""
+        for inp, n in self.runs:
+            for _ in range(n):
+                yield inp
+
+
+def decode(data: bytes) -> Recording:
+    if data[:4] != MAGIC:
+        raise ValueError("not an input recording")
+    version = data[4]
+    if version not in (1, VERSION):
+        raise ValueError(f"unsupported recording version {version}")
+    i = 5
+    seed, i = read_varint(data, i)
+    sim_hz, i = read_varint(data, i)
+    if version >= 2:
+        den, i = read_varint(data, i)
+        if den != 1:
+            sim_hz /= den
+    runs = []
+    inp, turn = None, 0
+    while True:
+        run, i = read_varint(data, i)
+        if inp is not None and run:
+            runs.append((inp, run))
+        mask = data[i]
+        i += 1
+        if mask & _END:
+            break
+        if mask & _TURN:
+            delta, i = read_varint(data, i)
+            turn += _unzigzag(delta)
+        inp = PlayerInput(bool(mask & _THRUST), turn / _TURN_SCALE,
+                          bool(mask & _FIRE), bool(mask & _HYPER))
+    return Recording(seed, sim_hz, runs)
+
+
+def load(path: str) -> Recording:
+    with open(path, "rb") as f:
+        return decode(f.read())
+
+
+def replay(recording: Recording, on_tick=None) -> GameWorld:
+    """Run a recording headless at full speed; on_tick(world, step_ns) after each tick."""
+    world = GameWorld(seed=recording.seed)
+    dt = 1.0 / recording.sim_hz
+    clock = time.perf_counter_ns
+    for inp in recording.inputs():
+        if world.game_over:
+            break
+        if on_tick is None:
+            world.step(inp, dt)
+        else:
+            t0 = clock()
+            world.step(inp, dt)
+            on_tick(world, clock() - t0)
+    return world
+
+
+def main(argv=None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+    profile = "--profile" in args
+    args = [a for a in args if a != "--profile"]
+    if not args:
+        print("usage: python replay.py RECORDING [SLOWEST_N] [--profile]")
+        sys.exit(2)
+    rec = load(args[0])
+    top = int(args[1]) if len(args) > 1 else 5
+    steps = []
+    capture = None
+    if profile:
+        capture = ProfileCapture(frames=rec.ticks)
+        capture.request()
+        capture.frame()
+
+    def on_tick(w, ns):
+        steps.append((ns, w.ticks))
+        if capture is not None:
+            capture.frame(w)
+
+    t0 = time.perf_counter()
+    world = replay(rec, on_tick)
+    elapsed = time.perf_counter() - t0
+    if capture is not None:
+        paths = capture.stop() or capture.last_paths
+        if paths:
+            print(f"profile: {paths[0]}\nsummary: {paths[1]}")
+        else:
+            print("profile: nothing captured, the recording has no ticks")
+    print(f"seed {rec.seed}  ticks {world.ticks}/{rec.ticks}  "
+          f"score {world.score}  wave {world.wave}  lives {world.lives}")
+    print(f"replayed in {elapsed:.2f}s ({world.ticks / max(elapsed, 1e-9):,.0f} ticks/s)")
+    for ns, tick in sorted(steps, reverse=True)[:top]:
+        print(f"  tick {tick:>7}  {ns / 1e6:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
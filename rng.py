@@ -0,0 +1,181 @@
+"""
+RngService — one game seed, independent random streams per subsystem.
+
+Every gameplay subsystem draws from its own stream:
+    spawn       wave asteroids (edge position, heading, speed, outline)
+    split       children of a destroyed asteroid
+    saucer      saucer entry, course changes and aim
+    hyperspace  death roll and landing spot
+    cosmetic    explosion particles and anything else purely visual
+
+Streams are derived from the game seed with NumPy's SeedSequence.spawn, so
+they are statistically independent. A visual change, such as more
+particles per explosion, cannot shift the asteroid or saucer sequence, and
+the same seed always replays the same game.
+
+RngStream implements the random.Random methods the entities call:
+random, uniform, randint, randrange and choice. Those draw from a buffer
+of RNG_BATCH uniforms that NumPy refills in bulk. Hot paths that need many
+values at once can take a whole array from `uniforms()` or use `generator`
+directly.
+"""
+import secrets
+
+import numpy as np
+from settings import RNG_BATCH
+
+STREAMS = ("spawn", "split", "saucer", "hyperspace", "cosmetic")
+
+STATE_WORDS = 12   # unsigned 64-bit words per stream in getwords()/setwords()
+_MASK64 = (1 << 64) - 1
+_PLACEHOLDER = np.random.SeedSequence(0)   # for streams whose state is set right after
+
+
+class RngStream:
+    def __init__(self, seed_seq: np.random.SeedSequence, batch: int = RNG_BATCH) -> None:
+        self.generator = np.random.Generator(np.random.PCG64(seed_seq))
+        self._batch = batch
+        self._buf = []
+        self._i = 0
+        self._origin = None   # (state, has_uint32, uinteger) the buffer was drawn from
+
+    def _refill(self) -> None:
+        s = self.generator.bit_generator.state
+        self._origin = (s["state"]["state"], s["has_uint32"], s["uinteger"])
+        self._buf = self.generator.random(self._batch).tolist()
+        self._i = 0
+
+    def random(self) -> float:
+        """Uniform float in [0, 1)."""
+        i = self._i
+        if i >= len(self._buf):
+            self._refill()
+            i = 0
+        self._i = i + 1
+        return self._buf[i]
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def randrange(self, start: int, stop: int = None) -> int:
+        if stop is None:
+            start, stop = 0, start
+        return start + int(self.random() * (stop - start))
+
+    def randint(self, a: int, b: int) -> int:
+        """Integer in [a, b], both ends included, like random.randint."""
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
+    def uniforms(self, n: int, low: float = 0.0, high: float = 1.0) -> np.ndarray:
+        """n uniforms in [low, high) as one array, straight from the generator."""
+        return self.generator.uniform(low, high, n)
+
+    def getstate(self) -> tuple:
+        return (self.generator.bit_generator.state, list(self._buf), self._i, self._origin)
+
+    def setstate(self, state: tuple) -> None:
+        bit_state, buf, i, origin = state
+        self.generator.bit_generator.state = bit_state
+        self._buf = list(buf)
+        self._i = i
+        self._origin = origin
+
+    def copy(self) -> "RngStream":
+        """An independent stream in the same state, buffer included."""
+        twin = RngStream(_PLACEHOLDER, self._batch)
+        twin.generator.bit_generator.state = self.generator.bit_generator.state
+        twin._buf = list(self._buf)
+        twin._i = self._i
+        twin._origin = self._origin
+        return twin
+
+    def getwords(self) -> list:
+        """State as STATE_WORDS ints below 2**64, for flat snapshots.
+
+        The buffer itself is left out: the words name the generator state it
+        was drawn from, and setwords() draws it again. A stream packs into
+        96 bytes instead of RNG_BATCH floats.
+        """
+        s = self.generator.bit_generator.state
+        state, inc = s["state"]["state"], s["state"]["inc"]
+        origin = self._origin if self._buf else (0, 0, 0)
+        return [
+            state >> 64, state & _MASK64, inc >> 64, inc & _MASK64, s["has_uint32"], s["uinteger"],
+            origin[0] >> 64, origin[0] & _MASK64, origin[1], origin[2], len(self._buf), self._i,
+        ]
+
+    def setwords(self, words) -> None:
+        """Inverse of getwords(). The buffer is only redrawn if it differs from the one held."""
+        w = [int(v) for v in words]
+        bits = self.generator.bit_generator
+        inc = w[2] << 64 | w[3]
+        if w[10]:
+            origin = (w[6] << 64 | w[7], w[8], w[9])
+            if origin != self._origin or len(self._buf) != w[10]:
+                bits.state = _pcg64_state(origin[0], inc, origin[1], origin[2])
+                self._buf = self.generator.random(w[10]).tolist()
+                self._origin = origin
+        else:
+            self._buf = []
+            self._origin = None
+        bits.state = _pcg64_state(w[0] << 64 | w[1], inc, w[4], w[5])
+        self._i = w[11]
+
+
+def _pcg64_state(state: int, inc: int, has_uint32: int, uinteger: int) -> dict:
+    return {"bit_generator": "PCG64", "state": {"state": state, "inc": inc},
+            "has_uint32": has_uint32, "uinteger": uinteger}
+
+
+class RngService:
+    def __init__(self, seed: int = None) -> None:
+        if seed is None:
+            seed = secrets.randbits(63)
+        self.seed = seed
+        children = np.random.SeedSequence(seed).spawn(len(STREAMS))
+        self._bind({name: RngStream(child) for name, child in zip(STREAMS, children)})
+
+    @classmethod
+    def from_words(cls, seed: int, words) -> "RngService":
+        """A service in the state getwords() returned, without deriving streams from seed."""
+        service = cls.__new__(cls)
+        service.seed = seed
+        service._bind({name: RngStream(_PLACEHOLDER) for name in STREAMS})
+        service.setwords(words)
+        return service
+
+    def copy(self) -> "RngService":
+        """An independent service in the same state, stream buffers included."""
+        service = RngService.__new__(RngService)
+        service.seed = self.seed
+        service._bind({name: s.copy() for name, s in self._streams.items()})
+        return service
+
+    def _bind(self, streams: dict) -> None:
+        self._streams = streams
+        self.spawn      = self._streams["spawn"]
+        self.split      = self._streams["split"]
+        self.saucer     = self._streams["saucer"]
+        self.hyperspace = self._streams["hyperspace"]
+        self.cosmetic   = self._streams["cosmetic"]
+
+    def stream(self, name: str) -> RngStream:
+        return self._streams[name]
+
+    def getstate(self) -> dict:
+        return {name: s.getstate() for name, s in self._streams.items()}
+
+    def setstate(self, state: dict) -> None:
+        for name, s in state.items():
+            self._streams[name].setstate(s)
+
+    def getwords(self) -> list:
+        """Every stream's getwords(), in STREAMS order."""
+        return [w for s in self._streams.values() for w in s.getwords()]
+
+    def setwords(self, words) -> None:
+        for k, s in enumerate(self._streams.values()):
+            s.setwords(words[k * STATE_WORDS:(k + 1) * STATE_WORDS])
@@ -9,7 +9,8 @@ from settings import (
     WHITE, LINE_WIDTH,
     SMALL_SAUCER_SCORE_THRESHOLD,
 )
-from utils import wrap_position
+from bodies import Body, KIND_SAUCER
+from transform_cache import SHAPES
 
 
 # Saucer polygon: classic flying-saucer silhouette in local space
@@ -28,12 +29,28 @@ _SAUCER_DOME = [
     (0.4, -0.4),
 ]
 
+# Outlines pre-scaled per saucer size: radius -> (body, dome)
+_SHAPES_BY_RADIUS = {}
 
-class Saucer:
+
+def _outlines(radius: float) -> tuple:
+    shapes = _SHAPES_BY_RADIUS.get(radius)
+    if shapes is None:
+        shapes = _SHAPES_BY_RADIUS[radius] = (
+            SHAPES.shape([(x * radius, y * radius) for x, y in _SAUCER_BODY]),
+            SHAPES.shape([(x * radius, y * radius) for x, y in _SAUCER_DOME]),
+        )
+    return shapes
+
+
+class Saucer(Body):
     """Enemy saucer — large aims randomly, small aims at player."""
 
-    def __init__(self, large: bool = True) -> None:
+    KIND = KIND_SAUCER
+
+    def __init__(self, large: bool = True, rng=random, store=None) -> None:
         self.large = large
+        self._rng = rng
         self.radius = SAUCER_LARGE_RADIUS if large else SAUCER_SMALL_RADIUS
         self._fire_interval = SAUCER_LARGE_FIRE_INTERVAL if large else SAUCER_SMALL_FIRE_INTERVAL
         self._fire_timer = self._fire_interval
@@ -41,35 +58,37 @@ class Saucer:
         self.expired = False
 
         # Spawn on left or right edge
-        side = random.choice([-1, 1])
-        self.pos = pygame.Vector2(
-            0 if side == -1 else SCREEN_WIDTH,
-            random.uniform(SCREEN_HEIGHT * 0.2, SCREEN_HEIGHT * 0.8),
-        )
+        side = rng.choice([-1, 1])
+        x = 0 if side == -1 else SCREEN_WIDTH
+        y = rng.uniform(SCREEN_HEIGHT * 0.2, SCREEN_HEIGHT * 0.8)
         speed = 120 if large else 160
-        self.vel = pygame.Vector2(speed * side, 0)
+        # Wraps vertically only; leaving the sides expires the saucer
+        super().__init__(store, x, y, speed * side, 0, wrap_x=False)
 
         # Direction change timer
-        self._dir_timer = random.uniform(1.5, 3.0)
+        self._dir_timer = rng.uniform(1.5, 3.0)
 
         # Lifespan (leave screen = expired)
         self._off_screen_timer = 0.0
 
     def update(self, dt: float, ship) -> None:
-        self.pos += self.vel * dt
-
-        # Wrap vertically, expire horizontally
-        self.pos.y = self.pos.y % SCREEN_HEIGHT
-        if self.pos.x < -self.radius * 2 or self.pos.x > SCREEN_WIDTH + self.radius * 2:
+        self._store.integrate_slot(self._slot, dt)
+        self.after_move(dt, ship)
+
+    def after_move(self, dt: float, ship) -> None:
+        """Timers and AI; runs after the store has moved the saucer."""
+        # Wrap vertically (done by the store), expire horizontally
+        x = self._store.pos[self._slot, 0]
+        if x < -self.radius * 2 or x > SCREEN_WIDTH + self.radius * 2:
             self.expired = True
             return
 
         # Random vertical direction changes
         self._dir_timer -= dt
         if self._dir_timer <= 0:
-            vy = random.choice([-1, 0, 1]) * (80 if self.large else 100)
-            self.vel.y = vy
-            self._dir_timer = random.uniform(1.5, 3.0)
+            vy = self._rng.choice([-1, 0, 1]) * (80 if self.large else 100)
+            self._store.vel[self._slot, 1] = vy
+            self._dir_timer = self._rng.uniform(1.5, 3.0)
 
         # Firing
         self._fire_timer -= dt
@@ -82,26 +101,24 @@ class Saucer:
     def wants_to_fire(self) -> bool:
         return self._wants_to_fire
 
-    def create_bullet(self, BulletClass, ship) -> object:
-        """Create a bullet aimed at the ship (small saucer) or random (large)."""
+    def aim(self, ship) -> float:
+        """Heading in degrees for the next shot: at the ship (small) or random (large)."""
         if self.large or ship is None or not ship.alive:
-            angle_rad = random.uniform(0, 2 * math.pi)
+            angle_rad = self._rng.uniform(0, 2 * math.pi)
         else:
             # Aim at ship with spread
-            dx = ship.pos.x - self.pos.x
-            dy = ship.pos.y - self.pos.y
+            dx = ship.x - self.x
+            dy = ship.y - self.y
             angle_rad = math.atan2(dx, -dy)  # convert to our angle convention
-            spread = math.radians(random.uniform(-SAUCER_AIM_SPREAD, SAUCER_AIM_SPREAD))
+            spread = math.radians(self._rng.uniform(-SAUCER_AIM_SPREAD, SAUCER_AIM_SPREAD))
             angle_rad += spread
+        return math.degrees(angle_rad)
+
+    def outlines(self) -> tuple:
+        return _outlines(self.radius)
 
-        angle_deg = math.degrees(angle_rad)
-        dummy_vel = pygame.Vector2(0, 0)
-        return BulletClass(self.pos, angle_deg, dummy_vel, is_player_bullet=False)
-
-    def draw(self, screen: pygame.Surface) -> None:
-        r = self.radius
-        # Scale body points by radius
-        body = [(self.pos.x + x * r, self.pos.y + y * r) for x, y in _SAUCER_BODY]
-        pygame.draw.polygon(screen, WHITE, body, LINE_WIDTH)
-        dome = [(self.pos.x + x * r, self.pos.y + y * r) for x, y in _SAUCER_DOME]
-        pygame.draw.polygon(screen, WHITE, dome, LINE_WIDTH)
+    def draw(self, screen: pygame.Surface, width: int = LINE_WIDTH) -> pygame.Rect:
+        px, py = self.draw_pos
+        body, dome = _outlines(self.radius)
+        rect = pygame.draw.polygon(screen, WHITE, body.place(0.0, px, py), width)
+        return rect.union(pygame.draw.polygon(screen, WHITE, dome.place(0.0, px, py), width))
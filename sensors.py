@@ -0,0 +1,220 @@
+"""
+Raycast sensors — K rays per ship against every hazard, in one NumPy pass.
+
+    dist, kind, closing = sense(world)              # one GameWorld: (K,) each
+    dist, kind, closing = sense_vecworld(vw)        # every VecWorld game: (N, K)
+
+Rays fan out evenly around the ship, starting at the nose (PlayerShip.angle,
+0 = up) and going clockwise. Each ray reports three things:
+
+  dist     distance to the first circle it enters, or max_range on a miss
+           (0 when the ship is already inside one)
+  kind     bodies.KIND_ASTEROID / KIND_SAUCER / KIND_BULLET, or KIND_NONE
+  closing  speed at which that body approaches along the ray, relative to
+           the ship, in px/s; negative when it is pulling away
+
+The hazards are asteroids, saucers and enemy bullets. The playfield wraps
+like utils.wrap_position does, so a body is seen through whichever edge is
+nearer along the ray. Along each axis, the nearest copy and the copy across
+the opposite edge are the only ones a ray of max_range can reach, as long
+as max_range plus the largest radius is under the screen height. Both
+copies are tested.
+
+cast_rays is the kernel. It takes B origins against B rows of T padded
+targets. Each (origin, target copy) pair within reach only tests the few
+rays inside its angular width, so the work scales with the hits rather than
+with B * K * T. The nearest hit per ray is then kept with np.minimum.at.
+No Python loop runs per ray or per body.
+"""
+import numpy as np
+from settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BULLET_RADIUS, SENSOR_RAYS, SENSOR_RANGE,
+)
+from bodies import KIND_ASTEROID, KIND_BULLET, KIND_SAUCER
+
+KIND_NONE = -1   # ray hit nothing within range
+
+
+_OFFSETS = {}   # n_rays -> (cos, sin) of each ray's angle past the nose
+
+
+def _offsets(n_rays: int) -> tuple:
+    table = _OFFSETS.get(n_rays)
+    if table is None:
+        step = np.arange(n_rays) * (2 * np.pi / n_rays)
+        table = _OFFSETS[n_rays] = (np.cos(step), np.sin(step))
+    return table
+
+
+def _fit(values, shape: tuple, dtype=float) -> np.ndarray:
+    """values as an array of shape; broadcasting only when it is not one already."""
+    a = np.asarray(values, dtype=dtype)
+    return a if a.shape == shape else np.broadcast_to(a, shape)
+
+
+def ray_directions(heading, n_rays: int = SENSOR_RAYS) -> tuple:
+    """Unit ray vectors (ux, uy), each (B, n_rays), for headings in degrees (0 = up)."""
+    h = np.radians(np.asarray(heading, dtype=float).reshape(-1, 1))
+    co, so = _offsets(n_rays)
+    sh, ch = np.sin(h), np.cos(h)
+    return sh * co + ch * so, sh * so - ch * co
+
+
+# ── Kernel ────────────────────────────────────────────────────
+def cast_rays(ox, oy, heading, tx, ty, tvx, tvy, radius, kind, alive=None,
+              ovx=0.0, ovy=0.0, n_rays: int = SENSOR_RAYS, max_range: float = SENSOR_RANGE,
+              width: float = SCREEN_WIDTH, height: float = SCREEN_HEIGHT) -> tuple:
+    """Cast n_rays from each of B origins against that origin's row of T targets.
+
+    ox, oy, heading, ovx, ovy are (B,), or scalars for one origin. Targets
+    are (B, T) arrays, or scalars for radius and kind; alive masks padding
+    slots. Returns (dist, kind, closing), each of shape (B, n_rays).
+    """
+    ox = np.asarray(ox, dtype=float).reshape(-1)
+    oy = np.asarray(oy, dtype=float).reshape(-1)
+    b_count = len(ox)
+    tx = np.asarray(tx, dtype=float).reshape(b_count, -1)
+    ty = np.asarray(ty, dtype=float).reshape(b_count, -1)
+    shape = tx.shape
+    radius = _fit(radius, shape)
+    if radius.size and max_range + radius.max() >= min(width, height):
+        raise ValueError("max_range plus the largest radius must be under the screen height")
+
+    dist = np.full(b_count * n_rays, float(max_range))
+    hit_kind = np.full(b_count * n_rays, KIND_NONE, dtype=np.int8)
+    closing = np.zeros(b_count * n_rays)
+    out = (dist.reshape(b_count, n_rays), hit_kind.reshape(b_count, n_rays),
+           closing.reshape(b_count, n_rays))
+
+    # Nearest copy of each target, then the copy across the other edge
+    dx = tx - ox[:, None]
+    dx -= width * np.round(dx / width)
+    dy = ty - oy[:, None]
+    dy -= height * np.round(dy / height)
+    fx = dx - np.copysign(width, dx)
+    fy = dy - np.copysign(height, dy)
+    px = np.concatenate((dx, fx, dx, fx), axis=1)
+    py = np.concatenate((dy, dy, fy, fy), axis=1)
+    pr = np.concatenate((radius,) * 4, axis=1)
+    reach = pr + max_range
+    near = (np.abs(px) <= reach) & (np.abs(py) <= reach)
+    if alive is not None:
+        live = np.asarray(alive, dtype=bool).reshape(shape)
+        near &= np.concatenate((live,) * 4, axis=1)
+    org, col = np.nonzero(near)
+    if org.size == 0:
+        return out
+    px, py, pr = px[org, col], py[org, col], pr[org, col]
+    d2 = px * px + py * py
+    inside = d2 <= pr * pr
+    d = np.sqrt(d2)
+    keep = d - pr <= max_range
+    if not keep.all():
+        org, col, px, py, pr, d2, d, inside = (
+            a[keep] for a in (org, col, px, py, pr, d2, d, inside))
+        if org.size == 0:
+            return out
+
+    # The rays that can touch each circle span its angular width around the bearing
+    per_ray = n_rays / (2 * np.pi)
+    h = np.radians(np.asarray(heading, dtype=float).reshape(-1))
+    h = _fit(h, (b_count,))[org]
+    bearing = (np.arctan2(px, -py) - h) * per_ray
+    half = np.arcsin(np.minimum(pr / np.maximum(d, 1e-9), 1.0)) * per_ray
+    lo = np.ceil(bearing - half).astype(np.intp)
+    count = np.floor(bearing + half).astype(np.intp) - lo + 1
+    count = np.where(inside, n_rays, np.minimum(np.maximum(count, 0), n_rays))
+    lo[inside] = 0
+
+    # One (pair, ray) element per candidate; t is the distance along the ray to the centre's foot
+    total = int(count.sum())
+    if total == 0:
+        return out
+    pair = np.repeat(np.arange(len(org)), count)
+    ray = np.arange(total) - np.repeat(np.cumsum(count) - count, count)
+    ray += lo[pair]
+    ray %= n_rays
+    sh, ch = np.sin(h), np.cos(h)
+    along_nose = px * sh - py * ch          # components in the nose frame
+    across = px * ch + py * sh
+    co, so = _offsets(n_rays)
+    t = along_nose[pair] * co[ray] + across[pair] * so[ray]
+    disc = t * t
+    disc += (pr * pr - d2)[pair]
+    entry = t - np.sqrt(np.maximum(disc, 0.0))
+    ok = (disc >= 0.0) & (entry <= max_range) & ((t >= 0.0) | inside[pair])
+    pair, ray, entry = pair[ok], ray[ok], np.maximum(entry[ok], 0.0)
+
+    # Nearest hit per (origin, ray)
+    key = org[pair] * n_rays + ray
+    best = np.full(b_count * n_rays, np.inf)
+    np.minimum.at(best, key, entry)
+    won = entry == best[key]
+    key, pair, ray = key[won], pair[won], ray[won]
+    src_org, src_col = org[pair], col[pair] % shape[1]
+    dist[key] = entry[won]
+    hit_kind[key] = _fit(kind, shape, np.int8)[src_org, src_col]
+    ux = sh[pair] * co[ray] + ch[pair] * so[ray]
+    uy = sh[pair] * so[ray] - ch[pair] * co[ray]
+    rvx = _fit(tvx, shape)[src_org, src_col] - _fit(ovx, (b_count,))[src_org]
+    rvy = _fit(tvy, shape)[src_org, src_col] - _fit(ovy, (b_count,))[src_org]
+    closing[key] = -(rvx * ux + rvy * uy)
+    return out
+
+
+# ── World adapters ────────────────────────────────────────────
+def _hazards(world) -> tuple:
+    """(x, y, vx, vy, radius, kind) arrays for a GameWorld's asteroids, saucers and enemy bullets."""
+    bodies = world.asteroids + world.saucers
+    targets = len(bodies)
+    bodies += world.enemy_bullets.active
+    store = world.bodies
+    slots = np.fromiter((b._slot for b in bodies), np.intp, len(bodies))
+    pos, vel = store.pos[slots], store.vel[slots]
+    radius = np.full(len(bodies), float(BULLET_RADIUS))
+    radius[:targets] = [b.radius for b in bodies[:targets]]
+    return pos[:, 0], pos[:, 1], vel[:, 0], vel[:, 1], radius, store.kind[slots]
+
+
+def sense_many(worlds, n_rays: int = SENSOR_RAYS, max_range: float = SENSOR_RANGE) -> tuple:
+    """Rays from each GameWorld's ship, as (len(worlds), n_rays) arrays."""
+    hazards = [_hazards(w) for w in worlds]
+    b_count = len(worlds)
+    t_count = max((len(h[0]) for h in hazards), default=0)
+    cols = np.zeros((6, b_count, t_count))
+    alive = np.zeros((b_count, t_count), dtype=bool)
+    for i, h in enumerate(hazards):
+        n = len(h[0])
+        for c, values in enumerate(h):
+            cols[c, i, :n] = values
+        alive[i, :n] = True
+    ships = [w.ship for w in worlds]
+    vel = np.array([tuple(s.vel) for s in ships]).reshape(-1, 2)
+    return cast_rays(
+        [s.x for s in ships], [s.y for s in ships], [s.angle for s in ships],
+        cols[0], cols[1], cols[2], cols[3], cols[4], cols[5], alive,
+        vel[:, 0], vel[:, 1], n_rays, max_range,
+    )
+
+
+def sense(world, n_rays: int = SENSOR_RAYS, max_range: float = SENSOR_RANGE) -> tuple:
+    """Rays from one GameWorld's ship, as (n_rays,) arrays."""
+    dist, kind, closing = sense_many([world], n_rays, max_range)
+    return dist[0], kind[0], closing[0]
+
+
+def sense_vecworld(vw, n_rays: int = SENSOR_RAYS, max_range: float = SENSOR_RANGE) -> tuple:
+    """Rays from every VecWorld ship, as (vw.n, n_rays) arrays."""
+    blocks = (
+        (vw.ast_x, vw.ast_y, vw.ast_vx, vw.ast_vy, vw.ast_radius, KIND_ASTEROID, vw.ast_alive),
+        (vw.saucer_x, vw.saucer_y, vw.saucer_vx, vw.saucer_vy, vw.saucer_radius, KIND_SAUCER,
+         vw.saucer_alive),
+        (vw.enemy_x, vw.enemy_y, vw.enemy_vx, vw.enemy_vy, BULLET_RADIUS, KIND_BULLET,
+         vw.enemy_alive),
+    )
+    cols = [np.concatenate([np.broadcast_to(b[c], b[0].shape) for b in blocks], axis=1)
+            for c in range(7)]
+    return cast_rays(
+        vw.ship_x, vw.ship_y, vw.ship_angle, *cols[:6], cols[6], vw.ship_vx, vw.ship_vy,
+        n_rays, max_range,
+    )
@@ -3,12 +3,14 @@
 # ──────────────────────────────────────────────
 SCREEN_WIDTH  = 1280
 SCREEN_HEIGHT = 720
-FPS           = 60
+FPS           = 60            # render frame cap; also the reference rate for per-frame constants
+SIM_HZ        = 60            # fixed simulation ticks per second
+MAX_SIM_STEPS = 5             # catch-up ticks per rendered frame before dropping time
 
 # ──────────────────────────────────────────────
 # PHYSICS (populated fully in Story 2.1)
 # ──────────────────────────────────────────────
-DRAG_COEFFICIENT = 0.98       # velocity multiplier per frame
+DRAG_COEFFICIENT = 0.98       # velocity multiplier per 1/FPS seconds
 SHIP_THRUST      = 300.0      # px/s² acceleration
 MAX_SPEED        = 600.0      # px/s velocity cap
 ROTATION_SPEED   = 270.0      # degrees/second
@@ -36,6 +38,12 @@ ASTEROID_SMALL_SPEED_MAX  = 220.0
 
 ASTEROID_SPAWN_SAFE_RADIUS = 150  # px from player at wave start
 
+# ──────────────────────────────────────────────
+# COLLISION
+# ──────────────────────────────────────────────
+BULLET_RADIUS         = 3                          # px, collision only
+BROADPHASE_CELL_SIZE  = ASTEROID_LARGE_RADIUS * 2  # target grid cell edge, px
+
 # ──────────────────────────────────────────────
 # SCORING
 # ──────────────────────────────────────────────
@@ -81,6 +89,18 @@ SMALL_SAUCER_SCORE_THRESHOLD  = 40000 # score at which only small saucers spawn
 HYPERSPACE_DEATH_CHANCE = 1 / 6
 HYPERSPACE_COOLDOWN     = 2.0  # seconds
 
+# ──────────────────────────────────────────────
+# PARTICLES
+# ──────────────────────────────────────────────
+PARTICLE_CAPACITY       = 512   # live explosion particles; oldest/faintest evicted
+PARTICLES_PER_EXPLOSION = 12
+PARTICLE_DRAG           = 0.95  # velocity multiplier per 1/FPS seconds
+
+# ──────────────────────────────────────────────
+# RANDOMNESS
+# ──────────────────────────────────────────────
+RNG_BATCH = 1024   # uniforms pre-generated per stream refill
+
 # ──────────────────────────────────────────────
 # COLORS
 # ──────────────────────────────────────────────
@@ -91,3 +111,86 @@ BLACK = (0,   0,   0)
 # RENDERING
 # ──────────────────────────────────────────────
 LINE_WIDTH = 2  # polygon stroke width in px
+TRANSFORM_ANGLE_STEPS  = 360   # rotation buckets per turn for cached polygons (1°)
+TRANSFORM_CACHE_ROWS   = 16384 # rotated vertex rows kept across all shapes (~1.4 KB each for a 12-gon)
+RENDERER               = "vector"  # "vector" (pygame.draw) or "sprite" (cached blits)
+SPRITE_CACHE_MB        = 32    # pre-rasterized sprite budget for the sprite renderer
+TEXT_CACHE_SIZE        = 256   # rendered text surfaces kept (LRU)
+DIRTY_RECTS            = False # clear/update only touched regions instead of fill + flip
+DIRTY_FULL_FRACTION    = 0.35  # dirty share of the screen above which a full flip is used
+
+# ──────────────────────────────────────────────
+# BENCHMARKS
+# ──────────────────────────────────────────────
+BENCH_FRAMES       = 600   # timed frames per scenario
+BENCH_WARMUP       = 60    # untimed frames first (caches, branch warm-up)
+BENCH_ALLOC_FRAMES = 120   # frames traced with tracemalloc for allocation counts
+BENCH_SEED         = 1234  # world and scenario seed, so runs are comparable
+BENCH_REGRESSION   = 0.10  # slowdown vs baseline (fraction) reported as a regression
+
+# ──────────────────────────────────────────────
+# PROFILER
+# ──────────────────────────────────────────────
+PROFILER_FRAMES        = 600        # frames kept in the ring buffer (10 s at 60 FPS)
+PROFILER_WORST_WINDOW  = 5.0        # seconds searched for the worst frame
+PROFILER_GRAPH_SIZE    = (300, 100) # px; one column per frame
+PROFILER_GRAPH_MS      = 33.3       # frame time at the top of the graph
+PROFILER_TEXT_INTERVAL = 0.25       # seconds between refreshes of the numbers
+CAPTURE_FRAMES         = 600        # frames per cProfile capture (F4 / SIGUSR1)
+CAPTURE_TOP_N          = 30         # functions listed in the capture's text summary
+
+# ──────────────────────────────────────────────
+# TELEMETRY
+# ──────────────────────────────────────────────
+TELEMETRY_BATCH        = 120   # records handed to the writer thread at a time (2 s at 60 FPS)
+TELEMETRY_QUEUE        = 32    # batches waiting for disk before new ones are dropped
+TELEMETRY_BUCKET       = 10    # entity-count bucket width in the analyzer
+TELEMETRY_SLOW_FACTOR  = 1.2   # a frame longer than this times the frame budget is slow
+
+# ──────────────────────────────────────────────
+# GARBAGE COLLECTION
+# ──────────────────────────────────────────────
+GC_ACTIVE_THRESHOLDS = (20000, 1000, 1000)  # gc thresholds while a wave is live; (0, 0, 0) disables
+
+# ──────────────────────────────────────────────
+# ADAPTIVE QUALITY
+# ──────────────────────────────────────────────
+QUALITY_ADAPTIVE   = True  # lower cosmetic detail when frames miss their budget
+QUALITY_WINDOW     = 60    # frames of work time judged at once
+QUALITY_PERCENTILE = 90    # the window's frame time that must fit the budget
+QUALITY_DOWN_AT    = 1.0   # step down when that percentile exceeds this share of the budget
+QUALITY_UP_AT      = 0.6   # step up only while it stays under this share ...
+QUALITY_UP_HOLD    = 180   # ... for this many frames (doubles after each bounce, up to 8x)
+
+# ──────────────────────────────────────────────
+# IDLE SCREENS
+# ──────────────────────────────────────────────
+IDLE_THROTTLE = True   # title, pause, settings and game over sleep until input or a blink edge
+IDLE_MAX_WAIT = 0.25   # seconds; longest single block in event.wait (bounds SIGUSR1 latency)
+
+# ──────────────────────────────────────────────
+# BATCH SIMULATION
+# ──────────────────────────────────────────────
+BATCH_MAX_TICKS    = 18000  # per game (5 simulated minutes); a game still running then is cut off
+BATCH_CHUNK        = 8      # games per worker job; amortizes the pickling round trip
+BATCH_SCORE_BUCKET = 500    # score histogram bucket width for the percentiles
+
+# ──────────────────────────────────────────────
+# VECTORIZED WORLDS
+# ──────────────────────────────────────────────
+VEC_SAUCER_SLOTS       = 4   # saucers alive at once per world; spawns past this are skipped
+VEC_ENEMY_BULLET_SLOTS = 8   # saucer shots alive at once per world (two per saucer)
+
+# ──────────────────────────────────────────────
+# RL ENVIRONMENT
+# ──────────────────────────────────────────────
+ENV_FRAME_SKIP   = 4           # simulation ticks per env step; the action is held for all of them
+ENV_MAX_TICKS    = 18000       # episode is truncated here (5 simulated minutes)
+ENV_MAX_ENTITIES = 32          # rows in an entity observation: the ship, then the nearest bodies
+ENV_FRAME_SIZE   = (128, 72)   # (w, h) of a downsampled grayscale frame observation
+
+# ──────────────────────────────────────────────
+# SENSORS
+# ──────────────────────────────────────────────
+SENSOR_RAYS  = 32      # rays per ship, evenly spaced from the nose clockwise
+SENSOR_RANGE = 600.0   # px; with the largest radius it must stay under SCREEN_HEIGHT
@@ -1,5 +1,6 @@
 import pygame
 from typing import Optional
+from text_cache import get_font, render_text
 
 AUDIO_FIELDS = ["master", "music", "sfx"]
 CONTROL_FIELDS = ["thrust", "turn_left", "turn_right", "fire", "pause"]
@@ -12,6 +13,7 @@ class SettingsOverlay:
         self.index = 0
         self.message = ""
         self.rebinding: Optional[str] = None
+        self._shade = None   # translucent backdrop, rebuilt only if the screen size changes
 
         # staged copy
         self.audio = dict(settings_mgr.settings["audio"])
@@ -100,19 +102,20 @@ class SettingsOverlay:
 
     def draw(self, screen):
         w, h = screen.get_size()
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 170))
-        screen.blit(overlay, (0, 0))
+        if self._shade is None or self._shade.get_size() != (w, h):
+            self._shade = pygame.Surface((w, h), pygame.SRCALPHA)
+            self._shade.fill((0, 0, 0, 170))
+        screen.blit(self._shade, (0, 0))
 
         panel = pygame.Rect(w * 0.18, h * 0.12, w * 0.64, h * 0.76)
         pygame.draw.rect(screen, (20, 28, 44), panel, border_radius=14)
         pygame.draw.rect(screen, (120, 140, 180), panel, width=2, border_radius=14)
 
-        title_font = pygame.font.SysFont(None, 46)
-        text_font = pygame.font.SysFont(None, 30)
-        small_font = pygame.font.SysFont(None, 24)
+        title_font = get_font(46)
+        text_font = get_font(30)
+        small_font = get_font(24)
 
-        title = title_font.render("SETTINGS", True, (240, 245, 255))
+        title = render_text(title_font, "SETTINGS", (240, 245, 255))
         screen.blit(title, (panel.x + 24, panel.y + 18))
 
         tabs = ["Audio", "Controls"]
@@ -121,7 +124,7 @@ class SettingsOverlay:
             active = i == self.tab
             r = pygame.Rect(tx, panel.y + 70, 120, 34)
             pygame.draw.rect(screen, (70, 96, 160) if active else (40, 54, 82), r, border_radius=8)
-            label = text_font.render(t, True, (255, 255, 255))
+            label = render_text(text_font, t, (255, 255, 255))
             screen.blit(label, (r.x + 20, r.y + 6))
             tx += 132
 
@@ -139,17 +142,17 @@ class SettingsOverlay:
             else:
                 text = key.upper()
 
-            surf = text_font.render(text, True, color)
+            surf = render_text(text_font, text, color)
             screen.blit(surf, (panel.x + 28, y))
             y += 40
 
         helper = "TAB switch section | ↑/↓ select | ENTER confirm | ESC back"
-        hs = small_font.render(helper, True, (180, 190, 210))
+        hs = render_text(small_font, helper, (180, 190, 210))
         screen.blit(hs, (panel.x + 24, panel.bottom - 48))
 
         if self.rebinding:
-            msg = small_font.render(f"Listening: press key for {self.rebinding}", True, (255, 220, 120))
+            msg = render_text(small_font, f"Listening: press key for {self.rebinding}", (255, 220, 120))
             screen.blit(msg, (panel.x + 24, panel.bottom - 78))
         elif self.message:
-            msg = small_font.render(self.message, True, (140, 230, 170))
+            msg = render_text(small_font, self.message, (140, 230, 170))
             screen.blit(msg, (panel.x + 24, panel.bottom - 78))
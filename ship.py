@@ -1,13 +1,15 @@
 import math
+import random
 import pygame
 from settings import (
-    SCREEN_WIDTH, SCREEN_HEIGHT,
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS,
     SHIP_THRUST, MAX_SPEED, DRAG_COEFFICIENT, ROTATION_SPEED,
     WHITE, LINE_WIDTH,
     INVINCIBILITY_TIME, BLINK_RATE,
     HYPERSPACE_DEATH_CHANCE, HYPERSPACE_COOLDOWN,
 )
-from utils import wrap_position, rotate_points
+from transform_cache import SHAPES
+from bodies import Body, KIND_SHIP
 
 
 # Ship polygon defined in local space (nose pointing up, i.e. +Y in screen coords is down)
@@ -26,24 +28,35 @@ _THRUSTER_FLAME = [
     (-5, 14),    # left flame base
 ]
 
+_SHIP_SHAPE  = SHAPES.shape(_SHIP_POINTS)
+_FLAME_SHAPE = SHAPES.shape(_THRUSTER_FLAME)
 
-class PlayerShip:
+
+class PlayerShip(Body):
     """Player-controlled ship with Newtonian physics."""
 
+    KIND = KIND_SHIP
     RADIUS = 14  # collision radius in px
 
-    def __init__(self, x: float, y: float) -> None:
-        self.pos = pygame.Vector2(x, y)
-        self.vel = pygame.Vector2(0, 0)
-        self.angle = 0.0          # degrees; 0 = nose up (−Y axis)
+    def __init__(self, x: float, y: float, store=None) -> None:
+        super().__init__(store, x, y)   # angle starts at 0 = nose up (−Y axis)
         self.alive = True
         self.invincible = False
         self.invincibility_timer = 0.0
-        self._blink_frame = 0
+        self._blink_time = 0.0
         self._show = True         # for blinking during invincibility
         self._thrust_on = False   # draw flame only when thrusting
         self._hyperspace_cooldown = 0.0
-        self._flame_toggle = 0    # flicker counter for thrust flame
+        self._flame_time = 0.0    # drives the thrust flame flicker
+
+    @property
+    def angle(self) -> float:
+        """Heading in degrees; 0 = nose up (−Y axis)."""
+        return float(self._store.rot[self._slot])
+
+    @angle.setter
+    def angle(self, value: float) -> None:
+        self._store.rot[self._slot] = self._store.draw_rot[self._slot] = value
 
     # ── Input ─────────────────────────────────────────────────
     def handle_keys(self, keys, dt: float, bindings=None) -> None:
@@ -60,34 +73,57 @@ class PlayerShip:
         if keys[bindings["turn_right"]]:
             self.angle += ROTATION_SPEED * dt
 
-        self._thrust_on = keys[bindings["thrust"]]
+        self.apply_thrust(bool(keys[bindings["thrust"]]), dt)
+
+    def apply_input(self, thrust: bool, turn: float, dt: float) -> None:
+        """Apply one tick of abstract input: turn in [-1, 1], thrust on/off."""
+        if turn:
+            self.angle += max(-1.0, min(1.0, turn)) * ROTATION_SPEED * dt
+        self.apply_thrust(thrust, dt)
+
+    def apply_thrust(self, thrust: bool, dt: float) -> None:
+        self._thrust_on = thrust
         if self._thrust_on:
             # Direction: angle=0 means nose points up (−Y), so thrust vector is:
             rad = math.radians(self.angle)
-            thrust_dir = pygame.Vector2(math.sin(rad), -math.cos(rad))
-            self.vel += thrust_dir * SHIP_THRUST * dt
+            push = SHIP_THRUST * dt
+            vel, slot = self._store.vel, self._slot
+            vel[slot, 0] = vel.item(slot, 0) + math.sin(rad) * push
+            vel[slot, 1] = vel.item(slot, 1) - math.cos(rad) * push
 
     # ── Update ────────────────────────────────────────────────
     def update(self, dt: float) -> None:
-        # Apply drag
-        self.vel *= DRAG_COEFFICIENT
-
-        # Cap speed
-        speed = self.vel.length()
-        if speed > MAX_SPEED:
-            self.vel.scale_to_length(MAX_SPEED)
-
-        # Move
-        self.pos += self.vel * dt
-
-        # Wrap
-        self.pos = wrap_position(self.pos, SCREEN_WIDTH, SCREEN_HEIGHT)
-
+        self.before_move(dt)
+        # Move and wrap
+        self._store.integrate_slot(self._slot, dt)
+        self.after_move(dt)
+
+    def before_move(self, dt: float) -> None:
+        """Drag and speed cap; runs before the store moves the ship."""
+        # Apply drag, scaled so the ship slows the same at any tick rate.
+        # Works on plain floats in the store row; no Vector2 per tick.
+        vel, slot = self._store.vel, self._slot
+        drag = DRAG_COEFFICIENT ** (dt * FPS)
+        vx = vel.item(slot, 0) * drag
+        vy = vel.item(slot, 1) * drag
+
+        # Cap speed, comparing squared so the common case takes no sqrt
+        speed_sq = vx * vx + vy * vy
+        if speed_sq > MAX_SPEED * MAX_SPEED:
+            scale = MAX_SPEED / math.sqrt(speed_sq)
+            vx *= scale
+            vy *= scale
+        vel[slot, 0] = vx
+        vel[slot, 1] = vy
+
+    def after_move(self, dt: float) -> None:
+        """Timers; runs after the store has moved the ship."""
         # Invincibility countdown
         if self.invincible:
             self.invincibility_timer -= dt
-            self._blink_frame += 1
-            if self._blink_frame % BLINK_RATE == 0:
+            self._blink_time += dt
+            if self._blink_time >= BLINK_RATE / FPS:
+                self._blink_time -= BLINK_RATE / FPS
                 self._show = not self._show
             if self.invincibility_timer <= 0:
                 self.invincible = False
@@ -99,21 +135,20 @@ class PlayerShip:
 
         # Flame flicker
         if self._thrust_on:
-            self._flame_toggle = (self._flame_toggle + 1) % 4
+            self._flame_time += dt
 
     # ── Hyperspace ────────────────────────────────────────────
-    def hyperspace(self) -> bool:
+    def hyperspace(self, rng=random) -> bool:
         """Teleport to a random position. Returns True if ship survives."""
-        import random
         if self._hyperspace_cooldown > 0:
             return True  # nothing happens during cooldown
         self._hyperspace_cooldown = HYPERSPACE_COOLDOWN
-        if random.random() < HYPERSPACE_DEATH_CHANCE:
+        if rng.random() < HYPERSPACE_DEATH_CHANCE:
             self.alive = False
             return False
         self.pos = pygame.Vector2(
-            random.uniform(0, SCREEN_WIDTH),
-            random.uniform(0, SCREEN_HEIGHT),
+            rng.uniform(0, SCREEN_WIDTH),
+            rng.uniform(0, SCREEN_HEIGHT),
         )
         self.vel = pygame.Vector2(0, 0)
         return True
@@ -123,23 +158,28 @@ class PlayerShip:
         self.pos = pygame.Vector2(x, y)
         self.vel = pygame.Vector2(0, 0)
         self.angle = 0.0
+        self._store.prev_rot[self._slot] = 0.0   # no spin-in from the old heading
         self.alive = True
         self.invincible = True
         self.invincibility_timer = INVINCIBILITY_TIME
-        self._blink_frame = 0
+        self._blink_time = 0.0
         self._show = True
         self._hyperspace_cooldown = 0.0
 
     # ── Draw ──────────────────────────────────────────────────
-    def draw(self, screen: pygame.Surface) -> None:
+    def outlines(self) -> tuple:
+        """Shape tables to draw this frame at draw_rot."""
         if not self._show:
-            return
-
-        rotated = rotate_points(_SHIP_POINTS, self.angle)
-        world_pts = [(self.pos.x + x, self.pos.y + y) for x, y in rotated]
-        pygame.draw.polygon(screen, WHITE, world_pts, LINE_WIDTH)
-
-        if self._thrust_on and self._flame_toggle < 3:  # flicker: skip every 4th frame
-            flame_pts = rotate_points(_THRUSTER_FLAME, self.angle)
-            world_flame = [(self.pos.x + x, self.pos.y + y) for x, y in flame_pts]
-            pygame.draw.polygon(screen, WHITE, world_flame, LINE_WIDTH)
+            return ()
+        if self._thrust_on and int(self._flame_time * FPS) % 4 < 3:  # flicker: skip every 4th frame
+            return (_SHIP_SHAPE, _FLAME_SHAPE)
+        return (_SHIP_SHAPE,)
+
+    def draw(self, screen: pygame.Surface, width: int = LINE_WIDTH) -> pygame.Rect:
+        """Stroke the ship; returns the touched rect (empty while blinked off)."""
+        px, py = self.draw_pos
+        angle = self.draw_rot
+        rect = pygame.Rect(int(px), int(py), 0, 0)
+        for shape in self.outlines():
+            rect = rect.union(pygame.draw.polygon(screen, WHITE, shape.place(angle, px, py), width))
+        return rect
@@ -0,0 +1,302 @@
+"""
+World snapshots — a GameWorld's whole simulation state as one flat array.
+
+    snap = snapshot(world)          # float64 ndarray; snap.tobytes() hashes or pickles
+    restore(snap, scratch)          # rewind a scratch world to it, in place
+    fork = clone(world)             # a new, independent world
+
+A snapshot covers the score, lives, wave, ticks, deaths, sub-state, every
+timer, `_next_extra_life_threshold`, the sim clock and the ship's flags and
+timers. It covers each body's kinematics row from the BodyStore, each
+asteroid's outline and its size, each saucer's timers, and every stream
+of the RngService as packed words (see RngStream.getwords). It also
+records the broadphase filing order, because that order decides which
+target a bullet meets first when it touches two. So a restored world
+steps exactly like the original did.
+
+Particles are cosmetic, so they are not saved; restore() clears them.
+
+Layout (version 1), all float64 cells. Counts sit in the header. Each
+section follows the previous one, so the layout only depends on the counts:
+
+    header    MAGIC, VERSION, rows, asteroids, saucers, player bullets,
+              enemy bullets, outline vertices, filed objects
+    world     _WORLD_FIELDS
+    ship      _SHIP_FIELDS
+    rng       seed, then STATE_WORDS per stream (uint64 bit patterns)
+    rows      _ROW_FIELDS per body: ship, asteroids, saucers, player
+              bullets, enemy bullets, in list order
+    asteroids size, stream, radius, vertex count
+    saucers   _SAUCER_FIELDS
+    vertices  x, y of every outline, asteroid by asteroid
+    filed     row of each object in broadphase filing order
+
+Rows are numbered by list order rather than by store slot. Two worlds in
+the same state therefore give the same bytes, whatever slots their bodies
+happen to hold.
+
+A restore builds fresh entity objects with __new__ and fills their
+attributes directly. There is no deepcopy and no Vector2 churn.
+
+Restoring into a scratch world is the fast path, and the one for hot loops:
+a lookahead bot keeps one scratch world per branch and restores into it.
+clone() and restore() without a world first build an empty GameWorld. It
+has no wave spawned, and its RNG streams are copied or set from words
+instead of derived from the seed, but it still allocates a BodyStore,
+pools and particles, which costs a few times a scratch restore.
+"""
+import numpy as np
+
+from settings import SAUCER_LARGE_RADIUS, SAUCER_SMALL_RADIUS
+from asteroid import Asteroid
+from saucer import Saucer
+from bullet import Bullet
+from transform_cache import SHAPES
+from rng import STREAMS, STATE_WORDS, RngService
+from world import GameWorld, PlaySubState
+
+MAGIC = 0x574F524C44          # "WORLD"
+VERSION = 1
+
+_CAUSES = ("asteroid", "saucer", "saucer_bullet", "hyperspace")
+_SIZES = ("large", "medium", "small")
+_STREAM_OF = ("spawn", "split")       # the RngService stream an asteroid splits with
+
+_WORLD_FIELDS = (
+    "score", "lives", "wave", "ticks", "pair_tests", "game_over", "play_sub_state",
+    "_respawn_timer", "_wave_timer", "_saucer_timer", "_next_extra_life_threshold", "clock",
+) + tuple("deaths." + c for c in _CAUSES)
+_SHIP_FIELDS = (
+    "alive", "invincible", "invincibility_timer", "_blink_time", "_show", "_thrust_on",
+    "_hyperspace_cooldown", "_flame_time",
+)
+_SHIP_FLAGS = {"alive", "invincible", "_show", "_thrust_on"}
+_ROW_FIELDS = ("x", "y", "vx", "vy", "rot", "spin", "life", "drag", "wrap_x", "kind",
+               "prev_x", "prev_y", "prev_rot")
+_SAUCER_FIELDS = ("large", "_fire_interval", "_fire_timer", "_wants_to_fire", "expired",
+                  "_dir_timer", "_off_screen_timer")
+
+_OUTLINE_CACHE = 2048     # outlines kept by restore(), keyed by their vertex bytes
+_outlines = {}            # bytes -> (polygon, ShapeTable)
+
+_HEADER = 9
+_NW, _NS, _NR = len(_WORLD_FIELDS), len(_SHIP_FIELDS), len(_ROW_FIELDS)
+_NRNG = 1 + len(STREAMS) * STATE_WORDS
+_AST = 4
+_NSAU = len(_SAUCER_FIELDS)
+
+
+def _sections(header: np.ndarray) -> tuple:
+    """(start, stop) of every section after the header, for the given counts."""
+    rows, asteroids, saucers, _, _, vertices, filed = (int(v) for v in header[2:9])
+    sizes = (_NW, _NS, _NRNG, rows * _NR, asteroids * _AST, saucers * _NSAU, vertices * 2, filed)
+    bounds, start = [], _HEADER
+    for size in sizes:
+        bounds.append((start, start + size))
+        start += size
+    return tuple(bounds)
+
+
+# ── Capture ───────────────────────────────────────────────────
+def snapshot(world: GameWorld) -> np.ndarray:
+    """The world's simulation state as a flat float64 array."""
+    ship = world.ship
+    asteroids, saucers = world.asteroids, world.saucers
+    player, enemy = world.player_bullets.active, world.enemy_bullets.active
+    bodies = [ship, *asteroids, *saucers, *player, *enemy]
+    row_of = {id(b): i for i, b in enumerate(bodies)}
+    filed = [row_of[id(o)] for o in world._grid._spans if id(o) in row_of]
+    outlines = [v for a in asteroids for p in a._polygon for v in p]
+
+    header = np.array([MAGIC, VERSION, len(bodies), len(asteroids), len(saucers),
+                       len(player), len(enemy), len(outlines) // 2, len(filed)], dtype=float)
+    sections = _sections(header)
+    snap = np.empty(sections[-1][1])
+    snap[:_HEADER] = header
+    (w0, w1), (s0, s1), (r0, r1), (b0, b1), (a0, a1), (u0, u1), (v0, v1), (f0, f1) = sections
+
+    deaths = world.deaths
+    if not deaths.keys() <= set(_CAUSES):
+        raise ValueError(f"unknown death causes {sorted(deaths.keys() - set(_CAUSES))}")
+    snap[w0:w1] = [
+        world.score, world.lives, world.wave, world.ticks, world.pair_tests, world.game_over,
+        world.play_sub_state.value, world._respawn_timer, world._wave_timer,
+        world._saucer_timer, world._next_extra_life_threshold, world.clock.now(),
+    ] + [deaths.get(c, 0) for c in _CAUSES]
+    snap[s0:s1] = [getattr(ship, name) for name in _SHIP_FIELDS]
+    rng = snap[r0:r1].view(np.uint64)
+    rng[0] = world.rng.seed
+    rng[1:] = world.rng.getwords()
+
+    store = world.bodies
+    slots = np.fromiter((b._slot for b in bodies), np.intp, len(bodies))
+    rows = snap[b0:b1].reshape(len(bodies), _NR)
+    rows[:, 0:2] = store.pos[slots]
+    rows[:, 2:4] = store.vel[slots]
+    rows[:, 4] = store.rot[slots]
+    rows[:, 5] = store.spin[slots]
+    rows[:, 6] = store.life[slots]
+    rows[:, 7] = store.drag[slots]
+    rows[:, 8] = store.wrap_x[slots]
+    rows[:, 9] = store.kind[slots]
+    rows[:, 10:12] = store.prev_pos[slots]
+    rows[:, 12] = store.prev_rot[slots]
+
+    split = world.rng.split
+    snap[a0:a1] = [v for a in asteroids
+                   for v in (_SIZES.index(a.size), a._rng is split, a.radius, len(a._polygon))]
+    snap[u0:u1] = [getattr(s, name) for s in saucers for name in _SAUCER_FIELDS]
+    snap[v0:v1] = outlines
+    snap[f0:f1] = filed
+    return snap
+
+
+# ── Restore ───────────────────────────────────────────────────
+def restore(snap: np.ndarray, world: GameWorld = None) -> GameWorld:
+    """Put world (or a new one) into the snapshot's state; returns the world."""
+    snap = np.asarray(snap, dtype=float)
+    header = snap[:_HEADER]
+    if len(header) < _HEADER or header[0] != MAGIC:
+        raise ValueError("not a world snapshot")
+    if header[1] != VERSION:
+        raise ValueError(f"snapshot version {int(header[1])}, expected {VERSION}")
+    sections = _sections(header)
+    if len(snap) != sections[-1][1]:
+        raise ValueError("snapshot length does not match its header")
+    (w0, w1), (s0, s1), (r0, r1), (b0, b1), (a0, a1), (u0, u1), (v0, v1), (f0, f1) = sections
+    n, n_ast, n_sau, n_player = (int(v) for v in header[2:6])
+
+    rng_words = snap[r0:r1].view(np.uint64)
+    if world is None:
+        rng = RngService.from_words(int(rng_words[0]), rng_words[1:].tolist())
+        world = GameWorld(rng=rng, spawn=False)
+
+    # Old entities let go of their slots without freeing rows the new ones will own
+    for group in (world.asteroids, world.saucers):
+        for o in group:
+            o._slot = -1
+    for pool in (world.player_bullets, world.enemy_bullets):
+        for b in pool.active:
+            b._slot = b._index = -1
+        pool._free.extend(pool.active)
+        pool.active = []
+
+    _restore_store(world.bodies, snap[b0:b1].reshape(n, _NR))
+
+    values = snap[w0:w1].tolist()
+    (world.score, world.lives, world.wave, world.ticks, world.pair_tests, game_over, sub_state,
+     world._respawn_timer, world._wave_timer, world._saucer_timer, threshold, now) = values[:12]
+    world.score, world.lives, world.wave = int(world.score), int(world.lives), int(world.wave)
+    world.ticks, world.pair_tests = int(world.ticks), int(world.pair_tests)
+    world.game_over = bool(game_over)
+    world.play_sub_state = PlaySubState(int(sub_state))
+    world._next_extra_life_threshold = int(threshold)
+    world.clock._now = now
+    world.deaths = {c: int(k) for c, k in zip(_CAUSES, values[12:]) if k}
+    world.rng.seed = int(rng_words[0])
+    world.rng.setwords(rng_words[1:].tolist())
+
+    ship = world.ship
+    ship._slot = 0
+    for name, v in zip(_SHIP_FIELDS, snap[s0:s1].tolist()):
+        setattr(ship, name, bool(v) if name in _SHIP_FLAGS else v)
+
+    store, rng = world.bodies, world.rng
+    records = snap[a0:a1].reshape(n_ast, _AST).tolist()
+    if len(_outlines) > _OUTLINE_CACHE:
+        _outlines.clear()
+    asteroids, k = [], v0
+    for row, (size, stream, radius, count) in enumerate(records, 1):
+        a = Asteroid.__new__(Asteroid)
+        a._store, a._slot = store, row
+        a.size = _SIZES[int(size)]
+        a.radius = radius
+        a._rng = rng.stream(_STREAM_OF[int(stream)])
+        end = k + 2 * int(count)
+        key = snap[k:end].tobytes()
+        outline = _outlines.get(key)
+        if outline is None:
+            polygon = [tuple(p) for p in snap[k:end].reshape(-1, 2).tolist()]
+            outline = _outlines[key] = (polygon, SHAPES.shape(polygon))
+        a._polygon, a._shape = outline
+        k = end
+        asteroids.append(a)
+    world.asteroids = asteroids
+
+    saucers = []
+    for row, fields in enumerate(snap[u0:u1].reshape(n_sau, _NSAU).tolist(), 1 + n_ast):
+        s = Saucer.__new__(Saucer)
+        s._store, s._slot, s._rng = store, row, rng.saucer
+        (large, s._fire_interval, s._fire_timer, wants, expired,
+         s._dir_timer, s._off_screen_timer) = fields
+        s.large, s._wants_to_fire, s.expired = bool(large), bool(wants), bool(expired)
+        s.radius = SAUCER_LARGE_RADIUS if s.large else SAUCER_SMALL_RADIUS
+        saucers.append(s)
+    world.saucers = saucers
+
+    first = 1 + n_ast + n_sau
+    _refill_pool(world.player_bullets, range(first, first + n_player))
+    _refill_pool(world.enemy_bullets, range(first + n_player, n))
+
+    grid = world._grid
+    grid.clear()
+    targets = [None] + asteroids + saucers
+    for row in snap[f0:f1].astype(np.intp).tolist():
+        grid.insert(targets[row])
+
+    world._dead.clear()
+    world.events = []
+    world.particles.clear()
+    return world
+
+
+def clone(world: GameWorld) -> GameWorld:
+    """An independent copy of the world, built from its snapshot."""
+    fork = GameWorld(rng=world.rng.copy(), spawn=False)
+    restore(snapshot(world), fork)
+    fork.explosion_particles = world.explosion_particles
+    fork.particle_limit = world.particle_limit
+    fork.particles.set_limit(world.particle_limit)
+    fork.asteroid_vertices = world.asteroid_vertices
+    return fork
+
+
+def _restore_store(store, rows: np.ndarray) -> None:
+    """Make store rows 0..n-1 the snapshot's bodies and free everything above."""
+    n = len(rows)
+    if store.capacity < n:
+        store._grow(max(n, store.capacity * 2))
+    top = max(store._top, n)
+    store.active[n:top] = False
+    store.kind[n:top] = -1
+    store.vel[n:top] = 0.0
+    store.spin[n:top] = 0.0
+    store.life[n:top] = np.inf
+    store.drag[n:top] = 1.0
+    store.wrap_x[n:top] = True
+
+    store.pos[:n] = store.draw_pos[:n] = rows[:, 0:2]
+    store.vel[:n] = rows[:, 2:4]
+    store.rot[:n] = store.draw_rot[:n] = rows[:, 4]
+    store.spin[:n] = rows[:, 5]
+    store.life[:n] = rows[:, 6]
+    store.drag[:n] = rows[:, 7]
+    store.wrap_x[:n] = rows[:, 8] != 0
+    store.kind[:n] = rows[:, 9]
+    store.prev_pos[:n] = rows[:, 10:12]
+    store.prev_rot[:n] = rows[:, 12]
+    store.active[:n] = True
+    store._top = n
+    store._free = list(range(store.capacity - 1, n - 1, -1))
+
+
+def _refill_pool(pool, rows: range) -> None:
+    free = pool._free
+    for i, row in enumerate(rows):
+        if free:
+            b = free.pop()
+        else:
+            b = Bullet.__new__(Bullet)
+            b._store, b.is_player_bullet = pool._store, pool.is_player_bullet
+        b._slot, b._index = row, i
+        pool.active.append(b)
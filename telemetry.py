@@ -0,0 +1,225 @@
+"""
+Per-frame telemetry to JSONL, and an offline analyzer.
+
+TelemetrySink turns each frame closed by the FrameProfiler into one JSON
+record. The record holds the frame time, non-zero phase durations, body
+counts, collision pairs tested, GC runs, state, sub-state, wave and quality
+tier. Records are batched and handed to a TelemetryWriter thread, which
+serializes and writes them. The render thread never touches the file. If
+the disk falls behind by TELEMETRY_QUEUE batches, new batches are dropped
+and counted rather than stalling a frame.
+
+The first line of a file is {"meta": {...}} with the frame cap the session
+ran at. The analyzer streams the files line by line and reports frame-time
+percentiles by game state, by wave, by entity-count bucket and by quality
+tier. For each group it also gives the share of frames slower than
+TELEMETRY_SLOW_FACTOR times the frame budget:
+
+    python telemetry.py data/telemetry/*.jsonl
+"""
+import gc
+import json
+import queue
+import sys
+import threading
+import time
+
+import numpy as np
+from settings import TELEMETRY_BATCH, TELEMETRY_QUEUE, TELEMETRY_BUCKET, TELEMETRY_SLOW_FACTOR, FPS
+
+
+# ── Writing ───────────────────────────────────────────────────
+class TelemetryWriter:
+    """Appends dict records to a JSONL file from a background thread."""
+
+    def __init__(self, path: str, batch: int = TELEMETRY_BATCH, max_batches: int = TELEMETRY_QUEUE) -> None:
+        self.path = path
+        self.dropped = 0          # records lost because the queue was full
+        self._batch_size = batch
+        self._batch = []
+        self._queue = queue.Queue(max_batches)
+        self._file = open(path, "w", encoding="utf-8")
+        self._thread = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, record: dict) -> None:
+        """Queue one record; never blocks."""
+        batch = self._batch
+        batch.append(record)
+        if len(batch) >= self._batch_size:
+            self._hand_off()
+
+    def _hand_off(self) -> None:
+        batch, self._batch = self._batch, []
+        try:
+            self._queue.put_nowait(batch)
+        except queue.Full:
+            self.dropped += len(batch)
+
+    def _run(self) -> None:
+        dumps = json.dumps
+        f = self._file
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                break
+            f.write("".join(dumps(r, separators=(",", ":")) + "\n" for r in batch))
+            f.flush()
+        f.close()
+
+    def close(self) -> None:
+        """Write what is buffered and wait for the thread to finish."""
+        if self._thread.is_alive():
+            if self._batch:
+                self._queue.put(self._batch)
+                self._batch = []
+            self._queue.put(None)
+            self._thread.join()
+
+
+class TelemetrySink:
+    """Builds one record per profiled frame and feeds a TelemetryWriter."""
+
+    def __init__(self, path: str, meta: dict = None, writer: TelemetryWriter = None) -> None:
+        self.writer = writer if writer is not None else TelemetryWriter(path)
+        self.writer.write({"meta": dict(meta or {}, started=time.strftime("%Y-%m-%dT%H:%M:%S"))})
+        self._t0 = time.perf_counter()
+        self._gc_runs = 0
+        self._world = None
+        self._pair_tests = 0
+        self._seen = 0    # profiler.total already recorded
+        self._decision = None   # latest quality decision already recorded
+        gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._gc_runs += 1
+
+    def frame(self, profiler, state: str, world=None, quality=None) -> None:
+        """Record the frame the profiler closed most recently, if not done yet.
+
+        state is the game state that frame ran in, captured by the caller as
+        the frame finished rather than read when the record is built.
+        quality, a QualityGovernor, adds the current tier and any tier
+        change decided since the previous record.
+        """
+        if profiler.total == self._seen:
+            return
+        self._seen = profiler.total
+        row = (profiler.head - 1) % profiler.capacity
+        rec = {
+            "t": round(time.perf_counter() - self._t0, 4),
+            "dt": round(int(profiler.frame_ns[row]) / 1e6, 3),
+            "phases": {name: round(ns / 1e6, 3)
+                       for name, ns in zip(profiler.phases, profiler.samples[row].tolist()) if ns},
+            "gc": self._gc_runs,
+            "state": state,
+        }
+        self._gc_runs = 0
+        if world is not None:
+            if world is not self._world:
+                self._world, self._pair_tests = world, 0
+            rec["sub_state"] = world.play_sub_state.name
+            rec["wave"] = world.wave
+            rec["bullets"] = len(world.player_bullets) + len(world.enemy_bullets)
+            rec["asteroids"] = len(world.asteroids)
+            rec["saucers"] = len(world.saucers)
+            rec["particles"] = len(world.particles)
+            rec["pairs"] = world.pair_tests - self._pair_tests
+            self._pair_tests = world.pair_tests
+        if quality is not None:
+            rec["tier"] = quality.tier.name
+            if quality.decisions and quality.decisions[-1] is not self._decision:
+                self._decision = quality.decisions[-1]
+                _, old, new, ms = self._decision
+                rec["quality"] = {"from": old, "to": new, "ms": ms}
+        self.writer.write(rec)
+
+    def close(self) -> None:
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        self.writer.close()
+
+
+# ── Analysis ──────────────────────────────────────────────────
+def read_records(paths):
+    """Yield (meta, record) for every frame record in the files, one line at a time."""
+    for path in paths:
+        meta = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue      # a torn last line from a killed session
+                if "meta" in rec:
+                    meta = rec["meta"]
+                else:
+                    yield meta, rec
+
+
+def analyze(paths, bucket: int = TELEMETRY_BUCKET, slow_factor: float = TELEMETRY_SLOW_FACTOR) -> dict:
+    """Frame-time stats grouped by state, by wave and by entity-count bucket."""
+    groups = {"state": {}, "wave": {}, "entities": {}, "tier": {}}
+    for meta, rec in read_records(paths):
+        dt, slow = rec["dt"], 1000.0 * slow_factor / meta.get("max_fps", FPS)
+        keys = [("state", rec["state"])]
+        if "tier" in rec:
+            keys.append(("tier", rec["tier"]))
+        if rec["state"] == "PLAYING" and "wave" in rec:
+            keys.append(("wave", rec["wave"]))
+            n = rec["asteroids"] + rec["bullets"] + rec["saucers"]
+            keys.append(("entities", n // bucket * bucket))
+        for group, key in keys:
+            entry = groups[group].get(key)
+            if entry is None:
+                entry = groups[group][key] = [[], 0]
+            entry[0].append(dt)
+            if dt > slow:
+                entry[1] += 1
+
+    report = {}
+    for group, by_key in groups.items():
+        rows = {}
+        for key in sorted(by_key):
+            dts, slow = by_key[key]
+            a = np.asarray(dts)
+            label = f"{key}-{key + bucket - 1}" if group == "entities" else str(key)
+            rows[label] = {
+                "frames": len(dts),
+                "p50": round(float(np.percentile(a, 50)), 2),
+                "p90": round(float(np.percentile(a, 90)), 2),
+                "p99": round(float(np.percentile(a, 99)), 2),
+                "max": round(float(a.max()), 2),
+                "slow": round(slow / len(dts), 4),
+            }
+        report[group] = rows
+    return report
+
+
+def format_report(report: dict) -> str:
+    lines = []
+    for group, rows in report.items():
+        if not rows:
+            continue
+        lines.append(f"\nby {group}")
+        lines.append(f"  {'':<14}{'frames':>8}{'p50':>8}{'p90':>8}{'p99':>8}{'max':>8}{'slow':>8}")
+        for key, r in rows.items():
+            lines.append(f"  {key:<14}{r['frames']:>8}{r['p50']:>8.2f}{r['p90']:>8.2f}"
+                         f"{r['p99']:>8.2f}{r['max']:>8.2f}{r['slow']:>8.1%}")
+    return "\n".join(lines).lstrip("\n")
+
+
+def main(argv=None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+    if not args:
+        print("usage: python telemetry.py FILE.jsonl [FILE.jsonl ...]")
+        sys.exit(2)
+    print(format_report(analyze(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import settings
+import ship as ship_module
+from batch import (
+    Aggregate, AimPolicy, RandomPolicy, apply_overrides, restore_overrides,
+    parse_override, play, run, run_job,
+)
+from world import GameWorld
+
+
+# ── Overrides ─────────────────────────────────────────────────
+class TestOverrides:
+    def test_parse_literal_and_widen_int_to_float(self):
+        assert parse_override("WAVE_ASTEROID_START=6") == ("WAVE_ASTEROID_START", 6)
+        assert parse_override("HYPERSPACE_DEATH_CHANCE=0") == ("HYPERSPACE_DEATH_CHANCE", 0.0)
+
+    @pytest.mark.parametrize("text", ["NOPE=1", "WAVE_ASTEROID_START", "WAVE_ASTEROID_START=2.5",
+                                      "WAVE_ASTEROID_START=abc", "os=1"])
+    def test_rejects_unknown_or_mistyped(self, text):
+        with pytest.raises(ValueError):
+            parse_override(text)
+
+    def test_patches_importers_and_restores(self):
+        before = ship_module.HYPERSPACE_DEATH_CHANCE
+        saved = apply_overrides({"HYPERSPACE_DEATH_CHANCE": 1.0})
+        assert settings.HYPERSPACE_DEATH_CHANCE == 1.0
+        assert ship_module.HYPERSPACE_DEATH_CHANCE == 1.0
+        restore_overrides(saved)
+        assert ship_module.HYPERSPACE_DEATH_CHANCE == before
+        assert settings.HYPERSPACE_DEATH_CHANCE == before
+
+    def test_override_changes_the_game(self):
+        summary = run_job((0, "idle", {"WAVE_ASTEROID_START": 7}, 1, [3]))[0]
+        assert summary["arm"] == 0
+        world = GameWorld(seed=3)
+        assert len(world.asteroids) == settings.WAVE_ASTEROID_START   # restored after the job
+
+
+# ── Games ─────────────────────────────────────────────────────
+class TestPlay:
+    def test_summary_is_deterministic_per_seed(self):
+        assert play(5, "random", 1200) == play(5, "random", 1200)
+
+    def test_summary_fields(self):
+        s = play(1, "idle", 600)
+        assert set(s) == {"seed", "score", "wave", "deaths", "ticks", "game_over"}
+        assert s["ticks"] <= 600
+
+    def test_deaths_by_cause_account_for_lives(self):
+        world = GameWorld(seed=2)
+        world.run(RandomPolicy(2), 20000)
+        assert world.game_over
+        assert sum(world.deaths.values()) >= settings.MAX_LIVES
+        assert set(world.deaths) <= {"asteroid", "saucer", "saucer_bullet", "hyperspace"}
+
+    def test_aim_policy_scores(self):
+        world = GameWorld(seed=4)
+        world.run(AimPolicy(4), 1800)
+        assert world.score > 0
+
+
+# ── Aggregation ───────────────────────────────────────────────
+class TestAggregate:
+    def _summary(self, score, wave=1, deaths=None, game_over=True):
+        return {"seed": 0, "score": score, "wave": wave, "deaths": deaths or {},
+                "ticks": 3600, "game_over": game_over}
+
+    def test_report(self):
+        agg = Aggregate("x", bucket=100)
+        for score in (50, 150, 250, 950):
+            agg.add(self._summary(score, wave=2, deaths={"asteroid": 2}))
+        agg.add(self._summary(0, wave=1, deaths={"hyperspace": 1}, game_over=False))
+        r = agg.report()
+        assert r["games"] == 5 and r["finished"] == 4
+        assert r["score_mean"] == 280.0 and r["score_max"] == 950
+        assert r["score_p50"] == 200
+        assert r["score_p90"] == 1000
+        assert r["waves"] == {"1": 1, "2": 4}
+        assert r["deaths_per_game"] == {"asteroid": 1.6, "hyperspace": 0.2}
+        assert r["minutes_mean"] == 1.0
+
+    def test_empty(self):
+        assert Aggregate("x").report()["games"] == 0
+
+
+class TestRun:
+    def test_pool_matches_serial_and_arms_share_seeds(self):
+        arms = [{}, {"HYPERSPACE_DEATH_CHANCE": 0.0}]
+        seen = []
+        aggs = run(arms, games=3, policy="random", seed=10, workers=2, chunk=2,
+                   max_ticks=600, on_progress=seen.append)
+        assert [a.games for a in aggs] == [3, 3]
+        assert seen[-1] == 6
+        serial = Aggregate("defaults")
+        for seed in range(10, 13):
+            serial.add(play(seed, "random", 600))
+        assert aggs[0].report() == serial.report()
+        assert aggs[1].label == "HYPERSPACE_DEATH_CHANCE=0.0"
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            run([{}], games=1, policy="nope")
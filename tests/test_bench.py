@@ -0,0 +1,100 @@
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import bench
+from bench import SCENARIOS, PHASES, PhaseTimer, compare, run
+
+
+@pytest.fixture(scope="module")
+def results():
+    return run(["wave1", "bullets_200"], frames=5, warmup=1, alloc_frames=2)
+
+
+class TestPhaseTimer:
+    def test_charges_time_since_last_mark(self):
+        ticks = iter([100, 150, 400, 410])
+        timer = PhaseTimer()
+        timer.clock = lambda: next(ticks)
+        assert timer.start() == 100
+        timer("a")
+        timer("b")
+        timer("a")
+        assert timer.ns == {"a": 60, "b": 250}
+
+
+class TestScenarios:
+    @pytest.mark.parametrize("name", list(SCENARIOS))
+    def test_top_up_restores_load(self, name):
+        scenario = SCENARIOS[name]
+        world, rng = scenario.build(7)
+        scenario.top_up(world, rng)
+        for _ in range(30):
+            world.step(bench.NO_INPUT, 1 / 60)
+            scenario.top_up(world, rng)
+        assert not world.game_over
+        assert world.ship.invincible
+        assert world.events == []
+        if name == "particles_500":
+            assert len(world.particles) >= 500
+        if name == "saucers_5":
+            assert len(world.saucers) == 5
+        if name == "bullets_200":
+            assert len(world.player_bullets) == 200
+
+    def test_same_seed_same_world(self):
+        a, rng_a = SCENARIOS["edge_clusters"].build(3)
+        b, rng_b = SCENARIOS["edge_clusters"].build(3)
+        assert [tuple(x.pos) for x in a.asteroids] == [tuple(x.pos) for x in b.asteroids]
+
+
+class TestRun:
+    def test_reports_every_phase(self, results):
+        for res in results["scenarios"].values():
+            assert set(res["phases"]) == set(PHASES)
+            for s in res["phases"].values():
+                assert 0 <= s["p50"] <= s["p99"] <= s["max"]
+            assert {"peak_kb_mean", "net_blocks_mean", "gc_collections"} <= set(res["alloc"])
+        assert results["scenarios"]["bullets_200"]["phases"]["collisions"]["mean"] > 0
+
+    def test_results_are_json(self, results):
+        assert json.loads(json.dumps(results)) == results
+
+    def test_unknown_scenario(self):
+        with pytest.raises(ValueError):
+            run(["nope"])
+
+
+class TestCompare:
+    def _with(self, results, factor):
+        out = json.loads(json.dumps(results))
+        for res in out["scenarios"].values():
+            for s in res["phases"].values():
+                for k in s:
+                    s[k] *= factor
+        return out
+
+    def test_flags_slowdown_past_threshold(self, results):
+        base = self._with(results, 1.0)
+        slower = self._with(results, 1.5)
+        rows = compare(slower, base, threshold=0.1)
+        assert rows and all(r[5] for r in rows if r[2] > 0)
+
+    def test_noise_is_not_a_regression(self, results):
+        rows = compare(self._with(results, 1.05), results, threshold=0.1)
+        assert not any(r[5] for r in rows)
+
+    def test_skips_scenarios_missing_from_baseline(self, results):
+        assert compare(results, {"scenarios": {}}) == []
+
+    def test_main_exits_nonzero_on_regression(self, results, tmp_path):
+        fast = self._with(results, 0.01)
+        path = tmp_path / "base.json"
+        path.write_text(json.dumps(fast))
+        code = bench.main(["wave1", "--frames", "5", "--warmup", "1", "--alloc-frames", "1",
+                           "--out", str(tmp_path / "out.json"), "--baseline", str(path)])
+        assert code == 1
+        assert (tmp_path / "out.json").exists()
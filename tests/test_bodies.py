@@ -0,0 +1,161 @@
+import sys
+import os
+import math
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+import pytest
+from bodies import BodyStore, KIND_ASTEROID, KIND_BULLET
+from settings import FPS
+
+
+# ── BodyStore ─────────────────────────────────────────────────
+class TestBodyStore:
+    def setup_method(self):
+        self.store = BodyStore(capacity=4, width=100, height=50)
+
+    def test_alloc_returns_distinct_slots(self):
+        a = self.store.alloc(KIND_ASTEROID, 0, 0)
+        b = self.store.alloc(KIND_ASTEROID, 0, 0)
+        assert a != b
+        assert len(self.store) == 2
+
+    def test_grows_past_capacity(self):
+        slots = [self.store.alloc(KIND_BULLET, i, 0) for i in range(20)]
+        assert len(set(slots)) == 20
+        assert self.store.capacity >= 20
+        assert self.store.pos[slots[3], 0] == pytest.approx(3)
+
+    def test_free_slot_is_reused(self):
+        a = self.store.alloc(KIND_BULLET, 0, 0)
+        self.store.free(a)
+        assert len(self.store) == 0
+        assert self.store.alloc(KIND_BULLET, 0, 0) == a
+
+    def test_integrate_moves_and_wraps(self):
+        s = self.store.alloc(KIND_ASTEROID, 90, 45, vx=20, vy=10)
+        self.store.integrate(1.0)
+        assert self.store.pos[s, 0] == pytest.approx(10)
+        assert self.store.pos[s, 1] == pytest.approx(5)
+
+    def test_integrate_skips_x_wrap_when_disabled(self):
+        s = self.store.alloc(KIND_ASTEROID, 90, 10, vx=20, wrap_x=False)
+        self.store.integrate(1.0)
+        assert self.store.pos[s, 0] == pytest.approx(110)
+
+    def test_integrate_spins_ages_and_drags(self):
+        s = self.store.alloc(KIND_BULLET, 0, 0, vx=10, spin=90, life=1.0, drag=0.5)
+        self.store.integrate(0.5)
+        assert self.store.rot[s] == pytest.approx(45)
+        assert self.store.life[s] == pytest.approx(0.5)
+        # Drag is a per-1/FPS-second factor, compounded over dt
+        assert self.store.vel[s, 0] == pytest.approx(10 * 0.5 ** (0.5 * FPS))
+
+    def test_drag_is_tick_rate_independent(self):
+        a = self.store.alloc(KIND_BULLET, 0, 0, vx=100, drag=0.9)
+        b = self.store.alloc(KIND_BULLET, 0, 10, vx=100, drag=0.9)
+        other = BodyStore()
+        c = other.alloc(KIND_BULLET, 0, 0, vx=100, drag=0.9)
+        for _ in range(120):
+            self.store.integrate(1 / 120)
+        for _ in range(30):
+            other.integrate(1 / 30)
+        assert self.store.vel[a, 0] == pytest.approx(other.vel[c, 0])
+        assert self.store.vel[b, 0] == pytest.approx(other.vel[c, 0])
+
+    def test_interpolate_blends_prev_and_current(self):
+        s = self.store.alloc(KIND_ASTEROID, 10, 10, vx=20, spin=40)
+        self.store.snapshot()
+        self.store.integrate(0.5)
+        self.store.interpolate(0.25)
+        assert tuple(self.store.draw_pos[s]) == pytest.approx((12.5, 10))
+        assert self.store.draw_rot[s] == pytest.approx(5)
+
+    def test_interpolate_follows_wrap(self):
+        s = self.store.alloc(KIND_ASTEROID, 98, 10, vx=8)
+        self.store.snapshot()
+        self.store.integrate(0.5)          # 98 -> 102 wraps to 2
+        self.store.interpolate(0.5)
+        assert self.store.draw_pos[s, 0] == pytest.approx(100)
+
+    def test_integrate_resets_draw_state(self):
+        s = self.store.alloc(KIND_ASTEROID, 10, 10, vx=20)
+        self.store.integrate(0.5)
+        assert tuple(self.store.draw_pos[s]) == pytest.approx((20, 10))
+
+    def test_free_rows_do_not_move(self):
+        s = self.store.alloc(KIND_BULLET, 10, 10, vx=50, life=1.0)
+        self.store.free(s)
+        self.store.integrate(1.0)
+        assert self.store.pos[s, 0] == pytest.approx(10)
+        assert not self.store.has_expired()
+
+    def test_has_expired(self):
+        self.store.alloc(KIND_BULLET, 0, 0, life=0.1)
+        assert not self.store.has_expired()
+        self.store.integrate(0.2)
+        assert self.store.has_expired()
+
+    def test_integrate_slot_matches_integrate(self):
+        other = BodyStore(capacity=4, width=100, height=50)
+        a = self.store.alloc(KIND_BULLET, 95, 5, vx=30, vy=-20, life=1.0, drag=0.9)
+        b = other.alloc(KIND_BULLET, 95, 5, vx=30, vy=-20, life=1.0, drag=0.9)
+        self.store.integrate(0.5)
+        other.integrate_slot(b, 0.5)
+        np.testing.assert_allclose(self.store.pos[a], other.pos[b])
+        np.testing.assert_allclose(self.store.vel[a], other.vel[b])
+
+
+# ── Body views ────────────────────────────────────────────────
+class TestBodyViews:
+    def test_asteroid_views_its_slot(self):
+        from asteroid import Asteroid
+        store = BodyStore()
+        a = Asteroid(pygame.Vector2(10, 20), pygame.Vector2(3, 4), "small", store=store)
+        assert tuple(store.pos[a._slot]) == (10, 20)
+        a.pos = pygame.Vector2(50, 60)
+        assert store.pos[a._slot, 0] == 50
+        assert a.vel.y == pytest.approx(4)
+
+    def test_release_frees_slot(self):
+        from bullet import Bullet
+        store = BodyStore()
+        b = Bullet(pygame.Vector2(0, 0), 0, pygame.Vector2(0, 0), store=store)
+        assert len(store) == 1
+        b.release()
+        assert len(store) == 0
+
+    def test_one_pass_moves_every_kind(self):
+        from asteroid import Asteroid
+        from bullet import Bullet
+        from ship import PlayerShip
+        store = BodyStore()
+        a = Asteroid(pygame.Vector2(100, 100), pygame.Vector2(60, 0), "large", store=store)
+        b = Bullet(pygame.Vector2(100, 100), 90, pygame.Vector2(0, 0), store=store)
+        ship = PlayerShip(100, 100, store=store)
+        ship.vel = pygame.Vector2(0, 30)
+        store.integrate(0.5)
+        assert a.pos.x == pytest.approx(130)
+        assert b.pos.x > 100
+        assert ship.pos.y == pytest.approx(115)
+
+    def test_ship_angle_lives_in_store(self):
+        from ship import PlayerShip
+        store = BodyStore()
+        ship = PlayerShip(0, 0, store=store)
+        ship.angle += 45
+        assert store.rot[ship._slot] == pytest.approx(45)
+
+    def test_world_releases_slots_between_waves(self):
+        import random
+        from world import GameWorld, NO_INPUT
+        world = GameWorld(rng=random.Random(5))
+        for a in world.asteroids:
+            a.release()
+        world.asteroids = []
+        world.step(NO_INPUT, 1 / 60)
+        world.step(NO_INPUT, 5.0)
+        # ship + the new wave's asteroids only
+        assert len(world.bodies) == 1 + len(world.asteroids)
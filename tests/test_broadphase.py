@@ -0,0 +1,108 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+from broadphase import SpatialHash
+from utils import circles_collide_wrapped
+
+
+class _Body:
+    def __init__(self, x, y, radius):
+        self.pos = pygame.Vector2(x, y)
+        self.radius = radius
+
+
+# ── SpatialHash ───────────────────────────────────────────────
+class TestSpatialHash:
+    def setup_method(self):
+        self.grid = SpatialHash(1280, 720, cell_size=100)
+
+    def test_grid_tiles_field_exactly(self):
+        assert self.grid.cols == 12
+        assert self.grid.rows == 7
+
+    def test_query_finds_nearby(self):
+        a = _Body(200, 200, 50)
+        self.grid.sync([a])
+        assert self.grid.query(pygame.Vector2(210, 205), 3) == [a]
+
+    def test_query_skips_distant(self):
+        a = _Body(200, 200, 50)
+        self.grid.sync([a])
+        assert self.grid.query(pygame.Vector2(900, 600), 3) == []
+
+    def test_straddler_found_across_right_edge(self):
+        a = _Body(1275, 360, 50)
+        self.grid.sync([a])
+        assert a in self.grid.query(pygame.Vector2(10, 360), 3)
+
+    def test_straddler_found_across_corner(self):
+        a = _Body(1275, 715, 50)
+        self.grid.sync([a])
+        assert a in self.grid.query(pygame.Vector2(5, 5), 3)
+
+    def test_query_has_no_duplicates(self):
+        a = _Body(640, 360, 50)   # spans several cells
+        self.grid.sync([a])
+        assert self.grid.query(pygame.Vector2(640, 360), 60) == [a]
+
+    def test_sync_moves_object(self):
+        a = _Body(100, 100, 10)
+        self.grid.sync([a])
+        a.pos = pygame.Vector2(900, 500)
+        self.grid.sync([a])
+        assert self.grid.query(pygame.Vector2(100, 100), 3) == []
+        assert self.grid.query(pygame.Vector2(900, 500), 3) == [a]
+
+    def test_sync_drops_missing_objects(self):
+        a = _Body(100, 100, 10)
+        b = _Body(110, 100, 10)
+        self.grid.sync([a, b])
+        self.grid.sync([b])
+        assert a not in self.grid
+        assert self.grid.query(pygame.Vector2(100, 100), 3) == [b]
+
+    def test_remove(self):
+        a = _Body(100, 100, 10)
+        self.grid.insert(a)
+        self.grid.remove(a)
+        assert len(self.grid) == 0
+        assert self.grid.query(pygame.Vector2(100, 100), 3) == []
+
+    def test_candidate_pairs(self):
+        a = _Body(100, 100, 20)
+        self.grid.sync([a])
+        near = _Body(105, 100, 0)
+        far = _Body(1000, 600, 0)
+        assert self.grid.candidate_pairs([near, far], 3) == [(near, a)]
+
+    def test_candidates_cover_every_true_overlap(self):
+        import random
+        rng = random.Random(7)
+        bodies = [_Body(rng.uniform(0, 1280), rng.uniform(0, 720), rng.choice([12, 25, 50]))
+                  for _ in range(300)]
+        self.grid.sync(bodies)
+        for _ in range(300):
+            p = pygame.Vector2(rng.uniform(0, 1280), rng.uniform(0, 720))
+            candidates = set(self.grid.query(p, 3))
+            for b in bodies:
+                if circles_collide_wrapped(p, 3, b.pos, b.radius, 1280, 720):
+                    assert b in candidates
+
+
+# ── circles_collide_wrapped ───────────────────────────────────
+class TestCirclesCollideWrapped:
+    def test_plain_overlap(self):
+        assert circles_collide_wrapped(
+            pygame.Vector2(0, 0), 10, pygame.Vector2(5, 0), 10, 1280, 720) is True
+
+    def test_overlap_across_seam(self):
+        assert circles_collide_wrapped(
+            pygame.Vector2(2, 360), 10, pygame.Vector2(1275, 360), 10, 1280, 720) is True
+
+    def test_touching_not_colliding(self):
+        assert circles_collide_wrapped(
+            pygame.Vector2(0, 0), 10, pygame.Vector2(20, 0), 10, 1280, 720) is False
@@ -0,0 +1,91 @@
+import sys
+import os
+import math
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+from bodies import BodyStore
+from bullet import BulletPool, heading
+
+
+# ── heading table ─────────────────────────────────────────────
+class TestHeading:
+    def test_up(self):
+        dx, dy = heading(0)
+        assert dx == pytest.approx(0, abs=1e-9)
+        assert dy == pytest.approx(-1)
+
+    def test_right(self):
+        dx, dy = heading(90)
+        assert dx == pytest.approx(1)
+        assert dy == pytest.approx(0, abs=1e-9)
+
+    def test_negative_and_large_angles_wrap(self):
+        assert heading(-90) == heading(270)
+        assert heading(725) == heading(5)
+
+    def test_close_to_exact_trig(self):
+        for angle in (12.34, 123.45, 271.9):
+            dx, dy = heading(angle)
+            rad = math.radians(angle)
+            assert dx == pytest.approx(math.sin(rad), abs=1e-3)
+            assert dy == pytest.approx(-math.cos(rad), abs=1e-3)
+
+
+# ── BulletPool ────────────────────────────────────────────────
+class TestBulletPool:
+    def setup_method(self):
+        self.store = BodyStore()
+        self.pool = BulletPool(True, self.store)
+
+    def test_bullet_has_no_instance_dict(self):
+        b = self.pool.fire(0, 0, 0)
+        assert not hasattr(b, "__dict__")
+
+    def test_fire_adds_live_bullet(self):
+        b = self.pool.fire(100, 100, 90, 10, 0)
+        assert len(self.pool) == 1
+        assert b.is_player_bullet is True
+        from settings import BULLET_SPEED
+        assert b.vel.x == pytest.approx(BULLET_SPEED + 10)
+
+    def test_despawn_swaps_last_into_hole(self):
+        a = self.pool.fire(0, 0, 0)
+        b = self.pool.fire(0, 0, 0)
+        c = self.pool.fire(0, 0, 0)
+        self.pool.despawn(a)
+        assert self.pool.active == [c, b]
+        assert c._index == 0
+        assert len(self.store) == 2
+
+    def test_despawned_bullet_is_reused(self):
+        a = self.pool.fire(0, 0, 0)
+        self.pool.despawn(a)
+        b = self.pool.fire(50, 60, 180)
+        assert b is a
+        assert b.pos.x == pytest.approx(50)
+        assert not b.expired
+
+    def test_despawn_expired(self):
+        from settings import BULLET_LIFETIME
+        keep = self.pool.fire(0, 0, 0)
+        old = [self.pool.fire(0, 0, 0) for _ in range(3)]
+        for b in old:
+            b._lifetime = 0.01
+        self.store.integrate(0.1)
+        self.pool.despawn_expired()
+        assert self.pool.active == [keep]
+        assert keep._lifetime == pytest.approx(BULLET_LIFETIME - 0.1)
+
+    def test_clear(self):
+        for _ in range(5):
+            self.pool.fire(0, 0, 0)
+        self.pool.clear()
+        assert len(self.pool) == 0
+        assert len(self.store) == 0
+
+    def test_enemy_pool_flags_bullets(self):
+        pool = BulletPool(False, self.store)
+        assert pool.fire(0, 0, 0).is_player_bullet is False
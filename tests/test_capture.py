@@ -0,0 +1,103 @@
+import sys
+import os
+import random
+import signal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+import replay
+from capture import ProfileCapture, UNTIL_WAVE_END
+from replay import InputRecorder
+from world import GameWorld, PlayerInput, PlaySubState
+
+
+def _busy(n):
+    return sum(i * i for i in range(n))
+
+
+# ── Captures ──────────────────────────────────────────────────
+class TestProfileCapture:
+    def test_idle_until_requested(self, tmp_path):
+        cap = ProfileCapture(str(tmp_path), frames=3)
+        for _ in range(5):
+            assert cap.frame() is None
+        assert not cap.active
+        assert cap.stop() is None
+        assert os.listdir(tmp_path) == []
+
+    def test_captures_n_frames_and_writes_both_files(self, tmp_path):
+        cap = ProfileCapture(str(tmp_path), frames=3, top_n=5)
+        cap.request()
+        results = []
+        for _ in range(6):
+            results.append(cap.frame())
+            _busy(1000)
+        saved = [r for r in results if r]
+        assert len(saved) == 1 and results.index(saved[0]) == 3
+        prof, txt = saved[0]
+        assert prof.endswith("-3f.prof") and os.path.exists(prof)
+        text = open(txt).read()
+        assert text.startswith("3 frames in")
+        assert "_busy" in text and "cumulative" in text and "tottime" in text
+
+    def test_two_captures_in_one_second_do_not_collide(self, tmp_path):
+        cap = ProfileCapture(str(tmp_path), frames=1)
+        paths = set()
+        for _ in range(2):
+            cap.request()
+            cap.frame()
+            paths.add(cap.frame()[0])
+        assert len(paths) == 2
+
+    def test_until_wave_end(self, tmp_path):
+        world = GameWorld(rng=random.Random(4))
+        cap = ProfileCapture(str(tmp_path))
+        cap.request(UNTIL_WAVE_END)
+        cap.frame(world)
+        for _ in range(10):
+            world.step(PlayerInput(), 1 / 60)
+            assert cap.frame(world) is None
+        world.play_sub_state = PlaySubState.WAVE_TRANSITION
+        assert cap.frame(world) is not None
+
+    def test_toggle_stops_early(self, tmp_path):
+        cap = ProfileCapture(str(tmp_path), frames=1000)
+        cap.toggle()
+        cap.frame()
+        cap.frame()
+        cap.toggle()
+        assert cap.frame() is not None
+        assert not cap.active
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="no SIGUSR1 here")
+    def test_sigusr1_requests_a_capture(self, tmp_path):
+        cap = ProfileCapture(str(tmp_path), frames=2)
+        old = signal.getsignal(signal.SIGUSR1)
+        try:
+            assert cap.install_signal()
+            os.kill(os.getpid(), signal.SIGUSR1)
+            cap.frame()
+            assert cap.active
+        finally:
+            signal.signal(signal.SIGUSR1, old)
+            cap.stop()
+
+
+# ── Headless ──────────────────────────────────────────────────
+class TestReplayProfile:
+    def test_replay_profile_flag(self, tmp_path, monkeypatch, capsys):
+        world = GameWorld(seed=9)
+        rec = InputRecorder(9, 60)
+        for t in range(120):
+            world.step(rec.record(PlayerInput(fire=t % 5 == 0, turn=0.5)), 1 / 60)
+        path = tmp_path / "s.rec"
+        rec.save(str(path))
+        monkeypatch.setattr(replay, "ProfileCapture",
+                            lambda frames: ProfileCapture(str(tmp_path / "prof"), frames=frames))
+        replay.main([str(path), "--profile"])
+        out = capsys.readouterr().out
+        assert "profile:" in out
+        files = sorted(os.listdir(tmp_path / "prof"))
+        assert [os.path.splitext(f)[1] for f in files] == [".prof", ".txt"]
+        assert "(step)" in (tmp_path / "prof" / files[1]).read_text()
@@ -0,0 +1,64 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+from dirty_rects import DirtyRectTracker
+from render_backend import VectorBackend
+from world import GameWorld, PlayerInput
+
+pygame.init()
+
+
+def _screen():
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1280, 720), pygame.NOFRAME)
+    return pygame.Surface((1280, 720))
+
+
+# ── DirtyRectTracker ──────────────────────────────────────────
+class TestDirtyRectTracker:
+    def test_first_frame_is_full(self):
+        tracker = DirtyRectTracker((1280, 720))
+        _screen()
+        tracker.present([pygame.Rect(0, 0, 10, 10)])
+        assert tracker.full_frames == 1
+
+    def test_small_frames_are_partial(self):
+        tracker = DirtyRectTracker((1280, 720))
+        _screen()
+        tracker.present([pygame.Rect(0, 0, 10, 10)])
+        tracker.present([pygame.Rect(5, 5, 10, 10)])
+        assert tracker.partial_frames == 1
+
+    def test_large_area_falls_back_to_flip(self):
+        tracker = DirtyRectTracker((1280, 720), full_fraction=0.1)
+        _screen()
+        tracker.present([])
+        tracker.present([pygame.Rect(0, 0, 640, 360)])
+        assert tracker.full_frames == 2
+
+    def test_none_forces_full_frame(self):
+        tracker = DirtyRectTracker((1280, 720))
+        _screen()
+        tracker.present([])
+        tracker.present(None)
+        assert tracker.full_frames == 2
+
+    def test_partial_clear_matches_full_redraw(self):
+        world = GameWorld(rng=random.Random(9))
+        backend = VectorBackend()
+        tracker = DirtyRectTracker((1280, 720))
+        partial = _screen()
+        for i in range(40):
+            world.step(PlayerInput(thrust=True, fire=i % 5 == 0, turn=0.3), 1 / 60)
+            tracker.clear(partial)
+            tracker.present(backend.draw(partial, world))
+            full = pygame.Surface((1280, 720))
+            backend.draw(full, world)
+        assert pygame.image.tobytes(partial, "RGB") == pygame.image.tobytes(full, "RGB")
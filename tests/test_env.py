@@ -0,0 +1,170 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+from env import (
+    AsteroidsEnv, SubprocVecEnv, ACTIONS, N_ACTIONS, ENTITY_FIELDS, encode_action,
+    observation_spec,
+)
+from bodies import KIND_SHIP, KIND_ASTEROID, KIND_BULLET
+from world import PlayerInput
+from settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, ENV_MAX_ENTITIES, ENV_FRAME_SIZE, WAVE_ASTEROID_START, MAX_LIVES,
+)
+
+
+def _play(env, actions):
+    rewards = []
+    for a in actions:
+        obs, reward, terminated, truncated, info = env.step(a)
+        rewards.append(reward)
+    return obs.copy(), rewards, info
+
+
+# ── Actions ───────────────────────────────────────────────────
+class TestActions:
+    def test_every_control_combination_once(self):
+        assert N_ACTIONS == 24
+        combos = {(i.thrust, i.turn, i.fire, i.hyperspace) for i in ACTIONS}
+        assert len(combos) == N_ACTIONS
+        assert ACTIONS[0].turn == 0 and not (ACTIONS[0].thrust or ACTIONS[0].fire)
+
+    def test_encode_round_trips(self):
+        for a, i in enumerate(ACTIONS):
+            assert encode_action(i.thrust, i.turn, i.fire, i.hyperspace) == a
+        assert ACTIONS[encode_action(turn=-0.3)].turn == -1.0
+
+    def test_fire_is_a_press(self):
+        env = AsteroidsEnv(frame_skip=4)
+        env.reset(seed=1)
+        env.step(encode_action(fire=True))
+        assert len(env.world.player_bullets) == 1   # not one per skipped tick
+
+    def test_player_input_accepted(self):
+        env = AsteroidsEnv(frame_skip=1)
+        env.reset(seed=1)
+        env.step(PlayerInput(turn=1.0))
+        assert env.world.ship.angle > 0
+
+
+# ── Episodes ──────────────────────────────────────────────────
+class TestEpisode:
+    def test_reset_info_and_step_requires_reset(self):
+        env = AsteroidsEnv()
+        with pytest.raises(RuntimeError):
+            env.step(0)
+        _, info = env.reset(seed=2)
+        assert info == {"score": 0, "lives": MAX_LIVES, "wave": 1, "ticks": 0}
+
+    def test_seed_is_reproducible(self):
+        rng = np.random.default_rng(0)
+        actions = rng.integers(0, 12, 200).tolist()   # no hyperspace
+        runs = []
+        for _ in range(2):
+            env = AsteroidsEnv()
+            env.reset(seed=5)
+            runs.append(_play(env, actions))
+        assert np.array_equal(runs[0][0], runs[1][0])
+        assert runs[0][1] == runs[1][1]
+
+    def test_reward_is_score_delta(self):
+        env = AsteroidsEnv()
+        env.reset(seed=3)
+        _, rewards, info = _play(env, [encode_action(turn=1, fire=True)] * 300)
+        assert sum(rewards) == info["score"] > 0
+
+    def test_truncated_at_max_ticks(self):
+        env = AsteroidsEnv(frame_skip=4, max_ticks=40)
+        env.reset(seed=4)
+        flags = [env.step(0)[3] for _ in range(10)]
+        assert flags == [False] * 9 + [True]
+
+    def test_unseeded_resets_follow_the_seed(self):
+        a, b = AsteroidsEnv(), AsteroidsEnv()
+        a.reset(seed=6)
+        b.reset(seed=6)
+        assert np.array_equal(a.reset()[0], b.reset()[0])
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            AsteroidsEnv("pixels")
+
+
+# ── Observations ──────────────────────────────────────────────
+class TestObservations:
+    def test_entities(self):
+        env = AsteroidsEnv("entities")
+        obs, _ = env.reset(seed=1)
+        assert obs.shape == (ENV_MAX_ENTITIES, len(ENTITY_FIELDS)) and obs.dtype == np.float32
+        assert obs[0, 1] == KIND_SHIP and obs[0, 0] == 1.0
+        assert obs[0, 8:].tolist() == [0.0, -1.0]                   # nose up
+        rows = obs[1:1 + WAVE_ASTEROID_START]
+        assert (rows[:, 1] == KIND_ASTEROID).all() and (rows[:, 2] == 1.0).all()
+        assert not obs[1 + WAVE_ASTEROID_START:].any()
+        dist = np.hypot(rows[:, 3] * SCREEN_WIDTH, rows[:, 4] * SCREEN_HEIGHT)
+        assert (np.diff(dist) >= -1e-3).all()                       # nearest first
+        assert (np.abs(obs[1:, 3:5]) <= 1.0).all()
+
+    def test_fresh_bullet_is_nearest_and_friendly(self):
+        env = AsteroidsEnv("entities", frame_skip=1)
+        env.reset(seed=1)
+        obs, *_ = env.step(encode_action(fire=True))
+        bullet = obs[1]
+        assert bullet[1] == KIND_BULLET and bullet[2] == 0.0
+
+    def test_frame(self):
+        env = AsteroidsEnv("frame")
+        obs, _ = env.reset(seed=1)
+        assert obs.shape == (ENV_FRAME_SIZE[1], ENV_FRAME_SIZE[0]) and obs.dtype == np.uint8
+        assert obs.max() > 128
+        h, w = obs.shape
+        assert obs[h // 2 - 2:h // 2 + 3, w // 2 - 2:w // 2 + 3].any()   # the ship, centre screen
+
+    def test_writes_into_out(self):
+        shape, dtype = observation_spec("entities")
+        out = np.zeros(shape, dtype)
+        env = AsteroidsEnv(out=out)
+        obs, _ = env.reset(seed=1)
+        assert obs is out and out.any()
+
+
+# ── Vectorized ────────────────────────────────────────────────
+class TestSubprocVecEnv:
+    def test_matches_single_envs(self):
+        actions = np.random.default_rng(1).integers(0, 12, (30, 3))
+        with SubprocVecEnv(3, workers=2) as venv:
+            obs, info = venv.reset(seed=10)
+            assert obs.shape == (3, ENV_MAX_ENTITIES, len(ENTITY_FIELDS))
+            for row in actions:
+                obs, reward, terminated, truncated, info = venv.step(row)
+            got = obs.copy(), info["score"].copy(), info["ticks"].copy()
+        for i in range(3):
+            env = AsteroidsEnv()
+            env.reset(seed=10 + i)
+            want, _, winfo = _play(env, actions[:, i].tolist())
+            assert np.array_equal(got[0][i], want)
+            assert got[1][i] == winfo["score"] and got[2][i] == winfo["ticks"]
+
+    def test_autoreset_keeps_final_stats(self):
+        with SubprocVecEnv(2, workers=1, max_ticks=8) as venv:
+            venv.reset(seed=1)
+            venv.step([0, 0])
+            _, _, terminated, truncated, info = venv.step([0, 0])
+            assert truncated.tolist() == [True, True] and not terminated.any()
+            assert info["ticks"].tolist() == [8, 8]
+            _, _, _, truncated, info = venv.step([0, 0])
+            assert info["ticks"].tolist() == [4, 4] and not truncated.any()
+
+    def test_frame_mode(self):
+        with SubprocVecEnv(2, obs_mode="frame", workers=2) as venv:
+            obs, _ = venv.reset(seed=1)
+            assert obs.dtype == np.uint8 and obs.shape[0] == 2
+            assert obs[0].any() and obs[1].any()
+
+    def test_worker_error_is_raised(self):
+        with SubprocVecEnv(1) as venv:
+            with pytest.raises(RuntimeError):
+                venv.step([0])        # step before reset
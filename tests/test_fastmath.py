@@ -0,0 +1,116 @@
+import math
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+import pytest
+from fastmath import (
+    wrap_inplace, dist_sq, circles_overlap, torus_delta, torus_dist_sq,
+    circles_overlap_wrapped, rotate_into,
+    wrap_array, torus_delta_array, torus_dist_sq_array, circles_overlap_array, rotate_array,
+)
+from bodies import BodyStore, Body
+from utils import circles_collide_wrapped, rotate_points
+
+
+# ── Scalars ───────────────────────────────────────────────────
+class TestScalars:
+    def test_wrap_inplace_mutates_and_returns_same_vector(self):
+        v = pygame.Vector2(-10, 725)
+        assert wrap_inplace(v, 1280, 720) is v
+        assert (v.x, v.y) == (pytest.approx(1270), pytest.approx(5))
+
+    def test_dist_sq(self):
+        assert dist_sq(0, 0, 3, 4) == 25
+
+    def test_circles_overlap_is_strict(self):
+        assert circles_overlap(0, 0, 10, 19.9, 0, 10)
+        assert not circles_overlap(0, 0, 10, 20, 0, 10)
+
+    def test_torus_delta_takes_short_way(self):
+        assert torus_delta(1270, 10, 1280) == pytest.approx(20)
+        assert torus_delta(10, 1270, 1280) == pytest.approx(-20)
+        assert torus_delta(100, 150, 1280) == pytest.approx(50)
+
+    def test_torus_dist_sq_across_corner(self):
+        assert torus_dist_sq(2, 2, 1278, 718, 1280, 720) == pytest.approx(32)
+
+    def test_wrapped_overlap_matches_utils(self):
+        rng = np.random.default_rng(3)
+        for ax, ay, bx, by, ra, rb in rng.uniform(0, 1, (300, 6)) * (1280, 720, 1280, 720, 60, 60):
+            assert circles_overlap_wrapped(ax, ay, ra, bx, by, rb, 1280, 720) == circles_collide_wrapped(
+                pygame.Vector2(ax, ay), ra, pygame.Vector2(bx, by), rb, 1280, 720)
+
+    def test_rotate_into_reuses_rows(self):
+        out = [[0.0, 0.0] for _ in range(5)]
+        rows = [row for row in out]
+        rotate_into([(10, 0), (0, 10)], 90, out)
+        assert all(a is b for a, b in zip(out, rows))
+        assert out[0] == [pytest.approx(0, abs=1e-9), pytest.approx(10)]
+        assert out[1] == [pytest.approx(-10), pytest.approx(0, abs=1e-9)]
+        assert out[2] == [0.0, 0.0]    # rows past len(points) are untouched
+
+    def test_rotate_into_matches_rotate_points(self):
+        pts = [(3, 1), (-2, 5)]
+        rad = math.radians(33)
+        expected = [(x * math.cos(rad) - y * math.sin(rad), x * math.sin(rad) + y * math.cos(rad))
+                    for x, y in pts]
+        assert rotate_points(pts, 33) == pytest.approx(expected)
+        out = rotate_into(pts, 33, [[0.0, 0.0] for _ in pts])
+        assert [tuple(row) for row in out] == rotate_points(pts, 33)
+
+
+# ── Batches ───────────────────────────────────────────────────
+class TestBatches:
+    def test_wrap_array_in_place(self):
+        pos = np.array([[-10.0, 725.0], [1300.0, -1.0]])
+        assert wrap_array(pos, 1280, 720) is pos
+        assert pos.tolist() == [[1270.0, 5.0], [20.0, 719.0]]
+
+    def test_wrap_array_into_out_leaves_input(self):
+        pos = np.array([[-10.0, 725.0]])
+        out = np.empty_like(pos)
+        wrap_array(pos, 1280, 720, out=out)
+        assert pos.tolist() == [[-10.0, 725.0]]
+        assert out.tolist() == [[1270.0, 5.0]]
+
+    def test_torus_delta_array_matches_scalar(self):
+        rng = np.random.default_rng(5)
+        a = rng.uniform(0, 1, (50, 2)) * (1280, 720)
+        b = rng.uniform(0, 1, (50, 2)) * (1280, 720)
+        before = a.copy()
+        d = torus_delta_array(a, b, 1280, 720)
+        assert np.array_equal(a, before)
+        for (ax, ay), (bx, by), (dx, dy) in zip(a, b, d):
+            assert dx == pytest.approx(torus_delta(ax, bx, 1280))
+            assert dy == pytest.approx(torus_delta(ay, by, 720))
+
+    def test_dist_sq_array_against_one_point(self):
+        a = np.array([[2.0, 2.0], [640.0, 360.0]])
+        d2 = torus_dist_sq_array(a, (1278.0, 718.0), 1280, 720)
+        assert d2[0] == pytest.approx(32)
+        assert d2[1] == pytest.approx(torus_dist_sq(640, 360, 1278, 718, 1280, 720))
+
+    def test_scratch_buffer_is_used(self):
+        a = np.array([[0.0, 0.0], [100.0, 0.0]])
+        scratch = np.empty_like(a)
+        mask = circles_overlap_array(a, np.array([5.0, 5.0]), (1276.0, 0.0), 2.0, 1280, 720, scratch)
+        assert mask.tolist() == [True, False]
+
+    def test_rotate_array_in_place_matches_rotate_points(self):
+        pts = np.array([[10.0, 0.0], [3.0, -4.0]])
+        expected = rotate_points(pts.tolist(), 47)
+        assert rotate_array(pts, 47, out=pts) is pts
+        assert np.allclose(pts, expected)
+
+
+# ── Body coordinates ──────────────────────────────────────────
+class TestBodyCoordinates:
+    def test_x_y_are_plain_floats_matching_pos(self):
+        store = BodyStore(capacity=4)
+        b = Body(store, 12.5, 40.0)
+        assert type(b.x) is float and type(b.y) is float
+        assert (b.x, b.y) == tuple(b.pos)
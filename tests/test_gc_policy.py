@@ -0,0 +1,93 @@
+import sys
+import os
+import gc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from gc_policy import GcPolicy, PauseStats
+
+
+@pytest.fixture
+def policy():
+    threshold, enabled = gc.get_threshold(), gc.isenabled()
+    p = GcPolicy(active_thresholds=(50000, 100, 100))
+    yield p
+    p.close()
+    gc.unfreeze()
+    gc.set_threshold(*threshold)
+    if enabled:
+        gc.enable()
+
+
+def _churn(n):
+    """Allocate n self-referencing lists, i.e. cyclic garbage."""
+    for _ in range(n):
+        a = []
+        a.append(a)
+
+
+class TestGcPolicy:
+    def test_hot_raises_thresholds_and_cold_restores(self, policy):
+        normal = gc.get_threshold()
+        policy.update(True)
+        assert policy.hot
+        assert gc.get_threshold() == (50000, 100, 100)
+        policy.update(False)
+        assert gc.get_threshold() == normal
+
+    def test_zero_threshold_disables_collection_while_hot(self):
+        p = GcPolicy(active_thresholds=(0, 0, 0))
+        try:
+            assert gc.isenabled()
+            p.update(True)
+            assert not gc.isenabled()
+            p.update(False)
+            assert gc.isenabled()
+        finally:
+            p.close()
+            gc.enable()
+
+    def test_cheap_window_runs_a_deferred_collection(self, policy):
+        policy.update(True)
+        policy.update(True)       # no change, no work
+        assert policy.deferred_pauses.count == 0
+        policy.update(False)
+        assert policy.deferred_pauses.count == 1
+        policy.update(False)
+        assert policy.deferred_pauses.count == 1
+
+    def test_no_automatic_collections_during_hot_play(self, policy):
+        policy.update(True)
+        _churn(20000)
+        assert policy.hot_pauses.count == 0
+        policy.update(False)
+        assert gc.collect() == 0     # the deferred pass already cleaned up
+
+    def test_times_automatic_collections_by_phase(self, policy):
+        policy.active_thresholds = (100, 10, 10)
+        policy.update(True)
+        _churn(2000)
+        assert policy.hot_pauses.count
+        stats = policy.stats()
+        assert stats["hot"]["count"] == policy.hot_pauses.count
+        assert stats["hot"]["max_ms"] >= 0
+        assert "in play" in policy.summary()
+
+    def test_freeze_moves_survivors_to_the_permanent_generation(self, policy):
+        keep = [[i] for i in range(1000)]
+        n = policy.freeze()
+        assert n >= 1000 and gc.get_freeze_count() == n
+        assert policy.deferred_pauses.count  # freeze collects first
+        assert keep
+
+    def test_pause_stats_are_running_totals(self):
+        pauses = PauseStats()
+        for ms in (1.0, 3.5, 2.0):
+            pauses.add(ms)
+        assert pauses.as_dict() == {"count": 3, "total_ms": 6.5, "max_ms": 3.5}
+
+    def test_close_removes_callback(self):
+        p = GcPolicy()
+        p.close()
+        assert p._on_gc not in gc.callbacks
@@ -61,8 +61,8 @@ class TestModuleImports:
         assert Saucer is not None
 
     def test_import_particle(self):
-        from particle import ExplosionParticle
-        assert ExplosionParticle is not None
+        from particle import ParticlePool
+        assert ParticlePool is not None
 
     def test_import_hud(self):
         from hud import HUD
@@ -246,31 +246,34 @@ class TestSaucer:
         s.update(0.05, None)
         assert s.wants_to_fire() is True
 
-    def test_saucer_create_bullet(self):
-        from bullet import Bullet
+    def test_saucer_fires_through_bullet_pool(self):
+        from bullet import BulletPool
         s = self.Saucer(large=True)
-        b = s.create_bullet(Bullet, None)
-        assert b is not None
+        pool = BulletPool(False, s._store)
+        b = pool.fire(s.pos.x, s.pos.y, s.aim(None))
+        assert b is not None and not b.is_player_bullet
+        assert len(pool) == 1
 
 
 # ── Particle tests ────────────────────────────────────────────
 class TestParticle:
     def test_particle_expires(self):
-        from particle import ExplosionParticle
-        p = ExplosionParticle(pygame.Vector2(640, 360))
+        from particle import ParticlePool
+        pool = ParticlePool(seed=1)
+        pool.emit(pygame.Vector2(640, 360), 4)
         # Override lifetime for fast expiry
-        p._lifetime = 0.01
-        p._max_lifetime = 0.01
-        p.update(0.1)
-        assert p.expired is True
+        pool._life[:4] = 0.01
+        pool.update(0.1)
+        assert len(pool) == 0
 
     def test_particle_moves(self):
-        from particle import ExplosionParticle
-        p = ExplosionParticle(pygame.Vector2(640, 360))
-        x0, y0 = p.pos.x, p.pos.y
-        p.update(0.1)
+        from particle import ParticlePool
+        pool = ParticlePool(seed=1)
+        pool.emit(pygame.Vector2(640, 360), 1)
+        x0, y0 = pool._pos[0]
+        pool.update(0.1)
         # Particle should have moved (unless velocity is zero, very unlikely)
-        moved = (p.pos.x != pytest.approx(x0) or p.pos.y != pytest.approx(y0))
+        moved = (pool._pos[0, 0] != pytest.approx(x0) or pool._pos[0, 1] != pytest.approx(y0))
         assert moved
 
 
@@ -368,6 +371,17 @@ class TestMenu:
         go = GameOverScreen(font, score=10000, high_score=9999)
         assert go._new_record is True
 
+    def test_update_reports_blink_edges(self):
+        from menu import TitleScreen, GameOverScreen
+        font = pygame.font.SysFont(None, 48)
+        for screen in (TitleScreen(font), GameOverScreen(font, score=0, high_score=0)):
+            assert screen.until_change() == pytest.approx(0.6)
+            assert screen.update(0.5) is False
+            assert screen.until_change() == pytest.approx(0.1)
+            assert screen.update(0.1) is True
+            assert screen._show_prompt is False
+            assert screen.until_change() == pytest.approx(0.6)
+
 
 # ── SoundManager tests ────────────────────────────────────────
 class TestSoundManager:
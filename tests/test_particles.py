@@ -0,0 +1,80 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+import pytest
+from particle import ParticlePool
+
+
+# ── ParticlePool ──────────────────────────────────────────────
+class TestParticlePool:
+    def setup_method(self):
+        self.pool = ParticlePool(capacity=32, seed=1)
+
+    def test_emit_adds_burst(self):
+        self.pool.emit(pygame.Vector2(100, 100), 12)
+        assert len(self.pool) == 12
+
+    def test_particles_move(self):
+        self.pool.emit((100, 100), 12)
+        before = self.pool._pos[:12].copy()
+        self.pool.update(0.1)
+        assert not np.allclose(before, self.pool._pos[:12])
+
+    def test_drag_slows_particles(self):
+        self.pool.emit((100, 100), 4)
+        speed0 = np.hypot(*self.pool._vel[:4].T)
+        self.pool.update(0.01)
+        assert (np.hypot(*self.pool._vel[:4].T) < speed0).all()
+
+    def test_positions_wrap(self):
+        self.pool.emit((1279, 719), 12)
+        for _ in range(10):
+            self.pool.update(0.05)
+        pos = self.pool._pos[:len(self.pool)]
+        assert (pos[:, 0] >= 0).all() and (pos[:, 0] < 1280).all()
+        assert (pos[:, 1] >= 0).all() and (pos[:, 1] < 720).all()
+
+    def test_all_expire(self):
+        self.pool.emit((100, 100), 12)
+        self.pool.update(2.0)
+        assert len(self.pool) == 0
+
+    def test_expiry_compacts_survivors(self):
+        self.pool.emit((100, 100), 12)
+        self.pool._life[:6] = 0.01
+        self.pool.update(0.05)
+        assert len(self.pool) == 6
+        assert (self.pool._life[:6] > 0).all()
+
+    def test_full_pool_evicts_faintest(self):
+        self.pool.emit((100, 100), 32)
+        self.pool._life[:32] = self.pool._max_life[:32]   # all fresh...
+        self.pool._life[:4] = 0.001                         # ...except four
+        faint = set(self.pool._max_life[:4].tolist())
+        self.pool.emit((500, 500), 4)
+        assert len(self.pool) == 32
+        assert not faint & set(self.pool._max_life[:28].tolist())
+
+    def test_burst_larger_than_capacity_is_clamped(self):
+        self.pool.emit((100, 100), 100)
+        assert len(self.pool) == 32
+
+    def test_clear(self):
+        self.pool.emit((100, 100), 12)
+        self.pool.clear()
+        assert len(self.pool) == 0
+
+    def test_same_seed_same_burst(self):
+        other = ParticlePool(capacity=32, seed=1)
+        self.pool.emit((100, 100), 12)
+        other.emit((100, 100), 12)
+        np.testing.assert_array_equal(self.pool._vel[:12], other._vel[:12])
+
+    def test_draw_without_crash(self):
+        self.pool.emit((100, 100), 12)
+        self.pool.update(0.1)
+        self.pool.draw(pygame.Surface((1280, 720)))
@@ -0,0 +1,146 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+import profiler
+from profiler import FrameProfiler, ProfilerOverlay, PHASES
+from render_backend import SpriteBackend, VectorBackend, DRAW_PHASES
+from world import GameWorld, PlayerInput, UPDATE_PHASES
+
+
+class _FakeClock:
+    def __init__(self, monkeypatch):
+        self.now = 1_000
+        monkeypatch.setattr(profiler.time, "perf_counter_ns", lambda: self.now)
+
+    def advance(self, ns):
+        self.now += ns
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    return _FakeClock(monkeypatch)
+
+
+def _frame(prof, clock, phases):
+    """Record one frame: each (phase, ns) in order."""
+    prof.frame()
+    for phase, ns in phases:
+        clock.advance(ns)
+        prof.mark(phase)
+
+
+# ── Ring buffer ───────────────────────────────────────────────
+class TestFrameProfiler:
+    def test_marks_accumulate_per_phase(self, clock):
+        prof = FrameProfiler(capacity=4)
+        _frame(prof, clock, [("events", 100), ("ship", 50), ("events", 25)])
+        clock.advance(1000)              # sleep: in the frame, in no phase
+        prof.frame()
+        assert prof.count == 1
+        row = dict(zip(PHASES, prof.samples[0].tolist()))
+        assert row["events"] == 125 and row["ship"] == 50
+        assert prof.frame_ns[0] == 1175
+
+    def test_skip_charges_nothing(self, clock):
+        prof = FrameProfiler(capacity=4)
+        prof.frame()
+        clock.advance(500)
+        prof.skip()
+        clock.advance(10)
+        prof.mark("flip")
+        prof.frame()
+        assert prof.samples[0].sum() == 10
+
+    def test_ring_wraps_and_keeps_newest(self, clock):
+        prof = FrameProfiler(capacity=3)
+        for ns in (10, 20, 30, 40, 50):
+            _frame(prof, clock, [("hud", ns)])
+        prof.frame()
+        assert prof.count == 3 and prof.total == 5
+        frame_ms, phase_ms = prof.mean_ms()
+        assert phase_ms[PHASES.index("hud")] * 1e6 == pytest.approx(40)
+
+    def test_worst_frame_only_looks_back_the_window(self, clock):
+        prof = FrameProfiler(capacity=256)
+        _frame(prof, clock, [("draw_asteroids", 9_000_000_000)])    # old spike
+        for _ in range(150):                                         # 1.5 s of 10 ms frames
+            _frame(prof, clock, [("collisions", 10_000_000)])
+        _frame(prof, clock, [("collisions", 30_000_000)])
+        prof.frame()
+        frame_ms, phases = prof.worst(seconds=1.0)
+        assert frame_ms == pytest.approx(30.0)
+        assert phases[PHASES.index("collisions")] == pytest.approx(30.0)
+        assert prof.worst(seconds=100)[0] == pytest.approx(9000.0)
+
+    def test_empty_profiler(self):
+        prof = FrameProfiler()
+        assert prof.worst() is None
+        assert prof.mean_ms()[0] == 0.0
+
+    def test_reset_forgets_frames(self, clock):
+        prof = FrameProfiler(capacity=4)
+        _frame(prof, clock, [("hud", 5)])
+        prof.frame()
+        prof.reset()
+        assert prof.count == prof.total == 0
+
+
+# ── Phase hooks ───────────────────────────────────────────────
+class TestPhaseHooks:
+    def test_world_reports_update_phases_in_order(self):
+        world = GameWorld(rng=random.Random(1))
+        seen = []
+        world.timer = seen.append
+        world.step(PlayerInput(fire=True), 1 / 60)
+        assert tuple(seen) == UPDATE_PHASES
+
+    def test_world_without_timer(self):
+        world = GameWorld(rng=random.Random(1))
+        world.step(PlayerInput(), 1 / 60)    # no hook, no error
+        assert world.timer is None
+
+    @pytest.mark.parametrize("backend", [VectorBackend(), SpriteBackend()])
+    def test_backends_report_draw_phases(self, backend):
+        world = GameWorld(rng=random.Random(2))
+        seen = []
+        backend.draw(pygame.Surface((1280, 720)), world, seen.append)
+        assert tuple(seen) == DRAW_PHASES
+
+    def test_every_hooked_phase_is_profiled(self):
+        assert set(UPDATE_PHASES + DRAW_PHASES) <= set(PHASES)
+
+
+# ── Overlay ───────────────────────────────────────────────────
+class TestProfilerOverlay:
+    def test_draws_graph_counts_and_worst_frame(self, clock):
+        pygame.font.init()
+        prof = FrameProfiler(capacity=8)
+        for _ in range(12):
+            _frame(prof, clock, [("events", 1_000_000), ("collisions", 4_000_000)])
+        prof.frame()
+        overlay = ProfilerOverlay(prof, bottomleft=(10, 470), graph_size=(50, 40), graph_ms=10.0)
+        screen = pygame.Surface((640, 480))
+        rect = overlay.draw(screen, GameWorld(rng=random.Random(3)))
+        assert rect.bottomleft == (10, 470)
+        # the newest column is stacked: collisions above events
+        graph = overlay._graph
+        x = graph.get_width() - 1
+        assert graph.get_at((x, 39))[:3] == profiler._PHASE_COLORS["events"]
+        assert graph.get_at((x, 39 - 4 - 10))[:3] == profiler._PHASE_COLORS["collisions"]
+
+    def test_plots_only_new_frames(self, clock):
+        pygame.font.init()
+        prof = FrameProfiler(capacity=8)
+        overlay = ProfilerOverlay(prof, graph_size=(20, 20))
+        screen = pygame.Surface((640, 480))
+        _frame(prof, clock, [("hud", 10)])
+        prof.frame()
+        overlay.draw(screen)
+        assert overlay._drawn == 1
+        overlay.draw(screen)
+        assert overlay._drawn == 1
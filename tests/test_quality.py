@@ -0,0 +1,189 @@
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from quality import QualityGovernor, TIERS, apply_tier
+from asteroid import _make_polygon
+from particle import ParticlePool
+from render_backend import SpriteBackend, VectorBackend
+from world import GameWorld, PlayerInput
+from settings import PARTICLES_PER_EXPLOSION, PARTICLE_CAPACITY
+
+
+def _feed(gov, ms, frames):
+    changes = 0
+    for _ in range(frames):
+        changes += gov.frame(ms)
+    return changes
+
+
+# ── Governor ──────────────────────────────────────────────────
+class TestQualityGovernor:
+    def make(self, **kw):
+        kw.setdefault("window", 10)
+        kw.setdefault("up_hold", 30)
+        return QualityGovernor(budget_ms=16.0, **kw)
+
+    def test_stays_high_within_budget(self):
+        gov = self.make()
+        assert _feed(gov, 12.0, 200) == 0
+        assert gov.tier is TIERS[0]
+
+    def test_steps_down_one_tier_per_slow_window(self):
+        gov = self.make()
+        assert _feed(gov, 9.0, 9) + gov.frame(20.0) == 0   # one slow frame is not a trend
+        assert _feed(gov, 20.0, 10) == 1
+        assert gov.index == 1
+        assert gov.decisions[-1][1:3] == ("high", "medium")
+        _feed(gov, 20.0, 100)
+        assert gov.tier is TIERS[-1]    # and stops at the bottom
+
+    def test_steps_up_only_after_hold(self):
+        gov = self.make()
+        _feed(gov, 20.0, 10)
+        assert _feed(gov, 5.0, 20) == 0
+        assert _feed(gov, 5.0, 10) == 1
+        assert gov.index == 0
+
+    def test_dead_band_holds_tier(self):
+        gov = self.make()
+        _feed(gov, 20.0, 10)
+        assert _feed(gov, 12.0, 500) == 0    # between up_at and down_at
+        assert gov.index == 1
+
+    def test_bounce_doubles_hold(self):
+        gov = self.make()
+        _feed(gov, 20.0, 10)
+        _feed(gov, 5.0, 30)          # back up
+        _feed(gov, 20.0, 10)         # straight back down: a bounce
+        assert gov.hold == 60
+        assert _feed(gov, 5.0, 50) == 0
+        assert _feed(gov, 5.0, 10) == 1
+
+    def test_hold_is_capped(self):
+        gov = self.make()
+        for _ in range(10):
+            _feed(gov, 20.0, 10)
+            _feed(gov, 5.0, gov.hold)
+        assert gov.hold == 30 * 8
+
+    def test_reset_and_budget(self):
+        gov = self.make()
+        _feed(gov, 20.0, 10)
+        gov.reset()
+        assert gov.index == 0 and not gov.decisions
+        gov.set_budget(33.3)
+        assert _feed(gov, 20.0, 50) == 0
+
+    def test_summary_mentions_tier_and_last_decision(self):
+        gov = self.make()
+        _feed(gov, 20.0, 10)
+        text = gov.summary()
+        assert "quality medium" in text
+        assert "high->medium" in text
+
+
+# ── Levers ────────────────────────────────────────────────────
+class TestLevers:
+    def teardown_method(self):
+        apply_tier(TIERS[0])
+
+    def test_apply_tier_sets_every_lever(self):
+        world = GameWorld(seed=1)
+        renderer = VectorBackend()
+
+        class Hud:
+            refresh_interval = 0.0
+        hud = Hud()
+        tier = TIERS[-1]
+        apply_tier(tier, world, renderer, hud)
+        assert world.explosion_particles == tier.particles
+        assert world.particles.limit == tier.particle_limit
+        assert renderer.line_width == tier.line_width
+        assert hud.refresh_interval == tier.hud_interval
+        assert world.asteroid_vertices == tier.asteroid_vertices
+
+    def test_vertex_cap_is_per_world(self):
+        shown, headless = GameWorld(seed=1), GameWorld(seed=1)
+        apply_tier(TIERS[-1], shown)
+        shown._spawn_wave(2)
+        headless._spawn_wave(2)
+        assert all(len(a._polygon) <= TIERS[-1].asteroid_vertices for a in shown.asteroids)
+        assert headless.asteroid_vertices is None
+        assert max(len(a._polygon) for a in headless.asteroids) > TIERS[-1].asteroid_vertices
+
+    def test_particle_limit_survives_reset(self):
+        world = GameWorld(seed=1)
+        apply_tier(TIERS[2], world)
+        world.reset()
+        assert world.particles.limit == TIERS[2].particle_limit
+
+    def test_top_tier_matches_defaults(self):
+        world = GameWorld(seed=1)
+        assert world.explosion_particles == PARTICLES_PER_EXPLOSION
+        assert world.particles.limit == PARTICLE_CAPACITY
+
+    def test_set_limit_evicts_overflow(self):
+        pool = ParticlePool(capacity=64, seed=1)
+        for _ in range(5):
+            pool.emit((100, 100), 12)
+        pool.set_limit(20)
+        assert len(pool) == 20
+        pool.emit((100, 100), 12)
+        assert len(pool) == 20
+
+    def test_vertex_cap_keeps_rng_in_step(self):
+        a, b = random.Random(7), random.Random(7)
+        full = _make_polygon(40, 12, a)
+        thin = _make_polygon(40, 12, b, max_vertices=6)
+        assert len(thin) == 6
+        assert set(thin) <= set(full)
+        assert a.random() == b.random()
+
+    def test_simulation_unchanged_by_tier(self):
+        runs = []
+        for tier in (TIERS[0], TIERS[-1]):
+            world = GameWorld(seed=3)
+            apply_tier(tier, world)
+            world.run(lambda w: PlayerInput(turn=0.5, fire=w.ticks % 8 == 0), max_ticks=900)
+            runs.append((world.score, [(a.x, a.y) for a in world.asteroids]))
+        assert runs[0][0] > 0      # asteroids were split, so polygons were rolled
+        assert runs[0] == runs[1]
+
+    def test_sprite_width_change_clears_cache(self):
+        backend = SpriteBackend(cache_mb=1)
+        backend._sprites["x"] = (None, 0, 10)
+        backend._bytes = 10
+        backend.line_width = backend.line_width
+        assert len(backend) == 1
+        backend.line_width = 1
+        assert len(backend) == 0 and backend.bytes_used == 0
+
+
+# ── HUD throttle ──────────────────────────────────────────────
+class TestHudRefresh:
+    def setup_method(self):
+        pygame.init()
+
+    def test_values_held_until_interval(self):
+        from hud import HUD
+        hud = HUD(pygame.font.SysFont(None, 48))
+        screen = pygame.Surface((1280, 720))
+        hud.refresh_interval = 0.5
+        hud.draw(screen, 100, 3, 1, 500, now=10.0)
+        hud.draw(screen, 200, 3, 1, 500, now=10.2)
+        assert hud._shown[0] == 100
+        hud.draw(screen, 200, 3, 1, 500, now=10.6)
+        assert hud._shown[0] == 200
+
+    def test_unthrottled_follows_every_change(self):
+        from hud import HUD
+        hud = HUD(pygame.font.SysFont(None, 48))
+        screen = pygame.Surface((1280, 720))
+        hud.draw(screen, 100, 3, 1, 500, now=10.0)
+        rects = hud.draw(screen, 200, 2, 1, 500, now=10.0)
+        assert hud._shown == (200, 2, 1, 500)
+        assert len(rects) == 3 + 2
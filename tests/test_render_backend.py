@@ -0,0 +1,55 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+from render_backend import SpriteBackend, VectorBackend, make_backend
+from world import GameWorld, PlayerInput
+
+
+def _busy_world():
+    world = GameWorld(rng=random.Random(5))
+    for _ in range(20):
+        world.step(PlayerInput(fire=True, thrust=True, turn=0.5), 1 / 60)
+    return world
+
+
+# ── Backends ──────────────────────────────────────────────────
+class TestRenderBackends:
+    def test_make_backend(self):
+        assert isinstance(make_backend("sprite"), SpriteBackend)
+        assert isinstance(make_backend("vector"), VectorBackend)
+        assert isinstance(make_backend("bogus"), VectorBackend)
+
+    def test_both_backends_draw_the_field(self):
+        world = _busy_world()
+        for backend in (VectorBackend(), SpriteBackend()):
+            screen = pygame.Surface((1280, 720))
+            backend.draw(screen, world)
+            x, y = (int(v) for v in world.asteroids[0].draw_pos)
+            r = world.asteroids[0].radius
+            area = screen.subsurface(pygame.Rect(x - r - 4, y - r - 4, 2 * r + 8, 2 * r + 8)
+                                     .clip(screen.get_rect()))
+            assert pygame.transform.average_color(area)[:3] != (0, 0, 0)
+
+    def test_sprites_reused_across_frames(self):
+        world = _busy_world()
+        backend = SpriteBackend()
+        screen = pygame.Surface((1280, 720))
+        backend.draw(screen, world)
+        misses = backend.misses
+        backend.draw(screen, world)
+        assert backend.misses == misses
+        assert backend.hits > 0
+
+    def test_cache_respects_byte_budget(self):
+        world = _busy_world()
+        backend = SpriteBackend(cache_mb=0.02)
+        screen = pygame.Surface((1280, 720))
+        for _ in range(30):
+            world.step(PlayerInput(turn=1.0), 1 / 60)
+            backend.draw(screen, world)
+        assert backend.bytes_used <= backend.max_bytes or len(backend) == 1
@@ -0,0 +1,100 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from replay import InputRecorder, decode, load, main, replay, write_varint, read_varint
+from world import GameWorld, PlayerInput
+
+
+def _session(seed, ticks, rng):
+    """Play a game with jittery input, recording it; returns (world, recorder)."""
+    world = GameWorld(seed=seed)
+    rec = InputRecorder(seed, 60)
+    turn = 0.0
+    for t in range(ticks):
+        if t % 20 == 0:
+            turn = rng.choice([-1.0, 0.0, 0.37, 1.0])
+        inp = PlayerInput(thrust=t % 90 < 30, turn=turn, fire=t % 7 == 0,
+                          hyperspace=t == 400)
+        world.step(rec.record(inp), 1 / 60)
+        if world.game_over:
+            break
+    return world, rec
+
+
+# ── Encoding ──────────────────────────────────────────────────
+class TestEncoding:
+    @pytest.mark.parametrize("n", [0, 1, 127, 128, 300, 2 ** 40])
+    def test_varint_roundtrip(self, n):
+        buf = bytearray()
+        write_varint(buf, n)
+        assert read_varint(bytes(buf), 0) == (n, len(buf))
+
+    def test_decode_matches_recorded_inputs(self):
+        rec = InputRecorder(5, 60)
+        sent = [rec.record(PlayerInput(fire=i % 3 == 0, turn=(i % 5 - 2) / 2)) for i in range(50)]
+        got = list(decode(rec.getvalue()).inputs())
+        assert len(got) == 50
+        for a, b in zip(sent, got):
+            assert (a.thrust, a.turn, a.fire, a.hyperspace) == (b.thrust, b.turn, b.fire, b.hyperspace)
+
+    def test_header(self):
+        recording = decode(InputRecorder(123456789, 120).getvalue())
+        assert recording.seed == 123456789
+        assert recording.sim_hz == 120
+        assert recording.ticks == 0
+
+    def test_non_integer_rate_is_exact(self):
+        hz = 60000 / 1001
+        recording = decode(InputRecorder(1, hz).getvalue())
+        assert recording.sim_hz == hz and 1.0 / recording.sim_hz == 1.0 / hz
+
+    def test_reads_version_1(self):
+        data = bytearray(b"ASTR\x01")
+        for n in (7, 60, 0):
+            write_varint(data, n)
+        data.append(0x80)
+        recording = decode(bytes(data))
+        assert (recording.seed, recording.sim_hz, recording.ticks) == (7, 60, 0)
+
+    def test_held_input_is_nearly_free(self):
+        rec = InputRecorder(1, 60)
+        for _ in range(10_000):
+            rec.record(PlayerInput(thrust=True, turn=1.0))
+        assert len(rec.getvalue()) < 24
+
+    def test_rejects_other_files(self):
+        with pytest.raises(ValueError):
+            decode(b"PNG\x00\x00\x00")
+
+
+# ── Replay ────────────────────────────────────────────────────
+class TestReplay:
+    def test_replay_reproduces_session(self, tmp_path):
+        world, rec = _session(31, 1500, random.Random(2))
+        path = tmp_path / "s.rec"
+        rec.save(str(path))
+        again = replay(load(str(path)))
+        assert (again.score, again.lives, again.wave, again.ticks) == \
+               (world.score, world.lives, world.wave, world.ticks)
+        assert [a.pos for a in again.asteroids] == [a.pos for a in world.asteroids]
+
+    def test_a_few_bytes_per_tick(self):
+        _, rec = _session(31, 1500, random.Random(2))
+        assert len(rec.getvalue()) / rec.ticks < 3
+
+    def test_on_tick_reports_step_time(self):
+        _, rec = _session(8, 100, random.Random(1))
+        seen = []
+        replay(decode(rec.getvalue()), lambda w, ns: seen.append(ns))
+        assert len(seen) == 100 and all(ns >= 0 for ns in seen)
+
+    def test_profile_of_empty_recording(self, tmp_path, capsys):
+        path = str(tmp_path / "empty.rec")
+        InputRecorder(1, 60, path).close()
+        main([path, "--profile"])
+        out = capsys.readouterr().out
+        assert "nothing captured" in out and "ticks 0/0" in out
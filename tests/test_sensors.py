@@ -0,0 +1,143 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+
+import numpy as np
+import pytest
+from sensors import KIND_NONE, cast_rays, ray_directions, sense, sense_many, sense_vecworld
+from bodies import KIND_ASTEROID, KIND_BULLET, KIND_SAUCER
+from vecworld import VecWorld
+from world import GameWorld
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, SENSOR_RAYS, SENSOR_RANGE
+
+W, H = SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+def _reference(ox, oy, heading, targets, ovx, ovy, n_rays, max_range):
+    """Per-ray loop over all nine copies of each (x, y, vx, vy, r, kind) target."""
+    rows = []
+    for k in range(n_rays):
+        th = math.radians(heading + k * 360 / n_rays)
+        ux, uy = math.sin(th), -math.cos(th)
+        best = (max_range, KIND_NONE, 0.0)
+        for x, y, vx, vy, r, kind in targets:
+            for ix in (-1, 0, 1):
+                for iy in (-1, 0, 1):
+                    px, py = x + ix * W - ox, y + iy * H - oy
+                    t = px * ux + py * uy
+                    disc = r * r - (px * px + py * py) + t * t
+                    if disc < 0:
+                        continue
+                    if px * px + py * py <= r * r:
+                        e = 0.0
+                    elif t < 0:
+                        continue
+                    else:
+                        e = t - math.sqrt(disc)
+                    if e <= max_range and (best[1] == KIND_NONE or e < best[0]):
+                        best = (e, kind, -((vx - ovx) * ux + (vy - ovy) * uy))
+        rows.append(best)
+    return rows
+
+
+def _one(x, y, vx=0.0, vy=0.0, r=25.0, kind=KIND_ASTEROID, **kw):
+    return cast_rays(W / 2, H / 2, 0.0, [[x]], [[y]], [[vx]], [[vy]], [[r]], [[kind]], **kw)
+
+
+# ── Kernel ────────────────────────────────────────────────────
+class TestCastRays:
+    def test_directions_start_at_nose_clockwise(self):
+        ux, uy = ray_directions([0.0, 90.0], 4)
+        assert ux[0] == pytest.approx([0, 1, 0, -1], abs=1e-12)
+        assert uy[0] == pytest.approx([-1, 0, 1, 0], abs=1e-12)
+        assert ux[1] == pytest.approx([1, 0, -1, 0], abs=1e-12)
+
+    def test_hit_straight_ahead(self):
+        dist, kind, closing = _one(W / 2, H / 2 - 200, vy=50.0, n_rays=4, max_range=400)
+        assert dist[0, 0] == pytest.approx(175.0)
+        assert kind[0].tolist() == [KIND_ASTEROID, KIND_NONE, KIND_NONE, KIND_NONE]
+        assert closing[0, 0] == pytest.approx(50.0)         # moving toward the ship
+        assert dist[0, 1:].tolist() == [400] * 3     # the wrapped copy behind is 495 away
+        assert closing[0, 1:].tolist() == [0.0] * 3
+
+    def test_sees_across_the_wrap(self):
+        dist, kind, _ = _one(W / 2, H / 2 + 360, n_rays=4, max_range=500)   # at y == H, shown at y == 0
+        assert kind[0, 0] == kind[0, 2] == KIND_ASTEROID
+        assert dist[0, 0] == dist[0, 2] == pytest.approx(335.0)
+
+    def test_inside_is_zero_and_range_cuts_off(self):
+        dist, kind, _ = _one(W / 2 + 5, H / 2, r=50.0, n_rays=8)
+        assert (dist == 0).all() and (kind == KIND_ASTEROID).all()
+        dist, kind, _ = _one(W / 2, H / 2 - 200, n_rays=4, max_range=150)
+        assert kind[0, 0] == KIND_NONE and dist[0, 0] == 150
+
+    def test_nearest_target_wins_and_ship_velocity_counts(self):
+        dist, kind, closing = cast_rays(
+            W / 2, H / 2, 90.0, [[W / 2 + 300, W / 2 + 100]], [[H / 2] * 2], 0.0, 0.0,
+            [[20.0, 3.0]], [[KIND_SAUCER, KIND_BULLET]], ovx=40.0, n_rays=4)
+        assert kind[0, 0] == KIND_BULLET and dist[0, 0] == pytest.approx(97.0)
+        assert closing[0, 0] == pytest.approx(40.0)
+
+    def test_alive_masks_padding(self):
+        dist, kind, _ = _one(W / 2, H / 2 - 200, n_rays=4, alive=[[False]])
+        assert (kind == KIND_NONE).all()
+
+    def test_range_must_fit_the_torus(self):
+        with pytest.raises(ValueError):
+            _one(0, 0, r=50.0, max_range=H - 40)
+
+    def test_matches_per_ray_reference(self):
+        rng = np.random.default_rng(0)
+        for _ in range(10):
+            b, t = 3, int(rng.integers(0, 12))
+            ox, oy, hd = rng.uniform(0, W, b), rng.uniform(0, H, b), rng.uniform(0, 360, b)
+            tx, ty = rng.uniform(-60, W + 60, (b, t)), rng.uniform(0, H, (b, t))
+            tvx, tvy = rng.normal(0, 100, (b, t)), rng.normal(0, 100, (b, t))
+            r = rng.choice([3.0, 12.0, 25.0, 50.0], (b, t))
+            kinds = rng.choice([KIND_ASTEROID, KIND_SAUCER, KIND_BULLET], (b, t))
+            alive = rng.random((b, t)) < 0.8
+            ovx, ovy = rng.normal(0, 50, b), rng.normal(0, 50, b)
+            dist, kind, closing = cast_rays(ox, oy, hd, tx, ty, tvx, tvy, r, kinds, alive,
+                                            ovx, ovy, n_rays=24, max_range=600)
+            for i in range(b):
+                m = alive[i]
+                targets = zip(tx[i][m], ty[i][m], tvx[i][m], tvy[i][m], r[i][m], kinds[i][m])
+                want = _reference(ox[i], oy[i], hd[i], list(targets), ovx[i], ovy[i], 24, 600)
+                assert dist[i] == pytest.approx([w[0] for w in want])
+                assert kind[i].tolist() == [w[1] for w in want]
+                assert closing[i] == pytest.approx([w[2] for w in want])
+
+
+# ── World adapters ────────────────────────────────────────────
+class TestWorlds:
+    def test_game_world(self):
+        world = GameWorld(seed=1)
+        dist, kind, closing = sense(world)
+        assert dist.shape == kind.shape == closing.shape == (SENSOR_RAYS,)
+        assert set(kind.tolist()) <= {KIND_NONE, KIND_ASTEROID}
+        many = sense_many([world, GameWorld(seed=2)])
+        assert np.array_equal(many[0][0], dist) and many[0].shape == (2, SENSOR_RAYS)
+
+    def test_vecworld_matches_game_world_geometry(self):
+        world = GameWorld(seed=1)
+        vw = VecWorld(1, seed=1)
+        vw.ast_alive[0] = False
+        for j, a in enumerate(world.asteroids):
+            vw.ast_alive[0, j] = True
+            vw.ast_x[0, j], vw.ast_y[0, j] = a.x, a.y
+            vw.ast_vx[0, j], vw.ast_vy[0, j] = a.vel
+            vw.ast_radius[0, j] = a.radius
+        vw.ship_x[0], vw.ship_y[0], vw.ship_angle[0] = world.ship.x, world.ship.y, world.ship.angle
+        got = sense_vecworld(vw, 48)
+        want = sense(world, 48)
+        for g, w in zip(got, want):
+            assert g[0] == pytest.approx(w)
+
+    def test_vecworld_batch_shape(self):
+        vw = VecWorld(16, seed=3)
+        dist, kind, _ = sense_vecworld(vw, 8)
+        assert dist.shape == kind.shape == (16, 8)
+        assert (dist <= SENSOR_RANGE).all()
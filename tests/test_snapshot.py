@@ -0,0 +1,120 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pickle
+
+import numpy as np
+import pytest
+from snapshot import MAGIC, VERSION, clone, restore, snapshot
+from batch import RandomPolicy
+from world import GameWorld, PlaySubState
+from settings import EXTRA_LIFE_THRESHOLD, SIM_HZ
+
+DT = 1.0 / SIM_HZ
+
+
+def _busy_world(seed=3, ticks=900):
+    """A world mid-game with asteroids, a saucer and bullets in flight."""
+    world = GameWorld(seed=seed)
+    world._saucer_timer = 1.0
+    world.run(RandomPolicy(seed), ticks)
+    return world
+
+
+def _play(world, seed, ticks):
+    policy = RandomPolicy(seed)
+    for _ in range(ticks):
+        world.step(policy(world), DT)
+    return snapshot(world)
+
+
+# ── Capture ───────────────────────────────────────────────────
+class TestSnapshot:
+    def test_flat_float_array_with_header(self):
+        world = _busy_world()
+        snap = snapshot(world)
+        assert snap.dtype == np.float64 and snap.ndim == 1
+        assert snap[0] == MAGIC and snap[1] == VERSION
+        assert snap[2] == 1 + len(world.asteroids) + len(world.saucers) + len(world.bullets)
+
+    def test_independent_of_slot_history(self):
+        world = _busy_world()
+        assert np.array_equal(snapshot(clone(world)), snapshot(world))
+
+    def test_bytes_round_trip(self):
+        world = _busy_world()
+        snap = snapshot(world)
+        raw = pickle.loads(pickle.dumps(snap.tobytes()))
+        assert np.array_equal(snapshot(restore(np.frombuffer(raw))), snap)
+
+
+# ── Restore ───────────────────────────────────────────────────
+class TestRestore:
+    def test_clone_steps_like_the_original(self):
+        world = _busy_world()
+        assert world.saucers or world.enemy_bullets.active or world.player_bullets.active
+        fork = clone(world)
+        assert np.array_equal(_play(fork, 9, 2400), _play(world, 9, 2400))
+        assert (fork.score, fork.lives, fork.wave, fork.deaths) == \
+               (world.score, world.lives, world.wave, world.deaths)
+
+    def test_clone_keeps_the_vertex_cap(self):
+        world = _busy_world()
+        world.asteroid_vertices = 6
+        fork = clone(world)
+        assert fork.asteroid_vertices == 6
+        start = world.score
+        assert np.array_equal(_play(fork, 9, 1200), _play(world, 9, 1200))
+        assert world.score > start       # asteroids split after the fork
+
+    def test_rewind_scratch_world(self):
+        world = _busy_world()
+        snap = snapshot(world)
+        scratch = GameWorld(seed=1)
+        ends = []
+        for _ in range(3):
+            restore(snap, scratch)
+            ends.append(_play(scratch, 4, 600).tobytes())
+        assert ends[0] == ends[1] == ends[2]
+        assert ends[0] == _play(world, 4, 600).tobytes()
+
+    def test_restore_without_a_world_spawns_nothing_extra(self):
+        world = _busy_world()
+        fresh = restore(snapshot(world))
+        assert len(fresh.bodies) == 1 + len(world.asteroids) + len(world.saucers) + len(world.bullets)
+        assert fresh.rng is not world.rng and GameWorld(spawn=False).asteroids == []
+
+    def test_scalars_and_rng(self):
+        world = _busy_world()
+        world._next_extra_life_threshold = 3 * EXTRA_LIFE_THRESHOLD
+        world.deaths = {"saucer_bullet": 2}
+        world.play_sub_state = PlaySubState.RESPAWNING
+        world._respawn_timer = 0.75
+        fork = clone(world)
+        assert fork._next_extra_life_threshold == 3 * EXTRA_LIFE_THRESHOLD
+        assert fork.deaths == {"saucer_bullet": 2}
+        assert fork.play_sub_state == PlaySubState.RESPAWNING and fork._respawn_timer == 0.75
+        assert fork.rng.seed == world.rng.seed
+        assert [fork.rng.hyperspace.random() for _ in range(5)] == \
+               [world.rng.hyperspace.random() for _ in range(5)]
+
+    def test_store_holds_only_the_restored_bodies(self):
+        scratch = _busy_world(seed=5, ticks=1800)
+        world = GameWorld(seed=2)
+        restore(snapshot(world), scratch)
+        assert len(scratch.bodies) == 1 + len(world.asteroids)
+        assert [a.pos for a in scratch.asteroids] == [a.pos for a in world.asteroids]
+        assert not scratch.bullets and not scratch.saucers
+
+    def test_rejects_bad_buffers(self):
+        snap = snapshot(GameWorld(seed=1))
+        with pytest.raises(ValueError):
+            restore(snap[:-1])
+        bad = snap.copy()
+        bad[1] = VERSION + 1
+        with pytest.raises(ValueError):
+            restore(bad)
+        with pytest.raises(ValueError):
+            restore(np.zeros(len(snap)))
@@ -0,0 +1,153 @@
+import sys
+import os
+import gc
+import json
+import random
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from profiler import FrameProfiler
+from telemetry import TelemetryWriter, TelemetrySink, analyze, format_report, read_records
+from world import GameWorld, PlayerInput
+from quality import QualityGovernor
+
+
+def _lines(path):
+    return [json.loads(line) for line in open(path)]
+
+
+# ── Writer ────────────────────────────────────────────────────
+class TestTelemetryWriter:
+    def test_close_writes_every_record_in_order(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        w = TelemetryWriter(str(path), batch=7)
+        for i in range(50):
+            w.write({"i": i})
+        w.close()
+        assert [r["i"] for r in _lines(path)] == list(range(50))
+        w.close()   # idempotent
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path):
+        release = threading.Event()
+
+        class Stalled(TelemetryWriter):
+            def _run(self):
+                release.wait()          # the disk is stuck
+                super()._run()
+
+        path = tmp_path / "t.jsonl"
+        w = Stalled(str(path), batch=1, max_batches=1)
+        for i in range(3):
+            w.write({"i": i})
+        assert w.dropped == 2
+        release.set()
+        w.close()
+        assert [r["i"] for r in _lines(path)] == [0]
+
+
+# ── Sink ──────────────────────────────────────────────────────
+class TestTelemetrySink:
+    def test_one_record_per_closed_frame(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        sink = TelemetrySink(str(path), {"max_fps": 60})
+        prof = FrameProfiler(capacity=8)
+        world = GameWorld(rng=random.Random(1))
+        world.timer = prof.mark
+        prof.reset()
+        for i in range(5):
+            world.step(PlayerInput(fire=True), 1 / 60)
+            gc.collect()
+            prof.frame()
+            sink.frame(prof, "PLAYING", world)
+            sink.frame(prof, "PLAYING", world)     # same frame: not recorded twice
+        sink.close()
+        meta, *recs = _lines(path)
+        assert meta["meta"]["max_fps"] == 60
+        assert len(recs) == 5
+        r = recs[-1]
+        assert r["state"] == "PLAYING" and r["sub_state"] == "ACTIVE" and r["wave"] == 1
+        assert r["asteroids"] == len(world.asteroids)
+        assert r["gc"] >= 1
+        assert r["dt"] > 0 and "collisions" in r["phases"]
+        assert sum(rec["pairs"] for rec in recs) == world.pair_tests
+        assert sink._on_gc not in gc.callbacks
+
+    def test_no_world(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        sink = TelemetrySink(str(path))
+        prof = FrameProfiler(capacity=4)
+        prof.reset()
+        prof.frame()
+        sink.frame(prof, "TITLE_SCREEN")
+        sink.close()
+        rec = _lines(path)[1]
+        assert rec["state"] == "TITLE_SCREEN" and "wave" not in rec
+
+    def test_quality_tier_and_decisions(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        sink = TelemetrySink(str(path))
+        prof = FrameProfiler(capacity=4)
+        gov = QualityGovernor(budget_ms=16.0, window=2)
+        prof.reset()
+        for ms in (5.0, 5.0, 30.0, 30.0, 30.0):
+            gov.frame(ms)
+            prof.frame()
+            sink.frame(prof, "PLAYING", quality=gov)
+        sink.close()
+        recs = _lines(path)[1:]
+        assert [r["tier"] for r in recs] == ["high", "high", "high", "medium", "medium"]
+        assert [r.get("quality") for r in recs][3:] == [{"from": "high", "to": "medium", "ms": 30.0}, None]
+        assert list(analyze([str(path)])["tier"]) == ["high", "medium"]
+
+
+class TestPairTests:
+    def test_world_counts_narrow_phase_tests(self):
+        world = GameWorld(rng=random.Random(2))
+        world.ship.invincible = False
+        world.ship.invincibility_timer = 0
+        for t in range(120):
+            world.step(PlayerInput(fire=t % 4 == 0, turn=1.0), 1 / 60)
+        assert world.pair_tests > 0
+
+
+# ── Analysis ──────────────────────────────────────────────────
+def _write(path, meta, recs, torn=False):
+    with open(path, "w") as f:
+        f.write(json.dumps({"meta": meta}) + "\n")
+        for r in recs:
+            f.write(json.dumps(r) + "\n")
+        if torn:
+            f.write('{"t": 1.0, "dt"')
+
+
+def _rec(dt, state="PLAYING", wave=1, asteroids=4, bullets=0, saucers=0):
+    return {"dt": dt, "state": state, "wave": wave, "asteroids": asteroids,
+            "bullets": bullets, "saucers": saucers}
+
+
+class TestAnalyze:
+    def test_groups_and_percentiles(self, tmp_path):
+        path = tmp_path / "a.jsonl"
+        recs = ([_rec(16.7) for _ in range(90)]
+                + [_rec(40.0, wave=2, asteroids=12, bullets=10) for _ in range(10)]
+                + [{"dt": 16.0, "state": "TITLE_SCREEN"}])
+        _write(path, {"max_fps": 60}, recs, torn=True)
+        report = analyze([str(path)], bucket=10)
+        assert report["state"]["PLAYING"]["frames"] == 100
+        assert report["state"]["PLAYING"]["slow"] == pytest.approx(0.1)
+        assert report["state"]["TITLE_SCREEN"]["frames"] == 1
+        assert report["wave"]["2"]["p50"] == 40.0
+        assert list(report["entities"]) == ["0-9", "20-29"]
+        assert report["entities"]["20-29"]["slow"] == 1.0
+        text = format_report(report)
+        assert "by wave" in text and "20-29" in text
+
+    def test_budget_follows_each_files_frame_cap(self, tmp_path):
+        a, b = tmp_path / "a.jsonl", tmp_path / "b.jsonl"
+        _write(a, {"max_fps": 30}, [_rec(30.0)])
+        _write(b, {"max_fps": 60}, [_rec(30.0)])
+        assert analyze([str(a)])["state"]["PLAYING"]["slow"] == 0.0
+        assert analyze([str(b)])["state"]["PLAYING"]["slow"] == 1.0
+        assert len(list(read_records([str(a), str(b)]))) == 2
@@ -0,0 +1,69 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+from text_cache import TextCache, DigitAtlas, get_font, digit_atlas
+
+pygame.font.init()
+
+
+# ── Font registry ─────────────────────────────────────────────
+class TestFontRegistry:
+    def test_same_size_same_font(self):
+        assert get_font(30) is get_font(30)
+
+    def test_sizes_are_distinct(self):
+        assert get_font(30) is not get_font(31)
+
+
+# ── TextCache ─────────────────────────────────────────────────
+class TestTextCache:
+    def setup_method(self):
+        self.cache = TextCache(max_entries=3)
+        self.font = get_font(24)
+
+    def test_repeat_render_is_cached(self):
+        a = self.cache.render(self.font, "HELLO")
+        b = self.cache.render(self.font, "HELLO")
+        assert a is b
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+
+    def test_color_is_part_of_key(self):
+        a = self.cache.render(self.font, "HELLO", (255, 255, 255))
+        b = self.cache.render(self.font, "HELLO", (255, 0, 0))
+        assert a is not b
+
+    def test_lru_eviction(self):
+        first = self.cache.render(self.font, "a")
+        self.cache.render(self.font, "b")
+        self.cache.render(self.font, "c")
+        self.cache.render(self.font, "a")      # refresh "a"
+        self.cache.render(self.font, "d")      # evicts "b"
+        assert len(self.cache) == 3
+        assert self.cache.render(self.font, "a") is first
+        misses = self.cache.misses
+        self.cache.render(self.font, "b")
+        assert self.cache.misses == misses + 1
+
+
+# ── DigitAtlas ────────────────────────────────────────────────
+class TestDigitAtlas:
+    def test_shared_per_font_and_color(self):
+        font = get_font(48)
+        assert digit_atlas(font) is digit_atlas(font)
+
+    def test_draw_covers_number_width(self):
+        atlas = DigitAtlas(get_font(48))
+        screen = pygame.Surface((400, 100))
+        rect = atlas.draw(screen, 12345, (10, 5))
+        assert rect.topleft == (10, 5)
+        assert rect.width == atlas.width(12345)
+        assert screen.get_bounding_rect().width > 0
+
+    def test_zero(self):
+        atlas = DigitAtlas(get_font(48))
+        rect = atlas.draw(pygame.Surface((100, 100)), 0, (0, 0))
+        assert rect.width > 0
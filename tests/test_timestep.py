@@ -0,0 +1,61 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from bodies import BodyStore
+from ship import PlayerShip
+from timestep import FixedTimestep
+
+
+# ── FixedTimestep ─────────────────────────────────────────────
+class TestFixedTimestep:
+    def test_whole_ticks_and_remainder(self):
+        ts = FixedTimestep(hz=60, max_steps=5)
+        assert ts.advance(2.5 / 60) == 2
+        assert ts.alpha == pytest.approx(0.5)
+
+    def test_fast_frames_accumulate(self):
+        ts = FixedTimestep(hz=30, max_steps=5)
+        assert ts.advance(1 / 120) == 0
+        assert ts.advance(1 / 120) == 0
+        assert ts.advance(1 / 120) == 0
+        assert ts.advance(1 / 120) == 1
+
+    def test_long_stall_is_capped(self):
+        ts = FixedTimestep(hz=60, max_steps=5)
+        assert ts.advance(2.0) == 5
+        # The backlog is dropped rather than replayed next frame
+        assert ts.advance(0.0) == 0
+        assert 0.0 <= ts.alpha < 1.0
+
+    def test_reset_discards_partial_tick(self):
+        ts = FixedTimestep(hz=60)
+        ts.advance(0.5 / 60)
+        ts.reset()
+        assert ts.alpha == 0.0
+
+    def test_set_rate(self):
+        ts = FixedTimestep(hz=60)
+        ts.set_rate(120)
+        assert ts.dt == pytest.approx(1 / 120)
+
+
+# ── Rate independence ─────────────────────────────────────────
+class TestSimRate:
+    def _coast(self, hz):
+        ship = PlayerShip(640, 360, store=BodyStore())
+        for _ in range(hz // 2):
+            ship.apply_input(True, 0.0, 1 / hz)
+            ship.update(1 / hz)
+        for _ in range(hz):
+            ship.apply_input(False, 0.0, 1 / hz)
+            ship.update(1 / hz)
+        return ship
+
+    def test_ship_drag_matches_across_rates(self):
+        slow = self._coast(30)
+        fast = self._coast(120)
+        assert fast.vel.length() == pytest.approx(slow.vel.length(), rel=0.05)
+        assert fast.pos.distance_to(slow.pos) < 10
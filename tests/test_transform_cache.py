@@ -0,0 +1,84 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+
+import pytest
+from transform_cache import SHAPES, ShapeCache
+from asteroid import Asteroid
+from utils import rotate_points
+
+_SQUARE = [(10, 0), (0, 10), (-10, 0), (0, -10)]
+
+
+# ── ShapeCache ────────────────────────────────────────────────
+class TestShapeCache:
+    def setup_method(self):
+        self.cache = ShapeCache(steps=360, max_rows=8)
+
+    def test_matches_rotate_points(self):
+        table = self.cache.shape(_SQUARE)
+        for angle in (0, 37, 90, 215, -45):
+            expected = rotate_points(_SQUARE, angle)
+            got = table.rotated(angle)
+            for (ex, ey), (gx, gy) in zip(expected, got):
+                assert gx == pytest.approx(ex, abs=1e-9)
+                assert gy == pytest.approx(ey, abs=1e-9)
+
+    def test_angles_quantize_to_steps(self):
+        table = self.cache.shape(_SQUARE)
+        assert table.rotated(45.2) is table.rotated(44.9)
+        assert table.rotated(360) is table.rotated(0)
+
+    def test_place_translates(self):
+        pts = self.cache.shape(_SQUARE).place(0, 100, 50)
+        assert pts[0] == pytest.approx((110, 50))
+
+    def test_equal_shapes_share_a_table(self):
+        a = self.cache.shape(_SQUARE)
+        b = self.cache.shape(tuple(_SQUARE))
+        assert a is b
+        assert len(self.cache) == 1
+
+    def test_rows_fill_lazily(self):
+        table = self.cache.shape(_SQUARE)
+        assert self.cache.rows == 0
+        table.rotated(10)
+        table.rotated(10)
+        assert self.cache.rows == 1
+
+    def test_row_budget_evicts_least_recent(self):
+        old = self.cache.shape(_SQUARE)
+        for angle in range(4):
+            old.rotated(angle)
+        new = self.cache.shape([(1, 1), (2, 2), (3, 1)])
+        for angle in range(5):
+            new.rotated(angle)
+        assert self.cache.rows <= 8
+        assert old.filled == 0
+        assert len(self.cache) == 1
+
+    def test_evicted_table_refills(self):
+        old = self.cache.shape(_SQUARE)
+        old.rotated(0)
+        new = self.cache.shape([(1, 1), (2, 2), (3, 1)])
+        for angle in range(8):
+            new.rotated(angle)
+        assert old.place(0, 0, 0)[0] == pytest.approx((10, 0))
+
+    def test_undrawn_tables_are_not_kept(self):
+        tables = [self.cache.shape([(i, 0), (0, i), (-i, -i)]) for i in range(1, 200)]
+        assert len(self.cache) == 199 and self.cache.rows == 0
+        del tables
+        assert len(self.cache) == 0
+
+
+# ── Headless ──────────────────────────────────────────────────
+class TestHeadlessAsteroids:
+    def test_shapes_stay_bounded_without_drawing(self):
+        before = len(SHAPES)
+        for seed in range(500):
+            Asteroid((0, 0), (0, 0), "large", rng=random.Random(seed))
+        assert len(SHAPES) <= before + 1
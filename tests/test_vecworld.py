@@ -0,0 +1,179 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+import vecworld
+from vecworld import (
+    VecWorld, ACT_FIRE, ACT_HYPERSPACE, ACTIVE, RESPAWNING, WAVE_TRANSITION,
+    DEATH_CAUSES, actions_from_inputs, _dist_sq,
+)
+from fastmath import torus_dist_sq
+from world import PlayerInput
+from settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, SIM_HZ, MAX_BULLETS, MAX_LIVES,
+    WAVE_ASTEROID_START, ASTEROID_SPAWN_SAFE_RADIUS, ASTEROID_MEDIUM_RADIUS,
+    SCORE_LARGE_ASTEROID, SCORE_SMALL_ASTEROID, EXTRA_LIFE_THRESHOLD,
+    RESPAWN_DELAY, WAVE_TRANSITION_DELAY,
+)
+
+DT = 1.0 / SIM_HZ
+
+
+def _idle(n):
+    return np.zeros((n, 4))
+
+
+def _steps(vw, seconds, actions=None):
+    for _ in range(int(round(seconds * SIM_HZ))):
+        vw.step(_idle(vw.n) if actions is None else actions, DT)
+
+
+def _lone_asteroid(vw, i, x, y, size=0):
+    """Clear world i's field and leave one asteroid at rest at (x, y)."""
+    vw.ast_alive[i] = False
+    vw.ast_alive[i, 0] = True
+    vw.ast_x[i, 0], vw.ast_y[i, 0] = x, y
+    vw.ast_vx[i, 0] = vw.ast_vy[i, 0] = 0.0
+    vw.ast_size[i, 0] = size
+    vw.ast_radius[i, 0] = vecworld._RADIUS[size]
+
+
+# ── Setup ─────────────────────────────────────────────────────
+class TestReset:
+    def test_first_wave(self):
+        vw = VecWorld(64, seed=1)
+        assert (vw.asteroid_counts == WAVE_ASTEROID_START).all()
+        assert (vw.lives == MAX_LIVES).all() and (vw.wave == 1).all()
+        assert vw.ship_alive.all() and vw.invincible.all()
+        d2 = (vw.ast_x - SCREEN_WIDTH / 2) ** 2 + (vw.ast_y - SCREEN_HEIGHT / 2) ** 2
+        assert (d2[vw.ast_alive] >= ASTEROID_SPAWN_SAFE_RADIUS ** 2).all()
+
+    def test_reset_selected_worlds_only(self):
+        vw = VecWorld(4, seed=1)
+        _steps(vw, 1.0)
+        vw.reset(np.array([True, False, False, False]))
+        assert vw.ticks.tolist() == [0, 60, 60, 60]
+
+    def test_seed_reproduces_batch(self):
+        runs = []
+        for _ in range(2):
+            vw = VecWorld(32, seed=9)
+            rng = np.random.default_rng(0)
+            for _ in range(600):
+                a = _idle(32)
+                a[:, 1] = rng.uniform(-1, 1, 32)
+                a[:, ACT_FIRE] = rng.random(32) < 0.2
+                vw.step(a)
+            runs.append((vw.score.copy(), vw.ast_x.copy()))
+        assert (runs[0][0] == runs[1][0]).all()
+        assert np.array_equal(runs[0][1], runs[1][1])
+
+
+# ── Rules ─────────────────────────────────────────────────────
+class TestRules:
+    def test_motion_wraps(self):
+        vw = VecWorld(8, seed=2)
+        _steps(vw, 20.0)
+        live = vw.ast_alive
+        assert (vw.ast_x[live] >= 0).all() and (vw.ast_x[live] < SCREEN_WIDTH).all()
+        assert (vw.ast_y[live] >= 0).all() and (vw.ast_y[live] < SCREEN_HEIGHT).all()
+
+    def test_fire_respects_bullet_limit(self):
+        vw = VecWorld(2, seed=3)
+        for i in range(2):
+            _lone_asteroid(vw, i, 100, 100)
+        a = _idle(2)
+        a[0, ACT_FIRE] = 1
+        for _ in range(MAX_BULLETS + 3):
+            vw.step(a)
+        assert vw.bullet_alive.sum(axis=1).tolist() == [MAX_BULLETS, 0]
+
+    def test_bullet_splits_large_and_scores(self):
+        vw = VecWorld(2, seed=4)
+        for i in range(2):
+            _lone_asteroid(vw, i, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 150)
+        a = _idle(2)
+        a[0, ACT_FIRE] = 1
+        vw.step(a)
+        _steps(vw, 0.5)
+        assert vw.score.tolist() == [SCORE_LARGE_ASTEROID, 0]
+        assert vw.asteroid_counts.tolist() == [2, 1]
+        kids = vw.ast_alive[0]
+        assert (vw.ast_radius[0][kids] == ASTEROID_MEDIUM_RADIUS).all()
+        assert not vw.bullet_alive[0].any()
+
+    def test_clearing_the_field_starts_next_wave(self):
+        vw = VecWorld(1, seed=5)
+        _lone_asteroid(vw, 0, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 100, size=2)
+        a = _idle(1)
+        a[0, ACT_FIRE] = 1
+        vw.step(a)
+        _steps(vw, 0.3)
+        assert vw.score[0] == SCORE_SMALL_ASTEROID
+        assert vw.state[0] == WAVE_TRANSITION
+        _steps(vw, WAVE_TRANSITION_DELAY)
+        assert vw.state[0] == ACTIVE and vw.wave[0] == 2
+        assert vw.asteroid_counts[0] == WAVE_ASTEROID_START + 1
+
+    def test_extra_life_at_threshold(self):
+        vw = VecWorld(1, seed=6)
+        vw.lives[0] = 2
+        vw.score[0] = EXTRA_LIFE_THRESHOLD - 10
+        _lone_asteroid(vw, 0, SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 150)
+        a = _idle(1)
+        a[0, ACT_FIRE] = 1
+        vw.step(a)
+        _steps(vw, 0.5)
+        assert vw.lives[0] == 3
+        assert vw._next_extra_life_threshold[0] == 2 * EXTRA_LIFE_THRESHOLD
+
+    def test_ship_hit_by_asteroid_then_respawns(self):
+        vw = VecWorld(2, seed=7)
+        vw.invincible[:] = False
+        _lone_asteroid(vw, 0, SCREEN_WIDTH / 2 + 30, SCREEN_HEIGHT / 2)
+        _lone_asteroid(vw, 1, 100, 100)
+        vw.step(_idle(2))
+        assert vw.state.tolist() == [RESPAWNING, ACTIVE]
+        assert vw.lives.tolist() == [MAX_LIVES - 1, MAX_LIVES]
+        assert vw.summary(0)["deaths"] == {"asteroid": 1}
+        assert vw.asteroid_counts[0] == 2          # the asteroid split on the ship
+        _steps(vw, RESPAWN_DELAY + DT)     # the timer may need one more tick to reach zero
+        assert vw.state[0] == ACTIVE and vw.ship_alive[0] and vw.invincible[0]
+
+    def test_hyperspace_death_and_game_over(self, monkeypatch):
+        monkeypatch.setattr(vecworld, "HYPERSPACE_DEATH_CHANCE", 1.0)
+        vw = VecWorld(2, seed=8)
+        vw.lives[0] = 1
+        a = _idle(2)
+        a[0, ACT_HYPERSPACE] = 1
+        vw.step(a)
+        assert vw.game_over.tolist() == [True, False]
+        assert vw.deaths[0, DEATH_CAUSES.index("hyperspace")] == 1
+        ticks = vw.ticks.copy()
+        vw.step(_idle(2))
+        assert vw.ticks.tolist() == [ticks[0], ticks[1] + 1]   # finished worlds stand still
+
+    def test_run_stops_when_all_over(self):
+        vw = VecWorld(4, seed=9)
+        vw.game_over[:] = True
+        assert vw.run(lambda v: _idle(v.n), 100) == 0
+
+
+# ── Helpers ───────────────────────────────────────────────────
+class TestHelpers:
+    def test_dist_sq_matches_torus_distance(self):
+        rng = np.random.default_rng(0)
+        ax = rng.uniform(-60, SCREEN_WIDTH + 60, 500)    # saucers may be off the sides
+        ay = rng.uniform(0, SCREEN_HEIGHT, 500)
+        bx = rng.uniform(0, SCREEN_WIDTH, 500)
+        by = rng.uniform(0, SCREEN_HEIGHT, 500)
+        got = _dist_sq(ax, ay, bx, by)
+        want = [torus_dist_sq(*p, SCREEN_WIDTH, SCREEN_HEIGHT) for p in zip(ax, ay, bx, by)]
+        assert got == pytest.approx(want)
+
+    def test_actions_from_inputs(self):
+        rows = actions_from_inputs([PlayerInput(thrust=True, turn=-0.5), PlayerInput(fire=True)])
+        assert rows.tolist() == [[1.0, -0.5, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0]]
@@ -0,0 +1,129 @@
+"""
+Tests for the headless GameWorld simulation.
+
+No display or mixer is initialised here: the world must run without either.
+"""
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+from world import GameWorld, PlayerInput, PlaySubState, NO_INPUT, SimClock
+
+
+def _fire_every_tick(world):
+    return PlayerInput(fire=True, turn=1.0)
+
+
+class TestGameWorld:
+    def test_new_world_starts_wave_one(self):
+        from settings import WAVE_ASTEROID_START, MAX_LIVES
+        world = GameWorld(rng=random.Random(1))
+        assert world.wave == 1
+        assert world.lives == MAX_LIVES
+        assert len(world.asteroids) == WAVE_ASTEROID_START
+        assert world.play_sub_state == PlaySubState.ACTIVE
+
+    def test_step_advances_clock(self):
+        world = GameWorld(rng=random.Random(1))
+        world.step(NO_INPUT, 0.5)
+        world.step(NO_INPUT, 0.25)
+        assert world.clock.now() == pytest.approx(0.75)
+        assert world.ticks == 2
+
+    def test_injected_clock_is_used(self):
+        clock = SimClock()
+        world = GameWorld(rng=random.Random(1), clock=clock)
+        world.step(NO_INPUT, 0.1)
+        assert clock.now() == pytest.approx(0.1)
+
+    def test_fire_spawns_bullet_and_event(self):
+        world = GameWorld(rng=random.Random(1))
+        world.step(PlayerInput(fire=True), 1 / 60)
+        assert len(world.bullets) == 1
+        assert "fire" in world.drain_events()
+        assert world.events == []
+
+    def test_fire_respects_max_bullets(self):
+        from settings import MAX_BULLETS
+        world = GameWorld(rng=random.Random(1))
+        for _ in range(MAX_BULLETS + 3):
+            world.step(PlayerInput(fire=True), 0.001)
+        assert len(world.player_bullets) <= MAX_BULLETS
+
+    def test_thrust_moves_ship(self):
+        world = GameWorld(rng=random.Random(1))
+        y0 = world.ship.pos.y
+        for _ in range(30):
+            world.step(PlayerInput(thrust=True), 1 / 60)
+        assert world.ship.pos.y < y0
+
+    def test_turn_rotates_ship(self):
+        world = GameWorld(rng=random.Random(1))
+        world.step(PlayerInput(turn=1.0), 0.1)
+        assert world.ship.angle > 0
+
+    def test_same_seed_same_game(self):
+        a = GameWorld(rng=random.Random(42))
+        b = GameWorld(rng=random.Random(42))
+        a.run(_fire_every_tick, 600)
+        b.run(_fire_every_tick, 600)
+        assert a.score == b.score
+        assert a.lives == b.lives
+        assert [x.pos for x in a.asteroids] == [x.pos for x in b.asteroids]
+
+    def test_ship_death_enters_respawn(self):
+        world = GameWorld(rng=random.Random(1))
+        world.ship.invincible = False
+        world.asteroids[0].pos = pygame.Vector2(world.ship.pos)
+        world.step(NO_INPUT, 1 / 60)
+        assert world.play_sub_state == PlaySubState.RESPAWNING
+        assert "explosion_ship" in world.drain_events()
+
+    def test_ship_meets_asteroid_before_saucer(self):
+        from saucer import Saucer
+        world = GameWorld(rng=random.Random(1))
+        world.ship.invincible = False
+        saucer = Saucer(large=True, store=world.bodies)
+        saucer.pos, saucer.vel = pygame.Vector2(world.ship.pos), pygame.Vector2(0, 0)
+        world.saucers.append(saucer)
+        world._grid.insert(saucer)            # filed ahead of the asteroid
+        target = world.asteroids[0]
+        target.pos, target.vel = pygame.Vector2(world.ship.pos), pygame.Vector2(0, 0)
+        world.step(NO_INPUT, 1 / 60)
+        assert world.deaths == {"asteroid": 1}
+        assert target not in world.asteroids and saucer in world.saucers
+
+    def test_last_life_ends_game(self):
+        world = GameWorld(rng=random.Random(1))
+        world.lives = 1
+        world.ship.invincible = False
+        world.asteroids[0].pos = pygame.Vector2(world.ship.pos)
+        world.step(NO_INPUT, 1 / 60)
+        assert world.game_over is True
+
+    def test_cleared_field_advances_wave(self):
+        world = GameWorld(rng=random.Random(1))
+        world.asteroids = []
+        world.step(NO_INPUT, 1 / 60)
+        assert world.play_sub_state == PlaySubState.WAVE_TRANSITION
+        world.step(NO_INPUT, 5.0)
+        assert world.wave == 2
+        assert world.play_sub_state == PlaySubState.ACTIVE
+
+    def test_extra_life_threshold(self):
+        from settings import EXTRA_LIFE_THRESHOLD
+        world = GameWorld(rng=random.Random(1))
+        world.lives = 2
+        world._add_score(EXTRA_LIFE_THRESHOLD)
+        assert world.lives == 3
+        assert world._next_extra_life_threshold == 2 * EXTRA_LIFE_THRESHOLD
+
+    def test_run_stops_at_game_over(self):
+        world = GameWorld(rng=random.Random(3))
+        ticks = world.run(lambda w: NO_INPUT, 200_000)
+        assert world.game_over is True
+        assert ticks < 200_000
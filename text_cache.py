@@ -0,0 +1,106 @@
+"""
+Shared fonts and rendered text.
+
+get_font() is a process-wide font registry, so each (name, size) is loaded
+once instead of inside every draw call. render_text() returns a cached
+Surface for a (font, text, color) triple. Static labels and slowly changing
+values like "WAVE 3" are rasterized once and then just blitted. The cache is
+LRU-bounded by TEXT_CACHE_SIZE.
+
+DigitAtlas pre-renders 0-9 for one font and color. The HUD score, which
+changes constantly, is drawn as a row of glyph blits instead of a fresh
+font rasterization.
+"""
+from collections import OrderedDict
+
+import pygame
+from settings import WHITE, TEXT_CACHE_SIZE
+
+_fonts = {}
+
+
+def get_font(size: int, name=None) -> pygame.font.Font:
+    """The shared Font for (name, size); name None is the default system font."""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.SysFont(name, size)
+    return font
+
+
+class TextCache:
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+    def render(self, font: pygame.font.Font, text: str, color=WHITE) -> pygame.Surface:
+        """Antialiased render of text, reused while the same triple keeps being drawn.
+
+        The returned Surface is shared; blit it, don't draw on it.
+        """
+        key = (font, text, tuple(color))
+        surfaces = self._surfaces
+        surf = surfaces.get(key)
+        if surf is not None:
+            surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = surfaces[key] = font.render(text, True, color)
+        if len(surfaces) > self.max_entries:
+            surfaces.popitem(last=False)
+        return surf
+
+
+TEXT = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, color=WHITE) -> pygame.Surface:
+    """Shorthand for TEXT.render()."""
+    return TEXT.render(font, text, color)
+
+
+class DigitAtlas:
+    """Glyphs 0-9 of one font and color, blitted side by side to draw numbers."""
+
+    def __init__(self, font: pygame.font.Font, color=WHITE) -> None:
+        self._glyphs = [font.render(str(d), True, color) for d in range(10)]
+        self._widths = [g.get_width() for g in self._glyphs]
+        self.height = max(g.get_height() for g in self._glyphs)
+
+    def width(self, number: int) -> int:
+        widths = self._widths
+        return sum(widths[ord(c) - 48] for c in str(number))
+
+    def draw(self, screen: pygame.Surface, number: int, pos) -> pygame.Rect:
+        """Blit non-negative `number` with its top-left at pos; returns the covered rect."""
+        x, y = pos
+        x0 = x
+        glyphs, widths = self._glyphs, self._widths
+        seq = []
+        for c in str(number):
+            d = ord(c) - 48
+            seq.append((glyphs[d], (x, y)))
+            x += widths[d]
+        screen.blits(seq, doreturn=False)
+        return pygame.Rect(x0, y, x - x0, self.height)
+
+
+_atlases = {}
+
+
+def digit_atlas(font: pygame.font.Font, color=WHITE) -> DigitAtlas:
+    """The shared DigitAtlas for (font, color)."""
+    key = (font, tuple(color))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = DigitAtlas(font, color)
+    return atlas
@@ -0,0 +1,43 @@
+"""
+FixedTimestep — decouples the simulation rate from the render rate.
+
+Each rendered frame feeds its wall-clock delta into advance(), which returns
+how many fixed-size simulation ticks to run. The leftover fraction is kept
+as `alpha` so the renderer can interpolate between the last two states.
+
+Catch-up is capped: after a long stall (window drag, breakpoint, slow
+kiosk) at most `max_steps` ticks run and the rest of the backlog is
+dropped, so a slow frame can never snowball into slower ones.
+"""
+from settings import SIM_HZ, MAX_SIM_STEPS
+
+
+class FixedTimestep:
+    def __init__(self, hz: float = SIM_HZ, max_steps: int = MAX_SIM_STEPS) -> None:
+        self.max_steps = max_steps
+        self.set_rate(hz)
+        self._acc = 0.0
+
+    def set_rate(self, hz: float) -> None:
+        self.hz = float(hz)
+        self.dt = 1.0 / self.hz
+
+    def reset(self) -> None:
+        """Forget any accumulated time, e.g. when resuming from pause."""
+        self._acc = 0.0
+
+    def advance(self, frame_dt: float) -> int:
+        """Bank frame_dt seconds and return the number of ticks due."""
+        self._acc += max(0.0, frame_dt)
+        steps = int(self._acc / self.dt)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            # Spiral-of-death guard: drop the backlog instead of chasing it
+            self._acc = steps * self.dt
+        self._acc -= steps * self.dt
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a tick elapsed since the last one, in [0, 1)."""
+        return min(self._acc / self.dt, 1.0)
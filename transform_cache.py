@@ -0,0 +1,125 @@
+"""
+ShapeCache — rotated polygon vertices looked up instead of recomputed.
+
+A shape's local-space (x, y) vertices are registered once with
+SHAPES.shape(points). That returns a ShapeTable, which the entity keeps.
+Rotation is quantized to TRANSFORM_ANGLE_STEPS buckets per turn. The first
+draw at a bucket computes the rotated offsets. Every later draw there is one
+list index plus a translate, with no trig and no hashing.
+
+Registering equal vertices returns the same table, so every instance of a
+shape (the ship, its flame, each saucer size) shares one. The registry only
+holds tables weakly: a table that is never drawn, such as every asteroid in
+a headless world, goes away with the last entity that holds it, and it owns
+no row list until its first fill. Memory is bounded by a budget of cached
+rows across all tables. When the budget is exceeded, the tables that were
+filled least recently are emptied and forgotten. An entity that still holds
+an emptied table simply refills it on its next draw.
+"""
+import math
+import weakref
+from collections import OrderedDict
+
+from settings import TRANSFORM_ANGLE_STEPS, TRANSFORM_CACHE_ROWS
+
+
+class ShapeTable:
+    """Rotated offsets of one shape, filled lazily per angle bucket."""
+
+    __slots__ = ("points", "radius", "rows", "filled", "_cache", "__weakref__")
+
+    def __init__(self, points: tuple, cache: "ShapeCache") -> None:
+        self.points = points
+        self.radius = max(math.hypot(x, y) for x, y in points)   # bounds every rotation
+        self.rows = cache._blank      # shared and read-only until the first fill
+        self.filled = 0
+        self._cache = cache
+
+    def bucket(self, angle_degrees: float) -> int:
+        """Index of the quantized rotation nearest angle_degrees."""
+        cache = self._cache
+        return int(round(angle_degrees * cache.per_degree)) % cache.steps
+
+    def rotated(self, angle_degrees: float) -> list:
+        """Offsets at the nearest quantized angle. Do not mutate."""
+        cache = self._cache
+        i = int(round(angle_degrees * cache.per_degree)) % cache.steps
+        row = self.rows[i]
+        if row is None:
+            row = cache._fill(self, i)
+        return row
+
+    def place(self, angle_degrees: float, x: float, y: float) -> list:
+        """Screen-space vertices rotated by angle and moved to (x, y)."""
+        cache = self._cache
+        row = self.rows[int(round(angle_degrees * cache.per_degree)) % cache.steps]
+        if row is None:
+            row = self.rotated(angle_degrees)
+        return [(x + dx, y + dy) for dx, dy in row]
+
+
+class ShapeCache:
+    def __init__(self, steps: int = TRANSFORM_ANGLE_STEPS,
+                 max_rows: int = TRANSFORM_CACHE_ROWS) -> None:
+        self.steps = steps
+        self.max_rows = max_rows
+        self.per_degree = steps / 360.0
+        self._cos = [math.cos(2 * math.pi * i / steps) for i in range(steps)]
+        self._sin = [math.sin(2 * math.pi * i / steps) for i in range(steps)]
+        self._blank = (None,) * steps
+        self._by_points = weakref.WeakValueDictionary()   # points -> ShapeTable, for sharing
+        self._lru = OrderedDict()     # ShapeTable -> None, least recently filled first
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return len(self._by_points)
+
+    @property
+    def rows(self) -> int:
+        """Rotated rows currently held across all tables."""
+        return self._rows
+
+    def shape(self, points) -> ShapeTable:
+        """The shared table for these vertices."""
+        points = tuple((float(x), float(y)) for x, y in points)
+        table = self._by_points.get(points)
+        if table is None:
+            table = self._by_points[points] = ShapeTable(points, self)
+        return table
+
+    def clear(self) -> None:
+        for table in self._lru:
+            self._empty(table)
+        self._lru.clear()
+        self._by_points.clear()
+        self._rows = 0
+
+    def _empty(self, table: ShapeTable) -> None:
+        table.rows = self._blank
+        table.filled = 0
+
+    def _fill(self, table: ShapeTable, i: int) -> list:
+        if not table.filled:
+            table.rows = [None] * self.steps
+        # Same rotation convention as utils.rotate_points
+        c, s = self._cos[i], self._sin[i]
+        row = table.rows[i] = [(x * c - y * s, x * s + y * c) for x, y in table.points]
+        table.filled += 1
+        self._rows += 1
+
+        lru = self._lru
+        lru[table] = None
+        lru.move_to_end(table)
+        by_points = self._by_points
+        if table.points not in by_points:
+            by_points[table.points] = table     # re-adopt after an eviction
+        while self._rows > self.max_rows and len(lru) > 1:
+            old, _ = lru.popitem(last=False)
+            self._rows -= old.filled
+            self._empty(old)
+            if by_points.get(old.points) is old:
+                del by_points[old.points]
+        return row
+
+
+SHAPES = ShapeCache()
@@ -1,10 +1,12 @@
 import math
 import pygame
 
+from fastmath import wrap_inplace, circles_overlap, circles_overlap_wrapped
+
 
 def wrap_position(pos: pygame.Vector2, width: int, height: int) -> pygame.Vector2:
     """Wrap a position to stay within screen bounds (torus topology)."""
-    return pygame.Vector2(pos.x % width, pos.y % height)
+    return wrap_inplace(pygame.Vector2(pos), width, height)
 
 
 def circles_collide(
@@ -12,7 +14,17 @@ def circles_collide(
     pos_b: pygame.Vector2, radius_b: float,
 ) -> bool:
     """Return True if two circles overlap."""
-    return pos_a.distance_to(pos_b) < (radius_a + radius_b)
+    return circles_overlap(pos_a[0], pos_a[1], radius_a, pos_b[0], pos_b[1], radius_b)
+
+
+def circles_collide_wrapped(
+    pos_a: pygame.Vector2, radius_a: float,
+    pos_b: pygame.Vector2, radius_b: float,
+    width: int, height: int,
+) -> bool:
+    """Return True if two circles overlap on the wrapped (torus) playfield."""
+    return circles_overlap_wrapped(pos_a[0], pos_a[1], radius_a,
+                                   pos_b[0], pos_b[1], radius_b, width, height)
 
 
 def rotate_points(points: list, angle_degrees: float) -> list:
@@ -0,0 +1,676 @@
+"""
+VecWorld — N independent games stepped in lockstep as NumPy arrays.
+
+For bots and Monte Carlo runs that want many worlds at once in one
+process. Every piece of play state is an array with a leading world axis:
+
+    ship      ship_x/_y/_vx/_vy (N,), angle, alive, invincibility and cooldown timers
+    asteroids ast_x/_y/_vx/_vy (N, A), size, radius, alive
+    bullets   player bullet_* (N, MAX_BULLETS) and saucer enemy_* (N, E), with lifetimes
+    saucers   saucer_x/_y/_vx/_vy (N, S), size, fire and course timers, alive
+    game      score, lives, wave, ticks, sub-state, timers, deaths by cause
+
+Coordinates are kept as separate x and y planes rather than (..., 2) rows.
+Arithmetic against a trailing axis of two runs many times slower in NumPy
+than on contiguous planes.
+
+Entities live in fixed slots. Spawning sets a slot's alive flag and
+despawning clears it, so no Python lists are kept. One step(actions)
+advances every world with the rules and ordering of GameWorld.step:
+
+  * fire and hyperspace;
+  * ship turn, thrust, drag and speed cap;
+  * movement and wrap;
+  * bullet expiry;
+  * saucer course changes, fire and spawns;
+  * collisions, asteroid splits (Asteroid.split), scoring and extra lives
+    (GameWorld._add_score);
+  * respawn and wave progression.
+
+Python loops run only over a world's few bullet and saucer slots, never
+over worlds or asteroids. Collisions take one broad pass that tests every
+bullet of every world. Only the handful of worlds with a hit are then
+resolved exactly.
+
+Slot counts are sized so the rules cannot overflow them. A wave holds at
+most WAVE_ASTEROID_MAX large asteroids, and each splits into at most four
+pieces alive at once. MAX_BULLETS is the player's limit. Saucers and their
+shots use VEC_SAUCER_SLOTS and VEC_ENEMY_BULLET_SLOTS. A spawn or shot
+that finds those slots full is skipped; at the default spawn rate this
+cannot happen.
+
+Differences from GameWorld, all deliberate:
+  * Randomness comes from one generator for the whole batch. A seed
+    reproduces the batch, but world i does not replay GameWorld(seed=i).
+  * Cosmetic state is not simulated: asteroid outlines and spin,
+    particles, sound events and blink timers.
+  * When an object touches several targets in one tick, asteroids are
+    checked before saucers, each in slot order. GameWorld takes them in
+    spatial-hash order.
+"""
+import math
+
+import numpy as np
+from settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, SIM_HZ, FPS,
+    SHIP_THRUST, MAX_SPEED, DRAG_COEFFICIENT, ROTATION_SPEED,
+    BULLET_SPEED, BULLET_LIFETIME, MAX_BULLETS, BULLET_RADIUS,
+    ASTEROID_LARGE_RADIUS, ASTEROID_MEDIUM_RADIUS, ASTEROID_SMALL_RADIUS,
+    ASTEROID_LARGE_SPEED_MIN, ASTEROID_LARGE_SPEED_MAX,
+    ASTEROID_MEDIUM_SPEED_MIN, ASTEROID_MEDIUM_SPEED_MAX,
+    ASTEROID_SMALL_SPEED_MIN, ASTEROID_SMALL_SPEED_MAX,
+    ASTEROID_SPAWN_SAFE_RADIUS,
+    SCORE_LARGE_ASTEROID, SCORE_MEDIUM_ASTEROID, SCORE_SMALL_ASTEROID,
+    SCORE_LARGE_SAUCER, SCORE_SMALL_SAUCER,
+    EXTRA_LIFE_THRESHOLD, MAX_LIVES,
+    RESPAWN_DELAY, INVINCIBILITY_TIME,
+    WAVE_ASTEROID_START, WAVE_ASTEROID_MAX, WAVE_TRANSITION_DELAY,
+    SAUCER_SPAWN_INTERVAL_BASE, SAUCER_SPAWN_INTERVAL_MIN,
+    SAUCER_LARGE_RADIUS, SAUCER_SMALL_RADIUS,
+    SAUCER_LARGE_FIRE_INTERVAL, SAUCER_SMALL_FIRE_INTERVAL,
+    SAUCER_AIM_SPREAD, SMALL_SAUCER_SCORE_THRESHOLD,
+    HYPERSPACE_DEATH_CHANCE, HYPERSPACE_COOLDOWN,
+    VEC_SAUCER_SLOTS, VEC_ENEMY_BULLET_SLOTS,
+)
+from ship import PlayerShip
+
+# Action columns: step() takes an (N, 4) array, one row per world
+ACT_THRUST, ACT_TURN, ACT_FIRE, ACT_HYPERSPACE = range(4)
+
+# Play sub-states, as GameWorld.PlaySubState
+ACTIVE, RESPAWNING, WAVE_TRANSITION = range(3)
+
+# Columns of VecWorld.deaths
+DEATH_CAUSES = ("asteroid", "saucer", "saucer_bullet", "hyperspace")
+_ASTEROID, _SAUCER, _SAUCER_BULLET, _HYPERSPACE = range(4)
+
+# Asteroid tables by size code: 0 large, 1 medium, 2 small
+_RADIUS    = np.array([ASTEROID_LARGE_RADIUS, ASTEROID_MEDIUM_RADIUS, ASTEROID_SMALL_RADIUS], dtype=float)
+_SPEED_MIN = np.array([ASTEROID_LARGE_SPEED_MIN, ASTEROID_MEDIUM_SPEED_MIN, ASTEROID_SMALL_SPEED_MIN])
+_SPEED_MAX = np.array([ASTEROID_LARGE_SPEED_MAX, ASTEROID_MEDIUM_SPEED_MAX, ASTEROID_SMALL_SPEED_MAX])
+_SCORE     = np.array([SCORE_LARGE_ASTEROID, SCORE_MEDIUM_ASTEROID, SCORE_SMALL_ASTEROID])
+_SMALL = 2
+
+# Unit headings at the same 0.1° steps as bullet.heading; angle 0 = up (−Y)
+_STEPS = 3600
+_HEADING_X = np.sin(np.arange(_STEPS) * (2 * np.pi / _STEPS))
+_HEADING_Y = -np.cos(np.arange(_STEPS) * (2 * np.pi / _STEPS))
+
+
+def _heading(angle: np.ndarray) -> tuple:
+    """Unit (dx, dy) arrays for headings in degrees."""
+    i = np.rint(angle * (_STEPS / 360.0)).astype(np.intp) % _STEPS
+    return _HEADING_X[i], _HEADING_Y[i]
+
+
+def _wrap(v: np.ndarray, size: float) -> None:
+    """Wrap one coordinate plane that moved less than a screen this tick, in place.
+
+    Equal to np.mod here, but two masked adds cost far less than a float modulo.
+    """
+    np.subtract(v, size, out=v, where=v >= size)
+    np.add(v, size, out=v, where=v < 0)
+
+
+def _dist_sq(ax, ay, bx, by) -> np.ndarray:
+    """Squared wrapped distances between broadcastable coordinate planes.
+
+    Per axis the offset is min(|d|, size - d). For |d| past one screen that
+    term is negative, but squaring still gives the wrapped distance. This
+    covers saucers, which sit up to a few radii off the sides.
+    """
+    dx = np.subtract(ax, bx)
+    np.abs(dx, out=dx)
+    np.minimum(dx, SCREEN_WIDTH - dx, out=dx)
+    dy = np.subtract(ay, by)
+    np.abs(dy, out=dy)
+    np.minimum(dy, SCREEN_HEIGHT - dy, out=dy)
+    dx *= dx
+    dy *= dy
+    dx += dy
+    return dx
+
+
+def _first_free(alive: np.ndarray) -> tuple:
+    """(has a free slot, index of the first free slot) per row of an alive mask."""
+    free = ~alive
+    return free.any(axis=1), free.argmax(axis=1)
+
+
+def _mask(n: int, index: np.ndarray) -> np.ndarray:
+    mask = np.zeros(n, dtype=bool)
+    mask[index] = True
+    return mask
+
+
+class VecWorld:
+    """N games of Asteroids advanced together by one step() call."""
+
+    def __init__(self, n: int, seed: int = None) -> None:
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        a = 4 * WAVE_ASTEROID_MAX          # every large of a full wave split to its two smalls
+        s = VEC_SAUCER_SLOTS
+        e = VEC_ENEMY_BULLET_SLOTS
+        b = MAX_BULLETS
+
+        # Game
+        self.score     = np.zeros(n, dtype=np.int64)
+        self.lives     = np.zeros(n, dtype=np.int64)
+        self.wave      = np.zeros(n, dtype=np.int64)
+        self.ticks     = np.zeros(n, dtype=np.int64)
+        self.game_over = np.zeros(n, dtype=bool)
+        self.state     = np.zeros(n, dtype=np.int8)
+        self.deaths    = np.zeros((n, len(DEATH_CAUSES)), dtype=np.int64)
+        self._respawn_timer = np.zeros(n)
+        self._wave_timer    = np.zeros(n)
+        self._saucer_timer  = np.zeros(n)
+        self._next_extra_life_threshold = np.zeros(n, dtype=np.int64)
+        self._points = np.zeros(n, dtype=np.int64)   # per-world points from one bullet slot
+
+        # Ship
+        self.ship_x, self.ship_y, self.ship_vx, self.ship_vy = np.zeros((4, n))
+        self.ship_angle = np.zeros(n)
+        self.ship_alive = np.zeros(n, dtype=bool)
+        self.invincible = np.zeros(n, dtype=bool)
+        self.invincibility_timer = np.zeros(n)
+        self.hyperspace_cooldown = np.zeros(n)
+
+        # Asteroids
+        self.ast_x, self.ast_y, self.ast_vx, self.ast_vy = np.zeros((4, n, a))
+        self.ast_size   = np.zeros((n, a), dtype=np.intp)
+        self.ast_radius = np.zeros((n, a))
+        self.ast_alive  = np.zeros((n, a), dtype=bool)
+
+        # Player bullets
+        self.bullet_x, self.bullet_y, self.bullet_vx, self.bullet_vy = np.zeros((4, n, b))
+        self.bullet_life  = np.zeros((n, b))
+        self.bullet_alive = np.zeros((n, b), dtype=bool)
+
+        # Saucers and their bullets
+        self.saucer_x, self.saucer_y, self.saucer_vx, self.saucer_vy = np.zeros((4, n, s))
+        self.saucer_large  = np.zeros((n, s), dtype=bool)
+        self.saucer_radius = np.zeros((n, s))
+        self.saucer_alive  = np.zeros((n, s), dtype=bool)
+        self._saucer_fire  = np.zeros((n, s))
+        self._saucer_dir   = np.zeros((n, s))
+        self.enemy_x, self.enemy_y, self.enemy_vx, self.enemy_vy = np.zeros((4, n, e))
+        self.enemy_life  = np.zeros((n, e))
+        self.enemy_alive = np.zeros((n, e), dtype=bool)
+
+        self.reset()
+
+    def reset(self, mask: np.ndarray = None) -> None:
+        """Start fresh games in the selected worlds (default: all)."""
+        if mask is None:
+            mask = np.ones(self.n, dtype=bool)
+        self.score[mask] = 0
+        self.lives[mask] = MAX_LIVES
+        self.wave[mask] = 1
+        self.ticks[mask] = 0
+        self.game_over[mask] = False
+        self.state[mask] = ACTIVE
+        self.deaths[mask] = 0
+        self._respawn_timer[mask] = 0.0
+        self._wave_timer[mask] = 0.0
+        self._saucer_timer[mask] = SAUCER_SPAWN_INTERVAL_BASE
+        self._next_extra_life_threshold[mask] = EXTRA_LIFE_THRESHOLD
+
+        self._place_ship(mask)
+        self.invincibility_timer[mask] = 3.0
+
+        self.bullet_alive[mask] = False
+        self.enemy_alive[mask] = False
+        self.saucer_alive[mask] = False
+        self._spawn_wave(mask)
+
+    # ── Inspection ────────────────────────────────────────────
+    @property
+    def asteroid_counts(self) -> np.ndarray:
+        return self.ast_alive.sum(axis=1)
+
+    def summary(self, i: int) -> dict:
+        """World i in the shape batch.play reports a game."""
+        return {
+            "score": int(self.score[i]),
+            "wave": int(self.wave[i]),
+            "deaths": {c: int(k) for c, k in zip(DEATH_CAUSES, self.deaths[i]) if k},
+            "ticks": int(self.ticks[i]),
+            "game_over": bool(self.game_over[i]),
+        }
+
+    # ── Stepping ──────────────────────────────────────────────
+    def step(self, actions: np.ndarray, dt: float = 1.0 / SIM_HZ) -> None:
+        """Advance every world that is not over by dt; actions is (N, 4), see ACT_*."""
+        live = ~self.game_over
+        if not live.any():
+            return
+        self.ticks += live
+
+        active = live & (self.state == ACTIVE)
+        armed = active & self.ship_alive
+        fire = armed & (actions[:, ACT_FIRE] != 0)
+        if fire.any():
+            self._fire_bullet(fire)
+        jump = armed & (actions[:, ACT_HYPERSPACE] != 0)
+        if jump.any():
+            self._do_hyperspace(jump)
+
+        # Sub-states as they stand after the actions, one branch per world
+        state = self.state
+        active = live & (state == ACTIVE)
+        respawning = live & (state == RESPAWNING)
+        transition = live & (state == WAVE_TRANSITION)
+
+        if active.any():
+            self._update_active(active, actions, dt)
+        if respawning.any():
+            np.subtract(self._respawn_timer, dt, out=self._respawn_timer, where=respawning)
+            self._do_respawn(respawning & (self._respawn_timer <= 0))
+        if transition.any():
+            np.subtract(self._wave_timer, dt, out=self._wave_timer, where=transition)
+            self._next_wave(transition & (self._wave_timer <= 0))
+
+    def run(self, policy, max_ticks: int, dt: float = 1.0 / SIM_HZ) -> int:
+        """Step until every game is over or max_ticks; policy(vecworld) -> (N, 4) actions.
+
+        Returns the number of steps taken.
+        """
+        steps = 0
+        while steps < max_ticks and not self.game_over.all():
+            self.step(policy(self), dt)
+            steps += 1
+        return steps
+
+    def _update_active(self, active: np.ndarray, actions: np.ndarray, dt: float) -> None:
+        W, H = SCREEN_WIDTH, SCREEN_HEIGHT
+
+        # Ship input, drag and speed cap
+        ship = active & self.ship_alive
+        turn = np.clip(actions[:, ACT_TURN], -1.0, 1.0)
+        turn[~ship] = 0.0
+        self.ship_angle += turn * (ROTATION_SPEED * dt)
+        thrust = ship & (actions[:, ACT_THRUST] != 0)
+        vx, vy = self.ship_vx, self.ship_vy
+        if thrust.any():
+            rad = np.radians(self.ship_angle[thrust])
+            push = SHIP_THRUST * dt
+            vx[thrust] += np.sin(rad) * push
+            vy[thrust] -= np.cos(rad) * push
+        drag = np.where(ship, DRAG_COEFFICIENT ** (dt * FPS), 1.0)
+        vx *= drag
+        vy *= drag
+        speed_sq = vx * vx + vy * vy
+        fast = speed_sq > MAX_SPEED * MAX_SPEED
+        if fast.any():
+            scale = MAX_SPEED / np.sqrt(speed_sq[fast])
+            vx[fast] *= scale
+            vy[fast] *= scale
+
+        # Kinematics: worlds outside ACTIVE stay frozen, as GameWorld's store does
+        if active.all():
+            step = step2 = dt
+        else:
+            step = np.where(active, dt, 0.0)
+            step2 = step[:, None]
+        top = self._asteroid_top()        # slots past this are free in every world
+        self.ship_x += vx * step
+        self.ship_y += vy * step
+        _wrap(self.ship_x, W)
+        _wrap(self.ship_y, H)
+        for x, y, vx, vy in (
+            (self.ast_x[:, :top], self.ast_y[:, :top], self.ast_vx[:, :top], self.ast_vy[:, :top]),
+            (self.bullet_x, self.bullet_y, self.bullet_vx, self.bullet_vy),
+            (self.enemy_x, self.enemy_y, self.enemy_vx, self.enemy_vy),
+        ):
+            x += vx * step2
+            y += vy * step2
+            _wrap(x, W)
+            _wrap(y, H)
+        self.saucer_x += self.saucer_vx * step2   # saucers leave by the sides
+        self.saucer_y += self.saucer_vy * step2
+        _wrap(self.saucer_y, H)
+        self.bullet_life -= step2
+        self.enemy_life -= step2
+
+        # Ship timers
+        inv = ship & self.invincible
+        np.subtract(self.invincibility_timer, dt, out=self.invincibility_timer, where=inv)
+        self.invincible &= ~(inv & (self.invincibility_timer <= 0))
+        cool = ship & (self.hyperspace_cooldown > 0)
+        np.subtract(self.hyperspace_cooldown, dt, out=self.hyperspace_cooldown, where=cool)
+
+        # Bullets that ran out of lifetime
+        self.bullet_alive &= self.bullet_life > 0
+        self.enemy_alive &= self.enemy_life > 0
+
+        # Saucers: leave by the sides, change course, fire
+        if self.saucer_alive.any():
+            flying = self.saucer_alive & active[:, None]
+            margin = self.saucer_radius * 2
+            gone = flying & ((self.saucer_x < -margin) | (self.saucer_x > W + margin))
+            self.saucer_alive &= ~gone
+            flying &= ~gone
+            np.subtract(self._saucer_dir, dt, out=self._saucer_dir, where=flying)
+            veer = flying & (self._saucer_dir <= 0)
+            if veer.any():
+                k = int(veer.sum())
+                climb = np.where(self.saucer_large[veer], 80.0, 100.0)
+                self.saucer_vy[veer] = self.rng.integers(-1, 2, k) * climb
+                self._saucer_dir[veer] = self.rng.uniform(1.5, 3.0, k)
+            np.subtract(self._saucer_fire, dt, out=self._saucer_fire, where=flying)
+            shoot = flying & (self._saucer_fire <= 0)
+            if shoot.any():
+                self._saucer_fire[shoot] = np.where(self.saucer_large[shoot],
+                                                    SAUCER_LARGE_FIRE_INTERVAL, SAUCER_SMALL_FIRE_INTERVAL)
+                self._fire_saucer_bullets(shoot)
+
+        # Saucer spawning
+        np.subtract(self._saucer_timer, dt, out=self._saucer_timer, where=active)
+        due = active & (self._saucer_timer <= 0)
+        if due.any():
+            self._spawn_saucers(due)
+            self._saucer_timer[due] = np.maximum(
+                SAUCER_SPAWN_INTERVAL_BASE - (self.wave[due] - 1) * 1.0,
+                SAUCER_SPAWN_INTERVAL_MIN,
+            )
+
+        self._check_collisions(active)
+
+        # Wave clear check
+        clear = (active & (self.state == ACTIVE)
+                 & ~self.ast_alive.any(axis=1) & ~self.saucer_alive.any(axis=1))
+        if clear.any():
+            self._wave_timer[clear] = WAVE_TRANSITION_DELAY
+            self.state[clear] = WAVE_TRANSITION
+
+    # ── Waves ─────────────────────────────────────────────────
+    def _spawn_wave(self, mask: np.ndarray) -> None:
+        """Replace the asteroids of the selected worlds with their wave's large ones.
+
+        Each asteroid takes the first of 20 random edge points that is clear
+        of the ship, or the corner if none is, like asteroid._random_edge_pos.
+        """
+        w = np.flatnonzero(mask)
+        if not len(w):
+            return
+        rng = self.rng
+        k, m, tries = len(w), WAVE_ASTEROID_MAX, 20
+        count = np.minimum(WAVE_ASTEROID_START + self.wave[w] - 1, WAVE_ASTEROID_MAX)
+
+        edge = rng.integers(0, 4, (k, m, tries))    # top, bottom, left, right
+        along = rng.random((k, m, tries))
+        x = np.where(edge < 2, along * SCREEN_WIDTH, np.where(edge == 2, 0.0, SCREEN_WIDTH))
+        y = np.where(edge < 2, np.where(edge == 0, 0.0, SCREEN_HEIGHT), along * SCREEN_HEIGHT)
+        sx = self.ship_x[w][:, None, None]
+        sy = self.ship_y[w][:, None, None]
+        clear = (x - sx) ** 2 + (y - sy) ** 2 >= ASTEROID_SPAWN_SAFE_RADIUS ** 2
+        first = clear.argmax(axis=2)[..., None]
+        found = clear.any(axis=2)
+        speed = rng.uniform(ASTEROID_LARGE_SPEED_MIN, ASTEROID_LARGE_SPEED_MAX, (k, m))
+        angle = rng.uniform(0, 2 * math.pi, (k, m))
+
+        self.ast_alive[w] = False
+        self.ast_alive[w, :m] = np.arange(m) < count[:, None]
+        self.ast_x[w, :m] = np.where(found, np.take_along_axis(x, first, 2)[..., 0], 0.0)
+        self.ast_y[w, :m] = np.where(found, np.take_along_axis(y, first, 2)[..., 0], 0.0)
+        self.ast_vx[w, :m] = np.cos(angle) * speed
+        self.ast_vy[w, :m] = np.sin(angle) * speed
+        self.ast_size[w, :m] = 0
+        self.ast_radius[w, :m] = _RADIUS[0]
+
+    def _next_wave(self, mask: np.ndarray) -> None:
+        if not mask.any():
+            return
+        self.wave[mask] += 1
+        self.saucer_alive[mask] = False
+        self._spawn_wave(mask)
+        self.state[mask] = ACTIVE
+        # Give ship brief invincibility at wave start
+        shield = mask & self.ship_alive
+        self.invincible[shield] = True
+        self.invincibility_timer[shield] = 2.0
+
+    # ── Scoring ───────────────────────────────────────────────
+    def _add_score(self, points: np.ndarray) -> None:
+        """Per-world points from one hit each; at most one extra life per call."""
+        self.score += points
+        earned = (points > 0) & (self.score >= self._next_extra_life_threshold)
+        if earned.any():
+            self.lives[earned] = np.minimum(self.lives[earned] + 1, MAX_LIVES)
+            self._next_extra_life_threshold[earned] += EXTRA_LIFE_THRESHOLD
+
+    # ── Player actions ────────────────────────────────────────
+    def _fire_bullet(self, mask: np.ndarray) -> None:
+        """Fire from the ship nose in worlds under the MAX_BULLETS limit."""
+        room, slot = _first_free(self.bullet_alive)
+        w = np.flatnonzero(mask & room)
+        s = slot[w]
+        dx, dy = _heading(self.ship_angle[w])
+        self.bullet_x[w, s] = self.ship_x[w] + dx * 20
+        self.bullet_y[w, s] = self.ship_y[w] + dy * 20
+        self.bullet_vx[w, s] = dx * BULLET_SPEED + self.ship_vx[w]
+        self.bullet_vy[w, s] = dy * BULLET_SPEED + self.ship_vy[w]
+        self.bullet_life[w, s] = BULLET_LIFETIME
+        self.bullet_alive[w, s] = True
+
+    def _do_hyperspace(self, mask: np.ndarray) -> None:
+        w = np.flatnonzero(mask & (self.hyperspace_cooldown <= 0))   # no-op during cooldown
+        if not len(w):
+            return
+        self.hyperspace_cooldown[w] = HYPERSPACE_COOLDOWN
+        lost = self.rng.random(len(w)) < HYPERSPACE_DEATH_CHANCE
+        jump = w[~lost]
+        self.ship_x[jump] = self.rng.uniform(0, SCREEN_WIDTH, len(jump))
+        self.ship_y[jump] = self.rng.uniform(0, SCREEN_HEIGHT, len(jump))
+        self.ship_vx[jump] = 0.0
+        self.ship_vy[jump] = 0.0
+        if lost.any():
+            self._on_ship_destroyed(_mask(self.n, w[lost]), _HYPERSPACE)
+
+    # ── Saucers ───────────────────────────────────────────────
+    def _spawn_saucers(self, mask: np.ndarray) -> None:
+        room, slot = _first_free(self.saucer_alive)
+        w = np.flatnonzero(mask & room)
+        if not len(w):
+            return
+        s = slot[w]
+        k = len(w)
+        rng = self.rng
+        large = self.score[w] < SMALL_SAUCER_SCORE_THRESHOLD
+        side = np.where(rng.random(k) < 0.5, -1.0, 1.0)
+        self.saucer_x[w, s] = np.where(side < 0, 0.0, SCREEN_WIDTH)
+        self.saucer_y[w, s] = rng.uniform(SCREEN_HEIGHT * 0.2, SCREEN_HEIGHT * 0.8, k)
+        self.saucer_vx[w, s] = np.where(large, 120.0, 160.0) * side
+        self.saucer_vy[w, s] = 0.0
+        self.saucer_large[w, s] = large
+        self.saucer_radius[w, s] = np.where(large, SAUCER_LARGE_RADIUS, SAUCER_SMALL_RADIUS)
+        self._saucer_fire[w, s] = np.where(large, SAUCER_LARGE_FIRE_INTERVAL, SAUCER_SMALL_FIRE_INTERVAL)
+        self._saucer_dir[w, s] = rng.uniform(1.5, 3.0, k)
+        self.saucer_alive[w, s] = True
+
+    def _fire_saucer_bullets(self, shoot: np.ndarray) -> None:
+        """One shot per firing saucer: at the ship (small) or anywhere (large), as Saucer.aim."""
+        for s in np.flatnonzero(shoot.any(axis=0)):
+            room, slot = _first_free(self.enemy_alive)
+            w = np.flatnonzero(shoot[:, s] & room)
+            if not len(w):
+                continue
+            u = self.rng.random(len(w))
+            x, y = self.saucer_x[w, s], self.saucer_y[w, s]
+            aimed = (np.arctan2(self.ship_x[w] - x, y - self.ship_y[w])
+                     + np.radians(SAUCER_AIM_SPREAD * (2 * u - 1)))
+            wild = self.saucer_large[w, s] | ~self.ship_alive[w]
+            dx, dy = _heading(np.degrees(np.where(wild, u * 2 * math.pi, aimed)))
+            e = slot[w]
+            self.enemy_x[w, e] = x
+            self.enemy_y[w, e] = y
+            self.enemy_vx[w, e] = dx * BULLET_SPEED
+            self.enemy_vy[w, e] = dy * BULLET_SPEED
+            self.enemy_life[w, e] = BULLET_LIFETIME
+            self.enemy_alive[w, e] = True
+
+    # ── Collision detection ───────────────────────────────────
+    def _check_collisions(self, active: np.ndarray) -> None:
+        r = BULLET_RADIUS
+
+        # Player bullets vs asteroid / saucer. A broad pass tests every bullet
+        # of every world at once and picks out the few worlds with a hit.
+        # Only those are resolved bullet slot by bullet slot, so a target is
+        # taken by one bullet and fresh fragments are in play for the next,
+        # as in GameWorld.
+        flying = active[:, None] & self.bullet_alive
+        if flying.any():
+            top = self._asteroid_top()
+            bx = self.bullet_x[:, :, None]
+            by = self.bullet_y[:, :, None]
+            reach = self.ast_radius[:, None, :top] + r
+            near = (self.ast_alive[:, None, :top]
+                    & (_dist_sq(self.ast_x[:, None, :top], self.ast_y[:, None, :top], bx, by)
+                       < reach * reach)).any(axis=2)
+            reach = self.saucer_radius[:, None, :] + r
+            near |= (self.saucer_alive[:, None, :]
+                     & (_dist_sq(self.saucer_x[:, None, :], self.saucer_y[:, None, :], bx, by)
+                        < reach * reach)).any(axis=2)
+            near &= flying
+            struck = np.flatnonzero(near.any(axis=1))
+            if len(struck):
+                self._resolve_bullets(struck)
+
+        # Saucer bullets vs player
+        exposed = np.flatnonzero(active & self.ship_alive & ~self.invincible)
+        if len(exposed) and self.enemy_alive.any():
+            reach = r + PlayerShip.RADIUS
+            on_ship = self.enemy_alive[exposed] & (_dist_sq(
+                self.enemy_x[exposed], self.enemy_y[exposed],
+                self.ship_x[exposed, None], self.ship_y[exposed, None]) < reach * reach)
+            hit = on_ship.any(axis=1)
+            if hit.any():
+                w = exposed[hit]
+                self.enemy_alive[w, on_ship[hit].argmax(axis=1)] = False
+                self._on_ship_destroyed(_mask(self.n, w), _SAUCER_BULLET)
+
+        # Ship vs asteroid / saucer
+        exposed = np.flatnonzero(active & self.ship_alive & ~self.invincible)
+        if len(exposed):
+            on_ast, on_sau = self._touching(exposed, self.ship_x[exposed], self.ship_y[exposed],
+                                            PlayerShip.RADIUS, self._asteroid_top())
+            hit_ast = on_ast.any(axis=1)
+            hit_sau = ~hit_ast & on_sau.any(axis=1)
+            if hit_ast.any():
+                w = exposed[hit_ast]
+                self._split(w, on_ast[hit_ast].argmax(axis=1))
+                self._on_ship_destroyed(_mask(self.n, w), _ASTEROID)
+            if hit_sau.any():
+                w = exposed[hit_sau]
+                self.saucer_alive[w, on_sau[hit_sau].argmax(axis=1)] = False
+                self._on_ship_destroyed(_mask(self.n, w), _SAUCER)
+
+    def _resolve_bullets(self, worlds: np.ndarray) -> None:
+        """Apply player bullet hits in the given worlds, in bullet slot order."""
+        points = self._points
+        for b in range(self.bullet_alive.shape[1]):
+            w = worlds[self.bullet_alive[worlds, b]]
+            if not len(w):
+                continue
+            on_ast, on_sau = self._touching(w, self.bullet_x[w, b], self.bullet_y[w, b], BULLET_RADIUS)
+            hit_ast = on_ast.any(axis=1)
+            hit_sau = ~hit_ast & on_sau.any(axis=1)
+            hit = hit_ast | hit_sau
+            if not hit.any():
+                continue
+            points[:] = 0
+            if hit_ast.any():
+                wa, t = w[hit_ast], on_ast[hit_ast].argmax(axis=1)
+                points[wa] = _SCORE[self.ast_size[wa, t]]
+                self._split(wa, t)
+            if hit_sau.any():
+                ws, t = w[hit_sau], on_sau[hit_sau].argmax(axis=1)
+                self.saucer_alive[ws, t] = False
+                points[ws] = np.where(self.saucer_large[ws, t], SCORE_LARGE_SAUCER, SCORE_SMALL_SAUCER)
+            self.bullet_alive[w[hit], b] = False
+            self._add_score(points)
+
+    def _touching(self, w: np.ndarray, x: np.ndarray, y: np.ndarray, radius: float,
+                  top: int = None) -> tuple:
+        """Masks of the live asteroids and saucers of worlds w that overlap a circle at (x, y)."""
+        x = x[:, None]
+        y = y[:, None]
+        reach = self.ast_radius[w, :top] + radius
+        on_ast = self.ast_alive[w, :top] & (
+            _dist_sq(self.ast_x[w, :top], self.ast_y[w, :top], x, y) < reach * reach)
+        reach = self.saucer_radius[w] + radius
+        on_sau = self.saucer_alive[w] & (
+            _dist_sq(self.saucer_x[w], self.saucer_y[w], x, y) < reach * reach)
+        return on_ast, on_sau
+
+    def _asteroid_top(self) -> int:
+        """One past the highest asteroid slot alive in any world."""
+        used = np.flatnonzero(self.ast_alive.any(axis=0))
+        return int(used[-1]) + 1 if len(used) else 0
+
+    def _split(self, w: np.ndarray, t: np.ndarray) -> None:
+        """Destroy asteroid t of each world w, leaving Asteroid.split's two children.
+
+        The first child reuses the parent's slot, the second takes the
+        world's first free slot. Children start at the parent's position
+        with a fresh speed and heading for their size.
+        """
+        child = self.ast_size[w, t] + 1
+        gone = child > _SMALL
+        self.ast_alive[w[gone], t[gone]] = False
+        w, t, child = w[~gone], t[~gone], child[~gone]
+        k = len(w)
+        if not k:
+            return
+        _, free = _first_free(self.ast_alive[w])
+        lo, hi = _SPEED_MIN[child][:, None], _SPEED_MAX[child][:, None]
+        speed = lo + (hi - lo) * self.rng.random((k, 2))
+        angle = self.rng.uniform(0, 2 * math.pi, (k, 2))
+        vx, vy = np.cos(angle) * speed, np.sin(angle) * speed
+        radius = _RADIUS[child]
+
+        self.ast_x[w, free] = self.ast_x[w, t]
+        self.ast_y[w, free] = self.ast_y[w, t]
+        for slot, i in ((t, 0), (free, 1)):
+            self.ast_vx[w, slot] = vx[:, i]
+            self.ast_vy[w, slot] = vy[:, i]
+            self.ast_size[w, slot] = child
+            self.ast_radius[w, slot] = radius
+        self.ast_alive[w, free] = True
+
+    # ── Ship ──────────────────────────────────────────────────
+    def _on_ship_destroyed(self, mask: np.ndarray, cause: int) -> None:
+        self.deaths[mask, cause] += 1
+        self.ship_alive[mask] = False
+        self.ship_vx[mask] = 0.0    # the wreck stays put
+        self.ship_vy[mask] = 0.0
+        self.lives[mask] -= 1
+        over = mask & (self.lives <= 0)
+        self.game_over |= over
+        again = mask & ~over
+        self.state[again] = RESPAWNING
+        self._respawn_timer[again] = RESPAWN_DELAY
+
+    def _do_respawn(self, mask: np.ndarray) -> None:
+        if not mask.any():
+            return
+        self._place_ship(mask)
+        self.invincibility_timer[mask] = INVINCIBILITY_TIME
+        self.state[mask] = ACTIVE
+
+    def _place_ship(self, mask: np.ndarray) -> None:
+        """A live, shielded ship at rest at the centre, nose up."""
+        self.ship_x[mask] = SCREEN_WIDTH / 2
+        self.ship_y[mask] = SCREEN_HEIGHT / 2
+        self.ship_vx[mask] = 0.0
+        self.ship_vy[mask] = 0.0
+        self.ship_angle[mask] = 0.0
+        self.ship_alive[mask] = True
+        self.invincible[mask] = True
+        self.hyperspace_cooldown[mask] = 0.0
+
+
+def actions_from_inputs(inputs) -> np.ndarray:
+    """(N, 4) action array from a sequence of PlayerInput."""
+    return np.array([(i.thrust, i.turn, i.fire, i.hyperspace) for i in inputs], dtype=float)
@@ -0,0 +1,458 @@
+"""
+GameWorld — headless game simulation.
+
+Owns every piece of live play state (ship, bullets, asteroids, saucers,
+particles, score, lives, wave, timers, sub-state) and advances it with an
+explicit step(inputs, dt). Nothing here touches the display, the mixer,
+the keyboard or the wall clock, so a world can be stepped as fast as the
+CPU allows. Sounds are reported as event names that the driver drains.
+
+All randomness comes from an RngService, so a seed reproduces a game
+exactly; see rng.py.
+"""
+from enum import Enum, auto
+
+import pygame
+from settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, SIM_HZ,
+    MAX_BULLETS, RESPAWN_DELAY,
+    WAVE_ASTEROID_START, WAVE_ASTEROID_MAX, WAVE_TRANSITION_DELAY,
+    EXTRA_LIFE_THRESHOLD, MAX_LIVES,
+    SCORE_LARGE_ASTEROID, SCORE_MEDIUM_ASTEROID, SCORE_SMALL_ASTEROID,
+    SCORE_LARGE_SAUCER, SCORE_SMALL_SAUCER,
+    SAUCER_SPAWN_INTERVAL_BASE, SAUCER_SPAWN_INTERVAL_MIN,
+    SMALL_SAUCER_SCORE_THRESHOLD, BULLET_RADIUS,
+    PARTICLES_PER_EXPLOSION, PARTICLE_CAPACITY,
+)
+from ship import PlayerShip
+from bullet import BulletPool, heading
+from asteroid import Asteroid
+from saucer import Saucer
+from particle import ParticlePool
+from fastmath import circles_overlap_wrapped
+from broadphase import SpatialHash
+from bodies import BodyStore
+from rng import RngService
+
+
+class PlaySubState(Enum):
+    ACTIVE          = auto()
+    RESPAWNING      = auto()
+    WAVE_TRANSITION = auto()
+
+
+class PlayerInput:
+    """One tick of player intent, independent of keyboard or gamepad."""
+
+    __slots__ = ("thrust", "turn", "fire", "hyperspace")
+
+    def __init__(
+        self,
+        thrust: bool = False,
+        turn: float = 0.0,
+        fire: bool = False,
+        hyperspace: bool = False,
+    ) -> None:
+        self.thrust = thrust          # engine on this tick
+        self.turn = turn              # -1 (left) .. 1 (right)
+        self.fire = fire              # fire one bullet this tick
+        self.hyperspace = hyperspace  # jump this tick
+
+
+NO_INPUT = PlayerInput()
+
+# Phases reported to GameWorld.timer, in update order
+UPDATE_PHASES = ("ship", "kinematics", "bullets", "particles", "saucers", "collisions")
+
+
+class SimClock:
+    """Simulation time source: advances only when the world is stepped."""
+
+    def __init__(self) -> None:
+        self._now = 0.0
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, dt: float) -> None:
+        self._now += dt
+
+
+class GameWorld:
+    """A single game of Asteroids, from first wave to game over."""
+
+    def __init__(self, rng=None, clock=None, seed: int = None, spawn: bool = True) -> None:
+        """rng is an RngService, or any random.Random-like object to seed one from.
+
+        spawn=False leaves the field empty, for callers that fill it in
+        themselves (snapshot.restore).
+        """
+        if rng is None:
+            rng = RngService(seed)
+        elif not isinstance(rng, RngService):
+            rng = RngService(rng.randrange(2 ** 63))
+        self.rng = rng
+        self.clock = clock if clock is not None else SimClock()
+        self.events = []   # sound names emitted since the last drain
+        self.timer = None  # optional timer(phase) called after each of UPDATE_PHASES
+        # Cosmetic detail; lowered by the quality governor on slow machines
+        self.explosion_particles = PARTICLES_PER_EXPLOSION
+        self.particle_limit = PARTICLE_CAPACITY
+        self.asteroid_vertices = None   # outline cap for new asteroids; None keeps every vertex
+        self.reset(spawn)
+
+    def reset(self, spawn: bool = True) -> None:
+        """Start a fresh game: full lives, wave 1, new asteroid field unless spawn is False."""
+        self.score = 0
+        self.lives = MAX_LIVES
+        self.wave  = 1
+        self.ticks = 0
+        self.pair_tests = 0   # narrow-phase circle tests run, summed over the game
+        self.deaths = {}      # cause -> ship losses: asteroid, saucer, saucer_bullet, hyperspace
+        self.game_over = False
+        self.play_sub_state = PlaySubState.ACTIVE
+
+        self.bodies    = BodyStore()
+        self.player_bullets = BulletPool(True, self.bodies)
+        self.enemy_bullets  = BulletPool(False, self.bodies)
+        self.asteroids = []
+        self.saucers   = []
+        self.particles = ParticlePool(seed=self.rng.cosmetic.generator)
+        self.particles.set_limit(self.particle_limit)
+        self._grid = SpatialHash(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self._dead = set()
+
+        self._respawn_timer = 0.0
+        self._wave_timer    = 0.0
+        self._saucer_timer  = SAUCER_SPAWN_INTERVAL_BASE
+        self._next_extra_life_threshold = EXTRA_LIFE_THRESHOLD
+
+        self.ship = PlayerShip(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, store=self.bodies)
+        self.ship.invincible = True
+        self.ship.invincibility_timer = 3.0
+
+        if spawn:
+            self._spawn_wave(self.wave)
+
+    @property
+    def bullets(self) -> list:
+        """Every live bullet, player's first; a fresh list for drawing and inspection."""
+        return self.player_bullets.active + self.enemy_bullets.active
+
+    def drain_events(self) -> list:
+        """Return and clear the sound events emitted since the last call."""
+        events, self.events = self.events, []
+        return events
+
+    def _emit(self, name: str) -> None:
+        self.events.append(name)
+
+    # ── Stepping ──────────────────────────────────────────────
+    def step(self, inputs: PlayerInput, dt: float) -> None:
+        """Advance the simulation by dt seconds under the given input."""
+        if self.game_over:
+            return
+        self.clock.advance(dt)
+        self.ticks += 1
+        self.bodies.snapshot()
+
+        if self.play_sub_state == PlaySubState.ACTIVE:
+            if inputs.fire:
+                self._fire_bullet()
+            if inputs.hyperspace:
+                self._do_hyperspace()
+
+        if self.play_sub_state == PlaySubState.ACTIVE:
+            self._update_active(inputs, dt)
+        elif self.play_sub_state == PlaySubState.RESPAWNING:
+            self._respawn_timer -= dt
+            if self._respawn_timer <= 0:
+                self._do_respawn()
+        elif self.play_sub_state == PlaySubState.WAVE_TRANSITION:
+            self._wave_timer -= dt
+            if self._wave_timer <= 0:
+                self._next_wave()
+
+    def run(self, policy, max_ticks: int, dt: float = 1.0 / SIM_HZ) -> int:
+        """Step until game over or max_ticks; policy(world) -> PlayerInput.
+
+        Returns the number of ticks simulated. Runs unthrottled.
+        """
+        start = self.ticks
+        while not self.game_over and self.ticks - start < max_ticks:
+            self.step(policy(self), dt)
+        return self.ticks - start
+
+    def _update_active(self, inputs: PlayerInput, dt: float) -> None:
+        ship = self.ship
+        timer = self.timer
+
+        # Ship input, drag and speed cap
+        if ship.alive:
+            ship.apply_input(inputs.thrust, inputs.turn, dt)
+            ship.before_move(dt)
+        if timer:
+            timer("ship")
+
+        # Kinematics: one vectorised pass moves, wraps and ages every body
+        self.bodies.integrate(dt)
+        if timer:
+            timer("kinematics")
+
+        if ship.alive:
+            ship.after_move(dt)
+
+        # Bullets that ran out of lifetime
+        if self.bodies.has_expired():
+            self.player_bullets.despawn_expired()
+            self.enemy_bullets.despawn_expired()
+        if timer:
+            timer("bullets")
+
+        # Particles: cosmetic, kept in their own fixed-size pool
+        self.particles.update(dt)
+        if timer:
+            timer("particles")
+
+        # Saucers
+        expired = False
+        for s in self.saucers:
+            s.after_move(dt, ship)
+            if s.expired:
+                expired = True
+            elif s.wants_to_fire():
+                self._fire_saucer_bullet(s)
+        if expired:
+            self.saucers = _drop_expired(self.saucers)
+
+        # Saucer spawning
+        self._saucer_timer -= dt
+        if self._saucer_timer <= 0:
+            self._spawn_saucer()
+            self._saucer_timer = max(
+                SAUCER_SPAWN_INTERVAL_BASE - (self.wave - 1) * 1.0,
+                SAUCER_SPAWN_INTERVAL_MIN,
+            )
+        if timer:
+            timer("saucers")
+
+        # Collisions
+        self._check_collisions()
+        if timer:
+            timer("collisions")
+
+        # Wave clear check
+        if (not self.asteroids and not self.saucers
+                and self.play_sub_state == PlaySubState.ACTIVE):
+            self._wave_timer = WAVE_TRANSITION_DELAY
+            self.play_sub_state = PlaySubState.WAVE_TRANSITION
+
+    # ── Waves ─────────────────────────────────────────────────
+    def _spawn_wave(self, wave_num: int) -> None:
+        """Spawn large asteroids for the given wave number."""
+        count = min(WAVE_ASTEROID_START + wave_num - 1, WAVE_ASTEROID_MAX)
+        ship_pos = self.ship.pos
+        _release_all(self.asteroids)
+        self.asteroids = [
+            Asteroid.spawn_large(ship_pos, self.rng.spawn, self.bodies, self.asteroid_vertices)
+            for _ in range(count)
+        ]
+
+    def _next_wave(self) -> None:
+        self.wave += 1
+        _release_all(self.saucers)
+        self.saucers = []
+        self.particles.clear()
+        self._spawn_wave(self.wave)
+        self.play_sub_state = PlaySubState.ACTIVE
+        # Give ship brief invincibility at wave start
+        if self.ship.alive:
+            self.ship.invincible = True
+            self.ship.invincibility_timer = 2.0
+
+    # ── Scoring ───────────────────────────────────────────────
+    def _add_score(self, points: int) -> None:
+        self.score += points
+        if self.score >= self._next_extra_life_threshold:
+            self.lives = min(self.lives + 1, MAX_LIVES)
+            self._next_extra_life_threshold += EXTRA_LIFE_THRESHOLD
+            self._emit("extra_life")
+
+    # ── Player actions ────────────────────────────────────────
+    def _fire_bullet(self) -> None:
+        """Fire a bullet from the ship nose if under MAX_BULLETS limit."""
+        ship = self.ship
+        if not ship.alive:
+            return
+        if len(self.player_bullets) >= MAX_BULLETS:
+            return
+        angle = ship.angle
+        dx, dy = heading(angle)
+        px, py = ship.pos
+        vx, vy = ship.vel
+        self.player_bullets.fire(px + dx * 20, py + dy * 20, angle, vx, vy)
+        self._emit("fire")
+
+    def _do_hyperspace(self) -> None:
+        if not self.ship.alive:
+            return
+        survived = self.ship.hyperspace(self.rng.hyperspace)
+        if not survived:
+            self._on_ship_destroyed("hyperspace")
+        else:
+            self._emit("hyperspace")
+
+    # ── Saucers ───────────────────────────────────────────────
+    def _spawn_saucer(self) -> None:
+        large = self.score < SMALL_SAUCER_SCORE_THRESHOLD
+        self.saucers.append(Saucer(large=large, rng=self.rng.saucer, store=self.bodies))
+        self._emit("saucer_large" if large else "saucer_small")
+
+    def _fire_saucer_bullet(self, saucer) -> None:
+        px, py = saucer.pos
+        self.enemy_bullets.fire(px, py, saucer.aim(self.ship))
+
+    # ── Collision detection ───────────────────────────────────
+    def _check_collisions(self) -> None:
+        ship = self.ship
+        grid = self._grid
+        dead = self._dead
+        W, H = SCREEN_WIDTH, SCREEN_HEIGHT
+
+        # Targets move every tick; only objects that changed cells are re-filed
+        grid.sync(self.asteroids, self.saucers)
+
+        # Player bullets vs asteroid / saucer. Coordinates are read as plain
+        # floats (Body.x / Body.y) so the narrow phase builds no Vector2s.
+        tests = 0
+        spent = []
+        r = BULLET_RADIUS
+        for b in self.player_bullets.active:
+            bx, by = b.x, b.y
+            for t in grid.query_xy(bx, by, r):
+                if t in dead:
+                    continue
+                tests += 1
+                if circles_overlap_wrapped(bx, by, r, t.x, t.y, t.radius, W, H):
+                    if isinstance(t, Saucer):
+                        self._on_bullet_hit_saucer(b, t)
+                    else:
+                        self._on_bullet_hit_asteroid(b, t)
+                    spent.append(b)
+                    break
+        for b in spent:
+            self.player_bullets.despawn(b)
+
+        # Saucer bullets vs player
+        if ship.alive and not ship.invincible:
+            sx, sy, sr = ship.x, ship.y, ship.RADIUS
+            for b in self.enemy_bullets.active:
+                tests += 1
+                if circles_overlap_wrapped(b.x, b.y, r, sx, sy, sr, W, H):
+                    self.enemy_bullets.despawn(b)
+                    self._on_ship_destroyed("saucer_bullet")
+                    break
+
+        # Ship vs asteroid, then saucer: an asteroid touching the ship wins
+        # whatever order the grid returns them in, as in the original checks
+        if ship.alive and not ship.invincible:
+            sx, sy, sr = ship.x, ship.y, ship.RADIUS
+            saucer_hit = None
+            for t in grid.query_xy(sx, sy, sr):
+                if t in dead:
+                    continue
+                tests += 1
+                if circles_overlap_wrapped(sx, sy, sr, t.x, t.y, t.radius, W, H):
+                    if not isinstance(t, Saucer):
+                        self._on_ship_hit_asteroid(t)
+                        break
+                    if saucer_hit is None:
+                        saucer_hit = t
+            else:
+                if saucer_hit is not None:
+                    self._kill(saucer_hit)
+                    self._on_ship_destroyed("saucer")
+
+        self.pair_tests += tests
+
+        # Compact once instead of list.remove per hit
+        if dead:
+            self.asteroids = [a for a in self.asteroids if a not in dead]
+            self.saucers = [s for s in self.saucers if s not in dead]
+            _release_all(dead)
+            dead.clear()
+
+    def _kill(self, target) -> None:
+        """Mark an asteroid or saucer destroyed; lists are compacted after collisions."""
+        self._dead.add(target)
+        self._grid.remove(target)
+
+    def _add_children(self, children: list) -> None:
+        self.asteroids.extend(children)
+        for child in children:
+            self._grid.insert(child)
+
+    def _on_bullet_hit_asteroid(self, bullet, asteroid) -> None:
+        """Handle bullet hitting an asteroid: split, score, particles."""
+        self._kill(asteroid)
+        if asteroid.size == "large":
+            self._add_score(SCORE_LARGE_ASTEROID)
+        elif asteroid.size == "medium":
+            self._add_score(SCORE_MEDIUM_ASTEROID)
+        elif asteroid.size == "small":
+            self._add_score(SCORE_SMALL_ASTEROID)
+
+        self._add_children(asteroid.split(self.rng.split, self.asteroid_vertices))
+        self._spawn_explosion(asteroid.pos)
+        self._emit("explosion_asteroid")
+
+    def _on_bullet_hit_saucer(self, bullet, saucer) -> None:
+        self._kill(saucer)
+        if saucer.large:
+            self._add_score(SCORE_LARGE_SAUCER)
+        else:
+            self._add_score(SCORE_SMALL_SAUCER)
+        self._spawn_explosion(saucer.pos)
+        self._emit("explosion_saucer")
+
+    def _on_ship_hit_asteroid(self, asteroid) -> None:
+        self._kill(asteroid)
+        self._add_children(asteroid.split(self.rng.split, self.asteroid_vertices))
+        self._spawn_explosion(asteroid.pos)
+        self._on_ship_destroyed("asteroid")
+
+    def _on_ship_destroyed(self, cause: str) -> None:
+        self.deaths[cause] = self.deaths.get(cause, 0) + 1
+        self.ship.alive = False
+        self.ship.vel = (0, 0)   # the wreck stays put while the store integrates
+        self._spawn_explosion(self.ship.pos)
+        self._emit("explosion_ship")
+        self.lives -= 1
+        if self.lives <= 0:
+            self.game_over = True
+        else:
+            self.play_sub_state = PlaySubState.RESPAWNING
+            self._respawn_timer = RESPAWN_DELAY
+
+    def _do_respawn(self) -> None:
+        self.ship.respawn(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+        self.play_sub_state = PlaySubState.ACTIVE
+
+    def _spawn_explosion(self, pos: pygame.Vector2) -> None:
+        self.particles.emit(pos, self.explosion_particles)
+
+
+def _drop_expired(objects: list) -> list:
+    """Return the live objects, giving expired ones' body slots back."""
+    live = []
+    for obj in objects:
+        if obj.expired:
+            obj.release()
+        else:
+            live.append(obj)
+    return live
+
+
+def _release_all(objects) -> None:
+    for obj in objects:
+        obj.release()